@@ -110,6 +110,56 @@ extern "C" {
                                                                         indy_error_t  err,
                                                                         const char*     claims_json)
                                                    );
+
+    extern indy_error_t indy_prover_open_claim_offers_search(indy_handle_t command_handle,
+                                                             indy_handle_t wallet_handle,
+                                                             const char *    filter_json,
+
+                                                             void           (*cb)(indy_handle_t xcommand_handle,
+                                                                                  indy_error_t  err,
+                                                                                  indy_handle_t search_handle)
+                                                             );
+
+    extern indy_error_t indy_prover_fetch_claim_offers(indy_handle_t command_handle,
+                                                       indy_handle_t search_handle,
+                                                       indy_u32_t    count,
+
+                                                       void           (*cb)(indy_handle_t xcommand_handle,
+                                                                            indy_error_t  err,
+                                                                            const char*     claim_offers_json)
+                                                       );
+
+    extern indy_error_t indy_prover_close_claim_offers_search(indy_handle_t command_handle,
+                                                              indy_handle_t search_handle,
+
+                                                              void           (*cb)(indy_handle_t xcommand_handle,
+                                                                                   indy_error_t  err)
+                                                              );
+
+    extern indy_error_t indy_prover_open_claims_search(indy_handle_t command_handle,
+                                                       indy_handle_t wallet_handle,
+                                                       const char *    filter_json,
+
+                                                       void           (*cb)(indy_handle_t xcommand_handle,
+                                                                            indy_error_t  err,
+                                                                            indy_handle_t search_handle)
+                                                       );
+
+    extern indy_error_t indy_prover_fetch_claims(indy_handle_t command_handle,
+                                                 indy_handle_t search_handle,
+                                                 indy_u32_t    count,
+
+                                                 void           (*cb)(indy_handle_t xcommand_handle,
+                                                                      indy_error_t  err,
+                                                                      const char*     claims_json)
+                                                 );
+
+    extern indy_error_t indy_prover_close_claims_search(indy_handle_t command_handle,
+                                                        indy_handle_t search_handle,
+
+                                                        void           (*cb)(indy_handle_t xcommand_handle,
+                                                                             indy_error_t  err)
+                                                        );
     
     
     extern indy_error_t indy_prover_get_claims_for_proof_req(indy_handle_t command_handle,
@@ -149,6 +199,14 @@ extern "C" {
                                                                             indy_bool_t   valid )
                                                        );
     
+    extern indy_error_t indy_verifier_verify_proofs(indy_handle_t command_handle,
+                                                        const char *    proofs_json,
+
+                                                        void           (*cb)(indy_handle_t xcommand_handle,
+                                                                             indy_error_t  err,
+                                                                             const char*   results_json)
+                                                        );
+    
 #ifdef __cplusplus
 }
 #endif
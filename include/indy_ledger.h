@@ -68,6 +68,32 @@ extern "C" {
                                                                      const char*     request_result_json)
                                                );
 
+    /// Cancels request sent to validator pool by sign_and_submit_request or submit_request.
+    ///
+    /// Callback of cancelled request is called with LedgerCancelledError.
+    /// Cancelling of request that is already completed does nothing.
+    ///
+    /// #Params
+    /// command_handle: command handle to map callback to caller context.
+    /// pool_handle: pool handle (created by open_pool_ledger).
+    /// request_json: Request data json (only reqId is used).
+    /// cb: Callback that takes command result as parameter.
+    ///
+    /// #Returns
+    /// Error code
+    ///
+    /// #Errors
+    /// Common*
+    /// Ledger*
+
+    extern indy_error_t indy_cancel_request(indy_handle_t command_handle,
+                                            indy_handle_t pool_handle,
+                                            const char *    request_json,
+
+                                            void           (*cb)(indy_handle_t xcommand_handle,
+                                                                 indy_error_t  err)
+                                           );
+
     /// Builds a request to get a DDO.
     ///
     /// #Params
@@ -75,6 +101,7 @@ extern "C" {
     /// submitter_did: Id of Identity stored in secured Wallet.
     /// target_did: Id of Identity stored in secured Wallet.
     /// cb: Callback that takes command result as parameter.
+    ///       Request is built in the caller thread, so callback is called before the function returns.
     ///
     /// #Returns
     /// Request result as json.
@@ -101,6 +128,7 @@ extern "C" {
     /// alias
     /// role: Role of a user NYM record
     /// cb: Callback that takes command result as parameter.
+    ///       Request is built in the caller thread, so callback is called before the function returns.
     ///
     /// #Returns
     /// Request result as json.
@@ -130,6 +158,7 @@ extern "C" {
     /// raw: represented as json, where key is attribute name and value is it's value
     /// enc: Encrypted attribute data
     /// cb: Callback that takes command result as parameter.
+    ///       Request is built in the caller thread, so callback is called before the function returns.
     ///
     /// #Returns
     /// Request result as json.
@@ -157,6 +186,7 @@ extern "C" {
     /// target_did: Id of Identity stored in secured Wallet.
     /// data: name (attribute name)
     /// cb: Callback that takes command result as parameter.
+    ///       Request is built in the caller thread, so callback is called before the function returns.
     ///
     /// #Returns
     /// Request result as json.
@@ -181,6 +211,7 @@ extern "C" {
     /// submitter_did: Id of Identity stored in secured Wallet.
     /// target_did: Id of Identity stored in secured Wallet.
     /// cb: Callback that takes command result as parameter.
+    ///       Request is built in the caller thread, so callback is called before the function returns.
     ///
     /// #Returns
     /// Request result as json.
@@ -204,6 +235,7 @@ extern "C" {
     /// submitter_did: Id of Identity stored in secured Wallet.
     /// data: name, version, type, attr_names (ip, port, keys)
     /// cb: Callback that takes command result as parameter.
+    ///       Request is built in the caller thread, so callback is called before the function returns.
     ///
     /// #Returns
     /// Request result as json.
@@ -228,6 +260,7 @@ extern "C" {
     /// dest: Id of Identity stored in secured Wallet.
     /// data: name, version
     /// cb: Callback that takes command result as parameter.
+    ///       Request is built in the caller thread, so callback is called before the function returns.
     ///
     /// #Returns
     /// Request result as json.
@@ -254,6 +287,7 @@ extern "C" {
     /// signature_type
     /// data: components of a key in json: N, R, S, Z
     /// cb: Callback that takes command result as parameter.
+    ///       Request is built in the caller thread, so callback is called before the function returns.
     ///
     /// #Returns
     /// Request result as json.
@@ -281,6 +315,7 @@ extern "C" {
     /// signature_type: signature type (only CL supported now)
     /// origin: issuer did
     /// cb: Callback that takes command result as parameter.
+    ///       Request is built in the caller thread, so callback is called before the function returns.
     ///
     /// #Returns
     /// Request result as json.
@@ -307,6 +342,7 @@ extern "C" {
     /// target_did: Id of Identity stored in secured Wallet.
     /// data: id of a target NYM record
     /// cb: Callback that takes command result as parameter.
+    ///       Request is built in the caller thread, so callback is called before the function returns.
     ///
     /// #Returns
     /// Request result as json.
@@ -332,6 +368,7 @@ extern "C" {
     /// target_did: Id of Identity stored in secured Wallet.
     /// data: id of a target NYM record
     /// cb: Callback that takes command result as parameter.
+    ///       Request is built in the caller thread, so callback is called before the function returns.
     ///
     /// #Returns
     /// Request result as json.
@@ -25,6 +25,11 @@ extern "C" {
                                                      void            (*cb)(indy_handle_t xcommand_handle, indy_error_t err)
                                                      );
     
+    extern indy_error_t indy_pool_get_stats(indy_handle_t command_handle,
+                                            indy_handle_t handle,
+                                            void          (*cb)(indy_handle_t xcommand_handle, indy_error_t err, const char* stats_json)
+                                            );
+    
     extern indy_error_t indy_close_pool_ledger(indy_handle_t command_hangle,
                                                    indy_handle_t handle,
                                                    void            (*cb)(indy_handle_t xcommand_handle, indy_error_t err)
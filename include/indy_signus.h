@@ -136,6 +136,35 @@ extern "C" {
                                                            const char* signature)
                                      );
     
+    /// Signs a batch of messages by a signing key associated with my DID. The DID with a signing key
+    /// must be already created and stored in a secured wallet (see create_and_store_my_identity).
+    /// Signing key is loaded from the wallet only once for the whole batch.
+    ///
+    /// #Params
+    /// wallet_handle: wallet handler (created by open_wallet).
+    /// command_handle: command handle to map callback to user context.
+    /// did: signing DID
+    /// msgs_json: json array of messages to be signed
+    /// cb: Callback that takes command result as parameter.
+    ///
+    /// #Returns
+    /// json array of signed messages in the same order as input messages
+    ///
+    /// #Errors
+    /// Common*
+    /// Wallet*
+    /// Crypto*
+    
+    extern indy_error_t indy_sign_batch(indy_handle_t command_handle,
+                                        indy_handle_t wallet_handle,
+                                        const char *    did,
+                                        const char *    msgs_json,
+                                        
+                                        void           (*cb)(indy_handle_t xcommand_handle,
+                                                             indy_error_t  err,
+                                                             const char* signed_msgs_json)
+                                       );
+    
     /// Verify a signature created by a key associated with a DID.
     /// If a secure wallet doesn't contain a verkey associated with the given DID,
     /// then verkey is read from the Ledger.
@@ -172,6 +201,33 @@ extern "C" {
                                                                        indy_bool_t   valid )
                                                  );
 
+    /// Verifies a batch of signatures created by keys associated with DIDs.
+    /// Verkeys are read from a secure wallet only once per DID (see wallet_store_their_identity),
+    /// unlike indy_verify_signature Ledger isn't requested for unknown DIDs.
+    ///
+    /// #Params
+    /// wallet_handle: wallet handler (created by open_wallet).
+    /// command_handle: command handle to map callback to user context.
+    /// signed_msgs_json: json array of [did, signed message] pairs
+    /// cb: Callback that takes command result as parameter.
+    ///
+    /// #Returns
+    /// json array of booleans with verification results in the same order as input messages
+    ///
+    /// #Errors
+    /// Common*
+    /// Wallet*
+    /// Crypto*
+    
+    extern indy_error_t indy_verify_signatures_batch(indy_handle_t command_handle,
+                                                     indy_handle_t wallet_handle,
+                                                     const char *    signed_msgs_json,
+                                                     
+                                                     void           (*cb)(indy_handle_t xcommand_handle,
+                                                                          indy_error_t  err,
+                                                                          const char* results_json)
+                                                    );
+    
     /// Encrypts a message by a public key associated with a DID.
     /// If a secure wallet doesn't contain a public key associated with the given DID,
     /// then the public key is read from the Ledger.
@@ -242,6 +298,147 @@ extern "C" {
                                                               const char*     decrypted_msg)
                                         );    
 
+    /// Signs raw bytes by a signing key associated with my DID. The DID with a signing key
+    /// must be already created and stored in a secured wallet (see create_and_store_my_identity).
+    /// Unlike indy_sign message isn't required to be json, detached signature is returned.
+    ///
+    /// #Params
+    /// wallet_handle: wallet handler (created by open_wallet).
+    /// command_handle: command handle to map callback to user context.
+    /// did: signing DID
+    /// msg_raw: a pointer to first byte of message to be signed
+    /// msg_len: a message length
+    /// cb: Callback that takes command result as parameter.
+    ///
+    /// #Returns
+    /// a signature as raw bytes
+    ///
+    /// #Errors
+    /// Common*
+    /// Wallet*
+    /// Crypto*
+
+    extern indy_error_t indy_sign_bytes(indy_handle_t command_handle,
+                                        indy_handle_t wallet_handle,
+                                        const char *    did,
+                                        const indy_u8_t *  msg_raw,
+                                        indy_u32_t         msg_len,
+
+                                        void           (*cb)(indy_handle_t     xcommand_handle,
+                                                             indy_error_t      err,
+                                                             const indy_u8_t*  signature_raw,
+                                                             indy_u32_t        signature_len)
+                                        );
+
+    /// Verify a detached signature of raw bytes created by a key associated with a DID.
+    /// Verkey must be already stored in a secured wallet (see wallet_store_their_identity),
+    /// Ledger isn't requested.
+    ///
+    /// #Params
+    /// wallet_handle: wallet handler (created by open_wallet).
+    /// command_handle: command handle to map callback to user context.
+    /// did: DID that signed the message
+    /// msg_raw: a pointer to first byte of message
+    /// msg_len: a message length
+    /// signature_raw: a pointer to first byte of signature
+    /// signature_len: a signature length
+    /// cb: Callback that takes command result as parameter.
+    ///
+    /// #Returns
+    /// valid: true - if signature is valid, false - otherwise
+    ///
+    /// #Errors
+    /// Common*
+    /// Wallet*
+    /// Crypto*
+
+    extern indy_error_t indy_verify_signature_bytes(indy_handle_t command_handle,
+                                                    indy_handle_t wallet_handle,
+                                                    const char *    did,
+                                                    const indy_u8_t *  msg_raw,
+                                                    indy_u32_t         msg_len,
+                                                    const indy_u8_t *  signature_raw,
+                                                    indy_u32_t         signature_len,
+
+                                                    void           (*cb)(indy_handle_t xcommand_handle,
+                                                                         indy_error_t  err,
+                                                                         indy_bool_t   valid )
+                                                    );
+
+    /// Encrypts raw bytes by a public key associated with a DID.
+    /// Public key must be already stored in a secured wallet (see wallet_store_their_identity),
+    /// Ledger isn't requested. Message and result aren't wrapped to strings.
+    ///
+    /// #Params
+    /// wallet_handle: wallet handler (created by open_wallet).
+    /// command_handle: command handle to map callback to user context.
+    /// my_did: encrypting DID
+    /// did: encrypting DID
+    /// msg_raw: a pointer to first byte of message to be encrypted
+    /// msg_len: a message length
+    /// cb: Callback that takes command result as parameter.
+    ///
+    /// #Returns
+    /// an encrypted message and nonce as raw bytes
+    ///
+    /// #Errors
+    /// Common*
+    /// Wallet*
+    /// Crypto*
+
+    extern indy_error_t indy_encrypt_bytes(indy_handle_t command_handle,
+                                           indy_handle_t wallet_handle,
+                                           const char *    my_did,
+                                           const char *    did,
+                                           const indy_u8_t *  msg_raw,
+                                           indy_u32_t         msg_len,
+
+                                           void           (*cb)(indy_handle_t     xcommand_handle,
+                                                                indy_error_t      err,
+                                                                const indy_u8_t*  encrypted_msg_raw,
+                                                                indy_u32_t        encrypted_msg_len,
+                                                                const indy_u8_t*  nonce_raw,
+                                                                indy_u32_t        nonce_len)
+                                           );
+
+    /// Decrypts raw bytes encrypted by a public key associated with my DID.
+    /// The DID with a secret key must be already created and
+    /// stored in a secured wallet (see wallet_create_and_store_my_identity)
+    ///
+    /// #Params
+    /// wallet_handle: wallet handler (created by open_wallet).
+    /// command_handle: command handle to map callback to user context.
+    /// my_did: DID
+    /// did: DID that encrypted the message
+    /// encrypted_msg_raw: a pointer to first byte of encrypted message
+    /// encrypted_msg_len: an encrypted message length
+    /// nonce_raw: a pointer to first byte of nonce that encrypted message
+    /// nonce_len: a nonce length
+    /// cb: Callback that takes command result as parameter.
+    ///
+    /// #Returns
+    /// decrypted message as raw bytes
+    ///
+    /// #Errors
+    /// Common*
+    /// Wallet*
+    /// Crypto*
+
+    extern indy_error_t indy_decrypt_bytes(indy_handle_t command_handle,
+                                           indy_handle_t wallet_handle,
+                                           const char *    my_did,
+                                           const char *    did,
+                                           const indy_u8_t *  encrypted_msg_raw,
+                                           indy_u32_t         encrypted_msg_len,
+                                           const indy_u8_t *  nonce_raw,
+                                           indy_u32_t         nonce_len,
+
+                                           void           (*cb)(indy_handle_t     xcommand_handle,
+                                                                indy_error_t      err,
+                                                                const indy_u8_t*  decrypted_msg_raw,
+                                                                indy_u32_t        decrypted_msg_len)
+                                           );
+
 #ifdef __cplusplus
 }
 #endif
@@ -5,6 +5,8 @@
 
 typedef int32_t       indy_i32_t;
 typedef int32_t       indy_handle_t;
+typedef uint32_t      indy_u32_t;
+typedef uint8_t       indy_u8_t;
 typedef unsigned int  indy_bool_t;
 
 #endif
\ No newline at end of file
@@ -12,6 +12,8 @@ extern "C" {
     /// #Params
     /// command_handle: Command handle to map callback to caller context.
     /// xtype: Wallet type name.
+    ///        Names of built-in types ('default' and 'inmem') are reserved,
+    ///        registration of them fails with WalletTypeAlreadyRegisteredError.
     /// create: WalletType create operation handler
     /// open: WalletType open operation handler
     /// set: Wallet set operation handler
@@ -68,6 +70,8 @@ extern "C" {
     /// pool_name: Name of the pool that corresponds to this wallet.
     /// name: Name of the wallet.
     /// xtype(optional): Type of the wallet. Defaults to 'default'.
+    ///                  Built-in types are 'default' (sqlite) and 'inmem' (records are kept in process memory,
+    ///                  config {"snapshot": true} writes them to wallet directory on close to restore in other process).
     ///                  Custom types can be registered with indy_register_wallet_type call.
     /// config(optional): Wallet configuration json. List of supported keys are defined by wallet type.
     ///                    if NULL, then default config will be used.
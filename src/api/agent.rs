@@ -19,6 +19,11 @@ use self::libc::c_char;
 ///
 /// Note that messages encryption/decryption will be performed automatically.
 ///
+/// If INDY_AGENT_REUSE_CONNECTIONS=true env variable is set, socket of closed connection is kept
+/// for a while and reused by the next connect to the same endpoint with the same keys and DIDs.
+/// Reused connection sends RECONNECT frame that listeners of previous libindy versions don't
+/// understand, so enable it only if all listeners you connect to support it.
+///
 /// #Params
 /// command_handle: Command handle to map callback to caller context.
 /// pool_handle: Pool handle (created by open_pool_ledger).
@@ -532,6 +532,241 @@ pub extern fn indy_prover_get_claims(command_handle: i32,
     result_to_err_code!(result)
 }
 
+/// Opens a search over claim offers (see prover_store_claim_offer) matching the filter.
+/// Unlike prover_get_claim_offers matched claim offers are returned by pages
+/// (see prover_fetch_claim_offers), so large wallets can be read with bounded memory.
+/// The search must be closed with prover_close_claim_offers_search.
+///
+/// #Params
+/// wallet_handle: wallet handler (created by open_wallet).
+/// command_handle: command handle to map callback to user context.
+/// filter_json: filter for claim offers
+///        {
+///            "issuer_did": string,
+///            "schema_seq_no": string
+///        }
+/// cb: Callback that takes command result as parameter.
+///
+/// #Returns
+/// search_handle: handle of opened search
+///
+/// #Errors
+/// Common*
+/// Wallet*
+#[no_mangle]
+pub extern fn indy_prover_open_claim_offers_search(command_handle: i32,
+                                                     wallet_handle: i32,
+                                                     filter_json: *const c_char,
+                                                     cb: Option<extern fn(xcommand_handle: i32, err: ErrorCode,
+                                                                          search_handle: i32
+                                                     )>) -> ErrorCode {
+    check_useful_c_str!(filter_json, ErrorCode::CommonInvalidParam3);
+    check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam4);
+
+    let result = CommandExecutor::instance()
+        .send(Command::Anoncreds(AnoncredsCommand::Prover(ProverCommand::OpenClaimOffersSearch(
+            wallet_handle,
+            filter_json,
+            Box::new(move |result| {
+                let (err, search_handle) = result_to_err_code_1!(result, 0);
+                cb(command_handle, err, search_handle)
+            })
+        ))));
+
+    result_to_err_code!(result)
+}
+
+/// Fetches next page of claim offers from the search (see prover_open_claim_offers_search).
+///
+/// #Params
+/// command_handle: command handle to map callback to user context.
+/// search_handle: handle of search opened by prover_open_claim_offers_search
+/// count: maximum number of claim offers to fetch
+/// cb: Callback that takes command result as parameter.
+///
+/// #Returns
+/// A json with a list of claim offers, empty list if search is exhausted.
+///        {
+///            [{"issuer_did": string,
+///            "schema_seq_no": string}]
+///        }
+///
+/// #Errors
+/// Common*
+#[no_mangle]
+pub extern fn indy_prover_fetch_claim_offers(command_handle: i32,
+                                               search_handle: i32,
+                                               count: u32,
+                                               cb: Option<extern fn(xcommand_handle: i32, err: ErrorCode,
+                                                                    claim_offers_json: *const c_char
+                                               )>) -> ErrorCode {
+    check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam4);
+
+    let result = CommandExecutor::instance()
+        .send(Command::Anoncreds(AnoncredsCommand::Prover(ProverCommand::FetchClaimOffers(
+            search_handle,
+            count as usize,
+            Box::new(move |result| {
+                let (err, claim_offers_json) = result_to_err_code_1!(result, String::new());
+                let claim_offers_json = CStringUtils::string_to_cstring(claim_offers_json);
+                cb(command_handle, err, claim_offers_json.as_ptr())
+            })
+        ))));
+
+    result_to_err_code!(result)
+}
+
+/// Closes the search opened by prover_open_claim_offers_search.
+///
+/// #Params
+/// command_handle: command handle to map callback to user context.
+/// search_handle: handle of search opened by prover_open_claim_offers_search
+/// cb: Callback that takes command result as parameter.
+///
+/// #Returns
+/// None
+///
+/// #Errors
+/// Common*
+#[no_mangle]
+pub extern fn indy_prover_close_claim_offers_search(command_handle: i32,
+                                                      search_handle: i32,
+                                                      cb: Option<extern fn(xcommand_handle: i32, err: ErrorCode
+                                                      )>) -> ErrorCode {
+    check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam3);
+
+    let result = CommandExecutor::instance()
+        .send(Command::Anoncreds(AnoncredsCommand::Prover(ProverCommand::CloseClaimOffersSearch(
+            search_handle,
+            Box::new(move |result| {
+                let err = result_to_err_code!(result);
+                cb(command_handle, err)
+            })
+        ))));
+
+    result_to_err_code!(result)
+}
+
+/// Opens a search over human readable claims matching the filter.
+/// Unlike prover_get_claims matched claims are returned by pages
+/// (see prover_fetch_claims), so large wallets can be read with bounded memory.
+/// The search must be closed with prover_close_claims_search,
+/// it is also closed when the wallet is closed.
+///
+/// #Params
+/// wallet_handle: wallet handler (created by open_wallet).
+/// command_handle: command handle to map callback to user context.
+/// filter_json: filter for claims
+///     {
+///         "issuer_did": string,
+///         "schema_seq_no": string
+///     }
+/// cb: Callback that takes command result as parameter.
+///
+/// #Returns
+/// search_handle: handle of opened search
+///
+/// #Errors
+/// Annoncreds*
+/// Common*
+/// Wallet*
+#[no_mangle]
+pub extern fn indy_prover_open_claims_search(command_handle: i32,
+                                               wallet_handle: i32,
+                                               filter_json: *const c_char,
+                                               cb: Option<extern fn(xcommand_handle: i32, err: ErrorCode,
+                                                                    search_handle: i32
+                                               )>) -> ErrorCode {
+    check_useful_c_str!(filter_json, ErrorCode::CommonInvalidParam3);
+    check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam4);
+
+    let result = CommandExecutor::instance()
+        .send(Command::Anoncreds(AnoncredsCommand::Prover(ProverCommand::OpenClaimsSearch(
+            wallet_handle,
+            filter_json,
+            Box::new(move |result| {
+                let (err, search_handle) = result_to_err_code_1!(result, 0);
+                cb(command_handle, err, search_handle)
+            })
+        ))));
+
+    result_to_err_code!(result)
+}
+
+/// Fetches next page of claims from the search (see prover_open_claims_search).
+///
+/// #Params
+/// command_handle: command handle to map callback to user context.
+/// search_handle: handle of search opened by prover_open_claims_search
+/// count: maximum number of claims to fetch
+/// cb: Callback that takes command result as parameter.
+///
+/// #Returns
+/// claims json, empty list if search is exhausted
+///     [{
+///         "claim_uuid": <string>,
+///         "attrs": [{"attr_name" : "attr_value"}],
+///         "schema_seq_no": string,
+///         "issuer_did": string,
+///         "revoc_reg_seq_no": string,
+///     }]
+/// #Errors
+/// Common*
+/// Wallet*
+#[no_mangle]
+pub extern fn indy_prover_fetch_claims(command_handle: i32,
+                                         search_handle: i32,
+                                         count: u32,
+                                         cb: Option<extern fn(xcommand_handle: i32, err: ErrorCode,
+                                                              claims_json: *const c_char
+                                         )>) -> ErrorCode {
+    check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam4);
+
+    let result = CommandExecutor::instance()
+        .send(Command::Anoncreds(AnoncredsCommand::Prover(ProverCommand::FetchClaims(
+            search_handle,
+            count as usize,
+            Box::new(move |result| {
+                let (err, claims_json) = result_to_err_code_1!(result, String::new());
+                let claims_json = CStringUtils::string_to_cstring(claims_json);
+                cb(command_handle, err, claims_json.as_ptr())
+            })
+        ))));
+
+    result_to_err_code!(result)
+}
+
+/// Closes the search opened by prover_open_claims_search.
+///
+/// #Params
+/// command_handle: command handle to map callback to user context.
+/// search_handle: handle of search opened by prover_open_claims_search
+/// cb: Callback that takes command result as parameter.
+///
+/// #Returns
+/// None
+///
+/// #Errors
+/// Common*
+#[no_mangle]
+pub extern fn indy_prover_close_claims_search(command_handle: i32,
+                                                search_handle: i32,
+                                                cb: Option<extern fn(xcommand_handle: i32, err: ErrorCode
+                                                )>) -> ErrorCode {
+    check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam3);
+
+    let result = CommandExecutor::instance()
+        .send(Command::Anoncreds(AnoncredsCommand::Prover(ProverCommand::CloseClaimsSearch(
+            search_handle,
+            Box::new(move |result| {
+                let err = result_to_err_code!(result);
+                cb(command_handle, err)
+            })
+        ))));
+
+    result_to_err_code!(result)
+}
+
 /// Gets human readable claims matching the given proof request.
 ///
 /// #Params
@@ -806,3 +1041,49 @@ pub extern fn indy_verifier_verify_proof(command_handle: i32,
 
     result_to_err_code!(result)
 }
+
+/// Verifies a batch of proofs.
+/// Proofs are verified concurrently, claim proofs of each proof are verified concurrently as well.
+///
+/// #Params
+/// command_handle: command handle to map callback to user context.
+/// proofs_json: json array with parameters of indy_verifier_verify_proof for each proof
+///     [
+///         {
+///             "proof_request": <proof_request_json>,
+///             "proof": <proof_json>,
+///             "schemas": <schemas_json>,
+///             "claim_defs": <claim_defs_jsons>,
+///             "revoc_regs": <revoc_regs_json>
+///         }
+///     ]
+/// cb: Callback that takes command result as parameter.
+///
+/// #Returns
+/// results_json: json array of booleans in the same order as proofs_json,
+///     true - if proof is valid, false - otherwise (including items that are malformed
+///     or can't be verified, they don't fail the whole batch)
+///
+/// #Errors
+/// Annoncreds*
+/// Common*
+#[no_mangle]
+pub extern fn indy_verifier_verify_proofs(command_handle: i32,
+                                          proofs_json: *const c_char,
+                                          cb: Option<extern fn(xcommand_handle: i32, err: ErrorCode,
+                                                               results_json: *const c_char)>) -> ErrorCode {
+    check_useful_c_str!(proofs_json, ErrorCode::CommonInvalidParam2);
+    check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam3);
+
+    let result = CommandExecutor::instance()
+        .send(Command::Anoncreds(AnoncredsCommand::Verifier(VerifierCommand::VerifyProofs(
+            proofs_json,
+            Box::new(move |result| {
+                let (err, results_json) = result_to_err_code_1!(result, String::new());
+                let results_json = CStringUtils::string_to_cstring(results_json);
+                cb(command_handle, err, results_json.as_ptr())
+            })
+        ))));
+
+    result_to_err_code!(result)
+}
@@ -4,6 +4,8 @@ use api::ErrorCode;
 use errors::ToErrorCode;
 use commands::{Command, CommandExecutor};
 use commands::ledger::LedgerCommand;
+use errors::common::CommonError;
+use services::ledger::LedgerService;
 use utils::cstring::CStringUtils;
 
 use self::libc::c_char;
@@ -97,6 +99,44 @@ pub extern fn indy_submit_request(command_handle: i32,
     result_to_err_code!(result)
 }
 
+/// Cancels request sent to validator pool by sign_and_submit_request or submit_request.
+///
+/// Callback of cancelled request is called with LedgerCancelledError.
+/// Cancelling of request that is already completed does nothing.
+///
+/// #Params
+/// command_handle: command handle to map callback to caller context.
+/// pool_handle: pool handle (created by open_pool_ledger).
+/// request_json: Request data json (only reqId is used).
+/// cb: Callback that takes command result as parameter.
+///
+/// #Returns
+/// Error code
+///
+/// #Errors
+/// Common*
+/// Ledger*
+#[no_mangle]
+pub extern fn indy_cancel_request(command_handle: i32,
+                                  pool_handle: i32,
+                                  request_json: *const c_char,
+                                  cb: Option<extern fn(xcommand_handle: i32, err: ErrorCode)>) -> ErrorCode {
+    check_useful_c_str!(request_json, ErrorCode::CommonInvalidParam3);
+    check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam4);
+
+    let result = CommandExecutor::instance()
+        .send(Command::Ledger(LedgerCommand::CancelRequest(
+            pool_handle,
+            request_json,
+            Box::new(move |result| {
+                let err = result_to_err_code!(result);
+                cb(command_handle, err)
+            })
+        )));
+
+    result_to_err_code!(result)
+}
+
 
 /// Builds a request to get a DDO.
 ///
@@ -105,6 +145,7 @@ pub extern fn indy_submit_request(command_handle: i32,
 /// submitter_did: Id of Identity stored in secured Wallet.
 /// target_did: Id of Identity stored in secured Wallet.
 /// cb: Callback that takes command result as parameter.
+///       Request is built in the caller thread, so callback is called before the function returns.
 ///
 /// #Returns
 /// Request result as json.
@@ -121,18 +162,9 @@ pub extern fn indy_build_get_ddo_request(command_handle: i32,
     check_useful_c_str!(target_did, ErrorCode::CommonInvalidParam3);
     check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam4);
 
-    let result = CommandExecutor::instance()
-        .send(Command::Ledger(LedgerCommand::BuildGetDdoRequest(
-            submitter_did,
-            target_did,
-            Box::new(move |result| {
-                let (err, request_json) = result_to_err_code_1!(result, String::new());
-                let request_json = CStringUtils::string_to_cstring(request_json);
-                cb(command_handle, err, request_json.as_ptr())
-            })
-        )));
+    let result = LedgerService::new().build_get_ddo_request(&submitter_did, &target_did);
 
-    result_to_err_code!(result)
+    _call_build_cb(command_handle, result, cb)
 }
 
 
@@ -146,6 +178,7 @@ pub extern fn indy_build_get_ddo_request(command_handle: i32,
 /// alias: alias
 /// role: Role of a user NYM record
 /// cb: Callback that takes command result as parameter.
+///       Request is built in the caller thread, so callback is called before the function returns.
 ///
 /// #Returns
 /// Request result as json.
@@ -168,21 +201,12 @@ pub extern fn indy_build_nym_request(command_handle: i32,
     check_useful_opt_c_str!(role, ErrorCode::CommonInvalidParam6);
     check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam7);
 
-    let result = CommandExecutor::instance()
-        .send(Command::Ledger(LedgerCommand::BuildNymRequest(
-            submitter_did,
-            target_did,
-            verkey,
-            alias,
-            role,
-            Box::new(move |result| {
-                let (err, request_json) = result_to_err_code_1!(result, String::new());
-                let request_json = CStringUtils::string_to_cstring(request_json);
-                cb(command_handle, err, request_json.as_ptr())
-            })
-        )));
+    let result = LedgerService::new().build_nym_request(&submitter_did, &target_did,
+                                                          verkey.as_ref().map(String::as_str),
+                                                          alias.as_ref().map(String::as_str),
+                                                          role.as_ref().map(String::as_str));
 
-    result_to_err_code!(result)
+    _call_build_cb(command_handle, result, cb)
 }
 
 /// Builds an ATTRIB request.
@@ -195,6 +219,7 @@ pub extern fn indy_build_nym_request(command_handle: i32,
 /// raw: represented as json, where key is attribute name and value is it's value
 /// enc: Encrypted attribute data
 /// cb: Callback that takes command result as parameter.
+///       Request is built in the caller thread, so callback is called before the function returns.
 ///
 /// #Returns
 /// Request result as json.
@@ -217,21 +242,12 @@ pub extern fn indy_build_attrib_request(command_handle: i32,
     check_useful_opt_c_str!(enc, ErrorCode::CommonInvalidParam6);
     check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam7);
 
-    let result = CommandExecutor::instance()
-        .send(Command::Ledger(LedgerCommand::BuildAttribRequest(
-            submitter_did,
-            target_did,
-            hash,
-            raw,
-            enc,
-            Box::new(move |result| {
-                let (err, request_json) = result_to_err_code_1!(result, String::new());
-                let request_json = CStringUtils::string_to_cstring(request_json);
-                cb(command_handle, err, request_json.as_ptr())
-            })
-        )));
+    let result = LedgerService::new().build_attrib_request(&submitter_did, &target_did,
+                                                             hash.as_ref().map(String::as_str),
+                                                             raw.as_ref().map(String::as_str),
+                                                             enc.as_ref().map(String::as_str));
 
-    result_to_err_code!(result)
+    _call_build_cb(command_handle, result, cb)
 }
 
 /// Builds a GET_ATTRIB request.
@@ -242,6 +258,7 @@ pub extern fn indy_build_attrib_request(command_handle: i32,
 /// target_did: Id of Identity stored in secured Wallet.
 /// data: name (attribute name)
 /// cb: Callback that takes command result as parameter.
+///       Request is built in the caller thread, so callback is called before the function returns.
 ///
 /// #Returns
 /// Request result as json.
@@ -260,19 +277,9 @@ pub extern fn indy_build_get_attrib_request(command_handle: i32,
     check_useful_c_str!(data, ErrorCode::CommonInvalidParam4);
     check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam5);
 
-    let result = CommandExecutor::instance()
-        .send(Command::Ledger(LedgerCommand::BuildGetAttribRequest(
-            submitter_did,
-            target_did,
-            data,
-            Box::new(move |result| {
-                let (err, request_json) = result_to_err_code_1!(result, String::new());
-                let request_json = CStringUtils::string_to_cstring(request_json);
-                cb(command_handle, err, request_json.as_ptr())
-            })
-        )));
+    let result = LedgerService::new().build_get_attrib_request(&submitter_did, &target_did, &data);
 
-    result_to_err_code!(result)
+    _call_build_cb(command_handle, result, cb)
 }
 
 /// Builds a GET_NYM request.
@@ -282,6 +289,7 @@ pub extern fn indy_build_get_attrib_request(command_handle: i32,
 /// submitter_did: Id of Identity stored in secured Wallet.
 /// target_did: Id of Identity stored in secured Wallet.
 /// cb: Callback that takes command result as parameter.
+///       Request is built in the caller thread, so callback is called before the function returns.
 ///
 /// #Returns
 /// Request result as json.
@@ -298,18 +306,9 @@ pub extern fn indy_build_get_nym_request(command_handle: i32,
     check_useful_c_str!(target_did, ErrorCode::CommonInvalidParam3);
     check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam4);
 
-    let result = CommandExecutor::instance()
-        .send(Command::Ledger(LedgerCommand::BuildGetNymRequest(
-            submitter_did,
-            target_did,
-            Box::new(move |result| {
-                let (err, request_json) = result_to_err_code_1!(result, String::new());
-                let request_json = CStringUtils::string_to_cstring(request_json);
-                cb(command_handle, err, request_json.as_ptr())
-            })
-        )));
+    let result = LedgerService::new().build_get_nym_request(&submitter_did, &target_did);
 
-    result_to_err_code!(result)
+    _call_build_cb(command_handle, result, cb)
 }
 
 /// Builds a SCHEMA request.
@@ -319,6 +318,7 @@ pub extern fn indy_build_get_nym_request(command_handle: i32,
 /// submitter_did: Id of Identity stored in secured Wallet.
 /// data: name, version, type, attr_names (ip, port, keys)
 /// cb: Callback that takes command result as parameter.
+///       Request is built in the caller thread, so callback is called before the function returns.
 ///
 /// #Returns
 /// Request result as json.
@@ -335,18 +335,9 @@ pub extern fn indy_build_schema_request(command_handle: i32,
     check_useful_c_str!(data, ErrorCode::CommonInvalidParam3);
     check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam4);
 
-    let result = CommandExecutor::instance()
-        .send(Command::Ledger(LedgerCommand::BuildSchemaRequest(
-            submitter_did,
-            data,
-            Box::new(move |result| {
-                let (err, request_json) = result_to_err_code_1!(result, String::new());
-                let request_json = CStringUtils::string_to_cstring(request_json);
-                cb(command_handle, err, request_json.as_ptr())
-            })
-        )));
+    let result = LedgerService::new().build_schema_request(&submitter_did, &data);
 
-    result_to_err_code!(result)
+    _call_build_cb(command_handle, result, cb)
 }
 
 /// Builds a GET_SCHEMA request.
@@ -357,6 +348,7 @@ pub extern fn indy_build_schema_request(command_handle: i32,
 /// dest: Id of Identity stored in secured Wallet.
 /// data: name, version
 /// cb: Callback that takes command result as parameter.
+///       Request is built in the caller thread, so callback is called before the function returns.
 ///
 /// #Returns
 /// Request result as json.
@@ -375,19 +367,9 @@ pub extern fn indy_build_get_schema_request(command_handle: i32,
     check_useful_c_str!(data, ErrorCode::CommonInvalidParam4);
     check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam5);
 
-    let result = CommandExecutor::instance()
-        .send(Command::Ledger(LedgerCommand::BuildGetSchemaRequest(
-            submitter_did,
-            dest,
-            data,
-            Box::new(move |result| {
-                let (err, request_json) = result_to_err_code_1!(result, String::new());
-                let request_json = CStringUtils::string_to_cstring(request_json);
-                cb(command_handle, err, request_json.as_ptr())
-            })
-        )));
+    let result = LedgerService::new().build_get_schema_request(&submitter_did, &dest, &data);
 
-    result_to_err_code!(result)
+    _call_build_cb(command_handle, result, cb)
 }
 
 /// Builds an CLAIM_DEF request.
@@ -399,6 +381,7 @@ pub extern fn indy_build_get_schema_request(command_handle: i32,
 /// signature_type: signature type (only CL supported now)
 /// data: components of a key in json: N, R, S, Z
 /// cb: Callback that takes command result as parameter.
+///       Request is built in the caller thread, so callback is called before the function returns.
 ///
 /// #Returns
 /// Request result as json.
@@ -418,20 +401,9 @@ pub extern fn indy_build_claim_def_txn(command_handle: i32,
     check_useful_c_str!(data, ErrorCode::CommonInvalidParam5);
     check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam6);
 
-    let result = CommandExecutor::instance()
-        .send(Command::Ledger(LedgerCommand::BuildClaimDefRequest(
-            submitter_did,
-            xref,
-            signature_type,
-            data,
-            Box::new(move |result| {
-                let (err, request_json) = result_to_err_code_1!(result, String::new());
-                let request_json = CStringUtils::string_to_cstring(request_json);
-                cb(command_handle, err, request_json.as_ptr())
-            })
-        )));
+    let result = LedgerService::new().build_claim_def_request(&submitter_did, xref, &signature_type, &data);
 
-    result_to_err_code!(result)
+    _call_build_cb(command_handle, result, cb)
 }
 
 /// Builds a GET_CLAIM_DEF request.
@@ -443,6 +415,7 @@ pub extern fn indy_build_claim_def_txn(command_handle: i32,
 /// signature_type: signature type (only CL supported now)
 /// origin: issuer did
 /// cb: Callback that takes command result as parameter.
+///       Request is built in the caller thread, so callback is called before the function returns.
 ///
 /// #Returns
 /// Request result as json.
@@ -462,20 +435,9 @@ pub extern fn indy_build_get_claim_def_txn(command_handle: i32,
     check_useful_c_str!(origin, ErrorCode::CommonInvalidParam4);
     check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam6);
 
-    let result = CommandExecutor::instance()
-        .send(Command::Ledger(LedgerCommand::BuildGetClaimDefRequest(
-            submitter_did,
-            xref,
-            signature_type,
-            origin,
-            Box::new(move |result| {
-                let (err, request_json) = result_to_err_code_1!(result, String::new());
-                let request_json = CStringUtils::string_to_cstring(request_json);
-                cb(command_handle, err, request_json.as_ptr())
-            })
-        )));
+    let result = LedgerService::new().build_get_claim_def_request(&submitter_did, xref, &signature_type, &origin);
 
-    result_to_err_code!(result)
+    _call_build_cb(command_handle, result, cb)
 }
 
 /// Builds a NODE request.
@@ -486,6 +448,7 @@ pub extern fn indy_build_get_claim_def_txn(command_handle: i32,
 /// target_did: Id of Identity stored in secured Wallet.
 /// data: id of a target NYM record
 /// cb: Callback that takes command result as parameter.
+///       Request is built in the caller thread, so callback is called before the function returns.
 ///
 /// #Returns
 /// Request result as json.
@@ -504,19 +467,9 @@ pub extern fn indy_build_node_request(command_handle: i32,
     check_useful_c_str!(data, ErrorCode::CommonInvalidParam4);
     check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam5);
 
-    let result = CommandExecutor::instance()
-        .send(Command::Ledger(LedgerCommand::BuildNodeRequest(
-            submitter_did,
-            target_did,
-            data,
-            Box::new(move |result| {
-                let (err, request_json) = result_to_err_code_1!(result, String::new());
-                let request_json = CStringUtils::string_to_cstring(request_json);
-                cb(command_handle, err, request_json.as_ptr())
-            })
-        )));
+    let result = LedgerService::new().build_node_request(&submitter_did, &target_did, &data);
 
-    result_to_err_code!(result)
+    _call_build_cb(command_handle, result, cb)
 }
 
 
@@ -527,6 +480,7 @@ pub extern fn indy_build_node_request(command_handle: i32,
 /// submitter_did: Id of Identity stored in secured Wallet.
 /// data: seq_no of transaction in ledger
 /// cb: Callback that takes command result as parameter.
+///       Request is built in the caller thread, so callback is called before the function returns.
 ///
 /// #Returns
 /// Request result as json.
@@ -542,16 +496,18 @@ pub extern fn indy_build_get_txn_request(command_handle: i32,
     check_useful_c_str!(submitter_did, ErrorCode::CommonInvalidParam2);
     check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam4);
 
-    let result = CommandExecutor::instance()
-        .send(Command::Ledger(LedgerCommand::BuildGetTxnRequest(
-            submitter_did,
-            data,
-            Box::new(move |result| {
-                let (err, request_json) = result_to_err_code_1!(result, String::new());
-                let request_json = CStringUtils::string_to_cstring(request_json);
-                cb(command_handle, err, request_json.as_ptr())
-            })
-        )));
+    let result = LedgerService::new().build_get_txn_request(&submitter_did, data);
 
-    result_to_err_code!(result)
+    _call_build_cb(command_handle, result, cb)
+}
+
+// Request builders only serialize request json, so they are called in the caller thread
+// instead of being queued to CommandExecutor behind other commands
+fn _call_build_cb(command_handle: i32,
+                  result: Result<String, CommonError>,
+                  cb: extern fn(xcommand_handle: i32, err: ErrorCode, request_json: *const c_char)) -> ErrorCode {
+    let (err, request_json) = result_to_err_code_1!(result, String::new());
+    let request_json = CStringUtils::string_to_cstring(request_json);
+    cb(command_handle, err, request_json.as_ptr());
+    ErrorCode::Success
 }
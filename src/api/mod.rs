@@ -103,6 +103,12 @@ pub enum ErrorCode
     // Attempt to send transaction without the necessary privileges
     LedgerSecurityError = 305,
 
+    // Pool ledger request wasn't completed in time
+    LedgerTimeoutError = 306,
+
+    // Pool ledger request was cancelled by caller
+    LedgerCancelledError = 307,
+
     // Revocation registry is full and creation of new registry is necessary
     AnoncredsRevocationRegistryFullError = 400,
 
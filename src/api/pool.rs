@@ -121,6 +121,52 @@ pub extern fn indy_refresh_pool_ledger(command_handle: i32,
     result_to_err_code!(result)
 }
 
+/// Returns statistics of pool nodes round-trips.
+///
+/// Read requests are sent to the healthy nodes with the lowest average latency first.
+///
+/// #Params
+/// handle: pool handle returned by indy_open_pool_ledger
+/// cb: Callback that takes command result as parameter.
+///
+/// #Returns
+/// Stats json:
+/// {
+///     "nodes": [{
+///         "name": string, node alias,
+///         "sent": int, count of requests sent to the node,
+///         "replies": int, count of requests answered by the node,
+///         "missed": int, count of requests the node didn't answer in time,
+///         "healthy": bool, false if the node missed the last requests,
+///         "avg_latency_ms": float or null, moving average of round-trip,
+///         "histogram": [{"le_ms": int or null, "count": int}], round-trips histogram,
+///     }],
+///     "pending_requests": int, count of requests waiting for replies
+/// }
+///
+/// #Errors
+/// Common*
+/// Ledger*
+#[no_mangle]
+pub extern fn indy_pool_get_stats(command_handle: i32,
+                                  handle: i32,
+                                  cb: Option<extern fn(xcommand_handle: i32, err: ErrorCode,
+                                                       stats_json: *const c_char)>) -> ErrorCode {
+    check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam3);
+
+    let result = CommandExecutor::instance()
+        .send(Command::Pool(PoolCommand::GetStats(
+            handle,
+            Box::new(move |result| {
+                let (err, stats_json) = result_to_err_code_1!(result, String::new());
+                let stats_json = CStringUtils::string_to_cstring(stats_json);
+                cb(command_handle, err, stats_json.as_ptr())
+            })
+        )));
+
+    result_to_err_code!(result)
+}
+
 /// Closes opened pool ledger, opened nodes connections and frees allocated resources.
 ///
 /// #Params
@@ -199,6 +199,51 @@ pub  extern fn indy_sign(command_handle: i32,
     result_to_err_code!(result)
 }
 
+/// Signs a batch of messages by a signing key associated with my DID. The DID with a signing key
+/// must be already created and stored in a secured wallet (see create_and_store_my_identity).
+/// Signing key is loaded from the wallet only once for the whole batch.
+///
+/// #Params
+/// wallet_handle: wallet handler (created by open_wallet).
+/// command_handle: command handle to map callback to user context.
+/// did: signing DID
+/// msgs_json: json array of messages to be signed. Example:
+///     ["{\"reqId\":1}", "{\"reqId\":2}"]
+/// cb: Callback that takes command result as parameter.
+///
+/// #Returns
+/// json array of signed messages in the same order as input messages
+///
+/// #Errors
+/// Common*
+/// Wallet*
+/// Crypto*
+#[no_mangle]
+pub  extern fn indy_sign_batch(command_handle: i32,
+                               wallet_handle: i32,
+                               did: *const c_char,
+                               msgs_json: *const c_char,
+                               cb: Option<extern fn(xcommand_handle: i32, err: ErrorCode,
+                                                    signed_msgs_json: *const c_char)>) -> ErrorCode {
+    check_useful_c_str!(did, ErrorCode::CommonInvalidParam3);
+    check_useful_c_str!(msgs_json, ErrorCode::CommonInvalidParam4);
+    check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam5);
+
+    let result = CommandExecutor::instance()
+        .send(Command::Signus(SignusCommand::SignBatch(
+            wallet_handle,
+            did,
+            msgs_json,
+            Box::new(move |result| {
+                let (err, signed_msgs_json) = result_to_err_code_1!(result, String::new());
+                let signed_msgs_json = CStringUtils::string_to_cstring(signed_msgs_json);
+                cb(command_handle, err, signed_msgs_json.as_ptr())
+            })
+        )));
+
+    result_to_err_code!(result)
+}
+
 /// Verify a signature created by a key associated with a DID.
 /// If a secure wallet doesn't contain a verkey associated with the given DID,
 /// then verkey is read from the Ledger.
@@ -249,6 +294,48 @@ pub  extern fn indy_verify_signature(command_handle: i32,
     result_to_err_code!(result)
 }
 
+/// Verifies a batch of signatures created by keys associated with DIDs.
+/// Verkeys are read from a secure wallet only once per DID (see wallet_store_their_identity),
+/// unlike indy_verify_signature Ledger isn't requested for unknown DIDs.
+///
+/// #Params
+/// wallet_handle: wallet handler (created by open_wallet).
+/// command_handle: command handle to map callback to user context.
+/// signed_msgs_json: json array of [did, signed message] pairs. Example:
+///     [["VsKV7grR1BUE29mG2Fm2kX", "{\"reqId\":1,\"signature\":\"...\"}"]]
+/// cb: Callback that takes command result as parameter.
+///
+/// #Returns
+/// json array of booleans with verification results in the same order as input messages,
+/// messages that can't be verified (malformed, signed by DID unknown to the wallet) are false
+///
+/// #Errors
+/// Common*
+/// Wallet*
+/// Crypto*
+#[no_mangle]
+pub  extern fn indy_verify_signatures_batch(command_handle: i32,
+                                            wallet_handle: i32,
+                                            signed_msgs_json: *const c_char,
+                                            cb: Option<extern fn(xcommand_handle: i32, err: ErrorCode,
+                                                                 results_json: *const c_char)>) -> ErrorCode {
+    check_useful_c_str!(signed_msgs_json, ErrorCode::CommonInvalidParam3);
+    check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam4);
+
+    let result = CommandExecutor::instance()
+        .send(Command::Signus(SignusCommand::VerifySignaturesBatch(
+            wallet_handle,
+            signed_msgs_json,
+            Box::new(move |result| {
+                let (err, results_json) = result_to_err_code_1!(result, String::new());
+                let results_json = CStringUtils::string_to_cstring(results_json);
+                cb(command_handle, err, results_json.as_ptr())
+            })
+        )));
+
+    result_to_err_code!(result)
+}
+
 /// Encrypts a message by a public key associated with a DID.
 /// If a secure wallet doesn't contain a public key associated with the given DID,
 /// then the public key is read from the Ledger.
@@ -356,4 +443,207 @@ pub  extern fn indy_decrypt(command_handle: i32,
         )));
 
     result_to_err_code!(result)
-}
\ No newline at end of file
+}
+
+/// Signs raw bytes by a signing key associated with my DID. The DID with a signing key
+/// must be already created and stored in a secured wallet (see create_and_store_my_identity).
+/// Unlike indy_sign message isn't required to be json, detached signature is returned.
+///
+/// #Params
+/// wallet_handle: wallet handler (created by open_wallet).
+/// command_handle: command handle to map callback to user context.
+/// did: signing DID
+/// msg_raw: a pointer to first byte of message to be signed
+/// msg_len: a message length
+/// cb: Callback that takes command result as parameter.
+///
+/// #Returns
+/// a signature as raw bytes
+///
+/// #Errors
+/// Common*
+/// Wallet*
+/// Crypto*
+#[no_mangle]
+pub  extern fn indy_sign_bytes(command_handle: i32,
+                               wallet_handle: i32,
+                               did: *const c_char,
+                               msg_raw: *const u8,
+                               msg_len: u32,
+                               cb: Option<extern fn(xcommand_handle: i32, err: ErrorCode,
+                                                    signature_raw: *const u8, signature_len: u32)>) -> ErrorCode {
+    check_useful_c_str!(did, ErrorCode::CommonInvalidParam3);
+    check_useful_c_byte_array!(msg_raw, msg_len, ErrorCode::CommonInvalidParam4);
+    check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam6);
+
+    let result = CommandExecutor::instance()
+        .send(Command::Signus(SignusCommand::SignBytes(
+            wallet_handle,
+            did,
+            msg_raw,
+            Box::new(move |result| {
+                let (err, signature) = result_to_err_code_1!(result, Vec::new());
+                cb(command_handle, err, signature.as_ptr(), signature.len() as u32)
+            })
+        )));
+
+    result_to_err_code!(result)
+}
+
+/// Verify a detached signature of raw bytes created by a key associated with a DID.
+/// Verkey must be already stored in a secured wallet (see wallet_store_their_identity),
+/// Ledger isn't requested.
+///
+/// #Params
+/// wallet_handle: wallet handler (created by open_wallet).
+/// command_handle: command handle to map callback to user context.
+/// did: DID that signed the message
+/// msg_raw: a pointer to first byte of message
+/// msg_len: a message length
+/// signature_raw: a pointer to first byte of signature
+/// signature_len: a signature length
+/// cb: Callback that takes command result as parameter.
+///
+/// #Returns
+/// valid: true - if signature is valid, false - otherwise
+///
+/// #Errors
+/// Common*
+/// Wallet*
+/// Crypto*
+#[no_mangle]
+pub  extern fn indy_verify_signature_bytes(command_handle: i32,
+                                           wallet_handle: i32,
+                                           did: *const c_char,
+                                           msg_raw: *const u8,
+                                           msg_len: u32,
+                                           signature_raw: *const u8,
+                                           signature_len: u32,
+                                           cb: Option<extern fn(xcommand_handle: i32, err: ErrorCode,
+                                                                valid: bool)>) -> ErrorCode {
+    check_useful_c_str!(did, ErrorCode::CommonInvalidParam3);
+    check_useful_c_byte_array!(msg_raw, msg_len, ErrorCode::CommonInvalidParam4);
+    check_useful_c_byte_array!(signature_raw, signature_len, ErrorCode::CommonInvalidParam6);
+    check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam8);
+
+    let result = CommandExecutor::instance()
+        .send(Command::Signus(SignusCommand::VerifySignatureBytes(
+            wallet_handle,
+            did,
+            msg_raw,
+            signature_raw,
+            Box::new(move |result| {
+                let (err, valid) = result_to_err_code_1!(result, false);
+                cb(command_handle, err, valid)
+            })
+        )));
+
+    result_to_err_code!(result)
+}
+
+/// Encrypts raw bytes by a public key associated with a DID.
+/// Public key must be already stored in a secured wallet (see wallet_store_their_identity),
+/// Ledger isn't requested. Message and result aren't wrapped to strings.
+///
+/// #Params
+/// wallet_handle: wallet handler (created by open_wallet).
+/// command_handle: command handle to map callback to user context.
+/// my_did: encrypting DID
+/// did: encrypting DID
+/// msg_raw: a pointer to first byte of message to be encrypted
+/// msg_len: a message length
+/// cb: Callback that takes command result as parameter.
+///
+/// #Returns
+/// an encrypted message and nonce as raw bytes
+///
+/// #Errors
+/// Common*
+/// Wallet*
+/// Crypto*
+#[no_mangle]
+pub  extern fn indy_encrypt_bytes(command_handle: i32,
+                                  wallet_handle: i32,
+                                  my_did: *const c_char,
+                                  did: *const c_char,
+                                  msg_raw: *const u8,
+                                  msg_len: u32,
+                                  cb: Option<extern fn(xcommand_handle: i32, err: ErrorCode,
+                                                       encrypted_msg_raw: *const u8, encrypted_msg_len: u32,
+                                                       nonce_raw: *const u8, nonce_len: u32)>) -> ErrorCode {
+    check_useful_c_str!(my_did, ErrorCode::CommonInvalidParam3);
+    check_useful_c_str!(did, ErrorCode::CommonInvalidParam4);
+    check_useful_c_byte_array!(msg_raw, msg_len, ErrorCode::CommonInvalidParam5);
+    check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam7);
+
+    let result = CommandExecutor::instance()
+        .send(Command::Signus(SignusCommand::EncryptBytes(
+            wallet_handle,
+            my_did,
+            did,
+            msg_raw,
+            Box::new(move |result| {
+                let (err, encrypted_msg, nonce) = result_to_err_code_2!(result, Vec::new(), Vec::new());
+                cb(command_handle, err,
+                   encrypted_msg.as_ptr(), encrypted_msg.len() as u32,
+                   nonce.as_ptr(), nonce.len() as u32)
+            })
+        )));
+
+    result_to_err_code!(result)
+}
+
+/// Decrypts raw bytes encrypted by a public key associated with my DID.
+/// The DID with a secret key must be already created and
+/// stored in a secured wallet (see wallet_create_and_store_my_identity)
+///
+/// #Params
+/// wallet_handle: wallet handler (created by open_wallet).
+/// command_handle: command handle to map callback to user context.
+/// my_did: DID
+/// did: DID that encrypted the message
+/// encrypted_msg_raw: a pointer to first byte of encrypted message
+/// encrypted_msg_len: an encrypted message length
+/// nonce_raw: a pointer to first byte of nonce that encrypted message
+/// nonce_len: a nonce length
+/// cb: Callback that takes command result as parameter.
+///
+/// #Returns
+/// decrypted message as raw bytes
+///
+/// #Errors
+/// Common*
+/// Wallet*
+/// Crypto*
+#[no_mangle]
+pub  extern fn indy_decrypt_bytes(command_handle: i32,
+                                  wallet_handle: i32,
+                                  my_did: *const c_char,
+                                  did: *const c_char,
+                                  encrypted_msg_raw: *const u8,
+                                  encrypted_msg_len: u32,
+                                  nonce_raw: *const u8,
+                                  nonce_len: u32,
+                                  cb: Option<extern fn(xcommand_handle: i32, err: ErrorCode,
+                                                       decrypted_msg_raw: *const u8, decrypted_msg_len: u32)>) -> ErrorCode {
+    check_useful_c_str!(my_did, ErrorCode::CommonInvalidParam3);
+    check_useful_c_str!(did, ErrorCode::CommonInvalidParam4);
+    check_useful_c_byte_array!(encrypted_msg_raw, encrypted_msg_len, ErrorCode::CommonInvalidParam5);
+    check_useful_c_byte_array!(nonce_raw, nonce_len, ErrorCode::CommonInvalidParam7);
+    check_useful_c_callback!(cb, ErrorCode::CommonInvalidParam9);
+
+    let result = CommandExecutor::instance()
+        .send(Command::Signus(SignusCommand::DecryptBytes(
+            wallet_handle,
+            my_did,
+            did,
+            encrypted_msg_raw,
+            nonce_raw,
+            Box::new(move |result| {
+                let (err, decrypted_msg) = result_to_err_code_1!(result, Vec::new());
+                cb(command_handle, err, decrypted_msg.as_ptr(), decrypted_msg.len() as u32)
+            })
+        )));
+
+    result_to_err_code!(result)
+}
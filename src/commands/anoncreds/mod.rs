@@ -10,6 +10,8 @@ use services::anoncreds::AnoncredsService;
 use services::pool::PoolService;
 use services::wallet::WalletService;
 
+use utils::threadpool::ThreadPool;
+
 use std::rc::Rc;
 
 pub enum AnoncredsCommand {
@@ -27,14 +29,15 @@ pub struct AnoncredsCommandExecutor {
 impl AnoncredsCommandExecutor {
     pub fn new(anoncreds_service: Rc<AnoncredsService>,
                pool_service: Rc<PoolService>,
-               wallet_service: Rc<WalletService>) -> AnoncredsCommandExecutor {
+               wallet_service: Rc<WalletService>,
+               thread_pool: Rc<ThreadPool>) -> AnoncredsCommandExecutor {
         AnoncredsCommandExecutor {
             issuer_command_cxecutor: IssuerCommandExecutor::new(
                 anoncreds_service.clone(), pool_service.clone(), wallet_service.clone()),
             prover_command_cxecutor: ProverCommandExecutor::new(
-                anoncreds_service.clone(), pool_service.clone(), wallet_service.clone()),
+                anoncreds_service.clone(), pool_service.clone(), wallet_service.clone(), thread_pool.clone()),
             verifier_command_cxecutor: VerifierCommandExecutor::new(
-                anoncreds_service.clone(), pool_service.clone(), wallet_service.clone()),
+                anoncreds_service.clone(), pool_service.clone(), wallet_service.clone(), thread_pool.clone()),
         }
     }
 
@@ -54,4 +57,8 @@ impl AnoncredsCommandExecutor {
             }
         };
     }
-}
\ No newline at end of file
+
+    pub fn close_wallet_searches(&self, wallet_handle: i32) {
+        self.prover_command_cxecutor.close_wallet_searches(wallet_handle);
+    }
+}
@@ -6,6 +6,7 @@ use errors::common::CommonError;
 use errors::indy::IndyError;
 use errors::anoncreds::AnoncredsError;
 use services::anoncreds::AnoncredsService;
+use services::anoncreds::prover::Prover;
 use utils::crypto::bn::BigNumber;
 use services::pool::PoolService;
 use utils::json::{JsonDecodable, JsonEncodable};
@@ -29,10 +30,17 @@ use services::anoncreds::types::{
     RevocationClaimInitData,
     ClaimRequestJson
 };
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet, VecDeque};
 use utils::crypto::pair::PointG2;
 use std::cell::RefCell;
 use utils::crypto::base58::Base58;
+use utils::threadpool::ThreadPool;
+use utils::sequence::SequenceUtils;
+use errors::wallet::WalletError;
+
+// Version of secondary claim indexes stored in wallet, indexes are rebuilt
+// from stored claims if wallet doesn't contain this version
+const CLAIM_INDEX_VERSION: &'static str = "1";
 
 pub enum ProverCommand {
     StoreClaimOffer(
@@ -75,22 +83,56 @@ pub enum ProverCommand {
         String, // claim defs json
         String, // revoc regs json
         Box<Fn(Result<String, IndyError>) + Send>),
+    OpenClaimOffersSearch(
+        i32, // wallet handle
+        String, // filter json
+        Box<Fn(Result<i32, IndyError>) + Send>),
+    FetchClaimOffers(
+        i32, // search handle
+        usize, // count
+        Box<Fn(Result<String, IndyError>) + Send>),
+    CloseClaimOffersSearch(
+        i32, // search handle
+        Box<Fn(Result<(), IndyError>) + Send>),
+    OpenClaimsSearch(
+        i32, // wallet handle
+        String, // filter json
+        Box<Fn(Result<i32, IndyError>) + Send>),
+    FetchClaims(
+        i32, // search handle
+        usize, // count
+        Box<Fn(Result<String, IndyError>) + Send>),
+    CloseClaimsSearch(
+        i32, // search handle
+        Box<Fn(Result<(), IndyError>) + Send>),
+}
+
+// Opened search keeps only matched claim offers or uuids of matched claims,
+// claims themselves are read from wallet page by page on fetch
+enum ProverSearch {
+    ClaimOffers(VecDeque<ClaimOffer>),
+    Claims(i32 /* wallet handle */, VecDeque<String> /* claim uuids */)
 }
 
 pub struct ProverCommandExecutor {
     anoncreds_service: Rc<AnoncredsService>,
     pool_service: Rc<PoolService>,
-    wallet_service: Rc<WalletService>
+    wallet_service: Rc<WalletService>,
+    thread_pool: Rc<ThreadPool>,
+    searches: RefCell<HashMap<i32, ProverSearch>>
 }
 
 impl ProverCommandExecutor {
     pub fn new(anoncreds_service: Rc<AnoncredsService>,
                pool_service: Rc<PoolService>,
-               wallet_service: Rc<WalletService>) -> ProverCommandExecutor {
+               wallet_service: Rc<WalletService>,
+               thread_pool: Rc<ThreadPool>) -> ProverCommandExecutor {
         ProverCommandExecutor {
             anoncreds_service: anoncreds_service,
             pool_service: pool_service,
             wallet_service: wallet_service,
+            thread_pool: thread_pool,
+            searches: RefCell::new(HashMap::new())
         }
     }
 
@@ -129,8 +171,32 @@ impl ProverCommandExecutor {
             ProverCommand::CreateProof(wallet_handle, proof_req_json, requested_claims_json, schemas_jsons,
                                        master_secret_name, claim_def_jsons, revoc_regs_jsons, cb) => {
                 info!(target: "prover_command_executor", "CreateProof command received");
-                self.create_proof(wallet_handle, &proof_req_json, &requested_claims_json, &schemas_jsons,
-                                  &master_secret_name, &claim_def_jsons, &revoc_regs_jsons, cb);
+                self.create_proof(wallet_handle, proof_req_json, requested_claims_json, schemas_jsons,
+                                  &master_secret_name, claim_def_jsons, revoc_regs_jsons, cb);
+            }
+            ProverCommand::OpenClaimOffersSearch(wallet_handle, filter_json, cb) => {
+                info!(target: "prover_command_executor", "OpenClaimOffersSearch command received");
+                cb(self._open_claim_offers_search(wallet_handle, &filter_json));
+            }
+            ProverCommand::FetchClaimOffers(search_handle, count, cb) => {
+                info!(target: "prover_command_executor", "FetchClaimOffers command received");
+                cb(self._fetch_claim_offers(search_handle, count));
+            }
+            ProverCommand::CloseClaimOffersSearch(search_handle, cb) => {
+                info!(target: "prover_command_executor", "CloseClaimOffersSearch command received");
+                cb(self._close_claim_offers_search(search_handle));
+            }
+            ProverCommand::OpenClaimsSearch(wallet_handle, filter_json, cb) => {
+                info!(target: "prover_command_executor", "OpenClaimsSearch command received");
+                cb(self._open_claims_search(wallet_handle, &filter_json));
+            }
+            ProverCommand::FetchClaims(search_handle, count, cb) => {
+                info!(target: "prover_command_executor", "FetchClaims command received");
+                cb(self._fetch_claims(search_handle, count));
+            }
+            ProverCommand::CloseClaimsSearch(search_handle, cb) => {
+                info!(target: "prover_command_executor", "CloseClaimsSearch command received");
+                cb(self._close_claims_search(search_handle));
             }
         };
     }
@@ -168,6 +234,18 @@ impl ProverCommandExecutor {
     fn _get_claim_offers(&self,
                          wallet_handle: i32,
                          filter_json: &str) -> Result<String, IndyError> {
+        let claim_offers = self._find_claim_offers(wallet_handle, filter_json)?;
+
+        let claim_offers_json = serde_json::to_string(&claim_offers)
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidState(format!("Invalid claim_offers: {}", err.to_string())))?;
+
+        Ok(claim_offers_json)
+    }
+
+    fn _find_claim_offers(&self,
+                          wallet_handle: i32,
+                          filter_json: &str) -> Result<Vec<ClaimOffer>, IndyError> {
         let claim_offer_jsons: Vec<(String, String)> = self.wallet_service.list(wallet_handle, &format!("claim_offer_json::"))?;
 
         let mut claim_offers: Vec<ClaimOffer> = Vec::new();
@@ -193,11 +271,7 @@ impl ProverCommandExecutor {
             condition
         });
 
-        let claim_offers_json = serde_json::to_string(&claim_offers)
-            .map_err(map_err_trace!())
-            .map_err(|err| CommonError::InvalidState(format!("Invalid claim_offers: {}", err.to_string())))?;
-
-        Ok(claim_offers_json)
+        Ok(claim_offers)
     }
 
     fn create_master_secret(&self,
@@ -358,10 +432,18 @@ impl ProverCommandExecutor {
             .map_err(map_err_trace!())
             .map_err(|err| CommonError::InvalidState(format!("Invalid claim_json: {}", err.to_string())))?;
 
+        self._ensure_claim_index(wallet_handle)?;
+
         let uuid = Uuid::new_v4().to_string();
+        let claim_info = ProverCommandExecutor::get_claim_info(&format!("claim::{}", &uuid), &claim_json.borrow());
+
+        // Wallet has no transactions, so records are written in order that lets
+        // readers detect interrupted store: index entries, claim, claim_info
+        self._index_claim(wallet_handle, &uuid, &claim_info)?;
         self.wallet_service.set(wallet_handle,
                                 &format!("claim::{}", &uuid),
                                 &claim)?;
+        self._set_claim_info(wallet_handle, &uuid, &claim_info)?;
 
         Ok(())
     }
@@ -377,13 +459,13 @@ impl ProverCommandExecutor {
     fn _get_claims(&self,
                    wallet_handle: i32,
                    filter_json: &str) -> Result<String, IndyError> {
-        let claims: Vec<(String, String)> = self.wallet_service.list(wallet_handle, &format!("claim::"))?;
-        let mut claims_info: Vec<ClaimInfo> = ProverCommandExecutor::get_all_claims(claims)?;
-
         let filter = ClaimInfoFilter::from_json(filter_json)
             .map_err(map_err_trace!())
             .map_err(|err| CommonError::InvalidStructure(format!("Invalid filter_json: {}", err.to_string())))?;
 
+        let mut claims_info: Vec<ClaimInfo> =
+            self._find_claims_info(wallet_handle, None, filter.schema_seq_no, filter.issuer_did.as_ref().map(String::as_str))?;
+
         claims_info.retain(move |claim_info| {
             let mut condition = true;
 
@@ -405,27 +487,177 @@ impl ProverCommandExecutor {
         Ok(claims_info_json)
     }
 
-    fn get_all_claims(claims: Vec<(String, String)>) -> Result<Vec<ClaimInfo>, IndyError> {
-        let mut claims_info: Vec<ClaimInfo> = Vec::new();
+    fn get_claim_info(claim_uuid: &str, claim_json: &ClaimJson) -> ClaimInfo {
+        let mut attrs: HashMap<String, String> = HashMap::new();
+
+        for (attr, values) in claim_json.claim.iter() {
+            attrs.insert(attr.clone(), values[1].clone());
+        }
+
+        ClaimInfo::new(claim_uuid.to_string(), attrs, claim_json.revoc_reg_seq_no.clone(),
+                       claim_json.schema_seq_no.clone(), claim_json.issuer_did.clone())
+    }
+
+    // Claims are indexed with wallet records:
+    // claim_info::<uuid> -> ClaimInfo json
+    // claim_index::schema_seq_no::<schema_seq_no>::<uuid> -> uuid
+    // claim_index::issuer_did::<issuer_did>::<uuid> -> uuid
+    // claim_index::attr::<attr_name>::<uuid> -> uuid
+    // so lookups are prefix scans proportional to the number of matched claims.
+    // Existing claim::<uuid> implies all its index entries exist and existing
+    // claim_info::<uuid> implies the claim exists, see _get_claims_info
+    fn _index_claim(&self, wallet_handle: i32, uuid: &str, claim_info: &ClaimInfo) -> Result<(), IndyError> {
+        self.wallet_service.set(wallet_handle, &format!("claim_index::schema_seq_no::{}::{}", claim_info.schema_seq_no, uuid), uuid)?;
+        self.wallet_service.set(wallet_handle, &format!("claim_index::issuer_did::{}::{}", claim_info.issuer_did, uuid), uuid)?;
+
+        for attr_name in claim_info.attrs.keys() {
+            self.wallet_service.set(wallet_handle, &format!("claim_index::attr::{}::{}", attr_name, uuid), uuid)?;
+        }
+
+        Ok(())
+    }
+
+    fn _set_claim_info(&self, wallet_handle: i32, uuid: &str, claim_info: &ClaimInfo) -> Result<(), IndyError> {
+        let claim_info_json = ClaimInfo::to_json(claim_info)
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidState(format!("Invalid claim_info: {}", err.to_string())))?;
 
-        for &(ref uuid, ref claim) in claims.iter() {
-            let claim_json: ClaimJson = ClaimJson::from_json(claim)
+        self.wallet_service.set(wallet_handle, &format!("claim_info::{}", uuid), &claim_info_json)?;
+        Ok(())
+    }
+
+    fn _ensure_claim_index(&self, wallet_handle: i32) -> Result<(), IndyError> {
+        match self.wallet_service.get(wallet_handle, "claim_index_version") {
+            Ok(ref version) if version == CLAIM_INDEX_VERSION => return Ok(()),
+            Ok(_) | Err(WalletError::NotFound(_)) => {}
+            Err(err) => return Err(IndyError::WalletError(err))
+        }
+
+        let claims: Vec<(String, String)> = self.wallet_service.list(wallet_handle, "claim::")?;
+
+        for (claim_uuid, claim) in claims {
+            let claim_json: ClaimJson = ClaimJson::from_json(&claim)
                 .map_err(map_err_trace!())
                 .map_err(|err| CommonError::InvalidState(format!("Invalid claim: {}", err.to_string())))?;
 
-            let mut attrs: HashMap<String, String> = HashMap::new();
+            let claim_info = ProverCommandExecutor::get_claim_info(&claim_uuid, &claim_json);
+            let uuid = &claim_uuid["claim::".len()..];
+            self._index_claim(wallet_handle, uuid, &claim_info)?;
+            self._set_claim_info(wallet_handle, uuid, &claim_info)?;
+        }
+
+        self.wallet_service.set(wallet_handle, "claim_index_version", CLAIM_INDEX_VERSION)?;
+        Ok(())
+    }
 
-            for (attr, values) in claim_json.claim {
-                attrs.insert(attr.clone(), values[1].clone());
-            }
+    fn _list_claim_index(&self, wallet_handle: i32, index_prefix: &str) -> Result<HashSet<String>, IndyError> {
+        let uuids = self.wallet_service.list(wallet_handle, index_prefix)?
+            .into_iter()
+            .map(|(_, uuid)| uuid)
+            .collect();
+        Ok(uuids)
+    }
 
-            claims_info.push(ClaimInfo::new(uuid.clone(), attrs, claim_json.revoc_reg_seq_no.clone(),
-                                            claim_json.schema_seq_no.clone(), claim_json.issuer_did.clone()));
+    // Returns sorted uuids of claims that contain given attribute and were issued
+    // for given schema by given issuer, None criteria matches any claim
+    fn _find_claim_uuids(&self,
+                         wallet_handle: i32,
+                         attr_name: Option<&str>,
+                         schema_seq_no: Option<i32>,
+                         issuer_did: Option<&str>) -> Result<Vec<String>, IndyError> {
+        self._ensure_claim_index(wallet_handle)?;
+
+        let mut index_prefixes: Vec<String> = Vec::new();
+
+        if let Some(attr_name) = attr_name {
+            index_prefixes.push(format!("claim_index::attr::{}::", attr_name));
+        }
+
+        if let Some(schema_seq_no) = schema_seq_no {
+            index_prefixes.push(format!("claim_index::schema_seq_no::{}::", schema_seq_no));
+        }
+
+        if let Some(issuer_did) = issuer_did {
+            index_prefixes.push(format!("claim_index::issuer_did::{}::", issuer_did));
+        }
+
+        if index_prefixes.is_empty() {
+            // Each claim is indexed by schema_seq_no, so it lists all claims
+            index_prefixes.push(format!("claim_index::schema_seq_no::"));
+        }
+
+        let mut uuids: Option<HashSet<String>> = None;
+
+        for index_prefix in index_prefixes {
+            let found = self._list_claim_index(wallet_handle, &index_prefix)?;
+
+            uuids = Some(match uuids {
+                Some(uuids) => uuids.intersection(&found).cloned().collect(),
+                None => found
+            });
+        }
+
+        let mut uuids: Vec<String> = uuids.unwrap_or_default().into_iter().collect();
+        uuids.sort();
+        Ok(uuids)
+    }
+
+    fn _get_claims_info<'a, I>(&self, wallet_handle: i32, uuids: I) -> Result<Vec<ClaimInfo>, IndyError>
+        where I: Iterator<Item=&'a String> {
+        let mut claims_info: Vec<ClaimInfo> = Vec::new();
+
+        for uuid in uuids {
+            match self.wallet_service.get(wallet_handle, &format!("claim_info::{}", uuid)) {
+                Ok(claim_info_json) => claims_info.push(ProverCommandExecutor::_parse_claim_info(&claim_info_json)?),
+                Err(WalletError::NotFound(_)) => {
+                    if let Some(claim_info) = self._repair_claim_info(wallet_handle, uuid)? {
+                        claims_info.push(claim_info);
+                    }
+                }
+                Err(err) => return Err(IndyError::WalletError(err))
+            }
         }
 
         Ok(claims_info)
     }
 
+    // Store of claim was interrupted before claim_info was written. If claim itself
+    // was written its index entries are complete and only claim_info is restored,
+    // otherwise index entries point to not stored claim and are ignored
+    fn _repair_claim_info(&self, wallet_handle: i32, uuid: &str) -> Result<Option<ClaimInfo>, IndyError> {
+        let claim_uuid = format!("claim::{}", uuid);
+
+        let claim = match self.wallet_service.get(wallet_handle, &claim_uuid) {
+            Ok(claim) => claim,
+            Err(WalletError::NotFound(_)) => return Ok(None),
+            Err(err) => return Err(IndyError::WalletError(err))
+        };
+
+        let claim_json = ClaimJson::from_json(&claim)
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidState(format!("Invalid claim: {}", err.to_string())))?;
+
+        let claim_info = ProverCommandExecutor::get_claim_info(&claim_uuid, &claim_json);
+        self._set_claim_info(wallet_handle, uuid, &claim_info)?;
+        Ok(Some(claim_info))
+    }
+
+    fn _find_claims_info(&self,
+                         wallet_handle: i32,
+                         attr_name: Option<&str>,
+                         schema_seq_no: Option<i32>,
+                         issuer_did: Option<&str>) -> Result<Vec<ClaimInfo>, IndyError> {
+        let uuids = self._find_claim_uuids(wallet_handle, attr_name, schema_seq_no, issuer_did)?;
+        self._get_claims_info(wallet_handle, uuids.iter())
+    }
+
+    fn _parse_claim_info(claim_info_json: &str) -> Result<ClaimInfo, IndyError> {
+        let claim_info = ClaimInfo::from_json(claim_info_json)
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidState(format!("Invalid claim_info: {}", err.to_string())))?;
+        Ok(claim_info)
+    }
+
     fn get_claims_for_proof_req(&self,
                                 wallet_handle: i32,
                                 proof_req_json: &str,
@@ -441,8 +673,29 @@ impl ProverCommandExecutor {
             .map_err(map_err_trace!())
             .map_err(|err| CommonError::InvalidStructure(format!("Invalid proof_req_json: {}", err.to_string())))?;
 
-        let claims: Vec<(String, String)> = self.wallet_service.list(wallet_handle, &format!("claim::"))?;
-        let claims_info: Vec<ClaimInfo> = ProverCommandExecutor::get_all_claims(claims)?;
+        // Only claims matched by indexes for any of requested attributes and predicates are checked
+        let mut claims_info: HashMap<String, ClaimInfo> = HashMap::new();
+
+        for attribute_info in proof_req.requested_attrs.values() {
+            for claim_info in self._find_claims_info(wallet_handle,
+                                                     Some(&attribute_info.name),
+                                                     attribute_info.schema_seq_no,
+                                                     attribute_info.issuer_did.as_ref().map(String::as_str))? {
+                claims_info.insert(claim_info.claim_uuid.clone(), claim_info);
+            }
+        }
+
+        for predicate in proof_req.requested_predicates.values() {
+            for claim_info in self._find_claims_info(wallet_handle,
+                                                     Some(&predicate.attr_name),
+                                                     predicate.schema_seq_no,
+                                                     predicate.issuer_did.as_ref().map(String::as_str))? {
+                claims_info.insert(claim_info.claim_uuid.clone(), claim_info);
+            }
+        }
+
+        let mut claims_info: Vec<ClaimInfo> = claims_info.into_iter().map(|(_, claim_info)| claim_info).collect();
+        claims_info.sort_by(|a, b| a.claim_uuid.cmp(&b.claim_uuid));
 
         let (attributes, predicates) =
             self.anoncreds_service.prover.find_claims(
@@ -456,27 +709,163 @@ impl ProverCommandExecutor {
 
         Ok(proof_claims_json)
     }
+    fn _open_claim_offers_search(&self, wallet_handle: i32, filter_json: &str) -> Result<i32, IndyError> {
+        let claim_offers = self._find_claim_offers(wallet_handle, filter_json)?;
+
+        let search_handle = SequenceUtils::get_next_id();
+        self.searches.borrow_mut().insert(search_handle, ProverSearch::ClaimOffers(claim_offers.into_iter().collect()));
+        Ok(search_handle)
+    }
+
+    fn _fetch_claim_offers(&self, search_handle: i32, count: usize) -> Result<String, IndyError> {
+        let claim_offers: Vec<ClaimOffer> = match self.searches.borrow_mut().get_mut(&search_handle) {
+            Some(&mut ProverSearch::ClaimOffers(ref mut claim_offers)) => {
+                let count = ::std::cmp::min(count, claim_offers.len());
+                claim_offers.drain(..count).collect()
+            }
+            _ => return Err(IndyError::CommonError(
+                CommonError::InvalidStructure(format!("Invalid claim offers search handle: {}", search_handle))))
+        };
+
+        let claim_offers_json = serde_json::to_string(&claim_offers)
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidState(format!("Invalid claim_offers: {}", err.to_string())))?;
+
+        Ok(claim_offers_json)
+    }
+
+    fn _open_claims_search(&self, wallet_handle: i32, filter_json: &str) -> Result<i32, IndyError> {
+        let filter = ClaimInfoFilter::from_json(filter_json)
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidStructure(format!("Invalid filter_json: {}", err.to_string())))?;
+
+        let uuids = self._find_claim_uuids(wallet_handle, None, filter.schema_seq_no, filter.issuer_did.as_ref().map(String::as_str))?;
+
+        let search_handle = SequenceUtils::get_next_id();
+        self.searches.borrow_mut().insert(search_handle, ProverSearch::Claims(wallet_handle, uuids.into_iter().collect()));
+        Ok(search_handle)
+    }
+
+    fn _fetch_claims(&self, search_handle: i32, count: usize) -> Result<String, IndyError> {
+        let (wallet_handle, uuids): (i32, Vec<String>) = match self.searches.borrow_mut().get_mut(&search_handle) {
+            Some(&mut ProverSearch::Claims(wallet_handle, ref mut uuids)) => {
+                let count = ::std::cmp::min(count, uuids.len());
+                (wallet_handle, uuids.drain(..count).collect())
+            }
+            _ => return Err(IndyError::CommonError(
+                CommonError::InvalidStructure(format!("Invalid claims search handle: {}", search_handle))))
+        };
+
+        let claims_info = self._get_claims_info(wallet_handle, uuids.iter())?;
+
+        let claims_info_json = serde_json::to_string(&claims_info)
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidState(format!("Invalid claim_info: {}", err.to_string())))?;
+
+        Ok(claims_info_json)
+    }
+
+    fn _close_claim_offers_search(&self, search_handle: i32) -> Result<(), IndyError> {
+        let mut searches = self.searches.borrow_mut();
+
+        match searches.get(&search_handle) {
+            Some(&ProverSearch::ClaimOffers(_)) => {}
+            _ => return Err(IndyError::CommonError(
+                CommonError::InvalidStructure(format!("Invalid claim offers search handle: {}", search_handle))))
+        }
+
+        searches.remove(&search_handle);
+        Ok(())
+    }
+
+    fn _close_claims_search(&self, search_handle: i32) -> Result<(), IndyError> {
+        let mut searches = self.searches.borrow_mut();
+
+        match searches.get(&search_handle) {
+            Some(&ProverSearch::Claims(_, _)) => {}
+            _ => return Err(IndyError::CommonError(
+                CommonError::InvalidStructure(format!("Invalid claims search handle: {}", search_handle))))
+        }
+
+        searches.remove(&search_handle);
+        Ok(())
+    }
+
+    // Claims searches read claims from their wallet on fetch,
+    // so they can't outlive the wallet and are dropped with it
+    pub fn close_wallet_searches(&self, wallet_handle: i32) {
+        self.searches.borrow_mut().retain(|_, search| match *search {
+            ProverSearch::Claims(search_wallet_handle, _) => search_wallet_handle != wallet_handle,
+            ProverSearch::ClaimOffers(_) => true
+        });
+    }
+
     fn create_proof(&self,
                     wallet_handle: i32,
-                    proof_req_json: &str,
-                    requested_claims_json: &str,
-                    schemas_jsons: &str,
+                    proof_req_json: String,
+                    requested_claims_json: String,
+                    schemas_jsons: String,
                     master_secret_name: &str,
-                    claim_def_jsons: &str,
-                    revoc_regs_jsons: &str,
+                    claim_def_jsons: String,
+                    revoc_regs_jsons: String,
                     cb: Box<Fn(Result<String, IndyError>) + Send>) {
-        let result = self._create_proof(wallet_handle, proof_req_json, requested_claims_json, schemas_jsons, master_secret_name, claim_def_jsons, revoc_regs_jsons);
-        cb(result)
+        // Wallet records are read in command executor thread and proof itself
+        // is built in thread pool, so it doesn't block other commands
+        let (claim_jsons, ms, tails_json) =
+            match self._get_proof_wallet_records(wallet_handle, master_secret_name, &claim_def_jsons, &revoc_regs_jsons) {
+                Ok(records) => records,
+                Err(err) => return cb(Err(err))
+            };
+
+        self.thread_pool.execute(move || {
+            let prover = Prover::new();
+            let result = ProverCommandExecutor::_create_proof(&prover, &proof_req_json, &requested_claims_json, &schemas_jsons,
+                                                              &claim_def_jsons, &revoc_regs_jsons, claim_jsons, &ms, tails_json);
+            cb(result)
+        });
     }
 
-    fn _create_proof(&self,
-                     wallet_handle: i32,
+    fn _get_proof_wallet_records(&self,
+                                 wallet_handle: i32,
+                                 master_secret_name: &str,
+                                 claim_def_jsons: &str,
+                                 revoc_regs_jsons: &str) -> Result<(HashMap<String, String>, String, Option<String>), IndyError> {
+        let claim_defs: HashMap<String, serde_json::Value> = serde_json::from_str(claim_def_jsons)
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidStructure(format!("Invalid claim_def_jsons: {}", err.to_string())))?;
+
+        let revoc_regs: HashMap<String, serde_json::Value> = serde_json::from_str(revoc_regs_jsons)
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidStructure(format!("Invalid revoc_regs_jsons: {}", err.to_string())))?;
+
+        let mut claim_jsons: HashMap<String, String> = HashMap::new();
+
+        for claim_uuid in claim_defs.keys() {
+            let claim_json = self.wallet_service.get(wallet_handle, &claim_uuid)?;
+            claim_jsons.insert(claim_uuid.clone(), claim_json);
+        }
+
+        let ms = self.wallet_service.get(wallet_handle, &format!("master_secret::{}", master_secret_name))?;
+
+        let tails_json = if revoc_regs.len() > 0 {
+            // TODO: need to change
+            Some(self.wallet_service.get(wallet_handle, &format!("tails"))?)
+        } else {
+            None
+        };
+
+        Ok((claim_jsons, ms, tails_json))
+    }
+
+    fn _create_proof(prover: &Prover,
                      proof_req_json: &str,
                      requested_claims_json: &str,
                      schemas_jsons: &str,
-                     master_secret_name: &str,
                      claim_def_jsons: &str,
-                     revoc_regs_jsons: &str) -> Result<String, IndyError> {
+                     revoc_regs_jsons: &str,
+                     claim_jsons: HashMap<String, String>,
+                     ms: &str,
+                     tails_json: Option<String>) -> Result<String, IndyError> {
         let proof_req: ProofRequestJson = ProofRequestJson::from_json(proof_req_json)
             .map_err(map_err_trace!())
             .map_err(|err| CommonError::InvalidStructure(format!("Invalid proof_req_json: {}", err.to_string())))?;
@@ -499,36 +888,31 @@ impl ProverCommandExecutor {
 
         let mut claims: HashMap<String, ClaimJson> = HashMap::new();
 
-        for claim_uuid in claim_defs.keys() {
-            let claim_json = self.wallet_service.get(wallet_handle, &claim_uuid)?;
+        for (claim_uuid, claim_json) in claim_jsons {
             let claim = ClaimJson::from_json(&claim_json)
                 .map_err(map_err_trace!())
                 .map_err(|err| CommonError::InvalidState(format!("Invalid claim_json: {}", err.to_string())))?;
 
-            claims.insert(claim_uuid.clone(), claim);
+            claims.insert(claim_uuid, claim);
         }
 
-        let ms = self.wallet_service.get(wallet_handle, &format!("master_secret::{}", master_secret_name))?;
-
-        let ms: BigNumber = BigNumber::from_dec(&ms)?;
+        let ms: BigNumber = BigNumber::from_dec(ms)?;
 
         let mut tails: HashMap<i32, PointG2> = HashMap::new();
-        if revoc_regs.len() > 0 {
-            // TODO: need to change
-            let tails_json = self.wallet_service.get(wallet_handle, &format!("tails"))?;
+        if let Some(tails_json) = tails_json {
             tails = serde_json::from_str(&tails_json)
                 .map_err(map_err_trace!())
                 .map_err(|err| CommonError::InvalidState(format!("Invalid tails_json: {}", err.to_string())))?;
         }
 
-        let proof_claims = self.anoncreds_service.prover.create_proof(claims,
-                                                                      &proof_req,
-                                                                      &schemas,
-                                                                      &claim_defs,
-                                                                      &revoc_regs,
-                                                                      &requested_claims,
-                                                                      &ms,
-                                                                      &tails)?;
+        let proof_claims = prover.create_proof(claims,
+                                               &proof_req,
+                                               &schemas,
+                                               &claim_defs,
+                                               &revoc_regs,
+                                               &requested_claims,
+                                               &ms,
+                                               &tails)?;
 
         let proof_claims_json = ProofJson::to_json(&proof_claims)
             .map_err(map_err_trace!())
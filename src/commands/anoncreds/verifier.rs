@@ -4,10 +4,12 @@ use errors::common::CommonError;
 use errors::indy::IndyError;
 
 use services::anoncreds::AnoncredsService;
+use services::anoncreds::verifier::Verifier;
 use services::pool::PoolService;
 use services::wallet::WalletService;
 use services::anoncreds::types::{
     ClaimDefinition,
+    ClaimProof,
     Schema,
     ProofRequestJson,
     ProofJson,
@@ -15,7 +17,12 @@ use services::anoncreds::types::{
     RevocationRegistry};
 use std::collections::{HashMap, HashSet};
 use std::rc::Rc;
+use std::sync::{Arc, Mutex};
+use utils::crypto::bn::BigNumber;
 use utils::json::JsonDecodable;
+use utils::threadpool::ThreadPool;
+
+use self::serde_json::Value;
 
 pub enum VerifierCommand {
     VerifyProof(
@@ -24,23 +31,60 @@ pub enum VerifierCommand {
         String, // schemas json
         String, // claim defs jsons
         String, // revoc regs json
-        Box<Fn(Result<bool, IndyError>) + Send>)
+        Box<Fn(Result<bool, IndyError>) + Send>),
+    VerifyProofs(
+        String, // proofs json
+        Box<Fn(Result<String, IndyError>) + Send>)
+}
+
+// Data required to calculate tau list of one claim proof. Sub-proofs of
+// different claims are independent, so they are calculated in parallel.
+// Json values are passed to thread pool and parsed there.
+struct ClaimProofTask {
+    proof_uuid: String,
+    claim_proof: Value,
+    c_hash: Value,
+    claim_def: Value,
+    schema: Value,
+    revoc_reg: Option<Value>
+}
+
+// State of proof verification shared between claim proof tasks,
+// the last finished task checks the whole proof and calls callback
+struct ProofVerification {
+    proof_request_json: String,
+    proof_json: String,
+    pending: usize,
+    tau_lists: HashMap<String, Vec<Vec<u8>>>,
+    error: Option<IndyError>,
+    cb: Box<Fn(Result<bool, IndyError>) + Send>
+}
+
+// Results of proofs batch verification, proof that can't be verified
+// is reported as invalid and doesn't fail the whole batch
+struct ProofsVerification {
+    pending: usize,
+    results: Vec<bool>,
+    cb: Box<Fn(Result<String, IndyError>) + Send>
 }
 
 pub struct VerifierCommandExecutor {
     anoncreds_service: Rc<AnoncredsService>,
     pool_service: Rc<PoolService>,
-    wallet_service: Rc<WalletService>
+    wallet_service: Rc<WalletService>,
+    thread_pool: Rc<ThreadPool>
 }
 
 impl VerifierCommandExecutor {
     pub fn new(anoncreds_service: Rc<AnoncredsService>,
                pool_service: Rc<PoolService>,
-               wallet_service: Rc<WalletService>) -> VerifierCommandExecutor {
+               wallet_service: Rc<WalletService>,
+               thread_pool: Rc<ThreadPool>) -> VerifierCommandExecutor {
         VerifierCommandExecutor {
             anoncreds_service: anoncreds_service,
             pool_service: pool_service,
             wallet_service: wallet_service,
+            thread_pool: thread_pool,
         }
     }
 
@@ -50,45 +94,236 @@ impl VerifierCommandExecutor {
                                          proof_json, schemas_json,
                                          claim_defs_jsons, revoc_regs_json, cb) => {
                 info!(target: "verifier_command_executor", "VerifyProof command received");
-                self.verify_proof(&proof_request_json, &proof_json, &schemas_json,
-                                  &claim_defs_jsons, &revoc_regs_json, cb);
+                self.verify_proof(proof_request_json, proof_json, schemas_json,
+                                  claim_defs_jsons, revoc_regs_json, cb);
+            }
+            VerifierCommand::VerifyProofs(proofs_json, cb) => {
+                info!(target: "verifier_command_executor", "VerifyProofs command received");
+                self.verify_proofs(&proofs_json, cb);
             }
         };
     }
 
     fn verify_proof(&self,
-                    proof_request_json: &str,
-                    proof_json: &str,
-                    schemas_json: &str,
-                    claim_defs_jsons: &str,
-                    revoc_regs_json: &str,
+                    proof_request_json: String,
+                    proof_json: String,
+                    schemas_json: String,
+                    claim_defs_jsons: String,
+                    revoc_regs_json: String,
                     cb: Box<Fn(Result<bool, IndyError>) + Send>) {
-        let result = self._verify_proof(proof_request_json, proof_json, schemas_json, claim_defs_jsons, revoc_regs_json);
-        cb(result)
+        // Verification doesn't touch wallets, so it is completely moved to thread pool.
+        // Claim proofs are verified by separate tasks to use all pool threads for multi-claim proofs
+        let tasks = match VerifierCommandExecutor::_split_proof(&proof_json, &schemas_json, &claim_defs_jsons, &revoc_regs_json) {
+            Ok(tasks) => tasks,
+            Err(err) => return cb(Err(err))
+        };
+
+        let verification = Arc::new(Mutex::new(ProofVerification {
+            proof_request_json: proof_request_json,
+            proof_json: proof_json,
+            pending: tasks.len(),
+            tau_lists: HashMap::new(),
+            error: None,
+            cb: cb
+        }));
+
+        if tasks.is_empty() {
+            return self.thread_pool.execute(move || VerifierCommandExecutor::_complete_proof_verification(&verification));
+        }
+
+        for task in tasks {
+            let verification = verification.clone();
+
+            self.thread_pool.execute(move || {
+                let result = VerifierCommandExecutor::_calc_claim_tau_list(&task);
+                VerifierCommandExecutor::_complete_claim_proof_task(&verification, task.proof_uuid, result);
+            });
+        }
     }
 
-    fn _verify_proof(&self,
-                     proof_request_json: &str,
-                     proof_json: &str,
-                     schemas_json: &str,
-                     claim_defs_jsons: &str,
-                     revoc_regs_json: &str) -> Result<bool, IndyError> {
-        let proof_req: ProofRequestJson = ProofRequestJson::from_json(proof_request_json)
+    fn verify_proofs(&self,
+                     proofs_json: &str,
+                     cb: Box<Fn(Result<String, IndyError>) + Send>) {
+        let proofs: Vec<Value> = match serde_json::from_str(proofs_json) {
+            Ok(proofs) => proofs,
+            Err(err) => return cb(Err(IndyError::CommonError(
+                CommonError::InvalidStructure(format!("Invalid proofs_json: {}", err.to_string())))))
+        };
+
+        if proofs.is_empty() {
+            return cb(Ok("[]".to_string()));
+        }
+
+        let verification = Arc::new(Mutex::new(ProofsVerification {
+            pending: proofs.len(),
+            results: vec![false; proofs.len()],
+            cb: cb
+        }));
+
+        for (index, proof) in proofs.iter().enumerate() {
+            let verification = verification.clone();
+
+            let cb = Box::new(move |result: Result<bool, IndyError>| {
+                let mut verification = verification.lock().unwrap();
+
+                match result {
+                    Ok(valid) => verification.results[index] = valid,
+                    Err(err) => warn!("Proof {} of batch can't be verified: {:?}", index, err)
+                }
+
+                verification.pending -= 1;
+
+                if verification.pending == 0 {
+                    let result = serde_json::to_string(&verification.results)
+                        .map_err(|err| IndyError::CommonError(
+                            CommonError::InvalidState(format!("Invalid verification results: {}", err.to_string()))));
+
+                    (verification.cb)(result);
+                }
+            });
+
+            let fields: Result<Vec<String>, IndyError> =
+                ["proof_request", "proof", "schemas", "claim_defs", "revoc_regs"].iter()
+                    .map(|field|
+                        proof.get(*field)
+                            .map(|value| value.to_string())
+                            .ok_or(IndyError::CommonError(
+                                CommonError::InvalidStructure(format!("Field {} is not found in proofs_json item", field)))))
+                    .collect();
+
+            match fields {
+                Ok(mut fields) => {
+                    let revoc_regs_json = fields.pop().unwrap();
+                    let claim_defs_jsons = fields.pop().unwrap();
+                    let schemas_json = fields.pop().unwrap();
+                    let proof_json = fields.pop().unwrap();
+                    let proof_request_json = fields.pop().unwrap();
+
+                    self.verify_proof(proof_request_json, proof_json, schemas_json, claim_defs_jsons, revoc_regs_json, cb);
+                }
+                Err(err) => cb(Err(err))
+            }
+        }
+    }
+
+    fn _split_proof(proof_json: &str,
+                    schemas_json: &str,
+                    claim_defs_jsons: &str,
+                    revoc_regs_json: &str) -> Result<Vec<ClaimProofTask>, IndyError> {
+        let proof: Value = serde_json::from_str(proof_json)
             .map_err(map_err_trace!())
-            .map_err(|err| CommonError::InvalidStructure(format!("Invalid proof_request_json: {}", err.to_string())))?;
+            .map_err(|err| CommonError::InvalidStructure(format!("Invalid proof_json: {}", err.to_string())))?;
 
-        let schemas: HashMap<String, Schema> = serde_json::from_str(schemas_json)
+        let schemas: HashMap<String, Value> = serde_json::from_str(schemas_json)
             .map_err(map_err_trace!())
             .map_err(|err| CommonError::InvalidStructure(format!("Invalid schemas_json: {}", err.to_string())))?;
 
-        let claim_defs: HashMap<String, ClaimDefinition> = serde_json::from_str(claim_defs_jsons)
+        let mut claim_defs: HashMap<String, Value> = serde_json::from_str(claim_defs_jsons)
             .map_err(map_err_trace!())
             .map_err(|err| CommonError::InvalidStructure(format!("Invalid claim_defs_jsons: {}", err.to_string())))?;
 
-        let revoc_regs: HashMap<String, RevocationRegistry> = serde_json::from_str(revoc_regs_json)
+        let mut revoc_regs: HashMap<String, Value> = serde_json::from_str(revoc_regs_json)
             .map_err(map_err_trace!())
             .map_err(|err| CommonError::InvalidStructure(format!("Invalid revoc_regs_json: {}", err.to_string())))?;
 
+        let claim_proofs = proof["proofs"].as_object()
+            .ok_or(CommonError::InvalidStructure(format!("Invalid proof_json: proofs not found")))?;
+
+        let c_hash = &proof["aggregated_proof"]["c_hash"];
+
+        let mut tasks: Vec<ClaimProofTask> = Vec::new();
+
+        for (proof_uuid, claim_proof) in claim_proofs {
+            let claim_def = claim_defs.remove(proof_uuid)
+                .ok_or(CommonError::InvalidStructure(format!("Claim definition is not found")))?;
+            let schema = schemas.get(proof_uuid)
+                .ok_or(CommonError::InvalidStructure(format!("Schema is not found")))?;
+
+            tasks.push(ClaimProofTask {
+                proof_uuid: proof_uuid.clone(),
+                claim_proof: claim_proof.clone(),
+                c_hash: c_hash.clone(),
+                claim_def: claim_def,
+                schema: schema.clone(),
+                revoc_reg: revoc_regs.remove(proof_uuid)
+            });
+        }
+
+        Ok(tasks)
+    }
+
+    fn _calc_claim_tau_list(task: &ClaimProofTask) -> Result<Vec<Vec<u8>>, IndyError> {
+        let claim_proof: ClaimProof = serde_json::from_value(task.claim_proof.clone())
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidStructure(format!("Invalid proof_json: {}", err.to_string())))?;
+
+        let c_hash: BigNumber = serde_json::from_value(task.c_hash.clone())
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidStructure(format!("Invalid proof_json: {}", err.to_string())))?;
+
+        let claim_def: ClaimDefinition = serde_json::from_value(task.claim_def.clone())
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidStructure(format!("Invalid claim_defs_jsons: {}", err.to_string())))?;
+
+        let schema: Schema = serde_json::from_value(task.schema.clone())
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidStructure(format!("Invalid schemas_json: {}", err.to_string())))?;
+
+        let revoc_reg: Option<RevocationRegistry> = match task.revoc_reg {
+            Some(ref revoc_reg) => Some(serde_json::from_value(revoc_reg.clone())
+                .map_err(map_err_trace!())
+                .map_err(|err| CommonError::InvalidStructure(format!("Invalid revoc_regs_json: {}", err.to_string())))?),
+            None => None
+        };
+
+        let tau_list = Verifier::calc_claim_tau_list(&claim_proof, &c_hash, &claim_def, &schema, revoc_reg.as_ref())?;
+
+        Ok(tau_list)
+    }
+
+    fn _complete_claim_proof_task(verification: &Arc<Mutex<ProofVerification>>,
+                                  proof_uuid: String,
+                                  result: Result<Vec<Vec<u8>>, IndyError>) {
+        let is_last = {
+            let mut verification = verification.lock().unwrap();
+
+            match result {
+                Ok(tau_list) => { verification.tau_lists.insert(proof_uuid, tau_list); }
+                Err(err) => if verification.error.is_none() { verification.error = Some(err) }
+            }
+
+            verification.pending -= 1;
+            verification.pending == 0
+        };
+
+        if is_last {
+            VerifierCommandExecutor::_complete_proof_verification(verification);
+        }
+    }
+
+    fn _complete_proof_verification(verification: &Arc<Mutex<ProofVerification>>) {
+        let mut verification = verification.lock().unwrap();
+        let error = verification.error.take();
+
+        let result = match error {
+            Some(err) => Err(err),
+            None => VerifierCommandExecutor::_verify_proof(&Verifier::new(),
+                                                           &verification.proof_request_json,
+                                                           &verification.proof_json,
+                                                           &verification.tau_lists)
+        };
+
+        (verification.cb)(result);
+    }
+
+    fn _verify_proof(verifier: &Verifier,
+                     proof_request_json: &str,
+                     proof_json: &str,
+                     tau_lists: &HashMap<String, Vec<Vec<u8>>>) -> Result<bool, IndyError> {
+        let proof_req: ProofRequestJson = ProofRequestJson::from_json(proof_request_json)
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidStructure(format!("Invalid proof_request_json: {}", err.to_string())))?;
+
         let proof_claims: ProofJson = ProofJson::from_json(&proof_json)
             .map_err(map_err_trace!())
             .map_err(|err| CommonError::InvalidStructure(format!("Invalid proof_json: {}", err.to_string())))?;
@@ -144,11 +379,16 @@ impl VerifierCommandExecutor {
                 format!("Requested predicates {:?} do not correspond to received {:?}", requested_predicates, received_predicates))))
         }
 
-        let result = self.anoncreds_service.verifier.verify(&proof_claims,
-                                                            &proof_req.nonce,
-                                                            &claim_defs,
-                                                            &revoc_regs,
-                                                            &schemas)?;
+        // Tau lists are joined in the same order as claim proofs are iterated by Verifier::verify
+        let mut tau_list: Vec<Vec<u8>> = Vec::new();
+
+        for proof_uuid in proof_claims.proofs.keys() {
+            let claim_tau_list = tau_lists.get(proof_uuid)
+                .ok_or(CommonError::InvalidStructure(format!("Claim proof is not verified: {}", proof_uuid)))?;
+            tau_list.extend_from_slice(claim_tau_list);
+        }
+
+        let result = verifier.verify_tau_list(&proof_claims, &proof_req.nonce, tau_list)?;
 
         Ok(result)
     }
@@ -27,6 +27,9 @@ use services::wallet::WalletService;
 use services::signus::SignusService;
 use services::ledger::LedgerService;
 
+use utils::threadpool::ThreadPool;
+
+use std::env;
 use std::error::Error;
 use std::sync::mpsc::{Sender, channel};
 use std::rc::Rc;
@@ -48,6 +51,11 @@ pub struct CommandExecutor {
     sender: Sender<Command>
 }
 
+// Number of threads used for CPU-heavy commands (proof creation and verification).
+// Can be overridden with INDY_COMMAND_THREADS env variable, 0 means all commands
+// are executed in the command executor thread
+const DEFAULT_COMMAND_THREADS: usize = 4;
+
 // Global (lazy inited) instance of CommandExecutor
 lazy_static! {
     static ref COMMAND_EXECUTOR: Mutex<CommandExecutor> = Mutex::new(CommandExecutor::new());
@@ -73,10 +81,11 @@ impl CommandExecutor {
                 let wallet_service = Rc::new(WalletService::new());
                 let signus_service = Rc::new(SignusService::new());
                 let ledger_service = Rc::new(LedgerService::new());
+                let thread_pool = Rc::new(ThreadPool::new(CommandExecutor::_command_threads()));
 
                 let agent_command_executor = AgentCommandExecutor::new(agent_service.clone(), ledger_service.clone(), pool_service.clone(), wallet_service.clone());
-                let anoncreds_command_executor = AnoncredsCommandExecutor::new(anoncreds_service.clone(), pool_service.clone(), wallet_service.clone());
-                let ledger_command_executor = LedgerCommandExecutor::new(anoncreds_service.clone(), pool_service.clone(), signus_service.clone(), wallet_service.clone(), ledger_service.clone());
+                let anoncreds_command_executor = AnoncredsCommandExecutor::new(anoncreds_service.clone(), pool_service.clone(), wallet_service.clone(), thread_pool.clone());
+                let ledger_command_executor = LedgerCommandExecutor::new(anoncreds_service.clone(), pool_service.clone(), signus_service.clone(), wallet_service.clone());
                 let pool_command_executor = PoolCommandExecutor::new(pool_service.clone());
                 let signus_command_executor = SignusCommandExecutor::new(anoncreds_service.clone(), pool_service.clone(), wallet_service.clone(), signus_service.clone(), ledger_service.clone());
                 let wallet_command_executor = WalletCommandExecutor::new(wallet_service.clone());
@@ -105,7 +114,16 @@ impl CommandExecutor {
                         }
                         Ok(Command::Wallet(cmd)) => {
                             info!(target: "command_executor", "WalletCommand command received");
+                            let closed_wallet_handle = match cmd {
+                                WalletCommand::Close(wallet_handle, _) => Some(wallet_handle),
+                                _ => None
+                            };
+
                             wallet_command_executor.execute(cmd);
+
+                            if let Some(wallet_handle) = closed_wallet_handle {
+                                anoncreds_command_executor.close_wallet_searches(wallet_handle);
+                            }
                         }
                         Ok(Command::Exit) => {
                             info!(target: "command_executor", "Exit command received");
@@ -125,6 +143,12 @@ impl CommandExecutor {
         self.sender.send(cmd).map_err(|err|
             CommonError::InvalidState(err.description().to_string()))
     }
+
+    fn _command_threads() -> usize {
+        env::var("INDY_COMMAND_THREADS").ok()
+            .and_then(|threads| threads.parse::<usize>().ok())
+            .unwrap_or(DEFAULT_COMMAND_THREADS)
+    }
 }
 
 impl Drop for CommandExecutor {
@@ -28,6 +28,10 @@ pub enum PoolCommand {
             Box<Fn(Result<(), IndyError>) + Send>),
     RefreshAck(i32,
                Result<(), PoolError>),
+    GetStats(i32, // pool handle
+             Box<Fn(Result<String, IndyError>) + Send>),
+    GetStatsAck(i32,
+                Result<String /* stats json */, PoolError>),
 }
 
 pub struct PoolCommandExecutor {
@@ -35,6 +39,7 @@ pub struct PoolCommandExecutor {
     close_callbacks: RefCell<HashMap<i32, Box<Fn(Result<(), IndyError>)>>>,
     refresh_callbacks: RefCell<HashMap<i32, Box<Fn(Result<(), IndyError>)>>>,
     open_callbacks: RefCell<HashMap<i32, Box<Fn(Result<i32, IndyError>)>>>,
+    stats_callbacks: RefCell<HashMap<i32, Box<Fn(Result<String, IndyError>)>>>,
 }
 
 impl PoolCommandExecutor {
@@ -44,6 +49,7 @@ impl PoolCommandExecutor {
             close_callbacks: RefCell::new(HashMap::new()),
             refresh_callbacks: RefCell::new(HashMap::new()),
             open_callbacks: RefCell::new(HashMap::new()),
+            stats_callbacks: RefCell::new(HashMap::new()),
         }
     }
 
@@ -115,6 +121,25 @@ impl PoolCommandExecutor {
                     Err(err) => { error!("{:?}", err); }
                 }
             }
+            PoolCommand::GetStats(handle, cb) => {
+                info!(target: "pool_command_executor", "GetStats command received");
+                self.get_stats(handle, cb);
+            }
+            PoolCommand::GetStatsAck(handle, result) => {
+                info!(target: "pool_command_executor", "GetStatsAck command received");
+                match self.stats_callbacks.try_borrow_mut() {
+                    Ok(mut cbs) => {
+                        match cbs.remove(&handle) {
+                            Some(cb) => cb(result.map_err(IndyError::from)),
+                            None => {
+                                error!("Can't process PoolCommand::GetStatsAck for handle {} with result {:?} - appropriate callback not found!",
+                                handle, result);
+                            }
+                        }
+                    }
+                    Err(err) => { error!("{:?}", err); }
+                }
+            }
         };
     }
 
@@ -170,4 +195,19 @@ impl PoolCommandExecutor {
             Ok((mut cbs, handle)) => { cbs.insert(handle, cb); /* TODO check if map contains same key */ }
         };
     }
+
+    fn get_stats(&self, handle: i32, cb: Box<Fn(Result<String, IndyError>) + Send>) {
+        let result = self.pool_service.get_stats(handle)
+            .map_err(From::from)
+            .and_then(|handle| {
+                match self.stats_callbacks.try_borrow_mut() {
+                    Ok(cbs) => Ok((cbs, handle)),
+                    Err(err) => Err(IndyError::PoolError(PoolError::from(CommonError::from(err))))
+                }
+            });
+        match result {
+            Err(err) => { cb(Err(err)); }
+            Ok((mut cbs, handle)) => { cbs.insert(handle, cb); }
+        };
+    }
 }
\ No newline at end of file
@@ -1,3 +1,5 @@
+extern crate serde_json;
+
 use utils::json::{JsonDecodable, JsonEncodable};
 use errors::signus::SignusError;
 use errors::common::CommonError;
@@ -42,6 +44,16 @@ pub enum SignusCommand {
         String, // did
         String, // msg
         Box<Fn(Result<String, IndyError>) + Send>),
+    SignBytes(
+        i32, // wallet handle
+        String, // did
+        Vec<u8>, // msg
+        Box<Fn(Result<Vec<u8>, IndyError>) + Send>),
+    SignBatch(
+        i32, // wallet handle
+        String, // did
+        String, // msgs json
+        Box<Fn(Result<String, IndyError>) + Send>),
     //TODO divide on two commands
     VerifySignature(
         i32, // wallet handle
@@ -49,6 +61,16 @@ pub enum SignusCommand {
         String, // did
         String, // signed message
         Box<Fn(Result<bool, IndyError>) + Send>),
+    VerifySignatureBytes(
+        i32, // wallet handle
+        String, // did
+        Vec<u8>, // msg
+        Vec<u8>, // signature
+        Box<Fn(Result<bool, IndyError>) + Send>),
+    VerifySignaturesBatch(
+        i32, // wallet handle
+        String, // signed messages json
+        Box<Fn(Result<String, IndyError>) + Send>),
     VerifySignatureGetNymAck(
         i32, // wallet handle
         String, // signed message
@@ -74,7 +96,20 @@ pub enum SignusCommand {
         String, // did
         String, // encrypted msg
         String, // nonce
-        Box<Fn(Result<String, IndyError>) + Send>)
+        Box<Fn(Result<String, IndyError>) + Send>),
+    EncryptBytes(
+        i32, // wallet handle
+        String, // my_did
+        String, // did
+        Vec<u8>, // msg
+        Box<Fn(Result<(Vec<u8>, Vec<u8>), IndyError>) + Send>),
+    DecryptBytes(
+        i32, // wallet handle
+        String, // my_did
+        String, // did
+        Vec<u8>, // encrypted msg
+        Vec<u8>, // nonce
+        Box<Fn(Result<Vec<u8>, IndyError>) + Send>)
 }
 
 pub struct SignusCommandExecutor {
@@ -123,10 +158,26 @@ impl SignusCommandExecutor {
                 info!(target: "signus_command_executor", "Sign command received");
                 self.sign(wallet_handle, &did, &msg, cb);
             }
+            SignusCommand::SignBytes(wallet_handle, did, msg, cb) => {
+                info!(target: "signus_command_executor", "SignBytes command received");
+                cb(self._sign_bytes(wallet_handle, &did, &msg));
+            }
+            SignusCommand::SignBatch(wallet_handle, did, msgs_json, cb) => {
+                info!(target: "signus_command_executor", "SignBatch command received");
+                self.sign_batch(wallet_handle, &did, &msgs_json, cb);
+            }
             SignusCommand::VerifySignature(wallet_handle, pool_handle, did, signed_msg, cb) => {
                 info!(target: "signus_command_executor", "VerifySignature command received");
                 self.verify_signature(wallet_handle, pool_handle, &did, &signed_msg, cb);
             }
+            SignusCommand::VerifySignatureBytes(wallet_handle, did, msg, signature, cb) => {
+                info!(target: "signus_command_executor", "VerifySignatureBytes command received");
+                cb(self._verify_signature_bytes(wallet_handle, &did, &msg, &signature));
+            }
+            SignusCommand::VerifySignaturesBatch(wallet_handle, signed_msgs_json, cb) => {
+                info!(target: "signus_command_executor", "VerifySignaturesBatch command received");
+                self.verify_signatures_batch(wallet_handle, &signed_msgs_json, cb);
+            }
             SignusCommand::VerifySignatureGetNymAck(wallet_handle, signed_msg, cb_id, result) => {
                 info!(target: "signus_command_executor", "VerifySignatureGetNymAck command received");
                 self.verify_signature_get_nym_ack(wallet_handle, &signed_msg, cb_id, result);
@@ -143,6 +194,14 @@ impl SignusCommandExecutor {
                 info!(target: "signus_command_executor", "Decrypt command received");
                 self.decrypt(wallet_handle, &my_did, &did, &encrypted_msg, &nonce, cb);
             }
+            SignusCommand::EncryptBytes(wallet_handle, my_did, did, msg, cb) => {
+                info!(target: "signus_command_executor", "EncryptBytes command received");
+                cb(self._encrypt_bytes(wallet_handle, &my_did, &did, &msg));
+            }
+            SignusCommand::DecryptBytes(wallet_handle, my_did, did, encrypted_msg, nonce, cb) => {
+                info!(target: "signus_command_executor", "DecryptBytes command received");
+                cb(self._decrypt_bytes(wallet_handle, &my_did, &did, &encrypted_msg, &nonce));
+            }
         };
     }
 
@@ -256,6 +315,38 @@ impl SignusCommandExecutor {
         Ok(signed_msg)
     }
 
+    fn sign_batch(&self,
+                  wallet_handle: i32,
+                  did: &str,
+                  msgs_json: &str,
+                  cb: Box<Fn(Result<String, IndyError>) + Send>) {
+        cb(self._sign_batch(wallet_handle, did, msgs_json));
+    }
+
+    fn _sign_batch(&self,
+                   wallet_handle: i32,
+                   did: &str,
+                   msgs_json: &str) -> Result<String, IndyError> {
+        let msgs: Vec<String> = serde_json::from_str(msgs_json)
+            .map_err(map_err_trace!())
+            .map_err(|err|
+                CommonError::InvalidStructure(format!("Invalid msgs json: {}", err.description())))?;
+
+        let my_did_json = self.wallet_service.get(wallet_handle, &format!("my_did::{}", did))?;
+        let my_did = MyDid::from_json(&my_did_json)
+            .map_err(map_err_trace!())
+            .map_err(|_| CommonError::InvalidState((format!("Invalid my did json"))))?;
+
+        let signed_msgs = self.signus_service.sign_batch(&my_did, &msgs)?;
+
+        let signed_msgs_json = serde_json::to_string(&signed_msgs)
+            .map_err(map_err_trace!())
+            .map_err(|err|
+                CommonError::InvalidState(format!("Can't serialize signed msgs: {}", err.description())))?;
+
+        Ok(signed_msgs_json)
+    }
+
     fn verify_signature(&self,
                         wallet_handle: i32,
                         pool_handle: i32,
@@ -316,6 +407,51 @@ impl SignusCommandExecutor {
         }
     }
 
+    fn verify_signatures_batch(&self,
+                               wallet_handle: i32,
+                               signed_msgs_json: &str,
+                               cb: Box<Fn(Result<String, IndyError>) + Send>) {
+        cb(self._verify_signatures_batch(wallet_handle, signed_msgs_json));
+    }
+
+    fn _verify_signatures_batch(&self,
+                                wallet_handle: i32,
+                                signed_msgs_json: &str) -> Result<String, IndyError> {
+        let signed_msgs: Vec<(String, String)> = serde_json::from_str(signed_msgs_json)
+            .map_err(map_err_trace!())
+            .map_err(|err|
+                CommonError::InvalidStructure(format!("Invalid signed msgs json: {}", err.description())))?;
+
+        let mut their_dids: HashMap<String, TheirDid> = HashMap::new();
+
+        for &(ref did, _) in signed_msgs.iter() {
+            if their_dids.contains_key(did) {
+                continue;
+            }
+
+            // Messages of DID that isn't stored in wallet are reported as not verified
+            let their_did_json = match self.wallet_service.get_not_expired(wallet_handle, &format!("their_did::{}", did)) {
+                Ok(their_did_json) => their_did_json,
+                Err(WalletError::NotFound(_)) => continue,
+                Err(err) => return Err(IndyError::WalletError(err))
+            };
+
+            match TheirDid::from_json(&their_did_json) {
+                Ok(their_did) => { their_dids.insert(did.clone(), their_did); }
+                Err(err) => warn!("Invalid their did json for {}: {:?}", did, err)
+            }
+        }
+
+        let results = self.signus_service.verify_batch(&their_dids, &signed_msgs);
+
+        let results_json = serde_json::to_string(&results)
+            .map_err(map_err_trace!())
+            .map_err(|err|
+                CommonError::InvalidState(format!("Can't serialize verification results: {}", err.description())))?;
+
+        Ok(results_json)
+    }
+
     fn verify_signature_get_nym_ack(&self,
                                     wallet_handle: i32,
                                     signed_msg: &str,
@@ -533,4 +669,66 @@ impl SignusCommandExecutor {
         self.signus_service.decrypt(&my_did, &their_did, encrypted_msg, nonce)
             .map_err(|err| IndyError::SignusError(err))
     }
-}
\ No newline at end of file
+
+    fn _sign_bytes(&self,
+                   wallet_handle: i32,
+                   did: &str,
+                   msg: &[u8]) -> Result<Vec<u8>, IndyError> {
+        let my_did = self._get_my_did(wallet_handle, did)?;
+
+        self.signus_service.sign_bytes(&my_did, msg)
+            .map_err(|err| IndyError::SignusError(err))
+    }
+
+    fn _verify_signature_bytes(&self,
+                               wallet_handle: i32,
+                               did: &str,
+                               msg: &[u8],
+                               signature: &[u8]) -> Result<bool, IndyError> {
+        let their_did = self._get_their_did(wallet_handle, did)?;
+
+        self.signus_service.verify_bytes(&their_did, msg, signature)
+            .map_err(|err| IndyError::SignusError(err))
+    }
+
+    fn _encrypt_bytes(&self,
+                      wallet_handle: i32,
+                      my_did: &str,
+                      did: &str,
+                      msg: &[u8]) -> Result<(Vec<u8>, Vec<u8>), IndyError> {
+        let my_did = self._get_my_did(wallet_handle, my_did)?;
+        let their_did = self._get_their_did(wallet_handle, did)?;
+
+        self.signus_service.encrypt_bytes(&my_did, &their_did, msg)
+            .map_err(|err| IndyError::SignusError(err))
+    }
+
+    fn _decrypt_bytes(&self,
+                      wallet_handle: i32,
+                      my_did: &str,
+                      did: &str,
+                      encrypted_msg: &[u8],
+                      nonce: &[u8]) -> Result<Vec<u8>, IndyError> {
+        let my_did = self._get_my_did(wallet_handle, my_did)?;
+        let their_did = self._get_their_did(wallet_handle, did)?;
+
+        self.signus_service.decrypt_bytes(&my_did, &their_did, encrypted_msg, nonce)
+            .map_err(|err| IndyError::SignusError(err))
+    }
+
+    fn _get_my_did(&self, wallet_handle: i32, did: &str) -> Result<MyDid, IndyError> {
+        let my_did_json = self.wallet_service.get(wallet_handle, &format!("my_did::{}", did))?;
+        let my_did = MyDid::from_json(&my_did_json)
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidState(format!("Invalid my did json: {}", err.description())))?;
+        Ok(my_did)
+    }
+
+    fn _get_their_did(&self, wallet_handle: i32, did: &str) -> Result<TheirDid, IndyError> {
+        let their_did_json = self.wallet_service.get(wallet_handle, &format!("their_did::{}", did))?;
+        let their_did = TheirDid::from_json(&their_did_json)
+            .map_err(map_err_trace!())
+            .map_err(|err| CommonError::InvalidState(format!("Invalid their did json: {}", err.description())))?;
+        Ok(their_did)
+    }
+}
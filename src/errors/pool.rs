@@ -14,6 +14,8 @@ pub enum PoolError {
     InvalidHandle(String),
     Rejected(String),
     Terminate,
+    Timeout,
+    Cancelled,
     CommonError(CommonError)
 }
 
@@ -24,6 +26,8 @@ impl fmt::Display for PoolError {
             PoolError::InvalidHandle(ref description) => write!(f, "Invalid Handle: {}", description),
             PoolError::Rejected(ref description) => write!(f, "Rejected by pool: {}", description),
             PoolError::Terminate => write!(f, "Pool work terminated"),
+            PoolError::Timeout => write!(f, "Pool request timed out"),
+            PoolError::Cancelled => write!(f, "Pool request cancelled"),
             PoolError::CommonError(ref err) => err.fmt(f)
         }
     }
@@ -36,6 +40,8 @@ impl error::Error for PoolError {
             PoolError::Rejected(ref description) |
             PoolError::InvalidHandle(ref description) => description,
             PoolError::Terminate => "Pool work terminated",
+            PoolError::Timeout => "Pool request timed out",
+            PoolError::Cancelled => "Pool request cancelled",
             PoolError::CommonError(ref err) => err.description()
         }
     }
@@ -46,6 +52,8 @@ impl error::Error for PoolError {
             PoolError::Rejected(ref description) |
             PoolError::InvalidHandle(ref description) => None,
             PoolError::Terminate => None,
+            PoolError::Timeout => None,
+            PoolError::Cancelled => None,
             PoolError::CommonError(ref err) => Some(err)
         }
     }
@@ -77,6 +85,8 @@ impl ToErrorCode for PoolError {
             PoolError::InvalidHandle(ref description) => ErrorCode::PoolLedgerInvalidPoolHandle,
             PoolError::Rejected(ref description) => ErrorCode::LedgerInvalidTransaction,
             PoolError::Terminate => ErrorCode::PoolLedgerTerminated,
+            PoolError::Timeout => ErrorCode::LedgerTimeoutError,
+            PoolError::Cancelled => ErrorCode::LedgerCancelledError,
             PoolError::CommonError(ref err) => err.to_error_code()
         }
     }
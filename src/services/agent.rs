@@ -4,8 +4,11 @@ extern crate serde_json;
 extern crate zmq_pw as zmq;
 
 use self::rust_base58::FromBase58;
-use std::collections::HashMap;
+use std::collections::{HashMap, VecDeque};
+use std::env;
 use std::error::Error;
+use std::sync::mpsc::{Receiver, Sender, channel};
+use std::time::{Duration, Instant};
 use std::{io, thread};
 
 use commands::{Command, CommandExecutor};
@@ -14,16 +17,45 @@ use errors::common::CommonError;
 use utils::json::{JsonDecodable, JsonEncodable};
 use utils::sequence::SequenceUtils;
 
+// Count of ZMQ IO threads shared by all agent connections and listeners.
+// Can be overridden with INDY_AGENT_IO_THREADS env variable
+const DEFAULT_AGENT_IO_THREADS: i32 = 1;
+
+// Closed connections sockets are kept open to be reused by the next connect
+// to the same endpoint with the same keys and DIDs. The least recently closed
+// socket is dropped when there are too many of them, any is dropped after TTL.
+// Reused connection sends RECONNECT_FRAME that listeners of older versions don't
+// understand, so reuse is disabled by default.
+// Can be enabled with INDY_AGENT_REUSE_CONNECTIONS=true env variable
+const DEFAULT_REUSE_AGENT_CONNECTIONS: bool = false;
+const MAX_IDLE_AGENT_CONNECTIONS: usize = 64;
+const IDLE_AGENT_CONNECTION_TTL_SECS: u64 = 60;
+
+// Reused connection sends its DID message as the second frame after this one,
+// application messages are always sent in single frame
+const RECONNECT_FRAME: &'static str = "RECONNECT";
+
 struct RemoteAgent {
     socket: zmq::Socket,
     addr: String,
     public_key: Vec<u8>,
     secret_key: Vec<u8>,
     server_key: Vec<u8>,
+    sender_did: String,
+    receiver_did: String,
     conn_handle: i32,
     connected: bool,
 }
 
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+struct RemoteAgentKey {
+    addr: String,
+    public_key: Vec<u8>,
+    server_key: Vec<u8>,
+    sender_did: String,
+    receiver_did: String,
+}
+
 struct AgentListener {
     connections: Vec<(i32 /* connection_handle*/, String /* identity */)>,
     pending_connections: HashMap<String /* sender DID */, (String, String) /* (sender pk, receiver DID) */>,
@@ -34,11 +66,18 @@ struct AgentListener {
 
 struct AgentWorker {
     cmd_socket: zmq::Socket,
+    cmd_receiver: Receiver<AgentWorkerCommand>,
+    ctx: zmq::Context,
     agent_connections: Vec<RemoteAgent>,
     agent_listeners: Vec<AgentListener>,
+    idle_connections: VecDeque<(RemoteAgentKey, zmq::Socket, Instant /* closed at */)>,
+    reuse_connections: bool,
 }
 
+// Commands are passed to the worker thread as is through the channel,
+// cmd_socket only wakes up the worker polling agents sockets
 struct Agent {
+    cmd_sender: Sender<AgentWorkerCommand>,
     cmd_socket: zmq::Socket,
     worker: Option<thread::JoinHandle<()>>,
 }
@@ -46,7 +85,7 @@ struct Agent {
 impl Drop for Agent {
     fn drop(&mut self) {
         trace!("agent drop >>");
-        self.cmd_socket.send(AgentWorkerCommand::Exit.to_json().unwrap().as_str(), zmq::DONTWAIT).unwrap(); //TODO
+        self.send_cmd(AgentWorkerCommand::Exit).unwrap(); //TODO
         self.worker.take().unwrap().join().unwrap();
         trace!("agent drop <<");
     }
@@ -59,16 +98,33 @@ pub struct AgentService {
 impl Agent {
     pub fn new() -> Agent {
         let (send_soc, recv_soc) = _create_zmq_socket_pair("agent", true).unwrap();
+        let (cmd_sender, cmd_receiver) = channel();
         let mut worker = AgentWorker {
             cmd_socket: recv_soc,
+            cmd_receiver: cmd_receiver,
+            ctx: AgentWorker::_create_zmq_context(),
             agent_connections: Vec::new(),
             agent_listeners: Vec::new(),
+            idle_connections: VecDeque::new(),
+            reuse_connections: AgentWorker::_reuse_connections(),
         };
         Agent {
+            cmd_sender: cmd_sender,
             cmd_socket: send_soc,
             worker: Some(thread::spawn(move || { worker.run() }))
         }
     }
+
+    fn send_cmd(&self, cmd: AgentWorkerCommand) -> Result<(), CommonError> {
+        self.cmd_sender.send(cmd)
+            .map_err(|err|
+                CommonError::InvalidState(format!("Can't send command to agent worker {}", err.description())))?;
+        match self.cmd_socket.send("".as_bytes(), zmq::DONTWAIT) {
+            // Queue of wake up signals is full, so the worker will wake up anyway
+            Err(zmq::Error::EAGAIN) => Ok(()),
+            res => res.map_err(From::from)
+        }
+    }
 }
 
 impl AgentService {
@@ -87,10 +143,7 @@ impl AgentService {
             server_key: server_key.to_string(),
             conn_handle: conn_handle,
         });
-        self.agent.cmd_socket.send(connect_cmd.to_json()
-                                       .map_err(|err|
-                                           CommonError::InvalidState(format!("Can't serialize AgentWorkerCommand::Connect {}", err.description())))?
-                                       .as_str(), zmq::DONTWAIT)?;
+        self.agent.send_cmd(connect_cmd)?;
         Ok(conn_handle)
     }
 
@@ -100,10 +153,7 @@ impl AgentService {
             listen_handle: listen_handle,
             endpoint: endpoint.to_string(),
         });
-        self.agent.cmd_socket.send(listen_cmd.to_json()
-                                       .map_err(|err|
-                                           CommonError::InvalidState(format!("Can't serialize AgentWorkerCommand::Listen {}", err.description())))?
-                                       .as_str(), zmq::DONTWAIT)?;
+        self.agent.send_cmd(listen_cmd)?;
         Ok(listen_handle)
     }
 
@@ -113,10 +163,7 @@ impl AgentService {
             did: did.to_string(),
             result: is_ok,
         });
-        self.agent.cmd_socket.send(ack_connect_cmd.to_json()
-                                       .map_err(|err|
-                                           CommonError::InvalidState(format!("Can't serialize AgentWorkerCommand::CheckConnect {}", err.description())))?
-                                       .as_str(), zmq::DONTWAIT)?;
+        self.agent.send_cmd(ack_connect_cmd)?;
         Ok(())
     }
 
@@ -133,10 +180,7 @@ impl AgentService {
             pk: pk.to_string(),
             sk: sk.to_string(),
         });
-        self.agent.cmd_socket.send(cmd.to_json()
-                                       .map_err(|err|
-                                           CommonError::InvalidState(format!("Can't serialize AgentWorkerCommand::AddIdentityCmd {}", err.description())))?
-                                       .as_str(), zmq::DONTWAIT)?;
+        self.agent.send_cmd(cmd)?;
         Ok(cmd_handle)
     }
 
@@ -148,10 +192,7 @@ impl AgentService {
             did: did.to_string(),
             pk: pk.to_string(),
         });
-        self.agent.cmd_socket.send(cmd.to_json()
-                                       .map_err(|err|
-                                           CommonError::InvalidState(format!("Can't serialize AgentWorkerCommand::RmIdentityCmd {}", err.description())))?
-                                       .as_str(), zmq::DONTWAIT)?;
+        self.agent.send_cmd(cmd)?;
         Ok(cmd_handle)
     }
 
@@ -162,10 +203,7 @@ impl AgentService {
             conn_handle: conn_id,
             msg: msg.map(str::to_string),
         });
-        self.agent.cmd_socket.send(send_cmd.to_json()
-                                       .map_err(|err|
-                                           CommonError::InvalidState(format!("Can't serialize AgentWorkerCommand::Send {}", err.description())))?
-                                       .as_str(), zmq::DONTWAIT)?;
+        self.agent.send_cmd(send_cmd)?;
         Ok(send_handle)
     }
 
@@ -177,10 +215,7 @@ impl AgentService {
             handle: handle,
             close_listener: close_listener,
         });
-        self.agent.cmd_socket.send(close_cmd.to_json()
-                                       .map_err(|err|
-                                           CommonError::InvalidState(format!("Can't serialize AgentWorkerCommand::Send {}", err.description())))?
-                                       .as_str(), zmq::DONTWAIT)?;
+        self.agent.send_cmd(close_cmd)?;
         Ok(close_conn_handle)
     }
 }
@@ -190,6 +225,7 @@ impl AgentWorker {
         'agent_pool_loop: loop {
             trace!("agent worker poll loop >>");
             let cmds = self.poll().unwrap();
+            self.drop_expired_idle_connections();
             for cmd in cmds {
                 debug!("AgentWorker::run received cmd {:?}", cmd);
                 match cmd {
@@ -200,7 +236,7 @@ impl AgentWorker {
                     AgentWorkerCommand::AddIdentity(cmd) => self.add_identity(cmd.cmd_id, cmd.listen_handle, cmd.did, cmd.pool_handle, cmd.wallet_handle, cmd.pk, cmd.sk).unwrap(),
                     AgentWorkerCommand::RmIdentity(cmd) => self.rm_identity(cmd.cmd_id, cmd.listen_handle, cmd.did, cmd.pk).unwrap(),
                     AgentWorkerCommand::Response(resp) => self.agent_connections[resp.agent_ind].handle_response(resp.msg),
-                    AgentWorkerCommand::Request(req) => self.agent_listeners[req.listener_ind].handle_request(req.identity, req.msg).unwrap(),
+                    AgentWorkerCommand::Request(req) => self.agent_listeners[req.listener_ind].handle_request(req.identity, req.msg, req.reconnect).unwrap(),
                     AgentWorkerCommand::Send(cmd) => self.send(cmd.cmd_id, cmd.conn_handle, cmd.msg).unwrap(),
                     AgentWorkerCommand::Exit => break 'agent_pool_loop,
                 }
@@ -211,11 +247,23 @@ impl AgentWorker {
     }
 
     fn connect(&mut self, cmd: ConnectCmd) -> Result<(), CommonError> {
-        let ra = RemoteAgent::new(cmd.public_key.as_str(), cmd.secret_key.as_str(),
-                                  cmd.server_key.as_str(), cmd.endpoint.as_str(),
-                                  cmd.conn_handle)
+        let mut ra = RemoteAgent::new(&self.ctx, cmd.public_key.as_str(), cmd.secret_key.as_str(),
+                                      cmd.server_key.as_str(), cmd.endpoint.as_str(),
+                                      cmd.sender_did.as_str(), cmd.receiver_did.as_str(),
+                                      cmd.conn_handle)
             .map_err(map_err_trace!("RemoteAgent::new failed"))?;
-        ra.connect(cmd.sender_did, cmd.receiver_did).map_err(map_err_trace!("RemoteAgent::connect failed"))?;
+
+        match self.take_idle_connection(&ra.key()) {
+            Some(socket) => {
+                debug!("Reuse connection to {} for {}", ra.addr, ra.sender_did);
+                ra.socket = socket;
+                ra.reconnect().map_err(map_err_trace!("RemoteAgent::reconnect failed"))?;
+            }
+            None => {
+                ra.connect(cmd.sender_did, cmd.receiver_did).map_err(map_err_trace!("RemoteAgent::connect failed"))?;
+            }
+        }
+
         self.agent_connections.push(ra);
         Ok(())
     }
@@ -341,7 +389,10 @@ impl AgentWorker {
         /* TODO check duplicates */
         for i in 0..self.agent_connections.len() {
             if self.agent_connections[i].conn_handle == conn_handle {
-                self.agent_connections.remove(i);
+                let ra = self.agent_connections.remove(i);
+                if ra.connected && self.reuse_connections {
+                    self.keep_idle_connection(ra);
+                }
                 return Ok(())
             }
         }
@@ -356,6 +407,40 @@ impl AgentWorker {
         return Err(CommonError::InvalidStructure(format!("Can't close agent connection {} - not found", conn_handle)))
     }
 
+    fn keep_idle_connection(&mut self, ra: RemoteAgent) {
+        if self.idle_connections.len() >= MAX_IDLE_AGENT_CONNECTIONS {
+            // Dropped socket is closed
+            self.idle_connections.pop_front();
+        }
+        self.idle_connections.push_back((ra.key(), ra.socket, Instant::now()));
+    }
+
+    fn take_idle_connection(&mut self, key: &RemoteAgentKey) -> Option<zmq::Socket> {
+        self.drop_expired_idle_connections();
+        let pos = self.idle_connections.iter().position(|&(ref idle_key, _, _)| idle_key == key);
+        pos.and_then(|i| self.idle_connections.remove(i)).map(|(_, socket, _)| socket)
+    }
+
+    fn drop_expired_idle_connections(&mut self) {
+        let ttl = Duration::from_secs(IDLE_AGENT_CONNECTION_TTL_SECS);
+        while self.idle_connections.front().map(|&(_, _, closed)| closed.elapsed() >= ttl).unwrap_or(false) {
+            self.idle_connections.pop_front();
+        }
+    }
+
+    // Poll timeout to wake up when the least recently closed idle connection expires
+    fn idle_connections_poll_timeout(&self) -> i64 {
+        match self.idle_connections.front() {
+            Some(&(_, _, closed)) => {
+                let left = Duration::from_secs(IDLE_AGENT_CONNECTION_TTL_SECS)
+                    .checked_sub(closed.elapsed())
+                    .unwrap_or(Duration::from_secs(0));
+                (left.as_secs() * 1000 + left.subsec_nanos() as u64 / 1_000_000 + 1) as i64
+            }
+            None => -1
+        }
+    }
+
     fn try_close_listener(&mut self, listener_handle: i32) -> Result<(), CommonError> {
         for i in 0..self.agent_listeners.len() {
             if self.agent_listeners[i].listener_handle == listener_handle {
@@ -367,7 +452,7 @@ impl AgentWorker {
     }
 
     fn try_start_listen(&mut self, handle: i32, endpoint: String) -> Result<(), CommonError> {
-        let listener = AgentListener::new(handle, endpoint.clone()).map_err(map_err_trace!("AgentListener::new"))?;
+        let listener = AgentListener::new(&self.ctx, handle, endpoint.clone()).map_err(map_err_trace!("AgentListener::new"))?;
         self.agent_listeners.push(listener);
         info!("Agent listener started at {}", endpoint);
         Ok(())
@@ -389,14 +474,15 @@ impl AgentWorker {
             poll_items.push(agent_listener.socket.as_poll_item(zmq::POLLIN));
         }
 
-        zmq::poll(poll_items.as_mut_slice(), -1).map_err(map_err_trace!("agent poll failed"))?;
+        zmq::poll(poll_items.as_mut_slice(), self.idle_connections_poll_timeout()).map_err(map_err_trace!("agent poll failed"))?;
 
         if poll_items[0].is_readable() {
-            let msg = self.cmd_socket.recv_string(zmq::DONTWAIT)?.map_err(|inv_bytes|
-                CommonError::InvalidState(format!("Invalid input on agent cmd socket: {:?}", inv_bytes)))?;
-            trace!("Input on cmd socket {}", msg);
-            result.push(AgentWorkerCommand::from_json(msg.as_str()).map_err(|err|
-                CommonError::InvalidState(format!("Invalid input on agent cmd socket: {}", err.description())))?);
+            // Command is sent to the channel before its wake up signal,
+            // so all commands of received signals are already in the channel
+            while self.cmd_socket.recv_bytes(zmq::DONTWAIT).is_ok() {}
+            while let Ok(cmd) = self.cmd_receiver.try_recv() {
+                result.push(cmd);
+            }
         }
 
         for i in 0..agent_connections_cnt {
@@ -416,13 +502,22 @@ impl AgentWorker {
                 let mut msg = self.agent_listeners[i].socket.recv_msg(zmq::DONTWAIT)?;
                 let pk: Option<String> = msg.gets("__cn_client").as_ref().map(|pk| pk.to_string());
 
-                match AgentWorker::_check_client_incoming_data(identity.clone(), pk, msg.to_vec()) {
+                let mut frames: Vec<Vec<u8>> = Vec::new();
+                while self.agent_listeners[i].socket.get_rcvmore()? {
+                    frames.push(self.agent_listeners[i].socket.recv_bytes(zmq::DONTWAIT)?);
+                }
+
+                let reconnect = frames.len() == 1 && &msg[..] == RECONNECT_FRAME.as_bytes();
+                let msg = if reconnect { frames.remove(0) } else { msg.to_vec() };
+
+                match AgentWorker::_check_client_incoming_data(identity.clone(), pk, msg) {
                     Ok((identity, msg)) => {
-                        trace!("Input on agent listener socket {}: identity {}, msg {}", i, identity, msg);
+                        trace!("Input on agent listener socket {}: identity {}, msg {}, reconnect {}", i, identity, msg, reconnect);
                         result.push(AgentWorkerCommand::Request(Request {
                             listener_ind: i,
                             identity: identity,
                             msg: msg,
+                            reconnect: reconnect,
                         }));
                     }
                     Err(err_description) => {
@@ -447,12 +542,30 @@ impl AgentWorker {
         let msg = String::from_utf8(msg).map_err(|_| "INVALID_MSG(should be valid UTF-8 string)".to_string())?;
         Ok((identity, msg))
     }
+
+    fn _create_zmq_context() -> zmq::Context {
+        let ctx = zmq::Context::new();
+        let io_threads = env::var("INDY_AGENT_IO_THREADS").ok()
+            .and_then(|threads| threads.parse::<i32>().ok())
+            .unwrap_or(DEFAULT_AGENT_IO_THREADS);
+        if let Err(err) = ctx.set_io_threads(io_threads) {
+            warn!("Can't set agent ZMQ IO threads count to {}: {:?}", io_threads, err);
+        }
+        ctx
+    }
+
+    fn _reuse_connections() -> bool {
+        env::var("INDY_AGENT_REUSE_CONNECTIONS").ok()
+            .and_then(|reuse| reuse.parse::<bool>().ok())
+            .unwrap_or(DEFAULT_REUSE_AGENT_CONNECTIONS)
+    }
 }
 
 impl RemoteAgent {
-    fn new(pub_key: &str, sec_key: &str, ver_key: &str, addr: &str, conn_handle: i32) -> Result<RemoteAgent, CommonError> {
+    fn new(ctx: &zmq::Context, pub_key: &str, sec_key: &str, ver_key: &str, addr: &str,
+           sender_did: &str, receiver_did: &str, conn_handle: i32) -> Result<RemoteAgent, CommonError> {
         Ok(RemoteAgent {
-            socket: zmq::Context::new().socket(zmq::SocketType::DEALER)?,
+            socket: ctx.socket(zmq::SocketType::DEALER)?,
             public_key: pub_key.from_base58()
                 .map_err(|err| CommonError::InvalidStructure(format!("invalid pub_key {}", err)))?,
             secret_key: sec_key.from_base58()
@@ -460,11 +573,35 @@ impl RemoteAgent {
             server_key: ver_key.from_base58()
                 .map_err(|err| CommonError::InvalidStructure(format!("invalid server_key {}", err)))?,
             addr: format!("tcp://{}", addr),
+            sender_did: sender_did.to_string(),
+            receiver_did: receiver_did.to_string(),
             conn_handle: conn_handle,
             connected: false,
         })
     }
 
+    fn key(&self) -> RemoteAgentKey {
+        RemoteAgentKey {
+            addr: self.addr.clone(),
+            public_key: self.public_key.clone(),
+            server_key: self.server_key.clone(),
+            sender_did: self.sender_did.clone(),
+            receiver_did: self.receiver_did.clone(),
+        }
+    }
+
+    // Socket of closed connection is already connected to the remote agent,
+    // so only DID message is sent again in RECONNECT_FRAME. Messages received
+    // while the socket was idle are dropped.
+    fn reconnect(&self) -> Result<(), CommonError> {
+        while self.socket.poll(zmq::POLLIN, 0)? > 0 {
+            self.socket.recv_bytes(zmq::DONTWAIT)?;
+        }
+        let msg = RemoteAgent::_did_msg(self.sender_did.clone(), self.receiver_did.clone());
+        self.socket.send_multipart(&[RECONNECT_FRAME.as_bytes(), msg.as_bytes()], zmq::DONTWAIT).map_err(map_err_trace!())?;
+        Ok(())
+    }
+
     fn connect(&self, sender_did: String, receiver_did: String) -> Result<(), CommonError> {
         impl From<zmq::EncodeError> for CommonError {
             fn from(err: zmq::EncodeError) -> CommonError {
@@ -484,15 +621,23 @@ impl RemoteAgent {
         self.socket.set_linger(0).map_err(map_err_trace!())?; //TODO set correct timeout
         self.socket.connect(self.addr.as_str())
             .map_err(map_err_trace!("RemoteAgent::connect self.socket.connect failed"))?;
+        self._send_did(sender_did, receiver_did)
+    }
+
+    fn _send_did(&self, sender_did: String, receiver_did: String) -> Result<(), CommonError> {
+        let msg = RemoteAgent::_did_msg(sender_did, receiver_did);
+        self.socket.send(msg.as_str(), zmq::DONTWAIT).map_err(map_err_trace!())?;
+        Ok(())
+    }
+
+    fn _did_msg(sender_did: String, receiver_did: String) -> String {
         let msg = MsgDID {
             did: DID {
                 sender_did: sender_did,
                 receiver_did: receiver_did,
             }
         };
-        let msg = msg.to_json().unwrap();
-        self.socket.send(msg.as_str(), zmq::DONTWAIT).map_err(map_err_trace!())?;
-        Ok(())
+        msg.to_json().unwrap()
     }
 
     fn handle_response(&mut self, msg: String) {
@@ -514,8 +659,8 @@ impl RemoteAgent {
 }
 
 impl AgentListener {
-    fn new(handle: i32, endpoint: String) -> Result<AgentListener, zmq::Error> {
-        let sock = zmq::Context::new().socket(zmq::SocketType::ROUTER).map_err(map_err_trace!())?;
+    fn new(ctx: &zmq::Context, handle: i32, endpoint: String) -> Result<AgentListener, zmq::Error> {
+        let sock = ctx.socket(zmq::SocketType::ROUTER).map_err(map_err_trace!())?;
         sock.set_curve_server(true).map_err(map_err_trace!())?;
         sock.bind(format!("tcp://{}", endpoint).as_str()).map_err(map_err_trace!())?;
         Ok(AgentListener {
@@ -527,8 +672,15 @@ impl AgentListener {
         })
     }
 
-    fn handle_request(&mut self, identity: String, msg: String) -> Result<(), CommonError> {
+    fn handle_request(&mut self, identity: String, msg: String, reconnect: bool) -> Result<(), CommonError> {
         if let Some(&(conn_handle, _)) = self.connections.iter().find(|&&(_, ref id)| identity.eq(id.as_str())) {
+            // Client reuses connection it closed before, the connection is already checked.
+            // Reconnect of unknown client is checked as new connection below
+            if reconnect {
+                info!("Connection {} to agent listener reused by {}", conn_handle, identity);
+                self.socket.send_multipart(&[identity.as_bytes(), "DID_ACK".as_bytes()], zmq::DONTWAIT)?;
+                return Ok(());
+            }
             return CommandExecutor::instance().send(Command::Agent(AgentCommand::MessageReceived(
                 conn_handle, Ok((conn_handle, msg)))));
         }
@@ -581,8 +733,7 @@ struct DID {
     receiver_did: String,
 }
 
-#[serde(tag = "cmd")]
-#[derive(Serialize, Deserialize, Debug)]
+#[derive(Debug, PartialEq)]
 enum AgentWorkerCommand {
     Connect(ConnectCmd),
     ConnectCheck(ConnectCheckCmd),
@@ -596,11 +747,7 @@ enum AgentWorkerCommand {
     Exit,
 }
 
-impl JsonEncodable for AgentWorkerCommand {}
-
-impl<'a> JsonDecodable<'a> for AgentWorkerCommand {}
-
-#[derive(Serialize, Deserialize, Debug)]
+#[derive(Debug, PartialEq)]
 struct ConnectCmd {
     endpoint: String,
     sender_did: String,
@@ -611,20 +758,20 @@ struct ConnectCmd {
     conn_handle: i32,
 }
 
-#[derive(Serialize, Deserialize, Debug)]
+#[derive(Debug, PartialEq)]
 struct ConnectCheckCmd {
     listener_handle: i32,
     did: String,
     result: bool,
 }
 
-#[derive(Serialize, Deserialize, Debug)]
+#[derive(Debug, PartialEq)]
 struct ListenCmd {
     listen_handle: i32,
     endpoint: String,
 }
 
-#[derive(Serialize, Deserialize, Debug)]
+#[derive(Debug, PartialEq)]
 struct AddIdentityCmd {
     cmd_id: i32,
     listen_handle: i32,
@@ -635,7 +782,7 @@ struct AddIdentityCmd {
     sk: String,
 }
 
-#[derive(Serialize, Deserialize, Debug)]
+#[derive(Debug, PartialEq)]
 struct RmIdentityCmd {
     cmd_id: i32,
     listen_handle: i32,
@@ -643,27 +790,28 @@ struct RmIdentityCmd {
     pk: String,
 }
 
-#[derive(Serialize, Deserialize, Debug)]
+#[derive(Debug, PartialEq)]
 struct SendCmd {
     cmd_id: i32,
     conn_handle: i32,
     msg: Option<String>,
 }
 
-#[derive(Serialize, Deserialize, Debug)]
+#[derive(Debug, PartialEq)]
 struct Response {
     agent_ind: usize,
     msg: String,
 }
 
-#[derive(Serialize, Deserialize, Debug)]
+#[derive(Debug, PartialEq)]
 struct Request {
     listener_ind: usize,
     identity: String,
     msg: String,
+    reconnect: bool,
 }
 
-#[derive(Serialize, Deserialize, Debug)]
+#[derive(Debug, PartialEq)]
 struct CloseCmd {
     cmd_id: i32,
     handle: i32,
@@ -706,20 +854,25 @@ mod tests {
     mod agent_service {
         use super::*;
 
-        #[test]
-        fn agent_service_connect_works() {
-            let (sender, receiver) = channel();
-            let (send_soc, recv_soc) = _create_zmq_socket_pair("test_connect", true).unwrap();
+        use std::sync::mpsc::Receiver;
+
+        fn _agent_service(address: &str) -> (AgentService, Receiver<AgentWorkerCommand>) {
+            let (cmd_sender, cmd_receiver) = channel();
+            let (send_soc, recv_soc) = _create_zmq_socket_pair(address, true).unwrap();
             let agent = Agent {
+                cmd_sender: cmd_sender,
                 cmd_socket: send_soc,
                 worker: Some(thread::spawn(move || {
-                    sender.send(recv_soc.recv_string(0).unwrap().unwrap()).unwrap();
-                    recv_soc.recv_string(0).unwrap().unwrap();
+                    recv_soc.recv_bytes(0).unwrap(); // tested command
+                    recv_soc.recv_bytes(0).unwrap(); // exit on drop
                 }))
             };
-            let agent_service = AgentService {
-                agent: agent,
-            };
+            (AgentService { agent: agent }, cmd_receiver)
+        }
+
+        #[test]
+        fn agent_service_connect_works() {
+            let (agent_service, receiver) = _agent_service("test_connect");
             let conn_handle = agent_service.connect("sd", "rd", "sk", "pk", "ep", "serv").unwrap();
             let expected_cmd = ConnectCmd {
                 server_key: "serv".to_string(),
@@ -730,47 +883,25 @@ mod tests {
                 receiver_did: "rd".to_string(),
                 conn_handle: conn_handle,
             };
-            let str = receiver.recv_timeout(TimeoutUtils::short_timeout()).unwrap();
-            assert_eq!(str, AgentWorkerCommand::Connect(expected_cmd).to_json().unwrap());
+            let cmd = receiver.recv_timeout(TimeoutUtils::short_timeout()).unwrap();
+            assert_eq!(cmd, AgentWorkerCommand::Connect(expected_cmd));
         }
 
         #[test]
         fn agent_service_listen_works() {
-            let (sender, receiver) = channel();
-            let (send_soc, recv_soc) = _create_zmq_socket_pair("test_connect", true).unwrap();
-            let agent = Agent {
-                cmd_socket: send_soc,
-                worker: Some(thread::spawn(move || {
-                    sender.send(recv_soc.recv_string(0).unwrap().unwrap()).unwrap();
-                    recv_soc.recv_string(0).unwrap().unwrap();
-                }))
-            };
-            let agent_service = AgentService {
-                agent: agent,
-            };
+            let (agent_service, receiver) = _agent_service("test_connect");
             let conn_handle = agent_service.listen("endpoint").unwrap();
             let expected_cmd = ListenCmd {
                 listen_handle: conn_handle,
                 endpoint: "endpoint".to_string(),
             };
-            let str = receiver.recv_timeout(TimeoutUtils::short_timeout()).unwrap();
-            assert_eq!(str, AgentWorkerCommand::Listen(expected_cmd).to_json().unwrap());
+            let cmd = receiver.recv_timeout(TimeoutUtils::short_timeout()).unwrap();
+            assert_eq!(cmd, AgentWorkerCommand::Listen(expected_cmd));
         }
 
         #[test]
         fn agent_service_add_identity_works() {
-            let (sender, receiver) = channel();
-            let (send_soc, recv_soc) = _create_zmq_socket_pair("test_connect", true).unwrap();
-            let agent = Agent {
-                cmd_socket: send_soc,
-                worker: Some(thread::spawn(move || {
-                    sender.send(recv_soc.recv_string(0).unwrap().unwrap()).unwrap();
-                    recv_soc.recv_string(0).unwrap().unwrap();
-                }))
-            };
-            let agent_service = AgentService {
-                agent: agent,
-            };
+            let (agent_service, receiver) = _agent_service("test_connect");
             let listener_handle = SequenceUtils::get_next_id();
             let wallet_handle = SequenceUtils::get_next_id();
             let pool_handle = SequenceUtils::get_next_id();
@@ -784,24 +915,13 @@ mod tests {
                 pk: "pk".to_string(),
                 sk: "sk".to_string(),
             };
-            let str = receiver.recv_timeout(TimeoutUtils::short_timeout()).unwrap();
-            assert_eq!(str, AgentWorkerCommand::AddIdentity(expected_cmd).to_json().unwrap());
+            let cmd = receiver.recv_timeout(TimeoutUtils::short_timeout()).unwrap();
+            assert_eq!(cmd, AgentWorkerCommand::AddIdentity(expected_cmd));
         }
 
         #[test]
         fn agent_service_rm_identity_works() {
-            let (sender, receiver) = channel();
-            let (send_soc, recv_soc) = _create_zmq_socket_pair("test_connect", true).unwrap();
-            let agent = Agent {
-                cmd_socket: send_soc,
-                worker: Some(thread::spawn(move || {
-                    sender.send(recv_soc.recv_string(0).unwrap().unwrap()).unwrap();
-                    recv_soc.recv_string(0).unwrap().unwrap();
-                }))
-            };
-            let agent_service = AgentService {
-                agent: agent,
-            };
+            let (agent_service, receiver) = _agent_service("test_connect");
             let listener_handle = SequenceUtils::get_next_id();
             let cmd_handle = agent_service.rm_identity(listener_handle, "did", "pk").unwrap();
             let expected_cmd = RmIdentityCmd {
@@ -810,24 +930,13 @@ mod tests {
                 did: "did".to_string(),
                 pk: "pk".to_string(),
             };
-            let str = receiver.recv_timeout(TimeoutUtils::short_timeout()).unwrap();
-            assert_eq!(str, AgentWorkerCommand::RmIdentity(expected_cmd).to_json().unwrap());
+            let cmd = receiver.recv_timeout(TimeoutUtils::short_timeout()).unwrap();
+            assert_eq!(cmd, AgentWorkerCommand::RmIdentity(expected_cmd));
         }
 
         #[test]
         fn agent_service_send_works() {
-            let (sender, receiver) = channel();
-            let (send_soc, recv_soc) = _create_zmq_socket_pair("test_send", true).unwrap();
-            let agent = Agent {
-                cmd_socket: send_soc,
-                worker: Some(thread::spawn(move || {
-                    sender.send(recv_soc.recv_string(0).unwrap().unwrap()).unwrap();
-                    recv_soc.recv_string(0).unwrap().unwrap();
-                }))
-            };
-            let agent_service = AgentService {
-                agent: agent,
-            };
+            let (agent_service, receiver) = _agent_service("test_send");
             let conn_handle = SequenceUtils::get_next_id();
             let msg = Some("test_msg");
             let cmd_id = agent_service.send(conn_handle, msg).unwrap();
@@ -836,24 +945,13 @@ mod tests {
                 conn_handle: conn_handle,
                 msg: msg.map(str::to_string),
             };
-            let str = receiver.recv_timeout(TimeoutUtils::short_timeout()).unwrap();
-            assert_eq!(str, AgentWorkerCommand::Send(expected_cmd).to_json().unwrap());
+            let cmd = receiver.recv_timeout(TimeoutUtils::short_timeout()).unwrap();
+            assert_eq!(cmd, AgentWorkerCommand::Send(expected_cmd));
         }
 
         #[test]
         fn agent_service_close_connection_or_listener_works() {
-            let (sender, receiver) = channel();
-            let (send_soc, recv_soc) = _create_zmq_socket_pair("test_close_conn", true).unwrap();
-            let agent = Agent {
-                cmd_socket: send_soc,
-                worker: Some(thread::spawn(move || {
-                    sender.send(recv_soc.recv_string(0).unwrap().unwrap()).unwrap();
-                    recv_soc.recv_string(0).unwrap().unwrap();
-                }))
-            };
-            let agent_service = AgentService {
-                agent: agent,
-            };
+            let (agent_service, receiver) = _agent_service("test_close_conn");
             let conn_handle = SequenceUtils::get_next_id();
             let cmd_id = agent_service.close_connection_or_listener(conn_handle, true).unwrap();
             let expected_cmd = CloseCmd {
@@ -861,8 +959,8 @@ mod tests {
                 handle: conn_handle,
                 close_listener: true,
             };
-            let str = receiver.recv_timeout(TimeoutUtils::short_timeout()).unwrap();
-            assert_eq!(str, AgentWorkerCommand::Close(expected_cmd).to_json().unwrap());
+            let cmd = receiver.recv_timeout(TimeoutUtils::short_timeout()).unwrap();
+            assert_eq!(cmd, AgentWorkerCommand::Close(expected_cmd));
         }
     }
 
@@ -902,6 +1000,10 @@ mod tests {
                 agent_connections: Vec::new(),
                 agent_listeners: Vec::new(),
                 cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
             let cmd = ConnectCmd {
                 endpoint: addr[6..].to_string(),
@@ -920,20 +1022,128 @@ mod tests {
             assert_eq!(recv_soc.recv_string(zmq::DONTWAIT).unwrap().unwrap(), r#"{"did":{"sender_did":"sd","receiver_did":"rd"}}"#);
         }
 
+        #[test]
+        fn agent_worker_connect_works_for_reuse_closed_connection() {
+            ::utils::logger::LoggerUtils::init();
+            let send_key_pair = zmq::CurveKeyPair::new().unwrap();
+            let recv_key_pair = zmq::CurveKeyPair::new().unwrap();
+            let ctx = zmq::Context::new();
+            let recv_soc = ctx.socket(zmq::SocketType::ROUTER).unwrap();
+            recv_soc.set_curve_server(true).unwrap();
+            recv_soc.add_curve_keypair([recv_key_pair.public_key, recv_key_pair.secret_key].concat().as_slice()).unwrap();
+            recv_soc.bind("tcp://127.0.0.1:*").unwrap();
+            let addr = recv_soc.get_last_endpoint().unwrap().unwrap();
+
+            let mut agent_worker = AgentWorker {
+                agent_connections: Vec::new(),
+                agent_listeners: Vec::new(),
+                cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: true,
+            };
+            let connect_cmd = |conn_handle: i32| ConnectCmd {
+                endpoint: addr[6..].to_string(),
+                public_key: send_key_pair.public_key.to_base58(),
+                secret_key: send_key_pair.secret_key.to_base58(),
+                sender_did: "sd".to_string(),
+                receiver_did: "rd".to_string(),
+                server_key: recv_key_pair.public_key.to_base58(),
+                conn_handle: conn_handle,
+            };
+
+            agent_worker.connect(connect_cmd(1)).unwrap();
+            agent_worker.agent_connections[0].connected = true;
+            agent_worker.try_close_connection(1).unwrap();
+            assert_eq!(agent_worker.idle_connections.len(), 1);
+
+            agent_worker.connect(connect_cmd(2)).unwrap();
+
+            assert_eq!(agent_worker.idle_connections.len(), 0);
+            assert_eq!(agent_worker.agent_connections.len(), 1);
+            assert_eq!(agent_worker.agent_connections[0].conn_handle, 2);
+
+            recv_soc.recv_string(0).unwrap().unwrap(); //ignore identity
+            assert_eq!(recv_soc.recv_string(0).unwrap().unwrap(), r#"{"did":{"sender_did":"sd","receiver_did":"rd"}}"#);
+            recv_soc.recv_string(0).unwrap().unwrap(); //ignore identity
+            assert_eq!(recv_soc.recv_string(0).unwrap().unwrap(), RECONNECT_FRAME);
+            assert_eq!(recv_soc.recv_string(0).unwrap().unwrap(), r#"{"did":{"sender_did":"sd","receiver_did":"rd"}}"#);
+        }
+
+        #[test]
+        fn agent_worker_keep_idle_connection_works_for_overflow() {
+            let mut agent_worker = AgentWorker {
+                agent_connections: Vec::new(),
+                agent_listeners: Vec::new(),
+                cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: true,
+            };
+
+            for i in 0..(MAX_IDLE_AGENT_CONNECTIONS + 1) {
+                let ra = RemoteAgent::new(&agent_worker.ctx, "", "", "", "127.0.0.1:9700",
+                                          format!("sd{}", i).as_str(), "rd", i as i32).unwrap();
+                agent_worker.keep_idle_connection(ra);
+            }
+
+            let key = |i: usize| RemoteAgent::new(&agent_worker.ctx, "", "", "", "127.0.0.1:9700",
+                                                  format!("sd{}", i).as_str(), "rd", 0).unwrap().key();
+
+            assert_eq!(agent_worker.idle_connections.len(), MAX_IDLE_AGENT_CONNECTIONS);
+            assert!(agent_worker.take_idle_connection(&key(0)).is_none());
+            assert!(agent_worker.take_idle_connection(&key(1)).is_some());
+            assert!(agent_worker.take_idle_connection(&key(MAX_IDLE_AGENT_CONNECTIONS)).is_some());
+        }
+
+        #[test]
+        fn agent_worker_drop_expired_idle_connections_works() {
+            let mut agent_worker = AgentWorker {
+                agent_connections: Vec::new(),
+                agent_listeners: Vec::new(),
+                cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: true,
+            };
+            assert_eq!(agent_worker.idle_connections_poll_timeout(), -1);
+
+            let ra = RemoteAgent::new(&agent_worker.ctx, "", "", "", "127.0.0.1:9700", "sd", "rd", 0).unwrap();
+            agent_worker.keep_idle_connection(ra);
+            assert!(agent_worker.idle_connections_poll_timeout() > 0);
+
+            agent_worker.idle_connections[0].2 = Instant::now() - Duration::from_secs(IDLE_AGENT_CONNECTION_TTL_SECS);
+            agent_worker.drop_expired_idle_connections();
+
+            assert_eq!(agent_worker.idle_connections.len(), 0);
+        }
+
         #[test]
         fn agent_worker_poll_works_for_cmd_socket() {
             let (send_soc, recv_soc) = _create_zmq_socket_pair("aw_poll_cmd", true).unwrap();
+            let (cmd_sender, cmd_receiver) = channel();
             let agent_worker = AgentWorker {
                 agent_connections: Vec::new(),
                 agent_listeners: Vec::new(),
                 cmd_socket: recv_soc,
+                cmd_receiver: cmd_receiver,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
-            send_soc.send(r#"{"cmd": "Exit"}"#, zmq::DONTWAIT).unwrap();
+            cmd_sender.send(AgentWorkerCommand::Listen(ListenCmd { listen_handle: 1, endpoint: "ep".to_string() })).unwrap();
+            cmd_sender.send(AgentWorkerCommand::Exit).unwrap();
+            send_soc.send("".as_bytes(), zmq::DONTWAIT).unwrap();
+            send_soc.send("".as_bytes(), zmq::DONTWAIT).unwrap();
 
             let cmds = agent_worker.poll().unwrap();
 
-            assert_eq!(cmds.len(), 1);
-            assert_match!(AgentWorkerCommand::Exit, cmds[0]);
+            assert_eq!(cmds.len(), 2);
+            assert_match!(AgentWorkerCommand::Listen(_), cmds[0]);
+            assert_match!(AgentWorkerCommand::Exit, cmds[1]);
         }
 
         #[test]
@@ -946,11 +1156,17 @@ mod tests {
                     public_key: Vec::new(),
                     secret_key: Vec::new(),
                     server_key: Vec::new(),
+                    sender_did: String::new(),
+                    receiver_did: String::new(),
                     conn_handle: 0,
                     connected: false,
                 }),
                 agent_listeners: Vec::new(),
                 cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
             send_soc.send("msg", zmq::DONTWAIT).unwrap();
 
@@ -997,20 +1213,28 @@ mod tests {
                 }),
                 agent_connections: Vec::new(),
                 cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
             send_soc.send("msg", zmq::DONTWAIT).unwrap();
+            send_soc.send_multipart(&[RECONNECT_FRAME.as_bytes(), "did_msg".as_bytes()], zmq::DONTWAIT).unwrap();
 
-            let mut cmds = agent_worker.poll().unwrap();
+            for &(exp_msg, exp_reconnect) in [("msg", false), ("did_msg", true)].iter() {
+                let mut cmds = agent_worker.poll().unwrap();
 
-            assert_eq!(cmds.len(), 1);
-            let cmd = cmds.remove(0);
-            match cmd {
-                AgentWorkerCommand::Request(req) => {
-                    assert_eq!(req.listener_ind, 0);
-                    assert_eq!(req.identity, identity);
-                    assert_eq!(req.msg, "msg");
+                assert_eq!(cmds.len(), 1);
+                let cmd = cmds.remove(0);
+                match cmd {
+                    AgentWorkerCommand::Request(req) => {
+                        assert_eq!(req.listener_ind, 0);
+                        assert_eq!(req.identity, identity);
+                        assert_eq!(req.msg, exp_msg);
+                        assert_eq!(req.reconnect, exp_reconnect);
+                    }
+                    _ => panic!("unexpected cmd {:?}", cmd),
                 }
-                _ => panic!("unexpected cmd {:?}", cmd),
             }
         }
 
@@ -1020,6 +1244,10 @@ mod tests {
                 agent_connections: Vec::new(),
                 agent_listeners: Vec::new(),
                 cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
             let conn_handle = SequenceUtils::get_next_id();
 
@@ -1041,6 +1269,10 @@ mod tests {
                     listener_handle: SequenceUtils::get_next_id(),
                 }],
                 cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
 
             agent_worker.try_close_connection(conn_handle).unwrap();
@@ -1057,13 +1289,46 @@ mod tests {
                     secret_key: Vec::new(),
                     server_key: Vec::new(),
                     addr: String::new(),
+                    sender_did: String::new(),
+                    receiver_did: String::new(),
                     connected: false,
                 }],
                 agent_listeners: Vec::new(),
                 cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
+            };
+
+            agent_worker.try_close_connection(conn_handle).unwrap();
+        }
+
+        #[test]
+        fn agent_worker_try_close_connection_works_for_connection_without_reuse() {
+            let conn_handle = SequenceUtils::get_next_id();
+            let mut agent_worker = AgentWorker {
+                agent_connections: vec![RemoteAgent {
+                    conn_handle: conn_handle,
+                    socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                    public_key: Vec::new(),
+                    secret_key: Vec::new(),
+                    server_key: Vec::new(),
+                    addr: String::new(),
+                    sender_did: String::new(),
+                    receiver_did: String::new(),
+                    connected: true,
+                }],
+                agent_listeners: Vec::new(),
+                cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
 
             agent_worker.try_close_connection(conn_handle).unwrap();
+            assert_eq!(agent_worker.idle_connections.len(), 0);
         }
 
         #[test]
@@ -1079,6 +1344,10 @@ mod tests {
                     listener_handle: listener_handle,
                 }],
                 cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
 
             agent_worker.try_close_listener(listener_handle).unwrap();
@@ -1091,6 +1360,10 @@ mod tests {
                 agent_connections: Vec::new(),
                 agent_listeners: Vec::new(),
                 cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
 
             let server_keys = zmq::CurveKeyPair::new().unwrap();
@@ -1121,6 +1394,10 @@ mod tests {
                 agent_connections: Vec::new(),
                 agent_listeners: Vec::new(),
                 cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
             let listener_handle = SequenceUtils::get_next_id();
 
@@ -1160,6 +1437,10 @@ mod tests {
                     listener_handle: listener_handle,
                 }],
                 cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
 
             agent_worker.try_add_identity(listener_handle, String::new(), -1, -1, server_kp.public_key.to_base58(), server_kp.secret_key.to_base58()).unwrap();
@@ -1205,6 +1486,10 @@ mod tests {
                     listener_handle: listener_handle,
                 }],
                 cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
 
             agent_worker.try_add_identity(listener_handle, "did1".to_string(), -1, -1, server_kp1.public_key.to_base58(), server_kp1.secret_key.to_base58()).unwrap();
@@ -1229,6 +1514,10 @@ mod tests {
                 agent_connections: Vec::new(),
                 agent_listeners: Vec::new(),
                 cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
             let conn_handle = SequenceUtils::get_next_id();
 
@@ -1248,6 +1537,8 @@ mod tests {
                     secret_key: Vec::new(),
                     server_key: Vec::new(),
                     addr: String::new(),
+                    sender_did: String::new(),
+                    receiver_did: String::new(),
                     connected: false,
                 }],
                 agent_listeners: vec![AgentListener {
@@ -1258,6 +1549,10 @@ mod tests {
                     listener_handle: SequenceUtils::get_next_id(),
                 }],
                 cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
 
             let res = agent_worker.try_send(conn_handle, None);
@@ -1279,6 +1574,10 @@ mod tests {
                     listener_handle: SequenceUtils::get_next_id(),
                 }],
                 cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
 
             agent_worker.try_send(conn_handle, Some("test_str".to_string())).unwrap();
@@ -1298,10 +1597,16 @@ mod tests {
                     secret_key: Vec::new(),
                     server_key: Vec::new(),
                     addr: String::new(),
+                    sender_did: String::new(),
+                    receiver_did: String::new(),
                     connected: false,
                 }],
                 agent_listeners: Vec::new(),
                 cmd_socket: zmq::Context::new().socket(zmq::SocketType::PAIR).unwrap(),
+                cmd_receiver: channel().1,
+                ctx: zmq::Context::new(),
+                idle_connections: VecDeque::new(),
+                reuse_connections: false,
             };
 
             agent_worker.try_send(conn_handle, Some("test_str".to_string())).unwrap();
@@ -1323,6 +1628,8 @@ mod tests {
             server_key: send_key_pair.public_key.to_vec(),
             secret_key: recv_key_pair.secret_key.to_vec(),
             public_key: recv_key_pair.public_key.to_vec(),
+            sender_did: "sd".to_string(),
+            receiver_did: "rd".to_string(),
             conn_handle: 0,
             connected: false,
         };
@@ -1,6 +1,7 @@
 pub mod constants;
 pub mod helpers;
 pub mod issuer;
+pub mod precomputed;
 pub mod prover;
 pub mod types;
 pub mod verifier;
@@ -0,0 +1,248 @@
+use errors::common::CommonError;
+use services::anoncreds::constants::LARGE_VTILDE;
+use services::anoncreds::types::PublicKey;
+use utils::crypto::bn::{BigNumber, BigNumberContext};
+
+use std::cell::RefCell;
+use std::collections::HashMap;
+use std::rc::Rc;
+
+// Bits of exponent processed by one table lookup
+const WINDOW: usize = 5;
+
+// Largest legitimate exponent is v^ of primary equality proof: vtilde + c * v',
+// it has at most LARGE_VTILDE + 1 bits. Exponents come from proofs received by verifier,
+// so larger ones are computed with generic mod_exp and never grow cached table.
+const MAX_EXPONENT_BITS: usize = LARGE_VTILDE + WINDOW;
+
+// Public keys tables are cached per thread, cache is dropped when overflowed
+const MAX_CACHED_PUBLIC_KEYS: usize = 16;
+
+thread_local! {
+    static PUBLIC_KEYS_TABLES: RefCell<HashMap<Vec<u8>, Rc<PublicKeyTables>>> = RefCell::new(HashMap::new());
+}
+
+// Fixed-base exponentiation modulo n (BGMW method). Keeps base^(2^(WINDOW * i)) mod n,
+// so exponentiation costs about bits / WINDOW + 2^WINDOW multiplications
+// instead of bits squarings of generic mod_exp. Table grows up to the largest exponent used,
+// but not beyond MAX_EXPONENT_BITS.
+pub struct FixedBaseTable {
+    base: BigNumber,
+    n: BigNumber,
+    powers: RefCell<Vec<BigNumber>>
+}
+
+impl FixedBaseTable {
+    pub fn new(base: &BigNumber, n: &BigNumber) -> Result<FixedBaseTable, CommonError> {
+        Ok(FixedBaseTable {
+            base: base.clone()?,
+            n: n.clone()?,
+            powers: RefCell::new(vec![base.modulus(n, None)?])
+        })
+    }
+
+    pub fn mod_exp(&self, exp: &BigNumber, ctx: Option<&mut BigNumberContext>) -> Result<BigNumber, CommonError> {
+        if exp.is_negative() || exp.num_bits()? as usize > MAX_EXPONENT_BITS {
+            return self.base.mod_exp(exp, &self.n, ctx);
+        }
+
+        let mut new_ctx;
+        let ctx = match ctx {
+            Some(ctx) => ctx,
+            None => {
+                new_ctx = BigNumber::new_context()?;
+                &mut new_ctx
+            }
+        };
+
+        let digits = FixedBaseTable::_digits(exp)?;
+        self._extend(digits.len(), &mut *ctx)?;
+
+        let mut buckets: Vec<Vec<usize>> = vec![Vec::new(); 1 << WINDOW];
+
+        for (i, digit) in digits.iter().enumerate() {
+            buckets[*digit].push(i);
+        }
+
+        let powers = self.powers.borrow();
+        let mut result: Option<BigNumber> = None;
+        let mut acc: Option<BigNumber> = None;
+
+        for digit in (1..(1 << WINDOW)).rev() {
+            for i in buckets[digit].iter() {
+                acc = Some(match acc {
+                    Some(acc) => acc.mul(&powers[*i], Some(&mut *ctx))?.modulus(&self.n, Some(&mut *ctx))?,
+                    None => powers[*i].clone()?
+                });
+            }
+
+            if let Some(ref acc) = acc {
+                result = Some(match result {
+                    Some(result) => result.mul(acc, Some(&mut *ctx))?.modulus(&self.n, Some(&mut *ctx))?,
+                    None => acc.clone()?
+                });
+            }
+        }
+
+        match result {
+            Some(result) => Ok(result),
+            None => BigNumber::from_dec("1")
+        }
+    }
+
+    fn _digits(exp: &BigNumber) -> Result<Vec<usize>, CommonError> {
+        let bits = exp.num_bits()? as usize;
+        let mut digits: Vec<usize> = Vec::with_capacity((bits + WINDOW - 1) / WINDOW);
+
+        for i in (0..bits).filter(|i| i % WINDOW == 0) {
+            let mut digit = 0;
+
+            for j in 0..WINDOW {
+                if i + j < bits && exp.is_bit_set((i + j) as i32)? {
+                    digit |= 1 << j;
+                }
+            }
+
+            digits.push(digit);
+        }
+
+        Ok(digits)
+    }
+
+    fn _extend(&self, len: usize, ctx: &mut BigNumberContext) -> Result<(), CommonError> {
+        let mut powers = self.powers.borrow_mut();
+
+        while powers.len() < len {
+            let mut power = powers[powers.len() - 1].clone()?;
+
+            for _ in 0..WINDOW {
+                power = power.sqr(Some(&mut *ctx))?.modulus(&self.n, Some(&mut *ctx))?;
+            }
+
+            powers.push(power);
+        }
+
+        Ok(())
+    }
+}
+
+// Fixed-base tables for all bases of issuer public key
+pub struct PublicKeyTables {
+    pub s: FixedBaseTable,
+    pub z: FixedBaseTable,
+    pub rms: FixedBaseTable,
+    pub rctxt: FixedBaseTable,
+    pub r: HashMap<String, FixedBaseTable>
+}
+
+impl PublicKeyTables {
+    pub fn new(pk: &PublicKey) -> Result<PublicKeyTables, CommonError> {
+        let mut r: HashMap<String, FixedBaseTable> = HashMap::new();
+
+        for (attr, base) in pk.r.iter() {
+            r.insert(attr.clone(), FixedBaseTable::new(base, &pk.n)?);
+        }
+
+        Ok(PublicKeyTables {
+            s: FixedBaseTable::new(&pk.s, &pk.n)?,
+            z: FixedBaseTable::new(&pk.z, &pk.n)?,
+            rms: FixedBaseTable::new(&pk.rms, &pk.n)?,
+            rctxt: FixedBaseTable::new(&pk.rctxt, &pk.n)?,
+            r: r
+        })
+    }
+
+    // Returns cached tables for public key of claim definition or creates new ones
+    pub fn get(pk: &PublicKey) -> Result<Rc<PublicKeyTables>, CommonError> {
+        let key = PublicKeyTables::_key(pk)?;
+
+        PUBLIC_KEYS_TABLES.with(|cache| {
+            let cached = cache.borrow().get(&key).cloned();
+
+            if let Some(tables) = cached {
+                return Ok(tables);
+            }
+
+            let tables = Rc::new(PublicKeyTables::new(pk)?);
+            let mut cache = cache.borrow_mut();
+
+            if cache.len() >= MAX_CACHED_PUBLIC_KEYS {
+                cache.clear();
+            }
+
+            cache.insert(key, tables.clone());
+            Ok(tables)
+        })
+    }
+
+    pub fn r(&self, attr: &str) -> Result<&FixedBaseTable, CommonError> {
+        self.r.get(attr)
+            .ok_or(CommonError::InvalidStructure(format!("Value by key '{}' not found in pk.r", attr)))
+    }
+
+    // Length-prefixed concatenation of all public key values, so different keys never collide
+    fn _key(pk: &PublicKey) -> Result<Vec<u8>, CommonError> {
+        let mut attrs: Vec<&String> = pk.r.keys().collect();
+        attrs.sort();
+
+        let mut parts: Vec<Vec<u8>> = vec![pk.n.to_bytes()?, pk.s.to_bytes()?, pk.z.to_bytes()?,
+                                           pk.rms.to_bytes()?, pk.rctxt.to_bytes()?];
+
+        for attr in attrs {
+            parts.push(attr.as_bytes().to_vec());
+            parts.push(pk.r[attr].to_bytes()?);
+        }
+
+        let mut key: Vec<u8> = Vec::new();
+
+        for part in parts {
+            let len = part.len() as u32;
+            key.extend_from_slice(&[(len >> 24) as u8, (len >> 16) as u8, (len >> 8) as u8, len as u8]);
+            key.extend(part);
+        }
+
+        Ok(key)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use services::anoncreds::issuer;
+
+    #[test]
+    fn fixed_base_table_mod_exp_works() {
+        let n = BigNumber::from_dec("89057765651800459030103911598694169835931320404459570102253965466045532669865684092518362135930940112502263498496335250135601124519172068317163741086983519494043168252186111551835366571584950296764626458785345784526001240216922303429306986452107305086081218398458713566716436069582054669919089014924698011567").unwrap();
+        let base = BigNumber::from_dec("64684820421150545443421261645532741305438158267230326415141505826951816460650437611148133267480407958360035501128469885271549378871140475869904030424615175830170939416512594291641188403335834762737251794282186335118831803135149622404791467775422384378569231649224208728902565541796896860352464500717052768431").unwrap();
+        let table = FixedBaseTable::new(&base, &n).unwrap();
+
+        for exp in &["0", "1", "31", "32", "1000000007", "21578029250517794450984707538122537192839006240802068037273983354680998203845"] {
+            let exp = BigNumber::from_dec(exp).unwrap();
+            assert_eq!(base.mod_exp(&exp, &n, None).unwrap(), table.mod_exp(&exp, None).unwrap());
+        }
+    }
+
+    #[test]
+    fn fixed_base_table_mod_exp_works_for_too_large_exponent() {
+        let n = BigNumber::from_dec("89057765651800459030103911598694169835931320404459570102253965466045532669865684092518362135930940112502263498496335250135601124519172068317163741086983519494043168252186111551835366571584950296764626458785345784526001240216922303429306986452107305086081218398458713566716436069582054669919089014924698011567").unwrap();
+        let base = BigNumber::from_dec("64684820421150545443421261645532741305438158267230326415141505826951816460650437611148133267480407958360035501128469885271549378871140475869904030424615175830170939416512594291641188403335834762737251794282186335118831803135149622404791467775422384378569231649224208728902565541796896860352464500717052768431").unwrap();
+        let table = FixedBaseTable::new(&base, &n).unwrap();
+
+        let mut exp = BigNumber::from_dec("1000000007").unwrap();
+        exp.set_bit(MAX_EXPONENT_BITS as i32).unwrap();
+
+        assert_eq!(base.mod_exp(&exp, &n, None).unwrap(), table.mod_exp(&exp, None).unwrap());
+        assert_eq!(1, table.powers.borrow().len());
+    }
+
+    #[test]
+    fn public_key_tables_get_works() {
+        let pk = issuer::mocks::get_pk();
+
+        let tables = PublicKeyTables::get(&pk).unwrap();
+        let other_tables = PublicKeyTables::get(&pk).unwrap();
+
+        assert!(Rc::ptr_eq(&tables, &other_tables));
+        assert_eq!(pk.r.len(), tables.r.len());
+    }
+}
@@ -47,6 +47,7 @@ use services::anoncreds::types::{
     ClaimJson,
     ProofJson
 };
+use services::anoncreds::precomputed::PublicKeyTables;
 use services::anoncreds::helpers::{
     get_mtilde,
     four_squares,
@@ -511,6 +512,7 @@ impl Prover {
 
     fn _init_eq_proof(pk: &PublicKey, schema: &Schema, c1: &PrimaryClaim, revealed_attrs: &Vec<String>,
                       m1_tilde: &BigNumber, m2_t: Option<BigNumber>) -> Result<PrimaryEqualInitProof, CommonError> {
+        let tables = PublicKeyTables::get(pk)?;
         let mut ctx = BigNumber::new_context()?;
 
         let m2_tilde = m2_t.unwrap_or(BigNumber::rand(LARGE_MVECT)?);
@@ -527,8 +529,8 @@ impl Prover {
 
         let mtilde = get_mtilde(&unrevealed_attrs)?;
 
-        let aprime = pk.s
-            .mod_exp(&r, &pk.n, Some(&mut ctx))?
+        let aprime = tables.s
+            .mod_exp(&r, Some(&mut ctx))?
             .mul(&c1.a, Some(&mut ctx))?
             .modulus(&pk.n, Some(&mut ctx))?;
 
@@ -556,6 +558,7 @@ impl Prover {
     fn _init_ge_proof(pk: &PublicKey, mtilde: &HashMap<String, BigNumber>,
                       encoded_attributes: &HashMap<String, Vec<String>>, predicate: &Predicate)
                       -> Result<PrimaryPredicateGEInitProof, CommonError> {
+        let tables = PublicKeyTables::get(pk)?;
         let mut ctx = BigNumber::new_context()?;
         let (k, value) = (&predicate.attr_name, predicate.value);
 
@@ -586,10 +589,10 @@ impl Prover {
 
             let cur_r = BigNumber::rand(LARGE_VPRIME)?;
 
-            let cut_t = pk.z
-                .mod_exp(&cur_u, &pk.n, Some(&mut ctx))?
+            let cut_t = tables.z
+                .mod_exp(&cur_u, Some(&mut ctx))?
                 .mul(
-                    &pk.s.mod_exp(&cur_r, &pk.n, Some(&mut ctx))?,
+                    &tables.s.mod_exp(&cur_r, Some(&mut ctx))?,
                     Some(&mut ctx)
                 )?
                 .modulus(&pk.n, Some(&mut ctx))?;
@@ -601,10 +604,10 @@ impl Prover {
 
         let r_delta = BigNumber::rand(LARGE_VPRIME)?;
 
-        let t_delta = pk.z
-            .exp(&BigNumber::from_dec(&delta.to_string())?, Some(&mut ctx))?
+        let t_delta = tables.z
+            .mod_exp(&BigNumber::from_dec(&delta.to_string())?, Some(&mut ctx))?
             .mul(
-                &pk.s.mod_exp(&r_delta, &pk.n, Some(&mut ctx))?,
+                &tables.s.mod_exp(&r_delta, Some(&mut ctx))?,
                 Some(&mut ctx)
             )?
             .modulus(&pk.n, Some(&mut ctx))?;
@@ -184,6 +184,10 @@ impl ClaimInfo {
     }
 }
 
+impl JsonEncodable for ClaimInfo {}
+
+impl<'a> JsonDecodable<'a> for ClaimInfo {}
+
 #[derive(Debug, Deserialize, Serialize)]
 pub struct ClaimInfoFilter {
     pub issuer_did: Option<String>,
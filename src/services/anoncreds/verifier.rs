@@ -9,12 +9,14 @@ use services::anoncreds::types::{
     PublicKey,
     RevocationPublicKey,
     ProofJson,
+    ClaimProof,
     ClaimDefinition,
     RevocationRegistry,
     Schema
 };
 use services::anoncreds::constants::{LARGE_E_START, ITERATION, LARGE_NONCE};
 use services::anoncreds::helpers::{AppendByteArray, get_hash_as_int, bignum_to_group_element};
+use services::anoncreds::precomputed::PublicKeyTables;
 use utils::crypto::bn::BigNumber;
 use std::collections::{HashMap, HashSet};
 use errors::common::CommonError;
@@ -43,33 +45,61 @@ impl Verifier {
         let mut tau_list: Vec<Vec<u8>> = Vec::new();
 
         for (proof_uuid, proof_item) in &proof.proofs {
-            let claim_definition = &claim_defs.get(proof_uuid)
+            let claim_definition = claim_defs.get(proof_uuid)
                 .ok_or(CommonError::InvalidStructure(format!("Claim definition is not found")))?;
             let schema = schemas.get(proof_uuid)
                 .ok_or(CommonError::InvalidStructure(format!("Schema is not found")))?;
 
-            if let (Some(ref non_revocation_proof), Some(ref pkr), Some(ref revoc_reg)) = (proof_item.proof.non_revoc_proof.clone(),
-                                                                                           claim_definition.data.public_key_revocation.clone(),
-                                                                                           revoc_regs.get(proof_uuid)) {
-
-                tau_list.extend_from_slice(
-                    &Verifier::_verify_non_revocation_proof(
-                        pkr,
-                        &revoc_reg.accumulator,
-                        &revoc_reg.acc_pk,
-                        &proof.aggregated_proof.c_hash,
-                        &non_revocation_proof)?.as_slice()?
-                );
-            };
-
-            tau_list.append_vec(
-                &Verifier::_verify_primary_proof(&claim_definition.data.public_key,
-                                                 &proof.aggregated_proof.c_hash,
-                                                 &proof_item.proof.primary_proof,
-                                                 &schema)?
-            )?;
+            tau_list.extend(
+                Verifier::calc_claim_tau_list(proof_item,
+                                              &proof.aggregated_proof.c_hash,
+                                              claim_definition,
+                                              schema,
+                                              revoc_regs.get(proof_uuid))?
+            );
         }
 
+        let result = self.verify_tau_list(proof, nonce, tau_list)?;
+
+        info!(target: "anoncreds_service", "Verifier verify proof -> done");
+
+        Ok(result)
+    }
+
+    // Calculates tau values of one claim proof. Claim proofs are independent of each other,
+    // so they can be calculated in parallel and then checked together by verify_tau_list
+    pub fn calc_claim_tau_list(proof_item: &ClaimProof,
+                               c_hash: &BigNumber,
+                               claim_definition: &ClaimDefinition,
+                               schema: &Schema,
+                               revoc_reg: Option<&RevocationRegistry>) -> Result<Vec<Vec<u8>>, CommonError> {
+        let mut tau_list: Vec<Vec<u8>> = Vec::new();
+
+        if let (Some(ref non_revocation_proof), Some(ref pkr), Some(ref revoc_reg)) = (proof_item.proof.non_revoc_proof.clone(),
+                                                                                       claim_definition.data.public_key_revocation.clone(),
+                                                                                       revoc_reg) {
+
+            tau_list.extend_from_slice(
+                &Verifier::_verify_non_revocation_proof(
+                    pkr,
+                    &revoc_reg.accumulator,
+                    &revoc_reg.acc_pk,
+                    c_hash,
+                    &non_revocation_proof)?.as_slice()?
+            );
+        };
+
+        tau_list.append_vec(
+            &Verifier::_verify_primary_proof(&claim_definition.data.public_key,
+                                             c_hash,
+                                             &proof_item.proof.primary_proof,
+                                             &schema)?
+        )?;
+
+        Ok(tau_list)
+    }
+
+    pub fn verify_tau_list(&self, proof: &ProofJson, nonce: &BigNumber, tau_list: Vec<Vec<u8>>) -> Result<bool, CommonError> {
         let mut values: Vec<Vec<u8>> = Vec::new();
 
         values.push(nonce.to_bytes()?);
@@ -78,8 +108,6 @@ impl Verifier {
 
         let c_hver = get_hash_as_int(&mut values)?;
 
-        info!(target: "anoncreds_service", "Verifier verify proof -> done");
-
         Ok(c_hver == proof.aggregated_proof.c_hash)
     }
 
@@ -109,15 +137,13 @@ impl Verifier {
         let t1: BigNumber = Verifier::calc_teq(&pk, &proof.a_prime, &proof.e, &proof.v, &proof.m,
                                                &proof.m1, &proof.m2, &unrevealed_attrs)?;
 
+        let tables = PublicKeyTables::get(pk)?;
         let mut ctx = BigNumber::new_context()?;
         let mut rar = BigNumber::from_dec("1")?;
 
         for (attr, value) in &proof.revealed_attrs {
-            let cur_r = pk.r.get(attr)
-                .ok_or(CommonError::InvalidStructure(format!("Value by key '{}' not found in pk.r", attr)))?;
-
-            rar = cur_r
-                .mod_exp(&BigNumber::from_dec(&value)?, &pk.n, Some(&mut ctx))?
+            rar = tables.r(attr)?
+                .mod_exp(&BigNumber::from_dec(&value)?, Some(&mut ctx))?
                 .mul(&rar, Some(&mut ctx))?;
         }
 
@@ -146,6 +172,7 @@ impl Verifier {
     }
 
     fn _verify_ge_predicate(pk: &PublicKey, proof: &PrimaryPredicateGEProof, c_h: &BigNumber) -> Result<Vec<BigNumber>, CommonError> {
+        let tables = PublicKeyTables::get(pk)?;
         let mut ctx = BigNumber::new_context()?;
         let mut tau_list = Verifier::calc_tge(&pk, &proof.u, &proof.r, &proof.mj,
                                               &proof.alpha, &proof.t)?;
@@ -164,10 +191,10 @@ impl Verifier {
         let delta = proof.t.get("DELTA")
             .ok_or(CommonError::InvalidStructure(format!("Value by key '{}' not found in proof.t", "DELTA")))?;
 
-        tau_list[ITERATION] = pk.z
+        tau_list[ITERATION] = tables.z
             .mod_exp(
                 &BigNumber::from_dec(&proof.predicate.value.to_string())?,
-                &pk.n, Some(&mut ctx))?
+                Some(&mut ctx))?
             .mul(&delta, Some(&mut ctx))?
             .mod_exp(&c_h, &pk.n, Some(&mut ctx))?
             .inverse(&pk.n, Some(&mut ctx))?
@@ -186,6 +213,7 @@ impl Verifier {
     pub fn calc_tge(pk: &PublicKey, u: &HashMap<String, BigNumber>, r: &HashMap<String, BigNumber>,
                     mj: &BigNumber, alpha: &BigNumber, t: &HashMap<String, BigNumber>)
                     -> Result<Vec<BigNumber>, CommonError> {
+        let tables = PublicKeyTables::get(pk)?;
         let mut tau_list: Vec<BigNumber> = Vec::new();
         let mut ctx = BigNumber::new_context()?;
 
@@ -195,10 +223,10 @@ impl Verifier {
             let cur_r = r.get(&i.to_string())
                 .ok_or(CommonError::InvalidStructure(format!("Value by key '{}' not found in r", i)))?;
 
-            let t_tau = pk.z
-                .mod_exp(&cur_u, &pk.n, Some(&mut ctx))?
+            let t_tau = tables.z
+                .mod_exp(&cur_u, Some(&mut ctx))?
                 .mul(
-                    &pk.s.mod_exp(&cur_r, &pk.n, Some(&mut ctx))?,
+                    &tables.s.mod_exp(&cur_r, Some(&mut ctx))?,
                     Some(&mut ctx)
                 )?
                 .modulus(&pk.n, Some(&mut ctx))?;
@@ -210,10 +238,10 @@ impl Verifier {
             .ok_or(CommonError::InvalidStructure(format!("Value by key '{}' not found in r", "DELTA")))?;
 
 
-        let t_tau = pk.z
-            .mod_exp(&mj, &pk.n, Some(&mut ctx))?
+        let t_tau = tables.z
+            .mod_exp(&mj, Some(&mut ctx))?
             .mul(
-                &pk.s.mod_exp(&delta, &pk.n, Some(&mut ctx))?,
+                &tables.s.mod_exp(&delta, Some(&mut ctx))?,
                 Some(&mut ctx)
             )?
             .modulus(&pk.n, Some(&mut ctx))?;
@@ -233,8 +261,8 @@ impl Verifier {
                 .mul(&q, Some(&mut ctx))?;
         }
 
-        q = pk.s
-            .mod_exp(&alpha, &pk.n, Some(&mut ctx))?
+        q = tables.s
+            .mod_exp(&alpha, Some(&mut ctx))?
             .mul(&q, Some(&mut ctx))?
             .modulus(&pk.n, Some(&mut ctx))?;
 
@@ -246,34 +274,33 @@ impl Verifier {
     pub fn calc_teq(pk: &PublicKey, a_prime: &BigNumber, e: &BigNumber, v: &BigNumber,
                     mtilde: &HashMap<String, BigNumber>, m1tilde: &BigNumber, m2tilde: &BigNumber,
                     unrevealed_attrs: &Vec<String>) -> Result<BigNumber, CommonError> {
+        let tables = PublicKeyTables::get(pk)?;
         let mut ctx = BigNumber::new_context()?;
         let mut result: BigNumber = BigNumber::from_dec("1")?;
 
         for k in unrevealed_attrs.iter() {
-            let cur_r = pk.r.get(k)
-                .ok_or(CommonError::InvalidStructure(format!("Value by key '{}' not found in pk.r", k)))?;
             let cur_m = mtilde.get(k)
                 .ok_or(CommonError::InvalidStructure(format!("Value by key '{}' not found in mtilde", k)))?;
 
-            result = cur_r
-                .mod_exp(&cur_m, &pk.n, Some(&mut ctx))?
+            result = tables.r(k)?
+                .mod_exp(&cur_m, Some(&mut ctx))?
                 .mul(&result, Some(&mut ctx))?;
         }
 
-        result = pk.rms
-            .mod_exp(&m1tilde, &pk.n, Some(&mut ctx))?
+        result = tables.rms
+            .mod_exp(&m1tilde, Some(&mut ctx))?
             .mul(&result, Some(&mut ctx))?;
 
-        result = pk.rctxt
-            .mod_exp(&m2tilde, &pk.n, Some(&mut ctx))?
+        result = tables.rctxt
+            .mod_exp(&m2tilde, Some(&mut ctx))?
             .mul(&result, Some(&mut ctx))?;
 
         result = a_prime
             .mod_exp(&e, &pk.n, Some(&mut ctx))?
             .mul(&result, Some(&mut ctx))?;
 
-        result = pk.s
-            .mod_exp(&v, &pk.n, Some(&mut ctx))?
+        result = tables.s
+            .mod_exp(&v, Some(&mut ctx))?
             .mul(&result, Some(&mut ctx))?
             .modulus(&pk.n, Some(&mut ctx))?;
 
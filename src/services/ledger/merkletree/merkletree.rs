@@ -36,39 +36,66 @@ impl MerkleTree {
             });
         }
 
-        let count = values.len();
-        let mut nodes_count = 0;
-        let mut height = 0;
-        let mut cur    = Vec::with_capacity(count);
+        let mut leaves = Vec::with_capacity(values.len());
 
         for v in values {
             let leaf = Tree::new_leaf(v)?;
-            cur.push(leaf);
+            leaves.push(leaf);
+        }
+
+        MerkleTree::from_leaves(leaves)
+    }
+
+    /// Constructs a Merkle Tree from a vector of data blocks with already known leaves hashes,
+    /// so only inner nodes hashes are calculated.
+    pub fn from_vec_with_hashes(values: Vec<TreeLeafData>, hashes: Vec<Vec<u8>>) -> Result<Self, CommonError> {
+
+        if values.len() != hashes.len() {
+            return Err(CommonError::InvalidStructure(
+                format!("Leaves count {} doesn't match hashes count {}", values.len(), hashes.len())));
+        }
+
+        if values.is_empty() {
+            return MerkleTree::from_vec(values);
         }
 
+        let leaves = values.into_iter()
+            .zip(hashes.into_iter())
+            .map(|(value, hash)| Tree::Leaf { hash: hash, value: value })
+            .collect();
+
+        MerkleTree::from_leaves(leaves)
+    }
+
+    fn from_leaves(leaves: Vec<Tree>) -> Result<Self, CommonError> {
+
+        let count = leaves.len();
+        let mut nodes_count = 0;
+        let mut height = 0;
+        let mut cur    = leaves;
+
         while cur.len() > 1 {
-            let mut next = Vec::new();
-            while !cur.is_empty() {
-                if cur.len() == 1 {
-                    next.push(cur.remove(0));
-                }
-                else {
-                    let left  = cur.remove(0);
-                    let right = cur.remove(0);
-
-                    let combined_hash = Hash::hash_nodes(
-                        left.hash(),
-                        right.hash()
-                    )?;
-
-                    let node = Tree::Node {
-                       hash: combined_hash.to_vec(),
-                       left: Box::new(left),
-                       right: Box::new(right)
-                    };
-
-                    next.push(node);
-                    nodes_count+=1;
+            let mut next = Vec::with_capacity((cur.len() + 1) / 2);
+            let mut iter = cur.into_iter();
+
+            while let Some(left) = iter.next() {
+                match iter.next() {
+                    Some(right) => {
+                        let combined_hash = Hash::hash_nodes(
+                            left.hash(),
+                            right.hash()
+                        )?;
+
+                        let node = Tree::Node {
+                           hash: combined_hash.to_vec(),
+                           left: Box::new(left),
+                           right: Box::new(right)
+                        };
+
+                        next.push(node);
+                        nodes_count+=1;
+                    }
+                    None => next.push(left)
                 }
             }
 
@@ -136,6 +163,25 @@ impl MerkleTree {
         self.root.iter()
     }
 
+    /// Returns hashes of the leaves in the same order as values.
+    pub fn leaves_hashes(&self) -> Vec<&Vec<u8>> {
+        let mut hashes: Vec<&Vec<u8>> = Vec::with_capacity(self.count);
+        let mut nodes: Vec<&Tree> = vec![&self.root];
+
+        while let Some(node) = nodes.pop() {
+            match *node {
+                Tree::Empty { .. } => {}
+                Tree::Leaf { ref hash, .. } => hashes.push(hash),
+                Tree::Node { ref left, ref right, .. } => {
+                    nodes.push(right);
+                    nodes.push(left);
+                }
+            }
+        }
+
+        hashes
+    }
+
 }
 
 impl IntoIterator for MerkleTree {
@@ -402,4 +402,35 @@ mod tests {
         mt.append(all_values[8 - 1].clone()).unwrap();
         assert!(mt.consistency_proof(&full_root_hash, 8, &proofs_for_8).unwrap());
     }
+
+    #[test]
+    fn from_vec_works_same_as_append() {
+        for cnt in 1..20 {
+            let values: Vec<String> = (0..cnt).map(|i| i.to_string()).collect();
+            let mut mt = MerkleTree::from_vec(vec![]).unwrap();
+            for value in values.iter() {
+                mt.append(value.clone()).unwrap();
+            }
+
+            let from_vec_mt = MerkleTree::from_vec(values).unwrap();
+
+            assert_eq!(mt.root, from_vec_mt.root);
+            assert_eq!(mt.count, from_vec_mt.count);
+            assert_eq!(mt.nodes_count, from_vec_mt.nodes_count);
+        }
+    }
+
+    #[test]
+    fn from_vec_with_hashes_works() {
+        let values: Vec<String> = (0..9).map(|i| i.to_string()).collect();
+        let mt = MerkleTree::from_vec(values.clone()).unwrap();
+        let hashes: Vec<Vec<u8>> = mt.leaves_hashes().into_iter().cloned().collect();
+
+        assert_eq!(hashes.len(), 9);
+
+        let restored_mt = MerkleTree::from_vec_with_hashes(values, hashes).unwrap();
+
+        assert_eq!(mt.root, restored_mt.root);
+        assert!(MerkleTree::from_vec_with_hashes(vec!["1".to_string()], vec![]).is_err());
+    }
 }
@@ -1,5 +1,6 @@
 use std::cmp;
 use std::collections::{BinaryHeap, HashMap};
+use std::time::{Duration, Instant};
 
 use commands::{Command, CommandExecutor};
 use commands::pool::PoolCommand;
@@ -7,12 +8,21 @@ use errors::common::CommonError;
 use errors::pool::PoolError;
 use super::{
     MerkleTree,
+    PoolWorker,
     RemoteNode,
 };
 use super::rust_base58::{FromBase58, ToBase58};
 use super::types::*;
 use utils::json::JsonEncodable;
 
+// Max count of transactions requested from one node by one CatchupReq,
+// catchup progress is stored to pool txns file by such chunks
+const CATCHUP_BATCH_SIZE: usize = 1000;
+
+// Range is requested from another node if it isn't received in this time
+const CATCHUP_REP_TIMEOUT_MS: u64 = 10000;
+
+#[derive(Debug, PartialEq)]
 enum CatchupStepResult {
     Finished,
     Continue,
@@ -30,6 +40,7 @@ pub struct CatchupHandler {
     pub f: usize,
     pub ledger_status_same: usize,
     pub merkle_tree: MerkleTree,
+    pub stored_txns_cnt: usize, /* count of transactions in pool txns file */
     pub target_mt_size: usize,
     pub target_mt_root: Vec<u8>,
     pub new_mt_vote: usize,
@@ -38,6 +49,7 @@ pub struct CatchupHandler {
     pub is_refresh: bool,
     pub pending_catchup: Option<CatchUpProcess>,
     pub pool_id: i32,
+    pub pool_name: String,
     pub nodes_votes: Vec<Option<(String, usize)>>,
 }
 
@@ -47,6 +59,7 @@ impl Default for CatchupHandler {
             f: 0,
             ledger_status_same: 0,
             merkle_tree: MerkleTree::from_vec(Vec::new()).unwrap(),
+            stored_txns_cnt: 0,
             nodes: Vec::new(),
             target_mt_size: 0,
             new_mt_vote: 0,
@@ -55,6 +68,7 @@ impl Default for CatchupHandler {
             initiate_cmd_id: 0,
             is_refresh: false,
             pool_id: 0,
+            pool_name: String::new(),
             nodes_votes: Vec::new(),
         }
     }
@@ -160,32 +174,70 @@ impl CatchupHandler {
         }
 
         let node_cnt = self.nodes.iter().filter(|node| !node.is_blacklisted).count();
-        let cnt_to_catchup = self.target_mt_size - self.merkle_tree.count();
-        if cnt_to_catchup <= 0 {
+        let cur_mt_size = self.merkle_tree.count();
+        if self.target_mt_size <= cur_mt_size {
             return Err(PoolError::CommonError(CommonError::InvalidState(
                 "Nothing to CatchUp, but started".to_string())));
         }
+        if node_cnt == 0 {
+            return Err(PoolError::CommonError(CommonError::InvalidState(
+                "No nodes to CatchUp from".to_string())));
+        }
 
         self.pending_catchup = Some(CatchUpProcess {
             merkle_tree: self.merkle_tree.clone(),
             pending_reps: BinaryHeap::new(),
+            requested: Vec::new(),
         });
 
-        let portion = (cnt_to_catchup + node_cnt - 1) / node_cnt; //TODO check standard round up div
-        let mut catchup_req = CatchupReq {
+        // Ranges are requested from all nodes in parallel, at least one range per node
+        let cnt_to_catchup = self.target_mt_size - cur_mt_size;
+        let portion = cmp::min((cnt_to_catchup + node_cnt - 1) / node_cnt, CATCHUP_BATCH_SIZE);
+        let mut start = cur_mt_size + 1;
+        while start <= self.target_mt_size {
+            let end = cmp::min(start + portion - 1, self.target_mt_size);
+            self.request_range(start, end, None)?;
+            start = end + 1;
+        }
+        Ok(())
+    }
+
+    // Sends CatchupReq to the node with the least count of requested ranges,
+    // failed_node_idx node is used only if there are no other nodes
+    fn request_range(&mut self, start: usize, end: usize, failed_node_idx: Option<usize>) -> Result<(), PoolError> {
+        let node_idx = {
+            let process = self.pending_catchup.as_ref()
+                .ok_or(CommonError::InvalidState("Request range for non-existing CatchUp".to_string()))?;
+            let requested_cnt = |node_idx: &usize|
+                process.requested.iter().filter(|range| range.node_idx == *node_idx).count();
+
+            let active_nodes: Vec<usize> = (0..self.nodes.len())
+                .filter(|&idx| !self.nodes[idx].is_blacklisted)
+                .collect();
+
+            active_nodes.iter()
+                .filter(|&&idx| Some(idx) != failed_node_idx)
+                .min_by_key(|&&idx| requested_cnt(&idx))
+                .or(active_nodes.iter().next())
+                .map(|idx| *idx)
+                .ok_or(CommonError::InvalidState("No nodes to CatchUp from".to_string()))?
+        };
+
+        let catchup_req = CatchupReq {
             ledgerId: 0,
-            seqNoStart: node_cnt + 1,
-            seqNoEnd: node_cnt + 1 + portion - 1,
+            seqNoStart: start,
+            seqNoEnd: end,
             catchupTill: self.target_mt_size,
         };
-        for node in &self.nodes {
-            if node.is_blacklisted {
-                continue;
-            }
-            node.send_msg(&Message::CatchupReq(catchup_req.clone()))?;
-            catchup_req.seqNoStart += portion;
-            catchup_req.seqNoEnd = cmp::min(catchup_req.seqNoStart + portion - 1,
-                                            catchup_req.catchupTill);
+        self.nodes[node_idx].send_msg(&Message::CatchupReq(catchup_req))?;
+
+        if let Some(ref mut process) = self.pending_catchup {
+            process.requested.push(CatchupRange {
+                start: start,
+                end: end,
+                node_idx: node_idx,
+                deadline: Instant::now() + Duration::from_millis(CATCHUP_REP_TIMEOUT_MS),
+            });
         }
         Ok(())
     }
@@ -197,23 +249,78 @@ impl CatchupHandler {
             CatchupStepResult::Finished => return Ok(CatchupProgress::Finished(self.finish_catchup()?)),
             CatchupStepResult::Continue => { /* nothing to do */ }
             CatchupStepResult::FailedAtNode(failed_node_idx) => {
-                warn!("Fail to continue catch-up by response from node with idx {}. Node will be blacklisted and catchup will be restarted", failed_node_idx);
+                warn!("Fail to continue catch-up by response from node with idx {}. Node will be blacklisted and its ranges will be requested from other nodes", failed_node_idx);
                 self.nodes[failed_node_idx].is_blacklisted = true;
-                self.pending_catchup = None;
                 // TODO may be send ledger status again and re-obtain target MerkleTree params
-                self.start_catchup()?
+                let failed_ranges = self.drop_node_ranges(failed_node_idx)?;
+                for range in failed_ranges {
+                    self.request_range(range.start, range.end, Some(failed_node_idx))?;
+                }
             }
         }
         Ok(CatchupProgress::InProgress)
     }
 
+    // Removes not applied replies and requested ranges of the node, returns removed ranges
+    fn drop_node_ranges(&mut self, node_idx: usize) -> Result<Vec<CatchupRange>, PoolError> {
+        let process = self.pending_catchup.as_mut()
+            .ok_or(CommonError::InvalidState("Process non-existing CatchUp".to_string()))?;
+
+        let pending_reps: Vec<(CatchupRep, usize)> = process.pending_reps.drain()
+            .filter(|&(_, rep_node_idx)| rep_node_idx != node_idx)
+            .collect();
+        process.pending_reps.extend(pending_reps);
+
+        let (node_ranges, other_ranges): (Vec<CatchupRange>, Vec<CatchupRange>) = process.requested.drain(..)
+            .partition(|range| range.node_idx == node_idx);
+        process.requested = other_ranges;
+
+        Ok(node_ranges)
+    }
+
+    pub fn get_upcoming_timeout(&self) -> Option<Duration> {
+        let now = Instant::now();
+        self.pending_catchup.as_ref()
+            .and_then(|process| process.requested.iter().map(|range| range.deadline).min())
+            .map(|deadline| if deadline > now { deadline - now } else { Duration::from_millis(0) })
+    }
+
+    pub fn process_timeouts(&mut self) {
+        let now = Instant::now();
+        let expired: Vec<CatchupRange> = match self.pending_catchup {
+            Some(ref mut process) => {
+                let (expired, requested): (Vec<CatchupRange>, Vec<CatchupRange>) = process.requested.drain(..)
+                    .partition(|range| range.deadline <= now);
+                process.requested = requested;
+                expired
+            }
+            None => return
+        };
+
+        for range in expired {
+            warn!("CatchupRep for txns {}..{} is not received from node with idx {} in time, request it from another node",
+                  range.start, range.end, range.node_idx);
+            if let Err(err) = self.request_range(range.start, range.end, Some(range.node_idx)) {
+                error!("Can't request txns {}..{} for CatchUp: {:?}", range.start, range.end, err);
+            }
+        }
+    }
+
     fn catchup_step(&mut self, catchup: CatchupRep, node_idx: usize) -> Result<CatchupStepResult, PoolError> {
+        if catchup.txns.is_empty() {
+            return Ok(CatchupStepResult::FailedAtNode(node_idx));
+        }
         let mut process = self.pending_catchup.as_mut()
             .ok_or(CommonError::InvalidState("Process non-existing CatchUp".to_string()))?;
         process.pending_reps.push((catchup, node_idx));
+        let mut appended = false;
         while !process.pending_reps.is_empty()
-            && process.pending_reps.peek().unwrap().0.min_tx() - 1 == process.merkle_tree.count() {
+            && process.pending_reps.peek().unwrap().0.min_tx() - 1 <= process.merkle_tree.count() {
             let (mut first_resp, node_idx) = process.pending_reps.pop().unwrap();
+            if first_resp.min_tx() - 1 < process.merkle_tree.count() {
+                // range was requested again from another node and is already applied
+                continue;
+            }
             let mut temp_mt = process.merkle_tree.clone();
             while !first_resp.txns.is_empty() {
                 let key = first_resp.min_tx().to_string();
@@ -231,8 +338,20 @@ impl CatchupHandler {
             }
 
             process.merkle_tree = temp_mt;
+            let applied_cnt = process.merkle_tree.count();
+            process.requested.retain(|range| range.end > applied_cnt);
+            appended = true;
         }
         trace!("updated mt hash {}, tree {:?}", process.merkle_tree.root_hash().as_slice().to_base58(), process.merkle_tree);
+
+        // Verified transactions are stored, so interrupted catchup will be continued from them
+        if appended && !self.pool_name.is_empty() {
+            match PoolWorker::_dump_txns(self.pool_name.as_str(), &process.merkle_tree, self.stored_txns_cnt) {
+                Ok(stored_txns_cnt) => self.stored_txns_cnt = stored_txns_cnt,
+                Err(err) => warn!("Can't store CatchUp progress: {:?}", err)
+            }
+        }
+
         if &process.merkle_tree.count() == &self.target_mt_size {
             if process.merkle_tree.root_hash().ne(&self.target_mt_root) {
                 return Err(PoolError::CommonError(CommonError::InvalidState(
@@ -277,3 +396,284 @@ impl CatchupHandler {
                     CommonError::InvalidState("Can't send ACK cmd".to_string())))
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use super::super::zmq;
+    use std::fs;
+    use std::io::{Read, Write};
+    use utils::environment::EnvironmentUtils;
+    use utils::json::JsonDecodable;
+
+    const NODE_TXNS: [&'static str; 8] = [
+        r#"{"data":{"alias":"Node1","client_ip":"10.0.0.2","client_port":9702,"node_ip":"10.0.0.2","node_port":9701,"services":["VALIDATOR"]},"dest":"Gw6pDLhcBcoQesN72qfotTgFa7cbuqZpkX3Xo6pLhPhv","identifier":"FYmoFw55GeQH7SRFa37dkx1d2dZ3zUF8ckg7wmL7ofN4","txnId":"fea82e10e894419fe2bea7d96296a6d46f50f93f9eeda954ec461b2ed2950b62","type":"0"}"#,
+        r#"{"data":{"alias":"Node2","client_ip":"10.0.0.2","client_port":9704,"node_ip":"10.0.0.2","node_port":9703,"services":["VALIDATOR"]},"dest":"8ECVSk179mjsjKRLWiQtssMLgp6EPhWXtaYyStWPSGAb","identifier":"8QhFxKxyaFsJy4CyxeYX34dFH8oWqyBv1P4HLQCsoeLy","txnId":"1ac8aece2a18ced660fef8694b61aac3af08ba875ce3026a160acbc3a3af35fc","type":"0"}"#,
+        r#"{"data":{"alias":"Node3","client_ip":"10.0.0.2","client_port":9706,"node_ip":"10.0.0.2","node_port":9705,"services":["VALIDATOR"]},"dest":"DKVxG2fXXTU8yT5N7hGEbXB3dfdAnYv1JczDUHpmDxya","identifier":"2yAeV5ftuasWNgQwVYzeHeTuM7LwwNtPR3Zg9N4JiDgF","txnId":"7e9f355dffa78ed24668f0e0e369fd8c224076571c51e2ea8be5f26479edebe4","type":"0"}"#,
+        r#"{"data":{"alias":"Node4","client_ip":"10.0.0.2","client_port":9708,"node_ip":"10.0.0.2","node_port":9707,"services":["VALIDATOR"]},"dest":"4PS3EDQ3dW1tci1Bp6543CfuuebjFrg36kLAUcskGfaA","identifier":"FTE95CVthRtrBnK2PYCBbC9LghTcGwi9Zfi1Gz2dnyNx","txnId":"aa5e817d7cc626170eca175822029339a444eb0ee8f0bd20d3b0b76e566fb008","type":"0"}"#,
+        r#"{"data":{"alias":"Node5","client_ip":"10.0.0.2","client_port":9710,"node_ip":"10.0.0.2","node_port":9709,"services":["VALIDATOR"]},"dest":"4SWokCJWJc69Tn74VvLS6t2G2ucvXqM9FDMsWJjmsUxe","identifier":"5NekXKJvGrxHvfxbXThySmaG8PmpNarXHCf1CkwTLfrg","txnId":"5abef8bc27d85d53753c5b6ed0cd2e197998c21513a379bfcf44d9c7a73c3a7e","type":"0"}"#,
+        r#"{"data":{"alias":"Node6","client_ip":"10.0.0.2","client_port":9712,"node_ip":"10.0.0.2","node_port":9711,"services":["VALIDATOR"]},"dest":"Cv1Ehj43DDM5ttNBmC6VPpEfwXWwfGktHwjDJsTV5Fz8","identifier":"A2yZJTPHZyqJDELb8E1mhxUqWPEW5vgH2ePLTiTDQayp","txnId":"a23059dc16aaf4513f97ca91f272235e809f8bda8c40f6688b88615a2c318ff8","type":"0"}"#,
+        r#"{"data":{"alias":"Node7","client_ip":"10.0.0.2","client_port":9714,"node_ip":"10.0.0.2","node_port":9713,"services":["VALIDATOR"]},"dest":"BM8dTooz5uykCbYSAAFwKNkYfT4koomBHsSWHTDtkjhW","identifier":"6pYGZXnqXLxLAhrEBhVjyvuhnV2LUgM9iw1gHds8JDqT","txnId":"e5f11aa7ec7091ca6c31a826eec885da7fcaa47611d03fdc3562b48247f179cf","type":"0"}"#,
+        r#"{"data":{"alias":"Node8","client_ip":"10.0.0.2","client_port":9716,"node_ip":"10.0.0.2","node_port":9715,"services":["VALIDATOR"]},"dest":"98VysG35LxrutKTNXvhaztPFHnx5u9kHtT7PnUGqDa8x","identifier":"B4xQBURedpCS3r6v8YxTyz5RYh3Nh5Jt2MxsmtAUr1rH","txnId":"2b01e69f89514be94ebf24bfa270abbe1c5abc72415801da3f0d58e71aaa33a2","type":"0"}"#,
+    ];
+
+    // Consistency proofs of the tree with first N transactions to the tree with all of them
+    const PROOFS_FOR_5: [&'static str; 4] = [
+        "9fVeiDkVJ4YrNB1cy9PEeRYXE5BhxapQsGu85WZ8MyiE",
+        "8p6GotiwYFiWgjMvY7KYNYcbz6hCFBJhcD9Sjo1PQANU",
+        "BqHByHYX9gAHye1SoKKiLXLFB7TDntyUoMtZQjMW2w7U",
+        "BhXMcoxZ9eu3Cu85bzr4G4Msrw77BT3R6Mw6P6bM9wQe",
+    ];
+    const PROOFS_FOR_6: [&'static str; 3] = [
+        "HhkWitSAXG12Ugn4KFtrUyhbZHi9XrP4jnbLuSthynSu",
+        "BqHByHYX9gAHye1SoKKiLXLFB7TDntyUoMtZQjMW2w7U",
+        "BhXMcoxZ9eu3Cu85bzr4G4Msrw77BT3R6Mw6P6bM9wQe",
+    ];
+    const PROOFS_FOR_7: [&'static str; 4] = [
+        "2D1aU5DeP8uPmaisGSpNoF2tNS35YhaRvfk2KPZzY2ue",
+        "5cVBJRrdFraAtDzUhezeifS6W4Gsgo3TdPXs8847p95L",
+        "HhkWitSAXG12Ugn4KFtrUyhbZHi9XrP4jnbLuSthynSu",
+        "BhXMcoxZ9eu3Cu85bzr4G4Msrw77BT3R6Mw6P6bM9wQe",
+    ];
+    const PROOFS_FOR_8: [&'static str; 0] = [];
+
+    fn catchup_range(start: usize, end: usize, node_idx: usize, deadline: Instant) -> CatchupRange {
+        CatchupRange {
+            start: start,
+            end: end,
+            node_idx: node_idx,
+            deadline: deadline,
+        }
+    }
+
+    fn catchup_rep(start: usize, end: usize, cons_proof: &[&str]) -> CatchupRep {
+        CatchupRep {
+            ledgerId: 0,
+            consProof: cons_proof.iter().map(|proof| proof.to_string()).collect(),
+            txns: (start..end + 1)
+                .map(|seq_no| (seq_no.to_string(), GenTransaction::from_json(NODE_TXNS[seq_no - 1]).unwrap()))
+                .collect(),
+        }
+    }
+
+    // Handler that catches up the tree of first cur_mt_size transactions to the tree of all of them.
+    // Each node gets PAIR socket, CatchupReqs sent to the node are received by returned socket with the same idx.
+    fn catchup_handler(ctx: &zmq::Context, cur_mt_size: usize) -> (CatchupHandler, Vec<zmq::Socket>) {
+        let txns: Vec<String> = NODE_TXNS.iter().map(|txn| txn.to_string()).collect();
+        let mut ch: CatchupHandler = Default::default();
+        ch.merkle_tree = MerkleTree::from_vec(txns[..cur_mt_size].to_vec()).unwrap();
+        ch.stored_txns_cnt = cur_mt_size;
+        ch.target_mt_size = txns.len();
+        ch.target_mt_root = MerkleTree::from_vec(txns).unwrap().root_hash().clone();
+
+        let mut receivers: Vec<zmq::Socket> = Vec::new();
+        for idx in 0..cur_mt_size {
+            let addr = format!("inproc://catchup_node_{}", idx);
+            let receiver = ctx.socket(zmq::SocketType::PAIR).unwrap();
+            receiver.set_linger(0).unwrap();
+            receiver.bind(addr.as_str()).unwrap();
+            let zsock = ctx.socket(zmq::SocketType::PAIR).unwrap();
+            zsock.set_linger(0).unwrap();
+            zsock.connect(addr.as_str()).unwrap();
+            ch.nodes.push(RemoteNode { name: format!("n{}", idx), public_key: Vec::new(), zaddr: addr, zsock: Some(zsock), is_blacklisted: false });
+            receivers.push(receiver);
+        }
+        (ch, receivers)
+    }
+
+    // Ranges of CatchupReqs received by the node since the previous call
+    fn received_ranges(receiver: &zmq::Socket) -> Vec<(usize, usize)> {
+        let mut ranges: Vec<(usize, usize)> = Vec::new();
+        while let Ok(Ok(msg)) = receiver.recv_string(zmq::DONTWAIT) {
+            match Message::from_raw_str(msg.as_str()).unwrap() {
+                Message::CatchupReq(req) => ranges.push((req.seqNoStart, req.seqNoEnd)),
+                msg => panic!("Unexpected message {:?}", msg),
+            }
+        }
+        ranges
+    }
+
+    fn requested_ranges(ch: &CatchupHandler) -> Vec<(usize, usize, usize)> {
+        ch.pending_catchup.as_ref().unwrap().requested.iter()
+            .map(|range| (range.start, range.end, range.node_idx))
+            .collect()
+    }
+
+    fn applied_cnt(ch: &CatchupHandler) -> usize {
+        ch.pending_catchup.as_ref().unwrap().merkle_tree.count()
+    }
+
+    #[test]
+    fn catchup_handler_start_catchup_works() {
+        let ctx = zmq::Context::new();
+        let (mut ch, receivers) = catchup_handler(&ctx, 4);
+
+        ch.start_catchup().unwrap();
+
+        assert_eq!(requested_ranges(&ch), vec![(5, 5, 0), (6, 6, 1), (7, 7, 2), (8, 8, 3)]);
+        for (idx, receiver) in receivers.iter().enumerate() {
+            assert_eq!(received_ranges(receiver), vec![(5 + idx, 5 + idx)]);
+        }
+    }
+
+    #[test]
+    fn catchup_handler_catchup_step_works_for_out_of_order_reps() {
+        let ctx = zmq::Context::new();
+        let (mut ch, _receivers) = catchup_handler(&ctx, 4);
+        ch.start_catchup().unwrap();
+
+        assert_eq!(ch.catchup_step(catchup_rep(8, 8, &PROOFS_FOR_8), 3).unwrap(), CatchupStepResult::Continue);
+        assert_eq!(ch.catchup_step(catchup_rep(6, 6, &PROOFS_FOR_6), 1).unwrap(), CatchupStepResult::Continue);
+        assert_eq!(applied_cnt(&ch), 4);
+        assert_eq!(ch.pending_catchup.as_ref().unwrap().pending_reps.len(), 2);
+        assert_eq!(requested_ranges(&ch).len(), 4);
+
+        assert_eq!(ch.catchup_step(catchup_rep(5, 5, &PROOFS_FOR_5), 0).unwrap(), CatchupStepResult::Continue);
+        assert_eq!(applied_cnt(&ch), 6);
+        assert_eq!(ch.pending_catchup.as_ref().unwrap().pending_reps.len(), 1);
+        assert_eq!(requested_ranges(&ch), vec![(7, 7, 2), (8, 8, 3)]);
+
+        assert_eq!(ch.catchup_step(catchup_rep(7, 7, &PROOFS_FOR_7), 2).unwrap(), CatchupStepResult::Finished);
+        assert_eq!(ch.pending_catchup.as_ref().unwrap().merkle_tree.root_hash(), &ch.target_mt_root);
+        assert!(ch.pending_catchup.as_ref().unwrap().requested.is_empty());
+    }
+
+    #[test]
+    fn catchup_handler_catchup_step_works_for_duplicated_reps() {
+        let ctx = zmq::Context::new();
+        let (mut ch, _receivers) = catchup_handler(&ctx, 4);
+        ch.start_catchup().unwrap();
+
+        assert_eq!(ch.catchup_step(catchup_rep(5, 5, &PROOFS_FOR_5), 0).unwrap(), CatchupStepResult::Continue);
+        assert_eq!(ch.catchup_step(catchup_rep(5, 5, &PROOFS_FOR_5), 1).unwrap(), CatchupStepResult::Continue);
+
+        assert_eq!(applied_cnt(&ch), 5);
+        assert!(ch.pending_catchup.as_ref().unwrap().pending_reps.is_empty());
+        assert_eq!(requested_ranges(&ch), vec![(6, 6, 1), (7, 7, 2), (8, 8, 3)]);
+    }
+
+    #[test]
+    fn catchup_handler_catchup_step_works_for_empty_rep() {
+        let ctx = zmq::Context::new();
+        let (mut ch, _receivers) = catchup_handler(&ctx, 4);
+        ch.start_catchup().unwrap();
+
+        let rep = CatchupRep { ledgerId: 0, consProof: Vec::new(), txns: HashMap::new() };
+
+        assert_eq!(ch.catchup_step(rep, 2).unwrap(), CatchupStepResult::FailedAtNode(2));
+    }
+
+    #[test]
+    fn catchup_handler_process_catchup_rep_works_for_invalid_cons_proof() {
+        let ctx = zmq::Context::new();
+        let (mut ch, receivers) = catchup_handler(&ctx, 4);
+        ch.start_catchup().unwrap();
+        for receiver in &receivers {
+            received_ranges(receiver);
+        }
+        // Not applied yet rep of the node is dropped with its ranges
+        ch.catchup_step(catchup_rep(6, 6, &PROOFS_FOR_6), 0).unwrap();
+
+        // Proof of the right length, but with wrong hash
+        let mut invalid_proof = PROOFS_FOR_5.to_vec();
+        invalid_proof[0] = PROOFS_FOR_6[0];
+        ch.process_catchup_rep(catchup_rep(5, 5, &invalid_proof), 0).unwrap();
+
+        assert!(ch.nodes[0].is_blacklisted);
+        assert_eq!(applied_cnt(&ch), 4);
+        assert!(ch.pending_catchup.as_ref().unwrap().pending_reps.is_empty());
+        assert_eq!(requested_ranges(&ch), vec![(6, 6, 1), (7, 7, 2), (8, 8, 3), (5, 5, 1)]);
+        assert!(received_ranges(&receivers[0]).is_empty());
+        assert_eq!(received_ranges(&receivers[1]), vec![(5, 5)]);
+
+        ch.process_catchup_rep(catchup_rep(5, 5, &PROOFS_FOR_5), 1).unwrap();
+
+        assert_eq!(applied_cnt(&ch), 5);
+    }
+
+    #[test]
+    fn catchup_handler_process_timeouts_works() {
+        let ctx = zmq::Context::new();
+        let (mut ch, receivers) = catchup_handler(&ctx, 4);
+        ch.start_catchup().unwrap();
+        for receiver in &receivers {
+            received_ranges(receiver);
+        }
+        ch.pending_catchup.as_mut().unwrap().requested[2].deadline = Instant::now();
+
+        ch.process_timeouts();
+
+        assert!(!ch.nodes[2].is_blacklisted);
+        assert_eq!(requested_ranges(&ch), vec![(5, 5, 0), (6, 6, 1), (8, 8, 3), (7, 7, 0)]);
+        assert_eq!(received_ranges(&receivers[0]), vec![(7, 7)]);
+        assert!(received_ranges(&receivers[2]).is_empty());
+        assert!(ch.get_upcoming_timeout().unwrap() > Duration::from_millis(0));
+    }
+
+    #[test]
+    fn catchup_handler_catchup_works_for_partially_written_txns() {
+        let pool_name = "test_catchup_partially_written_txns";
+        let mut path = EnvironmentUtils::pool_path(pool_name);
+        fs::create_dir_all(path.as_path()).unwrap();
+        path.push(pool_name);
+        path.set_extension("txn");
+        // Catchup was interrupted after storing of 5th txn, before its line break
+        fs::File::create(path.as_path()).unwrap().write_all(NODE_TXNS[..5].join("\n").as_bytes()).unwrap();
+
+        let ctx = zmq::Context::new();
+        let (mut ch, _receivers) = catchup_handler(&ctx, 5);
+        ch.merkle_tree = PoolWorker::_restore_merkle_tree(pool_name).unwrap();
+        ch.pool_name = pool_name.to_string();
+        ch.start_catchup().unwrap();
+
+        assert_eq!(requested_ranges(&ch), vec![(6, 6, 0), (7, 7, 1), (8, 8, 2)]);
+
+        ch.catchup_step(catchup_rep(6, 6, &PROOFS_FOR_6), 0).unwrap();
+        assert_eq!(ch.stored_txns_cnt, 6);
+        assert_eq!(PoolWorker::_restore_merkle_tree(pool_name).unwrap().count(), 6);
+
+        ch.catchup_step(catchup_rep(8, 8, &PROOFS_FOR_8), 2).unwrap();
+        assert_eq!(ch.stored_txns_cnt, 6);
+
+        assert_eq!(ch.catchup_step(catchup_rep(7, 7, &PROOFS_FOR_7), 1).unwrap(), CatchupStepResult::Finished);
+        assert_eq!(ch.stored_txns_cnt, 8);
+
+        let mut txns = String::new();
+        fs::File::open(path.as_path()).unwrap().read_to_string(&mut txns).unwrap();
+        assert_eq!(txns, NODE_TXNS.join("\n") + "\n");
+        assert_eq!(PoolWorker::_restore_merkle_tree(pool_name).unwrap().root_hash(), &ch.target_mt_root);
+
+        fs::remove_dir_all(EnvironmentUtils::pool_path(pool_name)).unwrap();
+    }
+
+    #[test]
+    fn catchup_handler_drop_node_ranges_works() {
+        let mut ch: CatchupHandler = Default::default();
+        let deadline = Instant::now() + Duration::from_millis(CATCHUP_REP_TIMEOUT_MS);
+        ch.pending_catchup = Some(CatchUpProcess {
+            merkle_tree: MerkleTree::from_vec(Vec::new()).unwrap(),
+            pending_reps: BinaryHeap::new(),
+            requested: vec![catchup_range(2, 3, 0, deadline), catchup_range(4, 5, 1, deadline)],
+        });
+
+        let dropped = ch.drop_node_ranges(0).unwrap();
+
+        assert_eq!(dropped, vec![catchup_range(2, 3, 0, deadline)]);
+        assert_eq!(ch.pending_catchup.as_ref().unwrap().requested, vec![catchup_range(4, 5, 1, deadline)]);
+    }
+
+    #[test]
+    fn catchup_handler_get_upcoming_timeout_works() {
+        let mut ch: CatchupHandler = Default::default();
+
+        assert_eq!(ch.get_upcoming_timeout(), None);
+
+        ch.pending_catchup = Some(CatchUpProcess {
+            merkle_tree: MerkleTree::from_vec(Vec::new()).unwrap(),
+            pending_reps: BinaryHeap::new(),
+            requested: vec![catchup_range(2, 3, 0, Instant::now())],
+        });
+
+        assert_eq!(ch.get_upcoming_timeout(), Some(Duration::from_millis(0)));
+    }
+}
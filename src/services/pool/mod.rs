@@ -1,5 +1,8 @@
 mod types;
 mod catchup;
+mod timer;
+mod snapshot;
+mod stats;
 
 extern crate byteorder;
 extern crate rust_base58;
@@ -10,10 +13,13 @@ use self::byteorder::{ByteOrder, LittleEndian};
 use self::rust_base58::FromBase58;
 use self::serde_json::Value;
 use std::cell::RefCell;
+use std::cmp;
 use std::collections::{HashMap};
-use std::{fmt, fs, io, thread};
+use std::{fmt, fs, io, mem, str, thread};
+use std::time::{Duration, Instant};
 use std::fmt::Debug;
-use std::io::{BufRead, Write};
+use std::path::Path;
+use std::io::{Read, Seek, SeekFrom, Write};
 use std::error::Error;
 
 use commands::{Command, CommandExecutor};
@@ -22,13 +28,29 @@ use commands::pool::PoolCommand;
 use errors::pool::PoolError;
 use errors::common::CommonError;
 use self::catchup::CatchupHandler;
+use self::snapshot::MerkleTreeSnapshot;
+use self::stats::{NodeStats, PoolStatsInfo};
+use self::timer::TimerWheel;
 use self::types::*;
+use services::ledger::constants::{GET_ATTR, GET_CLAIM_DEF, GET_DDO, GET_NYM, GET_SCHEMA, GET_TXN};
 use services::ledger::merkletree::merkletree::MerkleTree;
 use utils::crypto::ed25519::ED25519;
+use utils::crypto::hash::Hash;
 use utils::environment::EnvironmentUtils;
 use utils::json::{JsonDecodable, JsonEncodable};
 use utils::sequence::SequenceUtils;
 
+// Read requests are sent to f + 1 nodes first. The rest nodes are asked only if
+// these nodes disagree, reject the request or don't reply in this timeout.
+const READ_REQUEST_WIDEN_TIMEOUT_MS: u64 = 3000;
+
+// Pending request is failed with timeout error if it isn't completed in this time
+const REQUEST_TIMEOUT_MS: u64 = 60000;
+
+// Requests timeouts are checked with REQUEST_TIMER_TICK_MS precision
+const REQUEST_TIMER_TICK_MS: u64 = 100;
+const REQUEST_TIMER_SLOTS: usize = 1024;
+
 pub struct PoolService {
     pools: RefCell<HashMap<i32, Pool>>,
 }
@@ -46,6 +68,7 @@ struct PoolWorker {
     pool_id: i32,
     name: String,
     handler: PoolWorkerHandler,
+    node_stats: HashMap<String /* node alias */, NodeStats>, /* kept while catchup is in progress */
 }
 
 enum PoolWorkerHandler {
@@ -58,6 +81,8 @@ struct TransactionHandler {
     f: usize,
     nodes: Vec<RemoteNode>,
     pending_commands: HashMap<u64 /* requestId */, CommandProcess>,
+    node_stats: HashMap<String /* node alias */, NodeStats>,
+    timeouts: TimerWheel<(u64 /* requestId */, RequestTimeout)>,
 }
 
 impl PoolWorkerHandler {
@@ -85,6 +110,18 @@ impl PoolWorkerHandler {
         }
     }
 
+    fn cancel_request(&mut self, cmd: &str, cmd_id: i32) -> Result<(), PoolError> {
+        match self {
+            &mut PoolWorkerHandler::CatchupHandler(_) => {
+                Err(PoolError::CommonError(
+                    CommonError::InvalidState("Try cancel request while CatchUp.".to_string())))
+            }
+            &mut PoolWorkerHandler::TransactionHandler(ref mut ch) => {
+                ch.cancel_request(cmd, cmd_id)
+            }
+        }
+    }
+
     fn flush_requests(&mut self, status: Result<(), PoolError>) -> Result<(), PoolError> {
         match self {
             &mut PoolWorkerHandler::CatchupHandler(ref mut ch) => ch.flush_requests(status),
@@ -112,19 +149,33 @@ impl PoolWorkerHandler {
             &mut PoolWorkerHandler::TransactionHandler(ref mut ch) => ch.f = f,
         };
     }
+
+    fn get_upcoming_timeout(&self) -> Option<Duration> {
+        match self {
+            &PoolWorkerHandler::CatchupHandler(ref ch) => ch.get_upcoming_timeout(),
+            &PoolWorkerHandler::TransactionHandler(ref ch) => ch.get_upcoming_timeout(),
+        }
+    }
+
+    fn process_timeouts(&mut self) {
+        match self {
+            &mut PoolWorkerHandler::CatchupHandler(ref mut ch) => ch.process_timeouts(),
+            &mut PoolWorkerHandler::TransactionHandler(ref mut ch) => ch.process_timeouts(),
+        }
+    }
 }
 
 impl TransactionHandler {
     fn process_msg(&mut self, msg: Message, raw_msg: &String, src_ind: usize) -> Result<Option<MerkleTree>, PoolError> {
         match msg {
             Message::Reply(reply) => {
-                self.process_reply(reply.result.req_id, raw_msg);
+                self.process_reply(reply.result.req_id, raw_msg, src_ind);
             }
             Message::PoolLedgerTxns(response) => {
-                self.process_reply(response.txn.req_id, raw_msg);
+                self.process_reply(response.txn.req_id, raw_msg, src_ind);
             }
             Message::Reject(response) | Message::ReqNACK(response) => {
-                self.process_reject(&response, raw_msg);
+                self.process_reject(&response, raw_msg, src_ind);
             }
             _ => {
                 warn!("unhandled msg {:?}", msg);
@@ -133,25 +184,33 @@ impl TransactionHandler {
         Ok(None)
     }
 
-    fn process_reply(&mut self, req_id: u64, raw_msg: &String) {
+    fn process_reply(&mut self, req_id: u64, raw_msg: &String, src_ind: usize) {
         let mut remove = false;
         if let Some(pend_cmd) = self.pending_commands.get_mut(&req_id) {
             let pend_cmd: &mut CommandProcess = pend_cmd;
-            let mut json_msg: HashableValue = HashableValue { inner: serde_json::from_str(raw_msg).unwrap() };
-            if let Some(str) = json_msg.inner["result"]["data"].clone().as_str() {
-                let tmp_obj: serde_json::Value = serde_json::from_str(str).unwrap();
-                json_msg.inner["result"]["data"] = tmp_obj;
-            }
-            let reply_cnt: usize = *pend_cmd.replies.get(&json_msg).unwrap_or(&0usize);
+            TransactionHandler::track_answer(&self.nodes, &mut self.node_stats, pend_cmd, src_ind);
+            let digest = match TransactionHandler::reply_digest(raw_msg) {
+                Ok(digest) => digest,
+                Err(err) => {
+                    warn!("Skip invalid reply for request {}: {:?}", req_id, err);
+                    return;
+                }
+            };
+            let reply_cnt: usize = *pend_cmd.replies.get(&digest).unwrap_or(&0usize);
             if reply_cnt == self.f {
                 //already have f same replies and receive f+1 now
                 for &cmd_id in &pend_cmd.cmd_ids {
                     CommandExecutor::instance().send(
                         Command::Ledger(LedgerCommand::SubmitAck(cmd_id, Ok(raw_msg.clone())))).unwrap();
                 }
+                TransactionHandler::log_fan_out(req_id, pend_cmd, self.nodes.len(), "replied");
                 remove = true;
             } else {
-                pend_cmd.replies.insert(json_msg, reply_cnt + 1);
+                pend_cmd.replies.insert(digest, reply_cnt + 1);
+                if pend_cmd.replies.len() > 1 {
+                    // asked nodes disagree, so f+1 same replies can be received only from other nodes
+                    TransactionHandler::widen_request(&self.nodes, &mut self.node_stats, pend_cmd);
+                }
             }
         }
         if remove {
@@ -159,11 +218,38 @@ impl TransactionHandler {
         }
     }
 
+    // Replies are counted by hash of canonical serialization, so only the reply
+    // that reaches consensus is kept as is. Result data is a json string, nodes can
+    // serialize it with different keys order, so it is parsed before serialization.
+    fn reply_digest(raw_msg: &str) -> Result<Vec<u8>, CommonError> {
+        let mut reply: Value = serde_json::from_str(raw_msg)
+            .map_err(|err|
+                CommonError::InvalidStructure(
+                    format!("Invalid reply json: {}", err.description())))?;
+
+        let data: Option<Value> = match reply["result"]["data"] {
+            Value::String(ref data) => serde_json::from_str(data).ok(),
+            _ => None
+        };
+
+        if let Some(data) = data {
+            reply["result"]["data"] = data;
+        }
+
+        let canonical = serde_json::to_string(&reply)
+            .map_err(|err|
+                CommonError::InvalidState(
+                    format!("Can't serialize reply json: {}", err.description())))?;
+
+        Ok(Hash::hash(canonical.as_bytes())?.to_vec())
+    }
+
     //TODO correct handling of Reject
-    fn process_reject(&mut self, response: &Response, raw_msg: &String) {
+    fn process_reject(&mut self, response: &Response, raw_msg: &String, src_ind: usize) {
         let req_id = response.req_id;
         let mut remove = false;
         if let Some(pend_cmd) = self.pending_commands.get_mut(&req_id) {
+            TransactionHandler::track_answer(&self.nodes, &mut self.node_stats, pend_cmd, src_ind);
             pend_cmd.nack_cnt += 1;
             if pend_cmd.nack_cnt == self.f + 1 {
                 for &cmd_id in &pend_cmd.cmd_ids {
@@ -173,7 +259,10 @@ impl TransactionHandler {
                                                      Err(PoolError::Rejected(raw_msg.clone()))))
                     ).unwrap();
                 }
+                TransactionHandler::log_fan_out(req_id, pend_cmd, self.nodes.len(), "rejected");
                 remove = true;
+            } else {
+                TransactionHandler::widen_request(&self.nodes, &mut self.node_stats, pend_cmd);
             }
         }
         if remove {
@@ -195,17 +284,155 @@ impl TransactionHandler {
         if self.pending_commands.contains_key(&request_id) {
             self.pending_commands.get_mut(&request_id).unwrap().cmd_ids.push(cmd_id);
         } else {
-            let pc = CommandProcess {
-                cmd_ids: vec!(cmd_id),
-                nack_cnt: 0,
-                replies: HashMap::new(),
+            let mut pc = CommandProcess::new(cmd, cmd_id, Duration::from_millis(REQUEST_TIMEOUT_MS));
+            let nodes_cnt = self.nodes.len();
+
+            let (nodes_order, fan_out) = if TransactionHandler::is_read_request(&request) {
+                (self.nodes_by_rank(), cmp::min(self.f + 1, nodes_cnt))
+            } else {
+                ((0..nodes_cnt).collect(), nodes_cnt)
             };
+
+            let sent_at = Instant::now();
+            for &node_idx in nodes_order.iter().take(fan_out) {
+                self.nodes[node_idx].send_str(cmd)?;
+                pc.sent_to.push(node_idx);
+                pc.pending_nodes.insert(node_idx, sent_at);
+                TransactionHandler::node_stats(&self.nodes, &mut self.node_stats, node_idx).on_sent();
+            }
+
+            if fan_out < nodes_cnt {
+                let widen_at = Instant::now() + Duration::from_millis(READ_REQUEST_WIDEN_TIMEOUT_MS);
+                pc.widen_at = Some(widen_at);
+                self.timeouts.schedule(widen_at, (request_id, RequestTimeout::Widen));
+            }
+
+            self.timeouts.schedule(pc.deadline, (request_id, RequestTimeout::Deadline));
             self.pending_commands.insert(request_id, pc);
-            for node in &self.nodes {
-                let node: &RemoteNode = node;
-                node.send_str(cmd)?;
+        }
+        Ok(())
+    }
+
+    fn is_read_request(request: &Value) -> bool {
+        match request["operation"]["type"].as_str() {
+            Some(txn_type) => [GET_ATTR, GET_CLAIM_DEF, GET_DDO, GET_NYM, GET_SCHEMA, GET_TXN].contains(&txn_type),
+            None => false
+        }
+    }
+
+    // Indexes of nodes ordered by their latency, read requests are sent to the first ones
+    fn nodes_by_rank(&self) -> Vec<usize> {
+        let mut nodes_order: Vec<usize> = (0..self.nodes.len()).collect();
+        nodes_order.sort_by_key(|&node_idx| {
+            self.node_stats.get(&self.nodes[node_idx].name)
+                .map(NodeStats::rank)
+                .unwrap_or((false, 0))
+        });
+        nodes_order
+    }
+
+    fn node_stats<'a>(nodes: &Vec<RemoteNode>, node_stats: &'a mut HashMap<String, NodeStats>, node_idx: usize) -> &'a mut NodeStats {
+        node_stats.entry(nodes[node_idx].name.clone()).or_insert_with(NodeStats::new)
+    }
+
+    // Records round-trip of the first answer of the node to the request
+    fn track_answer(nodes: &Vec<RemoteNode>, node_stats: &mut HashMap<String, NodeStats>,
+                    pend_cmd: &mut CommandProcess, node_idx: usize) {
+        if let Some(sent_at) = pend_cmd.pending_nodes.remove(&node_idx) {
+            TransactionHandler::node_stats(nodes, node_stats, node_idx).on_reply(sent_at.elapsed());
+        }
+    }
+
+    // Nodes that haven't answered the request yet are marked as missed it
+    fn track_misses(nodes: &Vec<RemoteNode>, node_stats: &mut HashMap<String, NodeStats>,
+                    pend_cmd: &mut CommandProcess) {
+        for (node_idx, _) in pend_cmd.pending_nodes.drain() {
+            TransactionHandler::node_stats(nodes, node_stats, node_idx).on_miss();
+        }
+    }
+
+    fn widen_request(nodes: &Vec<RemoteNode>, node_stats: &mut HashMap<String, NodeStats>, pend_cmd: &mut CommandProcess) {
+        pend_cmd.widen_at = None;
+        let sent_at = Instant::now();
+
+        for (node_idx, node) in nodes.iter().enumerate() {
+            if pend_cmd.sent_to.contains(&node_idx) {
+                continue;
+            }
+
+            match node.send_str(pend_cmd.request.as_str()) {
+                Ok(()) => {
+                    pend_cmd.sent_to.push(node_idx);
+                    pend_cmd.pending_nodes.insert(node_idx, sent_at);
+                    TransactionHandler::node_stats(nodes, node_stats, node_idx).on_sent();
+                }
+                Err(err) => warn!("Can't send request to node {}: {:?}", node.name, err)
             }
         }
+    }
+
+    fn log_fan_out(req_id: u64, pend_cmd: &CommandProcess, nodes_cnt: usize, status: &str) {
+        info!("Request {} {}: sent to {} of {} nodes, {} replies, {} nacks, {:?}",
+              req_id, status, pend_cmd.sent_to.len(), nodes_cnt,
+              pend_cmd.replies.values().sum::<usize>() + 1, pend_cmd.nack_cnt,
+              pend_cmd.started_at.elapsed());
+    }
+
+    fn get_upcoming_timeout(&self) -> Option<Duration> {
+        self.timeouts.next_timeout(Instant::now())
+    }
+
+    fn process_timeouts(&mut self) {
+        let now = Instant::now();
+
+        for (req_id, timeout) in self.timeouts.expire(now) {
+            // Timers of completed or cancelled requests are just skipped
+            let expired = match (timeout, self.pending_commands.get_mut(&req_id)) {
+                (RequestTimeout::Widen, Some(pend_cmd)) => {
+                    if pend_cmd.widen_at.map(|widen_at| widen_at <= now).unwrap_or(false) {
+                        debug!("Request {} is not replied in time, send it to the rest nodes", req_id);
+                        TransactionHandler::track_misses(&self.nodes, &mut self.node_stats, pend_cmd);
+                        TransactionHandler::widen_request(&self.nodes, &mut self.node_stats, pend_cmd);
+                    }
+                    false
+                }
+                (RequestTimeout::Deadline, Some(pend_cmd)) => pend_cmd.deadline <= now,
+                (_, None) => false
+            };
+
+            if expired {
+                let mut pend_cmd = self.pending_commands.remove(&req_id).unwrap();
+                TransactionHandler::track_misses(&self.nodes, &mut self.node_stats, &mut pend_cmd);
+                TransactionHandler::log_fan_out(req_id, &pend_cmd, self.nodes.len(), "timed out");
+                for &cmd_id in &pend_cmd.cmd_ids {
+                    CommandExecutor::instance().send(
+                        Command::Ledger(LedgerCommand::SubmitAck(cmd_id, Err(PoolError::Timeout)))).unwrap();
+                }
+            }
+        }
+    }
+
+    fn cancel_request(&mut self, cmd: &str, cmd_id: i32) -> Result<(), PoolError> {
+        let request: Value = serde_json::from_str(cmd)
+            .map_err(|err|
+                CommonError::InvalidStructure(
+                    format!("Invalid request json: {}", err.description())))?;
+
+        let request_id: u64 = request["reqId"]
+            .as_u64()
+            .ok_or(CommonError::InvalidStructure("No reqId in request".to_string()))?;
+
+        // Request can be already completed, so cancel of unknown request isn't an error
+        if let Some(pend_cmd) = self.pending_commands.remove(&request_id) {
+            TransactionHandler::log_fan_out(request_id, &pend_cmd, self.nodes.len(), "cancelled");
+            for &pend_cmd_id in &pend_cmd.cmd_ids {
+                CommandExecutor::instance().send(
+                    Command::Ledger(LedgerCommand::SubmitAck(pend_cmd_id, Err(PoolError::Cancelled))))?;
+            }
+        }
+
+        CommandExecutor::instance().send(
+            Command::Ledger(LedgerCommand::CancelAck(cmd_id, Ok(()))))?;
         Ok(())
     }
 
@@ -239,6 +466,8 @@ impl Default for TransactionHandler {
             pending_commands: HashMap::new(),
             f: 0,
             nodes: Vec::new(),
+            node_stats: HashMap::new(),
+            timeouts: TimerWheel::new(REQUEST_TIMER_TICK_MS, REQUEST_TIMER_SLOTS),
         }
     }
 }
@@ -274,11 +503,15 @@ impl PoolWorker {
     }
 
     fn init_catchup(&mut self, refresh_cmd_id: Option<i32>) -> Result<(), PoolError> {
+        let merkle_tree = PoolWorker::_restore_merkle_tree(self.name.as_str())?;
         let catchup_handler = CatchupHandler {
-            merkle_tree: PoolWorker::_restore_merkle_tree(self.name.as_str())?,
+            // Merkle tree is restored from all stored transactions
+            stored_txns_cnt: merkle_tree.count(),
+            merkle_tree: merkle_tree,
             initiate_cmd_id: refresh_cmd_id.unwrap_or(self.open_cmd_id),
             is_refresh: refresh_cmd_id.is_some(),
             pool_id: self.pool_id,
+            pool_name: self.name.clone(),
             ..Default::default()
         };
         self.handler = PoolWorkerHandler::CatchupHandler(catchup_handler);
@@ -288,11 +521,39 @@ impl PoolWorker {
 
     fn refresh(&mut self, cmd_id: i32) -> Result<(), PoolError> {
         match self.handler.flush_requests(Err(PoolError::Terminate)) {
-            Ok(()) => self.init_catchup(Some(cmd_id)),
+            Ok(()) => {
+                if let PoolWorkerHandler::TransactionHandler(ref mut th) = self.handler {
+                    self.node_stats = mem::replace(&mut th.node_stats, HashMap::new());
+                }
+                self.init_catchup(Some(cmd_id))
+            }
             Err(err) => CommandExecutor::instance().send(Command::Pool(PoolCommand::RefreshAck(cmd_id, Err(err)))).map_err(PoolError::from),
         }
     }
 
+    fn get_stats(&self, cmd_id: i32) -> Result<(), PoolError> {
+        let (node_stats, pending_requests) = match self.handler {
+            PoolWorkerHandler::CatchupHandler(_) => (&self.node_stats, 0),
+            PoolWorkerHandler::TransactionHandler(ref th) => (&th.node_stats, th.pending_commands.len()),
+        };
+
+        let stats = PoolStatsInfo {
+            nodes: self.handler.nodes().iter()
+                .map(|node| node_stats.get(&node.name).cloned().unwrap_or_default().to_info(&node.name))
+                .collect(),
+            pending_requests: pending_requests,
+        };
+
+        let res = stats.to_json()
+            .map_err(|err|
+                PoolError::CommonError(
+                    CommonError::InvalidState(
+                        format!("Can't serialize pool stats: {}", err.description()))));
+
+        CommandExecutor::instance().send(Command::Pool(PoolCommand::GetStatsAck(cmd_id, res)))?;
+        Ok(())
+    }
+
     pub fn run(&mut self) -> Result<(), PoolError> {
         self._run().or_else(|err: PoolError| {
             self.handler.flush_requests(Err(PoolError::Terminate))?;
@@ -313,6 +574,8 @@ impl PoolWorker {
 
             self.process_actions(actions).map_err(map_err_trace!("process_actions"))?;
 
+            self.handler.process_timeouts();
+
             trace!("zmq poll loop <<");
         }
     }
@@ -330,10 +593,19 @@ impl PoolWorker {
                 &ZMQLoopAction::Refresh(cmd_id) => {
                     self.refresh(cmd_id)?;
                 }
+                &ZMQLoopAction::GetStats(cmd_id) => {
+                    self.get_stats(cmd_id)?;
+                }
                 &ZMQLoopAction::MessageToProcess(ref msg) => {
                     if let Some(new_mt) = self.handler.process_msg(&msg.message, msg.node_idx)? {
+                        PoolWorker::_dump_merkle_tree(self.name.as_str(), &new_mt).unwrap_or_else(|err| {
+                            warn!("Can't store merkle tree of pool {}: {:?}", self.name, err);
+                        });
                         self.handler.flush_requests(Ok(()))?;
-                        self.handler = PoolWorkerHandler::TransactionHandler(Default::default());
+                        self.handler = PoolWorkerHandler::TransactionHandler(TransactionHandler {
+                            node_stats: mem::replace(&mut self.node_stats, HashMap::new()),
+                            ..Default::default()
+                        });
                         self.connect_to_known_nodes(Some(&new_mt))?;
                     }
                 }
@@ -346,6 +618,15 @@ impl PoolWorker {
                             })
                     })?;
                 }
+                &ZMQLoopAction::RequestToCancel(ref req) => {
+                    self.handler.cancel_request(req.request.as_str(), req.id).or_else(|err| {
+                        CommandExecutor::instance()
+                            .send(Command::Ledger(LedgerCommand::CancelAck(req.id, Err(err))))
+                            .map_err(|err| {
+                                CommonError::InvalidState("Can't send ACK cmd".to_string())
+                            })
+                    })?;
+                }
             }
         }
         Ok(())
@@ -354,8 +635,13 @@ impl PoolWorker {
     fn poll_zmq(&mut self) -> Result<Vec<ZMQLoopAction>, PoolError> {
         let mut actions: Vec<ZMQLoopAction> = Vec::new();
 
+        let timeout: i64 = match self.handler.get_upcoming_timeout() {
+            Some(timeout) => timeout.as_secs() as i64 * 1000 + (timeout.subsec_nanos() / 1_000_000) as i64 + 1,
+            None => -1
+        };
+
         let mut poll_items = self.get_zmq_poll_items()?;
-        let r = zmq::poll(poll_items.as_mut_slice(), -1)?;
+        let r = zmq::poll(poll_items.as_mut_slice(), timeout)?;
         trace!("zmq poll {:?}", r);
 
         for i in 0..self.handler.nodes().len() {
@@ -379,6 +665,16 @@ impl PoolWorker {
                 actions.push(ZMQLoopAction::Terminate(id));
             } else if "refresh".eq(cmd_s.as_str()) {
                 actions.push(ZMQLoopAction::Refresh(id));
+            } else if "stats".eq(cmd_s.as_str()) {
+                actions.push(ZMQLoopAction::GetStats(id));
+            } else if "cancel".eq(cmd_s.as_str()) && cmd.len() > 2 {
+                let request = String::from_utf8(cmd[2].clone())
+                    .map_err(|err|
+                        CommonError::InvalidState("Invalid command received".to_string()))?;
+                actions.push(ZMQLoopAction::RequestToCancel(RequestToSend {
+                    id: id,
+                    request: request,
+                }));
             } else {
                 actions.push(ZMQLoopAction::RequestToSend(RequestToSend {
                     id: id,
@@ -404,17 +700,129 @@ impl PoolWorker {
 
     fn _restore_merkle_tree(pool_name: &str) -> Result<MerkleTree, PoolError> {
         let mut p = EnvironmentUtils::pool_path(pool_name);
-        let mut mt = MerkleTree::from_vec(Vec::new())?;
-        //TODO firstly try to deserialize merkle tree
         p.push(pool_name);
         p.set_extension("txn");
-        let f = fs::File::open(p)?;
-        let reader = io::BufReader::new(&f);
-        for line in reader.lines() {
-            let line: String = line?;
-            mt.append(line)?;
+        let mut txns_data: Vec<u8> = Vec::new();
+        fs::File::open(p.as_path())?.read_to_end(&mut txns_data)?;
+        let txns: Vec<String> = str::from_utf8(&txns_data)
+            .map_err(|err| CommonError::InvalidStructure(format!("Invalid pool txns file: {}", err)))?
+            .lines()
+            .map(|txn| txn.to_string())
+            .collect();
+
+        // Snapshot allows to skip hashing of all transactions, it is used only
+        // if it was created for the same txns file (length and digest) and gives the same root
+        p.set_extension("mt");
+        let snapshot = match MerkleTreeSnapshot::load(p.as_path()) {
+            Ok(snapshot) => {
+                if snapshot.txns_len == txns_data.len() as u64
+                    && snapshot.leaves_hashes.len() == txns.len()
+                    && snapshot.txns_digest == MerkleTreeSnapshot::txns_digest(&[txns_data.as_slice()])? {
+                    Some(snapshot)
+                } else {
+                    warn!("Merkle tree snapshot of pool {} is outdated", pool_name);
+                    None
+                }
+            }
+            Err(err) => {
+                debug!("Can't load merkle tree snapshot of pool {}: {:?}", pool_name, err);
+                None
+            }
+        };
+
+        let txns = match snapshot {
+            Some(snapshot) => {
+                let mt = MerkleTree::from_vec_with_hashes(txns, snapshot.leaves_hashes)?;
+                if mt.root_hash().eq(&snapshot.root) {
+                    return Ok(mt);
+                }
+                warn!("Merkle tree snapshot of pool {} has invalid root", pool_name);
+                mt.into_iter().collect()
+            }
+            None => txns
+        };
+
+        Ok(MerkleTree::from_vec(txns)?)
+    }
+
+    // Stores transactions received by catchup and snapshot of merkle tree to open pool faster next time
+    fn _dump_merkle_tree(pool_name: &str, mt: &MerkleTree) -> Result<(), PoolError> {
+        let mut p = EnvironmentUtils::pool_path(pool_name);
+        p.push(pool_name);
+        p.set_extension("txn");
+
+        let mut stored_txns: Vec<u8> = Vec::new();
+        fs::File::open(p.as_path())?.read_to_end(&mut stored_txns)?;
+        let appended_txns = PoolWorker::_append_txns(p.as_path(), mt, PoolWorker::_count_txns(&stored_txns),
+                                                     stored_txns.last().cloned())?;
+
+        let txns_len = (stored_txns.len() + appended_txns.len()) as u64;
+        let txns_digest = MerkleTreeSnapshot::txns_digest(&[stored_txns.as_slice(), appended_txns.as_slice()])?;
+
+        p.set_extension("mt");
+        MerkleTreeSnapshot::new(mt, txns_len, txns_digest).store(p.as_path())
+    }
+
+    // Appends transactions missed in pool txns file that contains stored_cnt of them, returns new count.
+    // Merkle tree is always restored from the file, so stored transactions are its prefix.
+    // Only the last byte of the file is read, so storing of catchup progress doesn't depend on ledger size.
+    fn _dump_txns(pool_name: &str, mt: &MerkleTree, stored_cnt: usize) -> Result<usize, PoolError> {
+        let mut p = EnvironmentUtils::pool_path(pool_name);
+        p.push(pool_name);
+        p.set_extension("txn");
+
+        let mut f = fs::File::open(p.as_path())?;
+        let last_byte = if f.metadata()?.len() > 0 {
+            let mut byte = [0u8; 1];
+            f.seek(SeekFrom::End(-1))?;
+            f.read_exact(&mut byte)?;
+            Some(byte[0])
+        } else {
+            None
+        };
+
+        PoolWorker::_append_txns(p.as_path(), mt, stored_cnt, last_byte)?;
+        Ok(mt.count())
+    }
+
+    // Appends transactions of merkle tree after stored_cnt ones to txns file, returns appended bytes.
+    // Line break is added first if the last stored transaction isn't terminated.
+    fn _append_txns(path: &Path, mt: &MerkleTree, stored_cnt: usize, last_byte: Option<u8>) -> Result<Vec<u8>, PoolError> {
+        if stored_cnt > mt.count() {
+            return Err(PoolError::CommonError(CommonError::InvalidState(
+                "Pool txns file contains more transactions than merkle tree".to_string())));
+        }
+
+        let mut txns: Vec<u8> = Vec::new();
+
+        if stored_cnt == mt.count() {
+            return Ok(txns);
+        }
+
+        if last_byte.map(|byte| byte != b'\n').unwrap_or(false) {
+            txns.push(b'\n');
+        }
+
+        for txn in mt.iter().skip(stored_cnt) {
+            txns.extend_from_slice(txn.as_bytes());
+            txns.push(b'\n');
+        }
+
+        let mut f = fs::OpenOptions::new().append(true).open(path)?;
+        f.write_all(&txns)?;
+        f.sync_all()?;
+        Ok(txns)
+    }
+
+    // Count of lines as str::lines gives it
+    fn _count_txns(txns: &[u8]) -> usize {
+        let cnt = txns.iter().filter(|&&byte| byte == b'\n').count();
+
+        if txns.last().map(|&byte| byte != b'\n').unwrap_or(false) {
+            cnt + 1
+        } else {
+            cnt
         }
-        Ok(mt)
     }
 
     #[allow(unreachable_code)]
@@ -448,6 +856,7 @@ impl Pool {
                 pool_id: pool_id,
                 ..Default::default()
             }),
+            node_stats: HashMap::new(),
         };
 
         Ok(Pool {
@@ -479,6 +888,18 @@ impl Pool {
         LittleEndian::write_i32(&mut buf, cmd_id);
         Ok(self.cmd_sock.send_multipart(&["refresh".as_bytes(), &buf], zmq::DONTWAIT)?)
     }
+
+    pub fn get_stats(&self, cmd_id: i32) -> Result<(), PoolError> {
+        let mut buf = [0u8; 4];
+        LittleEndian::write_i32(&mut buf, cmd_id);
+        Ok(self.cmd_sock.send_multipart(&["stats".as_bytes(), &buf], zmq::DONTWAIT)?)
+    }
+
+    pub fn cancel_tx(&self, cmd_id: i32, json: &str) -> Result<(), PoolError> {
+        let mut buf = [0u8; 4];
+        LittleEndian::write_i32(&mut buf, cmd_id);
+        Ok(self.cmd_sock.send_multipart(&["cancel".as_bytes(), &buf, json.as_bytes()], zmq::DONTWAIT)?)
+    }
 }
 
 impl Drop for Pool {
@@ -639,6 +1060,14 @@ impl PoolService {
         Ok(cmd_id)
     }
 
+    pub fn cancel_tx(&self, handle: i32, json: &str) -> Result<i32, PoolError> {
+        let cmd_id: i32 = SequenceUtils::get_next_id();
+        self.pools.try_borrow().map_err(CommonError::from)?
+            .get(&handle).ok_or(PoolError::InvalidHandle("No pool with requested handle".to_string()))?
+            .cancel_tx(cmd_id, json)?;
+        Ok(cmd_id)
+    }
+
     pub fn close(&self, handle: i32) -> Result<i32, PoolError> {
         let cmd_id: i32 = SequenceUtils::get_next_id();
         self.pools.try_borrow_mut().map_err(CommonError::from)?
@@ -655,6 +1084,14 @@ impl PoolService {
             .map(|()| cmd_id)
     }
 
+    pub fn get_stats(&self, handle: i32) -> Result<i32, PoolError> {
+        let cmd_id: i32 = SequenceUtils::get_next_id();
+        self.pools.try_borrow().map_err(CommonError::from)?
+            .get(&handle).ok_or(PoolError::InvalidHandle("No pool with requested handle".to_string()))?
+            .get_stats(cmd_id)
+            .map(|()| cmd_id)
+    }
+
     pub fn get_pool_name(&self, handle: i32) -> Result<String, PoolError> {
         self.pools.try_borrow().map_err(CommonError::from)?.get(&handle).map_or(
             Err(PoolError::InvalidHandle("Doesn't exists".to_string())),
@@ -851,6 +1288,7 @@ mod tests {
                 open_cmd_id: 0,
                 name: "".to_string(),
                 handler: PoolWorkerHandler::CatchupHandler(Default::default()),
+                node_stats: HashMap::new(),
             }
         }
     }
@@ -878,6 +1316,126 @@ mod tests {
         assert_eq!(merkle_tree.root_hash_hex(), "1285070cf01debc1155cef8dfd5ba54c05abb919a4c08c8632b079fb1e1e5e7c", "test restored MT root hash");
     }
 
+    #[test]
+    fn pool_worker_restore_merkle_tree_works_from_snapshot() {
+        let pool_name = "test_restore_from_snapshot";
+        let txns: Vec<String> = (0..10000)
+            .map(|i| format!("{{\"data\":{{\"alias\":\"Node{}\"}},\"type\":\"0\",\"txnId\":\"{}\"}}", i, i))
+            .collect();
+        let mut path = ::utils::environment::EnvironmentUtils::pool_path(pool_name);
+        fs::create_dir_all(path.as_path()).unwrap();
+        path.push(pool_name);
+        path.set_extension("mt");
+        fs::remove_file(path.as_path()).ok();
+        path.set_extension("txn");
+        let mut f = fs::File::create(path.as_path()).unwrap();
+        f.write_all((txns.join("\n") + "\n").as_bytes()).unwrap();
+        f.sync_all().unwrap();
+
+        let merkle_tree = PoolWorker::_restore_merkle_tree(pool_name).unwrap();
+        PoolWorker::_dump_merkle_tree(pool_name, &merkle_tree).unwrap();
+
+        let restored_merkle_tree = PoolWorker::_restore_merkle_tree(pool_name).unwrap();
+
+        assert_eq!(restored_merkle_tree.count(), 10000);
+        assert_eq!(restored_merkle_tree.root_hash(), merkle_tree.root_hash());
+        assert_eq!(restored_merkle_tree.root, merkle_tree.root);
+
+        fs::remove_dir_all(::utils::environment::EnvironmentUtils::pool_path(pool_name)).unwrap();
+    }
+
+    #[test]
+    fn pool_worker_restore_merkle_tree_works_for_outdated_snapshot() {
+        let pool_name = "test_restore_outdated_snapshot";
+        let mut path = ::utils::environment::EnvironmentUtils::pool_path(pool_name);
+        fs::create_dir_all(path.as_path()).unwrap();
+        path.push(pool_name);
+        path.set_extension("txn");
+        fs::File::create(path.as_path()).unwrap().write_all(b"1\n2\n").unwrap();
+
+        let merkle_tree = PoolWorker::_restore_merkle_tree(pool_name).unwrap();
+        PoolWorker::_dump_merkle_tree(pool_name, &merkle_tree).unwrap();
+
+        fs::File::create(path.as_path()).unwrap().write_all(b"1\n2\n3\n").unwrap();
+
+        let restored_merkle_tree = PoolWorker::_restore_merkle_tree(pool_name).unwrap();
+
+        assert_eq!(restored_merkle_tree.count(), 3);
+        assert_eq!(restored_merkle_tree.root_hash(), MerkleTree::from_vec(vec!["1".to_string(), "2".to_string(), "3".to_string()]).unwrap().root_hash());
+
+        fs::remove_dir_all(::utils::environment::EnvironmentUtils::pool_path(pool_name)).unwrap();
+    }
+
+    #[test]
+    fn pool_worker_restore_merkle_tree_works_for_rewritten_txns_of_same_length() {
+        let pool_name = "test_restore_rewritten_txns";
+        let mut path = ::utils::environment::EnvironmentUtils::pool_path(pool_name);
+        fs::create_dir_all(path.as_path()).unwrap();
+        path.push(pool_name);
+        path.set_extension("txn");
+        fs::File::create(path.as_path()).unwrap().write_all(b"1\n2\n").unwrap();
+
+        let merkle_tree = PoolWorker::_restore_merkle_tree(pool_name).unwrap();
+        PoolWorker::_dump_merkle_tree(pool_name, &merkle_tree).unwrap();
+
+        fs::File::create(path.as_path()).unwrap().write_all(b"3\n4\n").unwrap();
+
+        let restored_merkle_tree = PoolWorker::_restore_merkle_tree(pool_name).unwrap();
+
+        assert_eq!(restored_merkle_tree.count(), 2);
+        assert_eq!(restored_merkle_tree.root_hash(), MerkleTree::from_vec(vec!["3".to_string(), "4".to_string()]).unwrap().root_hash());
+
+        fs::remove_dir_all(::utils::environment::EnvironmentUtils::pool_path(pool_name)).unwrap();
+    }
+
+    #[test]
+    fn pool_worker_dump_merkle_tree_works_for_unterminated_txns() {
+        let pool_name = "test_dump_unterminated_txns";
+        let mut path = ::utils::environment::EnvironmentUtils::pool_path(pool_name);
+        fs::create_dir_all(path.as_path()).unwrap();
+        path.push(pool_name);
+        path.set_extension("txn");
+        fs::File::create(path.as_path()).unwrap().write_all(b"1\n2").unwrap();
+
+        let mut merkle_tree = PoolWorker::_restore_merkle_tree(pool_name).unwrap();
+        merkle_tree.append("3".to_string()).unwrap();
+        PoolWorker::_dump_merkle_tree(pool_name, &merkle_tree).unwrap();
+
+        let mut txns = String::new();
+        fs::File::open(path.as_path()).unwrap().read_to_string(&mut txns).unwrap();
+        assert_eq!(txns, "1\n2\n3\n");
+
+        let restored_merkle_tree = PoolWorker::_restore_merkle_tree(pool_name).unwrap();
+        assert_eq!(restored_merkle_tree.root_hash(), merkle_tree.root_hash());
+
+        fs::remove_dir_all(::utils::environment::EnvironmentUtils::pool_path(pool_name)).unwrap();
+    }
+
+    #[test]
+    fn pool_worker_dump_txns_works() {
+        let pool_name = "test_dump_txns";
+        let mut path = ::utils::environment::EnvironmentUtils::pool_path(pool_name);
+        fs::create_dir_all(path.as_path()).unwrap();
+        path.push(pool_name);
+        path.set_extension("txn");
+        fs::File::create(path.as_path()).unwrap().write_all(b"1").unwrap();
+
+        let mut merkle_tree = PoolWorker::_restore_merkle_tree(pool_name).unwrap();
+        let mut stored_cnt = merkle_tree.count();
+
+        for txn in &["2", "3"] {
+            merkle_tree.append(txn.to_string()).unwrap();
+            stored_cnt = PoolWorker::_dump_txns(pool_name, &merkle_tree, stored_cnt).unwrap();
+        }
+        assert_eq!(stored_cnt, 3);
+
+        let mut txns = String::new();
+        fs::File::open(path.as_path()).unwrap().read_to_string(&mut txns).unwrap();
+        assert_eq!(txns, "1\n2\n3\n");
+
+        fs::remove_dir_all(::utils::environment::EnvironmentUtils::pool_path(pool_name)).unwrap();
+    }
+
     #[test]
     fn pool_worker_connect_to_known_nodes_works() {
         let mut pw: PoolWorker = Default::default();
@@ -939,13 +1497,10 @@ mod tests {
     fn transaction_handler_process_reply_works() {
         let mut th: TransactionHandler = Default::default();
         th.f = 1;
-        let mut pc = super::types::CommandProcess {
-            cmd_ids: Vec::new(),
-            replies: HashMap::new(),
-            nack_cnt: 0,
-        };
+        let mut pc = super::types::CommandProcess::new("", 0, Duration::from_millis(REQUEST_TIMEOUT_MS));
+        pc.cmd_ids.clear();
         let json = "{\"value\":1}";
-        pc.replies.insert(HashableValue { inner: serde_json::from_str(json).unwrap() }, 1);
+        pc.replies.insert(TransactionHandler::reply_digest(json).unwrap(), 1);
         let req_id = 1;
         th.pending_commands.insert(req_id, pc);
         let reply = super::types::Reply {
@@ -954,7 +1509,7 @@ mod tests {
             },
         };
 
-        th.process_reply(reply.result.req_id, &json.to_string());
+        th.process_reply(reply.result.req_id, &json.to_string(), 0);
 
         assert_eq!(th.pending_commands.len(), 0);
     }
@@ -963,14 +1518,11 @@ mod tests {
     fn transaction_handler_process_reply_works_for_different_replies_with_same_req_id() {
         let mut th: TransactionHandler = Default::default();
         th.f = 1;
-        let mut pc = super::types::CommandProcess {
-            cmd_ids: Vec::new(),
-            replies: HashMap::new(),
-            nack_cnt: 0,
-        };
+        let mut pc = super::types::CommandProcess::new("", 0, Duration::from_millis(REQUEST_TIMEOUT_MS));
+        pc.cmd_ids.clear();
         let json1 = "{\"value\":1}";
         let json2 = "{\"value\":2}";
-        pc.replies.insert(HashableValue { inner: serde_json::from_str(json1).unwrap() }, 1);
+        pc.replies.insert(TransactionHandler::reply_digest(json1).unwrap(), 1);
         let req_id = 1;
         th.pending_commands.insert(req_id, pc);
         let reply = super::types::Reply {
@@ -979,12 +1531,25 @@ mod tests {
             },
         };
 
-        th.process_reply(reply.result.req_id, &json2.to_string());
+        th.process_reply(reply.result.req_id, &json2.to_string(), 0);
 
         assert_eq!(th.pending_commands.len(), 1);
         assert_eq!(th.pending_commands.get(&req_id).unwrap().replies.len(), 2);
     }
 
+    #[test]
+    fn transaction_handler_reply_digest_works_for_different_data_keys_order() {
+        let reply1 = r#"{"op":"REPLY","result":{"reqId":1,"data":"{\"a\":1,\"b\":2}"}}"#;
+        let reply2 = r#"{"result":{"data":"{\"b\":2,\"a\":1}","reqId":1},"op":"REPLY"}"#;
+        let reply3 = r#"{"op":"REPLY","result":{"reqId":1,"data":"{\"a\":1,\"b\":3}"}}"#;
+
+        let digest1 = TransactionHandler::reply_digest(reply1).unwrap();
+
+        assert_eq!(digest1, TransactionHandler::reply_digest(reply2).unwrap());
+        assert_ne!(digest1, TransactionHandler::reply_digest(reply3).unwrap());
+        assert!(TransactionHandler::reply_digest("not json").is_err());
+    }
+
     #[test]
     fn transaction_handler_try_send_request_works_for_new_req_id() {
         let mut th: TransactionHandler = Default::default();
@@ -997,12 +1562,88 @@ mod tests {
 
         assert_eq!(th.pending_commands.len(), 1);
         let pending_cmd = th.pending_commands.get(&req_id).unwrap();
-        let exp_command_process = CommandProcess {
-            nack_cnt: 0,
-            replies: HashMap::new(),
-            cmd_ids: vec!(cmd_id),
-        };
-        assert_eq!(pending_cmd, &exp_command_process);
+        assert_eq!(pending_cmd.nack_cnt, 0);
+        assert_eq!(pending_cmd.replies, HashMap::new());
+        assert_eq!(pending_cmd.cmd_ids, vec!(cmd_id));
+        assert_eq!(pending_cmd.request, cmd);
+    }
+
+    #[test]
+    fn transaction_handler_is_read_request_works() {
+        let get_nym: Value = serde_json::from_str(r#"{"reqId":1,"operation":{"type":"105","dest":"did"}}"#).unwrap();
+        let nym: Value = serde_json::from_str(r#"{"reqId":1,"operation":{"type":"1","dest":"did"}}"#).unwrap();
+
+        assert!(TransactionHandler::is_read_request(&get_nym));
+        assert!(!TransactionHandler::is_read_request(&nym));
+    }
+
+    #[test]
+    fn transaction_handler_process_timeouts_works_for_widen() {
+        let mut th: TransactionHandler = Default::default();
+        let mut pc = super::types::CommandProcess::new("{}", 1, Duration::from_millis(REQUEST_TIMEOUT_MS));
+        let widen_at = Instant::now();
+        pc.widen_at = Some(widen_at);
+        th.timeouts.schedule(widen_at, (1, RequestTimeout::Widen));
+        th.pending_commands.insert(1, pc);
+
+        assert!(th.get_upcoming_timeout().is_some());
+
+        thread::sleep(Duration::from_millis(REQUEST_TIMER_TICK_MS));
+        th.process_timeouts();
+
+        assert_eq!(th.pending_commands.get(&1).unwrap().widen_at, None);
+        assert_eq!(th.get_upcoming_timeout(), None);
+    }
+
+    #[test]
+    fn transaction_handler_process_reply_tracks_node_latency() {
+        let mut th: TransactionHandler = Default::default();
+        th.f = 1;
+        th.nodes.push(RemoteNode { name: "n1".to_string(), public_key: Vec::new(), zaddr: String::new(), zsock: None, is_blacklisted: false });
+        let mut pc = super::types::CommandProcess::new("", 0, Duration::from_millis(REQUEST_TIMEOUT_MS));
+        pc.cmd_ids.clear();
+        pc.sent_to.push(0);
+        pc.pending_nodes.insert(0, Instant::now());
+        th.pending_commands.insert(1, pc);
+
+        th.process_reply(1, &"{\"value\":1}".to_string(), 0);
+        th.process_reply(1, &"{\"value\":2}".to_string(), 0);
+
+        assert_eq!(th.node_stats.get("n1").unwrap().replies_cnt, 1);
+        assert!(th.pending_commands.get(&1).unwrap().pending_nodes.is_empty());
+    }
+
+    #[test]
+    fn transaction_handler_nodes_by_rank_works() {
+        let mut th: TransactionHandler = Default::default();
+        for name in &["n1", "n2", "n3", "n4"] {
+            th.nodes.push(RemoteNode { name: name.to_string(), public_key: Vec::new(), zaddr: String::new(), zsock: None, is_blacklisted: false });
+        }
+
+        let mut slow = NodeStats::new();
+        slow.on_reply(Duration::from_millis(500));
+        let mut fast = NodeStats::new();
+        fast.on_reply(Duration::from_millis(5));
+        let mut unhealthy = NodeStats::new();
+        for _ in 0..10 {
+            unhealthy.on_miss();
+        }
+
+        th.node_stats.insert("n1".to_string(), unhealthy);
+        th.node_stats.insert("n2".to_string(), slow);
+        th.node_stats.insert("n3".to_string(), fast);
+
+        assert_eq!(vec![3, 2, 1, 0], th.nodes_by_rank());
+    }
+
+    #[test]
+    fn transaction_handler_try_send_request_schedules_deadline() {
+        let mut th: TransactionHandler = Default::default();
+
+        th.try_send_request("{\"reqId\": 3}", 1).unwrap();
+
+        assert_eq!(th.timeouts.len(), 1);
+        assert!(th.get_upcoming_timeout().is_some());
     }
 
     #[test]
@@ -0,0 +1,150 @@
+use super::byteorder::{ByteOrder, LittleEndian};
+
+use std::fs;
+use std::io::{Read, Write};
+use std::path::Path;
+
+use errors::common::CommonError;
+use errors::pool::PoolError;
+use services::ledger::merkletree::merkletree::MerkleTree;
+use utils::crypto::hash::{Hash, HASH_OUTPUT_LEN};
+
+const SNAPSHOT_MAGIC: &'static [u8] = b"IMTS";
+const SNAPSHOT_VERSION: u32 = 2;
+
+// magic, version, txns file length, leaves count
+const SNAPSHOT_HEADER_LEN: usize = 4 + 4 + 8 + 8;
+
+// Binary snapshot of pool ledger merkle tree: root and leaves hashes.
+// Leaves values are read from pool txns file, snapshot only allows to skip
+// hashing of every transaction. Snapshot is bound to txns file by its length
+// and digest, so leaves hashes are never used for other transactions.
+//
+// Format: magic | version u32 | txns_len u64 | count u64 | txns digest | root | count * leaf hash,
+// integers are little endian, hashes are HASH_OUTPUT_LEN bytes
+#[derive(Debug, PartialEq, Eq)]
+pub struct MerkleTreeSnapshot {
+    pub txns_len: u64,
+    pub txns_digest: Vec<u8>,
+    pub root: Vec<u8>,
+    pub leaves_hashes: Vec<Vec<u8>>,
+}
+
+impl MerkleTreeSnapshot {
+    pub fn new(mt: &MerkleTree, txns_len: u64, txns_digest: Vec<u8>) -> MerkleTreeSnapshot {
+        MerkleTreeSnapshot {
+            txns_len: txns_len,
+            txns_digest: txns_digest,
+            root: mt.root_hash().clone(),
+            leaves_hashes: mt.leaves_hashes().into_iter().cloned().collect(),
+        }
+    }
+
+    pub fn to_bytes(&self) -> Vec<u8> {
+        let mut bytes = vec![0u8; SNAPSHOT_HEADER_LEN];
+        bytes[..4].copy_from_slice(SNAPSHOT_MAGIC);
+        LittleEndian::write_u32(&mut bytes[4..8], SNAPSHOT_VERSION);
+        LittleEndian::write_u64(&mut bytes[8..16], self.txns_len);
+        LittleEndian::write_u64(&mut bytes[16..24], self.leaves_hashes.len() as u64);
+
+        bytes.reserve((self.leaves_hashes.len() + 2) * HASH_OUTPUT_LEN);
+        bytes.extend_from_slice(&self.txns_digest);
+        bytes.extend_from_slice(&self.root);
+
+        for hash in &self.leaves_hashes {
+            bytes.extend_from_slice(hash);
+        }
+
+        bytes
+    }
+
+    pub fn from_bytes(bytes: &[u8]) -> Result<MerkleTreeSnapshot, CommonError> {
+        if bytes.len() < SNAPSHOT_HEADER_LEN + 2 * HASH_OUTPUT_LEN
+            || &bytes[..4] != SNAPSHOT_MAGIC
+            || LittleEndian::read_u32(&bytes[4..8]) != SNAPSHOT_VERSION {
+            return Err(CommonError::InvalidStructure("Invalid merkle tree snapshot header".to_string()));
+        }
+
+        let txns_len = LittleEndian::read_u64(&bytes[8..16]);
+        let count = LittleEndian::read_u64(&bytes[16..24]) as usize;
+        let hashes = &bytes[SNAPSHOT_HEADER_LEN..];
+
+        if hashes.len() != (count + 2) * HASH_OUTPUT_LEN {
+            return Err(CommonError::InvalidStructure("Invalid merkle tree snapshot length".to_string()));
+        }
+
+        let mut hashes = hashes.chunks(HASH_OUTPUT_LEN).map(|hash| hash.to_vec());
+        let txns_digest = hashes.next().unwrap();
+        let root = hashes.next().unwrap();
+
+        Ok(MerkleTreeSnapshot {
+            txns_len: txns_len,
+            txns_digest: txns_digest,
+            root: root,
+            leaves_hashes: hashes.collect(),
+        })
+    }
+
+    // Digest of txns file content passed by parts
+    pub fn txns_digest(parts: &[&[u8]]) -> Result<Vec<u8>, CommonError> {
+        let mut ctx = Hash::new_context()?;
+
+        for part in parts {
+            ctx.update(part)?;
+        }
+
+        Ok(ctx.finish2()?.to_vec())
+    }
+
+    pub fn load(path: &Path) -> Result<MerkleTreeSnapshot, PoolError> {
+        let mut bytes: Vec<u8> = Vec::new();
+        fs::File::open(path)?.read_to_end(&mut bytes)?;
+        Ok(MerkleTreeSnapshot::from_bytes(&bytes)?)
+    }
+
+    // Snapshot is written to temporary file and renamed, so broken snapshot is never read
+    pub fn store(&self, path: &Path) -> Result<(), PoolError> {
+        let tmp_path = path.with_extension("mt.tmp");
+        {
+            let mut f = fs::File::create(&tmp_path)?;
+            f.write_all(&self.to_bytes())?;
+            f.sync_all()?;
+        }
+        fs::rename(&tmp_path, path)?;
+        Ok(())
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn merkle_tree_snapshot_to_bytes_from_bytes_works() {
+        let values: Vec<String> = (0..5).map(|i| i.to_string()).collect();
+        let mt = MerkleTree::from_vec(values).unwrap();
+        let snapshot = MerkleTreeSnapshot::new(&mt, 10, MerkleTreeSnapshot::txns_digest(&["txns".as_bytes()]).unwrap());
+
+        let bytes = snapshot.to_bytes();
+
+        assert_eq!(bytes.len(), SNAPSHOT_HEADER_LEN + 7 * HASH_OUTPUT_LEN);
+        assert_eq!(snapshot, MerkleTreeSnapshot::from_bytes(&bytes).unwrap());
+    }
+
+    #[test]
+    fn merkle_tree_snapshot_from_bytes_works_for_invalid_data() {
+        let mt = MerkleTree::from_vec(vec!["1".to_string()]).unwrap();
+        let bytes = MerkleTreeSnapshot::new(&mt, 1, MerkleTreeSnapshot::txns_digest(&["1".as_bytes()]).unwrap()).to_bytes();
+
+        assert!(MerkleTreeSnapshot::from_bytes(&bytes[..bytes.len() - 1]).is_err());
+        assert!(MerkleTreeSnapshot::from_bytes(&bytes[4..]).is_err());
+        assert!(MerkleTreeSnapshot::from_bytes(&[]).is_err());
+    }
+
+    #[test]
+    fn merkle_tree_snapshot_txns_digest_works() {
+        assert_eq!(MerkleTreeSnapshot::txns_digest(&["1\n2\n".as_bytes()]).unwrap(),
+                   MerkleTreeSnapshot::txns_digest(&["1\n".as_bytes(), "2\n".as_bytes()]).unwrap());
+        assert!(MerkleTreeSnapshot::txns_digest(&["1\n2\n".as_bytes()]).unwrap() != MerkleTreeSnapshot::txns_digest(&["2\n1\n".as_bytes()]).unwrap());
+    }
+}
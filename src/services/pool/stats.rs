@@ -0,0 +1,179 @@
+use std::time::Duration;
+
+use utils::json::JsonEncodable;
+
+// Upper bounds of round-trip histogram buckets, the last bucket keeps the rest
+const LATENCY_BUCKETS_MS: [u64; 13] = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000];
+
+// Node is considered unhealthy after this count of requests missed in a row
+const MAX_CONSECUTIVE_MISSES: usize = 3;
+
+// Weight of the last round-trip in average latency
+const LATENCY_EWMA_WEIGHT: f64 = 0.2;
+
+// Round-trip statistics of the node. Request is missed if the node
+// doesn't answer it till the request is widened to the rest nodes or timed out.
+#[derive(Debug, Clone)]
+pub struct NodeStats {
+    pub sent_cnt: usize,
+    pub replies_cnt: usize,
+    pub missed_cnt: usize,
+    consecutive_misses: usize,
+    avg_latency_ms: Option<f64>,
+    histogram: Vec<usize>,
+}
+
+#[derive(Serialize, Debug, PartialEq)]
+pub struct LatencyBucket {
+    pub le_ms: Option<u64>, /* None for the last unbounded bucket */
+    pub count: usize,
+}
+
+#[derive(Serialize, Debug, PartialEq)]
+pub struct NodeStatsInfo {
+    pub name: String,
+    pub sent: usize,
+    pub replies: usize,
+    pub missed: usize,
+    pub healthy: bool,
+    pub avg_latency_ms: Option<f64>,
+    pub histogram: Vec<LatencyBucket>,
+}
+
+#[derive(Serialize, Debug, PartialEq)]
+pub struct PoolStatsInfo {
+    pub nodes: Vec<NodeStatsInfo>,
+    pub pending_requests: usize,
+}
+
+impl JsonEncodable for PoolStatsInfo {}
+
+impl NodeStats {
+    pub fn new() -> NodeStats {
+        NodeStats {
+            sent_cnt: 0,
+            replies_cnt: 0,
+            missed_cnt: 0,
+            consecutive_misses: 0,
+            avg_latency_ms: None,
+            histogram: vec![0; LATENCY_BUCKETS_MS.len() + 1],
+        }
+    }
+
+    pub fn on_sent(&mut self) {
+        self.sent_cnt += 1;
+    }
+
+    pub fn on_reply(&mut self, latency: Duration) {
+        let latency_ms = latency.as_secs() as f64 * 1000.0 + latency.subsec_nanos() as f64 / 1_000_000.0;
+
+        let bucket = LATENCY_BUCKETS_MS.iter()
+            .position(|&le_ms| latency_ms <= le_ms as f64)
+            .unwrap_or(LATENCY_BUCKETS_MS.len());
+
+        self.histogram[bucket] += 1;
+        self.replies_cnt += 1;
+        self.consecutive_misses = 0;
+        self.avg_latency_ms = Some(match self.avg_latency_ms {
+            Some(avg) => avg + LATENCY_EWMA_WEIGHT * (latency_ms - avg),
+            None => latency_ms
+        });
+    }
+
+    pub fn on_miss(&mut self) {
+        self.missed_cnt += 1;
+        self.consecutive_misses += 1;
+    }
+
+    pub fn is_healthy(&self) -> bool {
+        self.consecutive_misses < MAX_CONSECUTIVE_MISSES
+    }
+
+    // Nodes with lower rank are asked first: healthy before unhealthy, then
+    // by average latency. Not measured nodes go first to get their latency.
+    pub fn rank(&self) -> (bool, u64) {
+        (!self.is_healthy(), self.avg_latency_ms.map(|avg| (avg * 1000.0) as u64).unwrap_or(0))
+    }
+
+    pub fn to_info(&self, name: &str) -> NodeStatsInfo {
+        let mut histogram: Vec<LatencyBucket> = LATENCY_BUCKETS_MS.iter()
+            .zip(self.histogram.iter())
+            .map(|(&le_ms, &count)| LatencyBucket { le_ms: Some(le_ms), count: count })
+            .collect();
+
+        histogram.push(LatencyBucket { le_ms: None, count: self.histogram[LATENCY_BUCKETS_MS.len()] });
+
+        NodeStatsInfo {
+            name: name.to_string(),
+            sent: self.sent_cnt,
+            replies: self.replies_cnt,
+            missed: self.missed_cnt,
+            healthy: self.is_healthy(),
+            avg_latency_ms: self.avg_latency_ms,
+            histogram: histogram,
+        }
+    }
+}
+
+impl Default for NodeStats {
+    fn default() -> Self {
+        NodeStats::new()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn node_stats_on_reply_works() {
+        let mut stats = NodeStats::new();
+        stats.on_sent();
+        stats.on_sent();
+        stats.on_reply(Duration::from_millis(3));
+        stats.on_reply(Duration::from_millis(60000));
+
+        let info = stats.to_info("n1");
+
+        assert_eq!(2, info.sent);
+        assert_eq!(2, info.replies);
+        assert_eq!(LATENCY_BUCKETS_MS.len() + 1, info.histogram.len());
+        assert_eq!(LatencyBucket { le_ms: Some(5), count: 1 }, info.histogram[2]);
+        assert_eq!(LatencyBucket { le_ms: None, count: 1 }, info.histogram[LATENCY_BUCKETS_MS.len()]);
+        assert_eq!(Some(3.0 + LATENCY_EWMA_WEIGHT * (60000.0 - 3.0)), info.avg_latency_ms);
+    }
+
+    #[test]
+    fn node_stats_is_healthy_works() {
+        let mut stats = NodeStats::new();
+
+        for _ in 0..MAX_CONSECUTIVE_MISSES {
+            assert!(stats.is_healthy());
+            stats.on_miss();
+        }
+        assert!(!stats.is_healthy());
+
+        stats.on_reply(Duration::from_millis(10));
+        assert!(stats.is_healthy());
+        assert_eq!(MAX_CONSECUTIVE_MISSES, stats.missed_cnt);
+    }
+
+    #[test]
+    fn node_stats_rank_works() {
+        let mut fast = NodeStats::new();
+        fast.on_reply(Duration::from_millis(5));
+
+        let mut slow = NodeStats::new();
+        slow.on_reply(Duration::from_millis(500));
+
+        let mut unhealthy = NodeStats::new();
+        unhealthy.on_reply(Duration::from_millis(1));
+        for _ in 0..MAX_CONSECUTIVE_MISSES {
+            unhealthy.on_miss();
+        }
+
+        assert!(NodeStats::new().rank() < fast.rank());
+        assert!(fast.rank() < slow.rank());
+        assert!(slow.rank() < unhealthy.rank());
+    }
+}
@@ -0,0 +1,122 @@
+use std::cmp;
+use std::time::{Duration, Instant};
+
+// Hashed timer wheel. Timers are put to slot by deadline tick, so schedule is O(1)
+// and expiration checks only slots of elapsed ticks instead of all pending timers.
+// Timers deadlines are rounded up to the tick.
+pub struct TimerWheel<T> {
+    tick_ms: u64,
+    slots: Vec<Vec<(Instant, T)>>,
+    started_at: Instant,
+    current_tick: u64,
+    len: usize,
+}
+
+impl<T> TimerWheel<T> {
+    pub fn new(tick_ms: u64, slots_cnt: usize) -> TimerWheel<T> {
+        TimerWheel {
+            tick_ms: tick_ms,
+            slots: (0..slots_cnt).map(|_| Vec::new()).collect(),
+            started_at: Instant::now(),
+            current_tick: 0,
+            len: 0,
+        }
+    }
+
+    pub fn len(&self) -> usize {
+        self.len
+    }
+
+    pub fn schedule(&mut self, deadline: Instant, item: T) {
+        let tick = cmp::max(self._tick(deadline), self.current_tick);
+        let slot = (tick % self.slots.len() as u64) as usize;
+        self.slots[slot].push((deadline, item));
+        self.len += 1;
+    }
+
+    // Time till the next tick if there are scheduled timers
+    pub fn next_timeout(&self, now: Instant) -> Option<Duration> {
+        if self.len == 0 {
+            return None;
+        }
+
+        let next_tick_at = self.started_at + Duration::from_millis((self.current_tick + 1) * self.tick_ms);
+
+        Some(if next_tick_at > now { next_tick_at - now } else { Duration::from_millis(0) })
+    }
+
+    pub fn expire(&mut self, now: Instant) -> Vec<T> {
+        let mut expired: Vec<T> = Vec::new();
+
+        if self.len == 0 {
+            self.current_tick = cmp::max(self._tick(now), self.current_tick);
+            return expired;
+        }
+
+        let now_tick = cmp::max(self._tick(now), self.current_tick);
+        let slots_cnt = self.slots.len() as u64;
+        let ticks_cnt = cmp::min(now_tick - self.current_tick + 1, slots_cnt);
+
+        for tick in self.current_tick..self.current_tick + ticks_cnt {
+            let slot = &mut self.slots[(tick % slots_cnt) as usize];
+            let timers: Vec<(Instant, T)> = slot.drain(..).collect();
+
+            for (deadline, item) in timers {
+                if deadline <= now {
+                    expired.push(item);
+                } else {
+                    slot.push((deadline, item));
+                }
+            }
+        }
+
+        self.len -= expired.len();
+        self.current_tick = now_tick;
+        expired
+    }
+
+    fn _tick(&self, instant: Instant) -> u64 {
+        if instant <= self.started_at {
+            return 0;
+        }
+
+        let elapsed = instant - self.started_at;
+        let elapsed_ms = elapsed.as_secs() * 1000 + (elapsed.subsec_nanos() / 1_000_000) as u64;
+        elapsed_ms / self.tick_ms
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn timer_wheel_expire_works() {
+        let mut wheel: TimerWheel<u64> = TimerWheel::new(10, 8);
+        let now = Instant::now();
+
+        wheel.schedule(now + Duration::from_millis(20), 1);
+        wheel.schedule(now + Duration::from_millis(500), 2);
+        assert_eq!(2, wheel.len());
+
+        assert_eq!(Vec::<u64>::new(), wheel.expire(now));
+        assert_eq!(vec![1], wheel.expire(now + Duration::from_millis(100)));
+        assert_eq!(1, wheel.len());
+
+        assert_eq!(Vec::<u64>::new(), wheel.expire(now + Duration::from_millis(200)));
+        assert_eq!(vec![2], wheel.expire(now + Duration::from_millis(600)));
+        assert_eq!(0, wheel.len());
+    }
+
+    #[test]
+    fn timer_wheel_next_timeout_works() {
+        let mut wheel: TimerWheel<u64> = TimerWheel::new(10, 8);
+        let now = Instant::now();
+
+        assert_eq!(None, wheel.next_timeout(now));
+
+        wheel.schedule(now + Duration::from_millis(1000), 1);
+
+        assert!(wheel.next_timeout(now).unwrap() <= Duration::from_millis(10));
+    }
+}
@@ -3,7 +3,7 @@ extern crate serde_json;
 use std::cmp;
 use std::cmp::Eq;
 use std::collections::{BinaryHeap, HashMap};
-use std::hash::{Hash, Hasher};
+use std::time::{Duration, Instant};
 use super::zmq;
 
 use services::ledger::merkletree::merkletree::MerkleTree;
@@ -187,40 +187,61 @@ pub struct RemoteNode {
 pub struct CatchUpProcess {
     pub merkle_tree: MerkleTree,
     pub pending_reps: BinaryHeap<(CatchupRep, usize)>,
+    pub requested: Vec<CatchupRange>, /* ranges requested from nodes and not applied yet */
 }
 
-#[derive(Debug)]
-pub struct HashableValue {
-    pub inner: serde_json::Value
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct CatchupRange {
+    pub start: usize,
+    pub end: usize,
+    pub node_idx: usize,
+    pub deadline: Instant, /* when to request the range from another node */
 }
 
-impl Eq for HashableValue {}
-
-impl Hash for HashableValue {
-    fn hash<H: Hasher>(&self, state: &mut H) {
-        serde_json::to_string(&self.inner).unwrap().hash(state); //TODO
-    }
+#[derive(Debug, PartialEq, Eq)]
+pub struct CommandProcess {
+    pub nack_cnt: usize,
+    pub replies: HashMap<Vec<u8> /* reply digest */, usize>,
+    pub cmd_ids: Vec<i32>,
+    pub request: String,
+    pub sent_to: Vec<usize>, /* indexes of nodes the request was sent to */
+    pub pending_nodes: HashMap<usize /* node index */, Instant /* sent at */>, /* nodes that haven't answered yet */
+    pub widen_at: Option<Instant>, /* when to send read request to the rest nodes */
+    pub started_at: Instant,
+    pub deadline: Instant,
 }
 
-impl PartialEq for HashableValue {
-    fn eq(&self, other: &HashableValue) -> bool {
-        self.inner.eq(&other.inner)
+impl CommandProcess {
+    pub fn new(request: &str, cmd_id: i32, timeout: Duration) -> CommandProcess {
+        let started_at = Instant::now();
+        CommandProcess {
+            nack_cnt: 0,
+            replies: HashMap::new(),
+            cmd_ids: vec!(cmd_id),
+            request: request.to_string(),
+            sent_to: Vec::new(),
+            pending_nodes: HashMap::new(),
+            widen_at: None,
+            started_at: started_at,
+            deadline: started_at + timeout,
+        }
     }
 }
 
-#[derive(Debug, PartialEq, Eq)]
-pub struct CommandProcess {
-    pub nack_cnt: usize,
-    pub replies: HashMap<HashableValue, usize>,
-    pub cmd_ids: Vec<i32>,
+#[derive(Debug, PartialEq, Eq, Clone, Copy)]
+pub enum RequestTimeout {
+    Widen,
+    Deadline,
 }
 
 #[derive(Debug, PartialEq, Eq)]
 pub enum ZMQLoopAction {
     RequestToSend(RequestToSend),
+    RequestToCancel(RequestToSend),
     MessageToProcess(MessageToProcess),
     Terminate(i32),
     Refresh(i32),
+    GetStats(i32),
 }
 
 #[derive(Debug, PartialEq, Eq)]
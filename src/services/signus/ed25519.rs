@@ -36,6 +36,10 @@ impl CryptoType for ED25519Signus {
         ED25519::verify(public_key, doc, signature)
     }
 
+    fn verify_batch(&self, public_key: &[u8], docs_and_signatures: &[(Vec<u8>, Vec<u8>)]) -> Result<Vec<bool>, CommonError> {
+        ED25519::verify_batch(public_key, docs_and_signatures)
+    }
+
     fn verkey_to_public_key(&self, vk: &[u8]) -> Result<Vec<u8>, CommonError> {
         ED25519::vk_to_curve25519(vk)
     }
@@ -31,6 +31,7 @@ trait CryptoType {
     fn create_key_pair_for_signature(&self, seed: Option<&[u8]>) -> Result<(Vec<u8>, Vec<u8>), CommonError>;
     fn sign(&self, private_key: &[u8], doc: &[u8]) -> Result<Vec<u8>, CommonError>;
     fn verify(&self, public_key: &[u8], doc: &[u8], signature: &[u8]) -> Result<bool, CommonError>;
+    fn verify_batch(&self, public_key: &[u8], docs_and_signatures: &[(Vec<u8>, Vec<u8>)]) -> Result<Vec<bool>, CommonError>;
     fn verkey_to_public_key(&self, vk: &[u8]) -> Result<Vec<u8>, CommonError>;
     fn signkey_to_private_key(&self, sk: &[u8]) -> Result<Vec<u8>, CommonError>;
 }
@@ -112,15 +113,28 @@ impl SignusService {
     }
 
     pub fn sign(&self, my_did: &MyDid, doc: &str) -> Result<String, SignusError> {
-        if !self.crypto_types.contains_key(&my_did.crypto_type.as_str()) {
-            return Err(
-                SignusError::UnknownCryptoError(
-                    format!("Trying to sign message with unknown crypto: {}", my_did.crypto_type)));
-        }
+        let signus = self._get_sign_crypto_type(my_did)?;
+        let sign_key = Base58::decode(&my_did.signkey)?;
 
-        let signus = self.crypto_types.get(&my_did.crypto_type.as_str()).unwrap();
+        SignusService::_sign(signus, &sign_key, doc)
+    }
 
+    pub fn sign_batch(&self, my_did: &MyDid, docs: &Vec<String>) -> Result<Vec<String>, SignusError> {
+        let signus = self._get_sign_crypto_type(my_did)?;
         let sign_key = Base58::decode(&my_did.signkey)?;
+
+        docs.iter()
+            .map(|doc| SignusService::_sign(signus, &sign_key, doc))
+            .collect()
+    }
+
+    fn _get_sign_crypto_type(&self, my_did: &MyDid) -> Result<&Box<CryptoType>, SignusError> {
+        self.crypto_types.get(&my_did.crypto_type.as_str())
+            .ok_or(SignusError::UnknownCryptoError(
+                format!("Trying to sign message with unknown crypto: {}", my_did.crypto_type)))
+    }
+
+    fn _sign(signus: &Box<CryptoType>, sign_key: &[u8], doc: &str) -> Result<String, SignusError> {
         let mut msg: Value = serde_json::from_str(doc)
             .map_err(|err|
                 SignusError::CommonError(
@@ -132,7 +146,7 @@ impl SignusService {
         }
 
         let signature = serialize_signature(msg.clone())?;
-        let signature = signus.sign(&sign_key, signature.as_bytes())?;
+        let signature = signus.sign(sign_key, signature.as_bytes())?;
         let signature = Base58::encode(&signature);
         msg["signature"] = Value::String(signature);
         let signed_msg: String = serde_json::to_string(&msg)
@@ -143,17 +157,79 @@ impl SignusService {
     }
 
     pub fn verify(&self, their_did: &TheirDid, signed_msg: &str) -> Result<bool, SignusError> {
-        if !self.crypto_types.contains_key(their_did.crypto_type.as_str()) {
-            return Err(SignusError::UnknownCryptoError(format!("Trying to verify message with unknown crypto: {}", their_did.crypto_type)));
+        let signus = self._get_verify_crypto_type(their_did)?;
+        let verkey = SignusService::_get_verkey(their_did)?;
+
+        let (message, signature) = SignusService::_parse_signed_msg(signed_msg)?;
+        Ok(signus.verify(&verkey, message.as_bytes(), &signature)?)
+    }
+
+    // Message that can't be verified (unknown DID, DID without valid verkey,
+    // malformed signed message) is reported as not verified and doesn't fail the whole batch
+    pub fn verify_batch(&self, their_dids: &HashMap<String, TheirDid>, signed_msgs: &Vec<(String, String)>) -> Vec<bool> {
+        let mut msgs_by_did: HashMap<&str, Vec<usize>> = HashMap::new();
+
+        for (i, &(ref did, _)) in signed_msgs.iter().enumerate() {
+            msgs_by_did.entry(did.as_str()).or_insert(Vec::new()).push(i);
         }
 
-        let signus = self.crypto_types.get(their_did.crypto_type.as_str()).unwrap();
+        let mut results: Vec<bool> = vec![false; signed_msgs.len()];
 
-        let verkey = match their_did.verkey {
-            Some(ref verkey) => Base58::decode(&verkey)?,
-            None => return Err(SignusError::CommonError(CommonError::InvalidStructure(format!("TheirDid doesn't contain verkey: {}", their_did.did))))
-        };
+        for (did, indexes) in msgs_by_did {
+            let their_did = match their_dids.get(did) {
+                Some(their_did) => their_did,
+                None => {
+                    warn!("Signed messages of unknown DID {} are not verified", did);
+                    continue;
+                }
+            };
+
+            let mut parsed_indexes: Vec<usize> = Vec::new();
+            let mut docs_and_signatures: Vec<(Vec<u8>, Vec<u8>)> = Vec::new();
+
+            for &i in indexes.iter() {
+                match SignusService::_parse_signed_msg(&signed_msgs[i].1) {
+                    Ok((message, signature)) => {
+                        parsed_indexes.push(i);
+                        docs_and_signatures.push((message.into_bytes(), signature));
+                    }
+                    Err(err) => warn!("Signed message {} is not verified: {:?}", i, err)
+                }
+            }
+
+            match self._verify_batch(their_did, &docs_and_signatures) {
+                Ok(verified) => {
+                    for (&i, verified) in parsed_indexes.iter().zip(verified) {
+                        results[i] = verified;
+                    }
+                }
+                Err(err) => warn!("Signed messages of DID {} are not verified: {:?}", did, err)
+            }
+        }
+
+        results
+    }
+
+    fn _verify_batch(&self, their_did: &TheirDid, docs_and_signatures: &[(Vec<u8>, Vec<u8>)]) -> Result<Vec<bool>, SignusError> {
+        let signus = self._get_verify_crypto_type(their_did)?;
+        let verkey = SignusService::_get_verkey(their_did)?;
+        Ok(signus.verify_batch(&verkey, docs_and_signatures)?)
+    }
+
+    fn _get_verify_crypto_type(&self, their_did: &TheirDid) -> Result<&Box<CryptoType>, SignusError> {
+        self.crypto_types.get(their_did.crypto_type.as_str())
+            .ok_or(SignusError::UnknownCryptoError(
+                format!("Trying to verify message with unknown crypto: {}", their_did.crypto_type)))
+    }
 
+    fn _get_verkey(their_did: &TheirDid) -> Result<Vec<u8>, SignusError> {
+        match their_did.verkey {
+            Some(ref verkey) => Ok(Base58::decode(&verkey)?),
+            None => Err(SignusError::CommonError(CommonError::InvalidStructure(format!("TheirDid doesn't contain verkey: {}", their_did.did))))
+        }
+    }
+
+    fn _parse_signed_msg(signed_msg: &str) -> Result<(String, Vec<u8>), SignusError> {
         let signed_msg: Value = serde_json::from_str(signed_msg)
             .map_err(|err|
                 SignusError::CommonError(
@@ -173,13 +249,36 @@ impl SignusService {
                     message[key] = signed_msg[key].clone();
                 }
             }
-            Ok(signus.verify(&verkey, &serialize_signature(message)?.as_bytes(), &signature)?)
+            Ok((serialize_signature(message)?, signature))
         } else {
             return Err(SignusError::CommonError(CommonError::InvalidStructure(format!("No signature field in message json"))));
         }
     }
 
+    pub fn sign_bytes(&self, my_did: &MyDid, doc: &[u8]) -> Result<Vec<u8>, SignusError> {
+        let signus = self._get_sign_crypto_type(my_did)?;
+        let sign_key = Base58::decode(&my_did.signkey)?;
+
+        Ok(signus.sign(&sign_key, doc)?)
+    }
+
+    pub fn verify_bytes(&self, their_did: &TheirDid, doc: &[u8], signature: &[u8]) -> Result<bool, SignusError> {
+        let signus = self._get_verify_crypto_type(their_did)?;
+        let verkey = SignusService::_get_verkey(their_did)?;
+
+        Ok(signus.verify(&verkey, doc, signature)?)
+    }
+
     pub fn encrypt(&self, my_did: &MyDid, their_did: &TheirDid, doc: &str) -> Result<(String, String), SignusError> {
+        let (encrypted_doc, nonce) = self.encrypt_bytes(my_did, their_did, doc.as_bytes())?;
+
+        let encrypted_doc = Base58::encode(&encrypted_doc);
+        let nonce = Base58::encode(&nonce);
+
+        Ok((encrypted_doc, nonce))
+    }
+
+    pub fn encrypt_bytes(&self, my_did: &MyDid, their_did: &TheirDid, doc: &[u8]) -> Result<(Vec<u8>, Vec<u8>), SignusError> {
         if !self.crypto_types.contains_key(&my_did.crypto_type.as_str()) {
             return Err(SignusError::UnknownCryptoError(format!("Trying to encrypt message with unknown crypto: {}", my_did.crypto_type)));
         }
@@ -197,14 +296,24 @@ impl SignusService {
         let secret_key = Base58::decode(&my_did.sk)?;
         let public_key = Base58::decode(&public_key)?;
 
-        let encrypted_doc = signus.encrypt(&secret_key, &public_key, &doc.as_bytes(), &nonce);
-        let encrypted_doc = Base58::encode(&encrypted_doc);
-        let nonce = Base58::encode(&nonce);
+        let encrypted_doc = signus.encrypt(&secret_key, &public_key, doc, &nonce);
 
         Ok((encrypted_doc, nonce))
     }
 
     pub fn decrypt(&self, my_did: &MyDid, their_did: &TheirDid, doc: &str, nonce: &str) -> Result<String, SignusError> {
+        let nonce = Base58::decode(&nonce)?;
+        let doc = Base58::decode(&doc)?;
+
+        let decrypted_doc = self.decrypt_bytes(my_did, their_did, &doc, &nonce)?;
+
+        let decrypted_doc = str::from_utf8(&decrypted_doc)
+            .map_err(|err|
+                CommonError::InvalidStructure(format!("Decrypted message is invalid string: {}", their_did.did)))?;
+        Ok(decrypted_doc.to_string())
+    }
+
+    pub fn decrypt_bytes(&self, my_did: &MyDid, their_did: &TheirDid, doc: &[u8], nonce: &[u8]) -> Result<Vec<u8>, SignusError> {
         if !self.crypto_types.contains_key(&my_did.crypto_type.as_str()) {
             return Err(SignusError::UnknownCryptoError(format!("MyDid crypto is unknown: {}, {}", my_did.did, my_did.crypto_type)));
         }
@@ -220,15 +329,8 @@ impl SignusService {
 
         let secret_key = Base58::decode(&my_did.sk)?;
         let public_key = Base58::decode(&public_key)?;
-        let nonce = Base58::decode(&nonce)?;
-        let doc = Base58::decode(&doc)?;
-
-        let decrypted_doc = signus.decrypt(&secret_key, &public_key, &doc, &nonce)?;
 
-        let decrypted_doc = str::from_utf8(&decrypted_doc)
-            .map_err(|err|
-                CommonError::InvalidStructure(format!("Decrypted message is invalid string: {}", their_did.did)))?;
-        Ok(decrypted_doc.to_string())
+        Ok(signus.decrypt(&secret_key, &public_key, doc, nonce)?)
     }
 }
 
@@ -314,6 +416,40 @@ mod tests {
         assert!(signature.is_ok());
     }
 
+    #[test]
+    fn sign_batch_works() {
+        let service = SignusService::new();
+
+        let did_info = MyDidInfo::new(None, None, None, None);
+        let my_did = service.create_my_did(&did_info).unwrap();
+
+        let messages = vec![
+            r#"{"reqId":1495034346617224651}"#.to_string(),
+            r#"{"reqId":1495034346617224652}"#.to_string()
+        ];
+
+        let signed_messages = service.sign_batch(&my_did, &messages).unwrap();
+        assert_eq!(2, signed_messages.len());
+        assert_eq!(service.sign(&my_did, &messages[0]).unwrap(), signed_messages[0]);
+        assert_eq!(service.sign(&my_did, &messages[1]).unwrap(), signed_messages[1]);
+    }
+
+    #[test]
+    fn sign_batch_works_for_invalid_message() {
+        let service = SignusService::new();
+
+        let did_info = MyDidInfo::new(None, None, None, None);
+        let my_did = service.create_my_did(&did_info).unwrap();
+
+        let messages = vec![
+            r#"{"reqId":1495034346617224651}"#.to_string(),
+            r#"1495034346617224652"#.to_string()
+        ];
+
+        let res = service.sign_batch(&my_did, &messages);
+        assert_match!(Err(SignusError::CommonError(CommonError::InvalidStructure(_))), res);
+    }
+
     #[test]
     fn sign_works_for_invalid_signkey() {
         let service = SignusService::new();
@@ -375,6 +511,65 @@ mod tests {
         assert!(valid);
     }
 
+    #[test]
+    fn sign_verify_batch_works() {
+        let service = SignusService::new();
+
+        let my_did1 = service.create_my_did(&MyDidInfo::new(None, None, None, None)).unwrap();
+        let my_did2 = service.create_my_did(&MyDidInfo::new(None, None, None, None)).unwrap();
+
+        let message = r#"{"reqId":1495034346617224651}"#;
+
+        let signed_msg1 = service.sign(&my_did1, message).unwrap();
+        let signed_msg2 = service.sign(&my_did2, message).unwrap();
+
+        let mut their_dids: HashMap<String, TheirDid> = HashMap::new();
+        their_dids.insert(my_did1.did.clone(), TheirDid::new(my_did1.did.clone(), DEFAULT_CRYPTO_TYPE.to_string(), Some(my_did1.verkey.clone()), None, None));
+        their_dids.insert(my_did2.did.clone(), TheirDid::new(my_did2.did.clone(), DEFAULT_CRYPTO_TYPE.to_string(), Some(my_did2.verkey.clone()), None, None));
+
+        let signed_msgs = vec![
+            (my_did1.did.clone(), signed_msg1.clone()),
+            (my_did2.did.clone(), signed_msg2.clone()),
+            (my_did1.did.clone(), signed_msg2.clone())
+        ];
+
+        let res = service.verify_batch(&their_dids, &signed_msgs);
+        assert_eq!(vec![true, true, false], res);
+    }
+
+    #[test]
+    fn verify_batch_works_for_unknown_did() {
+        let service = SignusService::new();
+
+        let my_did = service.create_my_did(&MyDidInfo::new(None, None, None, None)).unwrap();
+        let signed_msg = service.sign(&my_did, r#"{"reqId":1495034346617224651}"#).unwrap();
+
+        let res = service.verify_batch(&HashMap::new(), &vec![(my_did.did.clone(), signed_msg)]);
+        assert_eq!(vec![false], res);
+    }
+
+    #[test]
+    fn verify_batch_works_for_malformed_messages() {
+        let service = SignusService::new();
+
+        let my_did = service.create_my_did(&MyDidInfo::new(None, None, None, None)).unwrap();
+        let signed_msg = service.sign(&my_did, r#"{"reqId":1495034346617224651}"#).unwrap();
+
+        let mut their_dids: HashMap<String, TheirDid> = HashMap::new();
+        their_dids.insert(my_did.did.clone(), TheirDid::new(my_did.did.clone(), DEFAULT_CRYPTO_TYPE.to_string(), Some(my_did.verkey.clone()), None, None));
+
+        let signed_msgs = vec![
+            (my_did.did.clone(), signed_msg.clone()),
+            (my_did.did.clone(), r#"{"reqId":1495034346617224651}"#.to_string()),
+            (my_did.did.clone(), r#"{"reqId":1495034346617224651,"signature":"2Vc4"}"#.to_string()),
+            (my_did.did.clone(), "invalid".to_string()),
+            (my_did.did.clone(), signed_msg.clone())
+        ];
+
+        let res = service.verify_batch(&their_dids, &signed_msgs);
+        assert_eq!(vec![true, false, false, false, true], res);
+    }
+
     #[test]
     fn try_verify_with_invalid_verkey() {
         let service = SignusService::new();
@@ -440,6 +635,34 @@ mod tests {
         assert!(encrypted_message.is_ok());
     }
 
+    #[test]
+    fn sign_verify_bytes_works() {
+        let service = SignusService::new();
+
+        let my_did = service.create_my_did(&MyDidInfo::new(None, None, None, None)).unwrap();
+        let their_did = TheirDid::new(my_did.did.clone(), DEFAULT_CRYPTO_TYPE.to_string(), Some(my_did.verkey.clone()), None, None);
+
+        let msg = vec![0, 1, 2, 0, 255];
+
+        let signature = service.sign_bytes(&my_did, &msg).unwrap();
+        assert!(service.verify_bytes(&their_did, &msg, &signature).unwrap());
+        assert!(!service.verify_bytes(&their_did, &vec![0, 1, 2], &signature).unwrap());
+    }
+
+    #[test]
+    fn encrypt_decrypt_bytes_works() {
+        let service = SignusService::new();
+
+        let my_did = service.create_my_did(&MyDidInfo::new(None, None, None, None)).unwrap();
+        let their_did = TheirDid::new(my_did.did.clone(), DEFAULT_CRYPTO_TYPE.to_string(), Some(my_did.verkey.clone()), Some(my_did.pk.clone()), None);
+
+        let msg = vec![0, 1, 2, 0, 255];
+
+        let (encrypted_msg, nonce) = service.encrypt_bytes(&my_did, &their_did, &msg).unwrap();
+        let decrypted_msg = service.decrypt_bytes(&my_did, &their_did, &encrypted_msg, &nonce).unwrap();
+        assert_eq!(msg, decrypted_msg);
+    }
+
     #[test]
     fn encrypt_decrypt_works() {
         let service = SignusService::new();
@@ -43,77 +43,87 @@ struct DefaultWalletRecord {
 struct DefaultWallet {
     name: String,
     pool_name: String,
-    config: DefaultWalletRuntimeConfig
+    config: DefaultWalletRuntimeConfig,
+    connection: Connection
 }
 
 impl DefaultWallet {
     fn new(name: &str,
            pool_name: &str,
            config: DefaultWalletRuntimeConfig,
-           credentials: DefaultWalletCredentials) -> DefaultWallet {
+           credentials: DefaultWalletCredentials,
+           connection: Connection) -> DefaultWallet {
         DefaultWallet {
             name: name.to_string(),
             pool_name: pool_name.to_string(),
-            config: config
+            config: config,
+            connection: connection
+        }
+    }
+
+    fn _get_record(&self, key: &str) -> Result<DefaultWalletRecord, WalletError> {
+        let mut stmt = self.connection.prepare_cached("SELECT key, value, time_created FROM wallet WHERE key = ?1 LIMIT 1")?;
+        let mut records = stmt.query_map(&[&key.to_string()], |row| {
+            DefaultWalletRecord {
+                key: row.get(0),
+                value: row.get(1),
+                time_created: row.get(2)
+            }
+        })?;
+
+        let record = records.next();
+
+        match record {
+            Some(record) => Ok(record?),
+            None => Err(WalletError::NotFound(format!("Wallet record is not found: {}", key)))
         }
     }
 }
 
 impl Wallet for DefaultWallet {
     fn set(&self, key: &str, value: &str) -> Result<(), WalletError> {
-        _open_connection(self.name.as_str())?
-            .execute(
-                "INSERT OR REPLACE INTO wallet (key, value, time_created) VALUES (?1, ?2, ?3)",
-                &[&key.to_string(), &value.to_string(), &time::get_time()])?;
+        self.connection
+            .prepare_cached("INSERT OR REPLACE INTO wallet (key, value, time_created) VALUES (?1, ?2, ?3)")?
+            .execute(&[&key.to_string(), &value.to_string(), &time::get_time()])?;
         Ok(())
     }
 
     fn get(&self, key: &str) -> Result<String, WalletError> {
-        let record = _open_connection(self.name.as_str())?
-            .query_row(
-                "SELECT key, value, time_created FROM wallet WHERE key = ?1 LIMIT 1",
-                &[&key.to_string()], |row| {
-                    DefaultWalletRecord {
-                        key: row.get(0),
-                        value: row.get(1),
-                        time_created: row.get(2)
-                    }
-                })?;
+        let record = self._get_record(key)?;
         Ok(record.value)
     }
 
     fn list(&self, key_prefix: &str) -> Result<Vec<(String, String)>, WalletError> {
-        let connection = _open_connection(self.name.as_str())?;
-        let mut stmt = connection.prepare("SELECT key, value, time_created FROM wallet WHERE key like ?1 order by key")?;
-        let records = stmt.query_map(&[&format!("{}%", key_prefix)], |row| {
-            DefaultWalletRecord {
-                key: row.get(0),
-                value: row.get(1),
-                time_created: row.get(2)
-            }
-        })?;
+        // Prefix is listed as a range scan [key_prefix, upper_bound) over the primary key index,
+        // unlike LIKE it is always served from the index
+        let key_prefix = key_prefix.to_string();
 
         let mut key_values = Vec::new();
 
-        for record in records {
-            let key_value = record?;
-            key_values.push((key_value.key, key_value.value));
+        match _prefix_upper_bound(&key_prefix) {
+            Some(upper_bound) => {
+                let mut stmt = self.connection.prepare_cached("SELECT key, value FROM wallet WHERE key >= ?1 AND key < ?2 ORDER BY key")?;
+                let records = stmt.query_map(&[&key_prefix, &upper_bound], |row| (row.get(0), row.get(1)))?;
+
+                for record in records {
+                    key_values.push(record?);
+                }
+            }
+            None => {
+                let mut stmt = self.connection.prepare_cached("SELECT key, value FROM wallet WHERE key >= ?1 ORDER BY key")?;
+                let records = stmt.query_map(&[&key_prefix], |row| (row.get(0), row.get(1)))?;
+
+                for record in records {
+                    key_values.push(record?);
+                }
+            }
         }
 
         Ok(key_values)
     }
 
     fn get_not_expired(&self, key: &str) -> Result<String, WalletError> {
-        let record = _open_connection(self.name.as_str())?
-            .query_row(
-                "SELECT key, value, time_created FROM wallet WHERE key = ?1 LIMIT 1",
-                &[&key.to_string()], |row| {
-                    DefaultWalletRecord {
-                        key: row.get(0),
-                        value: row.get(1),
-                        time_created: row.get(2)
-                    }
-                })?;
+        let record = self._get_record(key)?;
 
         if self.config.freshness_time != 0
             && time::get_time().sub(record.time_created).num_seconds() > self.config.freshness_time {
@@ -163,13 +173,18 @@ impl WalletType for DefaultWalletType {
             None => DefaultWalletRuntimeConfig::default()
         };
 
+        // Connection is opened once and kept for the whole wallet lifetime,
+        // so prepared statements can be cached between operations
+        let connection = _open_connection(name)?;
+
         // FIXME: parse and implement credentials!!!
         Ok(Box::new(
             DefaultWallet::new(
                 name,
                 pool_name,
                 runtime_config,
-                DefaultWalletCredentials {})))
+                DefaultWalletCredentials {},
+                connection)))
     }
 }
 
@@ -190,6 +205,26 @@ fn _open_connection(name: &str) -> Result<Connection, WalletError> {
     Ok(Connection::open(path)?)
 }
 
+// The least string that is greater than all strings starting with the prefix,
+// None if there is no such string (empty prefix)
+fn _prefix_upper_bound(prefix: &str) -> Option<String> {
+    let mut chars: Vec<char> = prefix.chars().collect();
+
+    while let Some(c) = chars.pop() {
+        let next = match c as u32 {
+            0xD7FF => Some('\u{E000}'),
+            code => ::std::char::from_u32(code + 1)
+        };
+
+        if let Some(next) = next {
+            chars.push(next);
+            return Some(chars.into_iter().collect());
+        }
+    }
+
+    None
+}
+
 impl From<rusqlite::Error> for WalletError {
     fn from(err: rusqlite::Error) -> WalletError {
         match err {
@@ -371,6 +406,57 @@ mod tests {
         TestUtils::cleanup_indy_home();
     }
 
+    #[test]
+    fn default_wallet_list_works_for_neighbour_prefixes() {
+        TestUtils::cleanup_indy_home();
+
+        let wallet_type = DefaultWalletType::new();
+        wallet_type.create("wallet1", None, None).unwrap();
+        let wallet = wallet_type.open("wallet1", "pool1", None, None, None).unwrap();
+
+        wallet.set("claim::1", "value1").unwrap();
+        wallet.set("claim::2", "value2").unwrap();
+        wallet.set("claim:", "value3").unwrap();
+        wallet.set("claim;", "value4").unwrap();
+        wallet.set("claim_offer_json::1", "value5").unwrap();
+        wallet.set("CLAIM::3", "value6").unwrap();
+
+        let key_values = wallet.list("claim::").unwrap();
+        assert_eq!(vec![("claim::1".to_string(), "value1".to_string()),
+                        ("claim::2".to_string(), "value2".to_string())], key_values);
+
+        assert_eq!(6, wallet.list("").unwrap().len());
+
+        TestUtils::cleanup_indy_home();
+    }
+
+    #[test]
+    fn prefix_upper_bound_works() {
+        assert_eq!(Some("claim:;".to_string()), _prefix_upper_bound("claim::"));
+        assert_eq!(Some("b".to_string()), _prefix_upper_bound("a"));
+        assert_eq!(Some("\u{E000}".to_string()), _prefix_upper_bound("\u{D7FF}"));
+        assert_eq!(Some("b".to_string()), _prefix_upper_bound("a\u{10FFFF}"));
+        assert_eq!(None, _prefix_upper_bound(""));
+    }
+
+    #[test]
+    fn default_wallet_set_get_list_works_for_many_operations() {
+        TestUtils::cleanup_indy_home();
+
+        let wallet_type = DefaultWalletType::new();
+        wallet_type.create("wallet1", None, None).unwrap();
+        let wallet = wallet_type.open("wallet1", "pool1", None, None, None).unwrap();
+
+        for i in 0..10 {
+            wallet.set(&format!("key1::subkey{}", i), &format!("value{}", i)).unwrap();
+            assert_eq!(format!("value{}", i), wallet.get(&format!("key1::subkey{}", i)).unwrap());
+            assert_eq!(format!("value{}", i), wallet.get_not_expired(&format!("key1::subkey{}", i)).unwrap());
+            assert_eq!(i + 1, wallet.list("key1::").unwrap().len());
+        }
+
+        TestUtils::cleanup_indy_home();
+    }
+
     #[test]
     fn default_wallet_get_pool_name_works() {
         TestUtils::cleanup_indy_home();
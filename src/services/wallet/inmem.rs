@@ -0,0 +1,313 @@
+extern crate time;
+
+use super::{Wallet, WalletType};
+
+use errors::wallet::WalletError;
+use utils::environment::EnvironmentUtils;
+use utils::json::{JsonDecodable, JsonEncodable};
+
+use self::time::Timespec;
+
+use std::cell::RefCell;
+use std::collections::{BTreeMap, HashMap};
+use std::fs;
+use std::io::{Read, Write};
+use std::ops::Sub;
+use std::path::PathBuf;
+use std::rc::Rc;
+
+#[derive(Deserialize)]
+struct InmemWalletConfig {
+    #[serde(default)]
+    snapshot: bool
+}
+
+impl<'a> JsonDecodable<'a> for InmemWalletConfig {}
+
+impl Default for InmemWalletConfig {
+    fn default() -> Self {
+        InmemWalletConfig { snapshot: false }
+    }
+}
+
+#[derive(Deserialize)]
+struct InmemWalletRuntimeConfig {
+    freshness_time: i64
+}
+
+impl<'a> JsonDecodable<'a> for InmemWalletRuntimeConfig {}
+
+impl Default for InmemWalletRuntimeConfig {
+    fn default() -> Self {
+        InmemWalletRuntimeConfig { freshness_time: 1000 }
+    }
+}
+
+struct InmemWalletRecord {
+    value: String,
+    time_created: Timespec
+}
+
+#[derive(Serialize, Deserialize)]
+struct InmemWalletSnapshotRecord {
+    key: String,
+    value: String,
+    time_created: i64
+}
+
+#[derive(Serialize, Deserialize)]
+struct InmemWalletSnapshot {
+    records: Vec<InmemWalletSnapshotRecord>
+}
+
+impl JsonEncodable for InmemWalletSnapshot {}
+
+impl<'a> JsonDecodable<'a> for InmemWalletSnapshot {}
+
+// Records are ordered by key, so list is a range scan from key prefix
+type InmemWalletRecords = Rc<RefCell<BTreeMap<String, InmemWalletRecord>>>;
+
+struct InmemWallet {
+    name: String,
+    pool_name: String,
+    config: InmemWalletRuntimeConfig,
+    snapshot: bool,
+    records: InmemWalletRecords
+}
+
+impl Wallet for InmemWallet {
+    fn set(&self, key: &str, value: &str) -> Result<(), WalletError> {
+        self.records.borrow_mut().insert(key.to_string(), InmemWalletRecord {
+            value: value.to_string(),
+            time_created: time::get_time()
+        });
+        Ok(())
+    }
+
+    fn get(&self, key: &str) -> Result<String, WalletError> {
+        match self.records.borrow().get(key) {
+            Some(record) => Ok(record.value.clone()),
+            None => Err(WalletError::NotFound(format!("Wallet record is not found: {}", key)))
+        }
+    }
+
+    fn list(&self, key_prefix: &str) -> Result<Vec<(String, String)>, WalletError> {
+        Ok(self.records.borrow()
+            .range(key_prefix.to_string()..)
+            .take_while(|&(key, _)| key.starts_with(key_prefix))
+            .map(|(key, record)| (key.clone(), record.value.clone()))
+            .collect())
+    }
+
+    fn get_not_expired(&self, key: &str) -> Result<String, WalletError> {
+        match self.records.borrow().get(key) {
+            Some(ref record) if self.config.freshness_time == 0
+                || time::get_time().sub(record.time_created).num_seconds() <= self.config.freshness_time => Ok(record.value.clone()),
+            _ => Err(WalletError::NotFound(key.to_string()))
+        }
+    }
+
+    fn get_pool_name(&self) -> String {
+        self.pool_name.clone()
+    }
+
+    fn get_name(&self) -> String {
+        self.name.clone()
+    }
+
+    fn close(&self) -> Result<(), WalletError> {
+        if self.snapshot {
+            _store_snapshot(&self.name, &self.records.borrow())?;
+        }
+        Ok(())
+    }
+}
+
+// Wallet without disk storage. Records are kept by wallet type, so they survive
+// close and open in the same process. If wallet config is {"snapshot": true},
+// records are written to wallet directory on close and read on the first open in other process.
+pub struct InmemWalletType {
+    wallets: RefCell<HashMap<String, InmemWalletRecords>>
+}
+
+impl InmemWalletType {
+    pub fn new() -> InmemWalletType {
+        InmemWalletType {
+            wallets: RefCell::new(HashMap::new())
+        }
+    }
+}
+
+impl WalletType for InmemWalletType {
+    fn create(&self, name: &str, config: Option<&str>, credentials: Option<&str>) -> Result<(), WalletError> {
+        if let Some(config) = config {
+            InmemWalletConfig::from_json(config)?;
+        }
+
+        // WalletService checks that wallet directory doesn't exist, so records
+        // left here belong to wallet which directory was removed without delete
+        self.wallets.borrow_mut().insert(name.to_string(), Rc::new(RefCell::new(BTreeMap::new())));
+        Ok(())
+    }
+
+    fn delete(&self, name: &str, config: Option<&str>, credentials: Option<&str>) -> Result<(), WalletError> {
+        // Snapshot is removed with wallet directory
+        self.wallets.borrow_mut().remove(name);
+        Ok(())
+    }
+
+    fn open(&self, name: &str, pool_name: &str, config: Option<&str>, runtime_config: Option<&str>, credentials: Option<&str>) -> Result<Box<Wallet>, WalletError> {
+        let config = match config {
+            Some(config) => InmemWalletConfig::from_json(config)?,
+            None => InmemWalletConfig::default()
+        };
+
+        let runtime_config = match runtime_config {
+            Some(config) => InmemWalletRuntimeConfig::from_json(config)?,
+            None => InmemWalletRuntimeConfig::default()
+        };
+
+        let mut wallets = self.wallets.borrow_mut();
+
+        if !wallets.contains_key(name) {
+            // Wallet was created by other process, records are restored from snapshot if there is one
+            let records = if config.snapshot && _snapshot_path(name).exists() {
+                _load_snapshot(name)?
+            } else {
+                BTreeMap::new()
+            };
+
+            wallets.insert(name.to_string(), Rc::new(RefCell::new(records)));
+        }
+
+        Ok(Box::new(InmemWallet {
+            name: name.to_string(),
+            pool_name: pool_name.to_string(),
+            config: runtime_config,
+            snapshot: config.snapshot,
+            records: wallets[name].clone()
+        }))
+    }
+}
+
+fn _snapshot_path(name: &str) -> PathBuf {
+    EnvironmentUtils::wallet_path(name).join("inmem.json")
+}
+
+fn _load_snapshot(name: &str) -> Result<BTreeMap<String, InmemWalletRecord>, WalletError> {
+    let mut snapshot_json = String::new();
+    fs::File::open(_snapshot_path(name))?.read_to_string(&mut snapshot_json)?;
+
+    Ok(InmemWalletSnapshot::from_json(&snapshot_json)?
+        .records
+        .into_iter()
+        .map(|record| (record.key, InmemWalletRecord {
+            value: record.value,
+            time_created: Timespec::new(record.time_created, 0)
+        }))
+        .collect())
+}
+
+// Snapshot is written to temporary file and renamed, so broken snapshot is never read
+fn _store_snapshot(name: &str, records: &BTreeMap<String, InmemWalletRecord>) -> Result<(), WalletError> {
+    let snapshot = InmemWalletSnapshot {
+        records: records.iter()
+            .map(|(key, record)| InmemWalletSnapshotRecord {
+                key: key.clone(),
+                value: record.value.clone(),
+                time_created: record.time_created.sec
+            })
+            .collect()
+    };
+
+    let path = _snapshot_path(name);
+    let tmp_path = path.with_extension("json.tmp");
+    {
+        let mut f = fs::File::create(&tmp_path)?;
+        f.write_all(snapshot.to_json()?.as_bytes())?;
+        f.sync_all()?;
+    }
+    fs::rename(&tmp_path, path)?;
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use utils::test::TestUtils;
+
+    #[test]
+    fn inmem_wallet_type_open_works_for_reopen() {
+        let wallet_type = InmemWalletType::new();
+        wallet_type.create("wallet1", None, None).unwrap();
+
+        {
+            let wallet = wallet_type.open("wallet1", "pool1", None, None, None).unwrap();
+            wallet.set("key1", "value1").unwrap();
+            wallet.close().unwrap();
+        }
+
+        let wallet = wallet_type.open("wallet1", "pool1", None, None, None).unwrap();
+        assert_eq!("value1", wallet.get("key1").unwrap());
+    }
+
+    #[test]
+    fn inmem_wallet_list_works() {
+        let wallet_type = InmemWalletType::new();
+        wallet_type.create("wallet1", None, None).unwrap();
+        let wallet = wallet_type.open("wallet1", "pool1", None, None, None).unwrap();
+
+        wallet.set("key1", "value1").unwrap();
+        wallet.set("key2", "value2").unwrap();
+        wallet.set("other", "value3").unwrap();
+
+        assert_eq!(vec![("key1".to_string(), "value1".to_string()), ("key2".to_string(), "value2".to_string())],
+                   wallet.list("key").unwrap());
+    }
+
+    #[test]
+    fn inmem_wallet_get_works_for_unknown() {
+        let wallet_type = InmemWalletType::new();
+        wallet_type.create("wallet1", None, None).unwrap();
+        let wallet = wallet_type.open("wallet1", "pool1", None, None, None).unwrap();
+
+        assert_match!(Err(WalletError::NotFound(_)), wallet.get("key1"));
+        assert_match!(Err(WalletError::NotFound(_)), wallet.get_not_expired("key1"));
+    }
+
+    #[test]
+    fn inmem_wallet_type_create_works_for_stale_records() {
+        let wallet_type = InmemWalletType::new();
+        wallet_type.create("wallet1", None, None).unwrap();
+        wallet_type.open("wallet1", "pool1", None, None, None).unwrap().set("key1", "value1").unwrap();
+
+        wallet_type.create("wallet1", None, None).unwrap();
+
+        let wallet = wallet_type.open("wallet1", "pool1", None, None, None).unwrap();
+        assert_match!(Err(WalletError::NotFound(_)), wallet.get("key1"));
+    }
+
+    #[test]
+    fn inmem_wallet_close_works_for_snapshot() {
+        TestUtils::cleanup_indy_home();
+        fs::create_dir_all(EnvironmentUtils::wallet_path("wallet1")).unwrap();
+
+        let config = Some(r#"{"snapshot":true}"#);
+
+        {
+            let wallet_type = InmemWalletType::new();
+            wallet_type.create("wallet1", config, None).unwrap();
+
+            let wallet = wallet_type.open("wallet1", "pool1", config, None, None).unwrap();
+            wallet.set("key1", "value1").unwrap();
+            wallet.close().unwrap();
+        }
+
+        // New wallet type has no records as it would be in other process
+        let wallet_type = InmemWalletType::new();
+        let wallet = wallet_type.open("wallet1", "pool1", config, None, None).unwrap();
+        assert_eq!("value1", wallet.get("key1").unwrap());
+
+        TestUtils::cleanup_indy_home();
+    }
+}
@@ -1,9 +1,11 @@
 extern crate libc;
 
 mod default;
+mod inmem;
 mod plugged;
 
 use self::default::DefaultWalletType;
+use self::inmem::InmemWalletType;
 use self::plugged::PluggedWalletType;
 
 use api::ErrorCode;
@@ -28,6 +30,9 @@ pub trait Wallet {
     fn get_not_expired(&self, key: &str) -> Result<String, WalletError>;
     fn get_pool_name(&self) -> String;
     fn get_name(&self) -> String;
+    fn close(&self) -> Result<(), WalletError> {
+        Ok(())
+    }
 }
 
 trait WalletType {
@@ -66,6 +71,7 @@ impl WalletService {
     pub fn new() -> WalletService {
         let mut types: HashMap<String, Box<WalletType>> = HashMap::new();
         types.insert("default".to_string(), Box::new(DefaultWalletType::new()));
+        types.insert("inmem".to_string(), Box::new(InmemWalletType::new()));
 
         WalletService {
             types: RefCell::new(types),
@@ -233,7 +239,7 @@ impl WalletService {
 
     pub fn close(&self, handle: i32) -> Result<(), WalletError> {
         match self.wallets.borrow_mut().remove(&handle) {
-            Some(wallet) => Ok(()),
+            Some(wallet) => wallet.close(),
             None => Err(WalletError::InvalidHandle(handle.to_string()))
         }
     }
@@ -311,7 +317,7 @@ mod tests {
 
         wallet_service
             .register_type(
-                "inmem",
+                "plugged_inmem",
                 InmemWallet::create,
                 InmemWallet::open,
                 InmemWallet::set,
@@ -347,7 +353,7 @@ mod tests {
 
         wallet_service
             .register_type(
-                "inmem",
+                "plugged_inmem",
                 InmemWallet::create,
                 InmemWallet::open,
                 InmemWallet::set,
@@ -360,7 +366,7 @@ mod tests {
             )
             .unwrap();
 
-        wallet_service.create("pool1", Some("inmem"), "wallet1", None, None).unwrap();
+        wallet_service.create("pool1", Some("plugged_inmem"), "wallet1", None, None).unwrap();
 
         TestUtils::cleanup_indy_home();
         InmemWallet::cleanup();
@@ -421,7 +427,7 @@ mod tests {
 
         wallet_service
             .register_type(
-                "inmem",
+                "plugged_inmem",
                 InmemWallet::create,
                 InmemWallet::open,
                 InmemWallet::set,
@@ -434,9 +440,9 @@ mod tests {
             )
             .unwrap();
 
-        wallet_service.create("pool1", Some("inmem"), "wallet1", None, None).unwrap();
+        wallet_service.create("pool1", Some("plugged_inmem"), "wallet1", None, None).unwrap();
         wallet_service.delete("wallet1", None).unwrap();
-        wallet_service.create("pool1", Some("inmem"), "wallet1", None, None).unwrap();
+        wallet_service.create("pool1", Some("plugged_inmem"), "wallet1", None, None).unwrap();
 
         TestUtils::cleanup_indy_home();
         InmemWallet::cleanup();
@@ -462,7 +468,7 @@ mod tests {
 
         wallet_service
             .register_type(
-                "inmem",
+                "plugged_inmem",
                 InmemWallet::create,
                 InmemWallet::open,
                 InmemWallet::set,
@@ -475,7 +481,7 @@ mod tests {
             )
             .unwrap();
 
-        wallet_service.create("pool1", Some("inmem"), "wallet1", None, None).unwrap();
+        wallet_service.create("pool1", Some("plugged_inmem"), "wallet1", None, None).unwrap();
         wallet_service.open("wallet1", None, None).unwrap();
 
         TestUtils::cleanup_indy_home();
@@ -503,7 +509,7 @@ mod tests {
 
         wallet_service
             .register_type(
-                "inmem",
+                "plugged_inmem",
                 InmemWallet::create,
                 InmemWallet::open,
                 InmemWallet::set,
@@ -516,7 +522,7 @@ mod tests {
             )
             .unwrap();
 
-        wallet_service.create("pool1", Some("inmem"), "wallet1", None, None).unwrap();
+        wallet_service.create("pool1", Some("plugged_inmem"), "wallet1", None, None).unwrap();
         let wallet_handle = wallet_service.open("wallet1", None, None).unwrap();
         wallet_service.close(wallet_handle).unwrap();
 
@@ -548,7 +554,7 @@ mod tests {
 
         wallet_service
             .register_type(
-                "inmem",
+                "plugged_inmem",
                 InmemWallet::create,
                 InmemWallet::open,
                 InmemWallet::set,
@@ -561,7 +567,7 @@ mod tests {
             )
             .unwrap();
 
-        wallet_service.create("pool1", Some("inmem"), "wallet1", None, None).unwrap();
+        wallet_service.create("pool1", Some("plugged_inmem"), "wallet1", None, None).unwrap();
         let wallet_handle = wallet_service.open("wallet1", None, None).unwrap();
 
         wallet_service.set(wallet_handle, "key1", "value1").unwrap();
@@ -613,7 +619,7 @@ mod tests {
 
         wallet_service
             .register_type(
-                "inmem",
+                "plugged_inmem",
                 InmemWallet::create,
                 InmemWallet::open,
                 InmemWallet::set,
@@ -626,7 +632,7 @@ mod tests {
             )
             .unwrap();
 
-        wallet_service.create("pool1", Some("inmem"), "wallet1", None, None).unwrap();
+        wallet_service.create("pool1", Some("plugged_inmem"), "wallet1", None, None).unwrap();
         let wallet_handle = wallet_service.open("wallet1", None, None).unwrap();
 
         let res = wallet_service.get(wallet_handle, "key1");
@@ -644,7 +650,7 @@ mod tests {
 
         wallet_service
             .register_type(
-                "inmem",
+                "plugged_inmem",
                 InmemWallet::create,
                 InmemWallet::open,
                 InmemWallet::set,
@@ -657,7 +663,7 @@ mod tests {
             )
             .unwrap();
 
-        wallet_service.create("pool1", Some("inmem"), "wallet1", None, None).unwrap();
+        wallet_service.create("pool1", Some("plugged_inmem"), "wallet1", None, None).unwrap();
         let wallet_handle = wallet_service.open("wallet1", None, None).unwrap();
 
         wallet_service.set(wallet_handle, "key1", "value1").unwrap();
@@ -735,7 +741,7 @@ mod tests {
 
         wallet_service
             .register_type(
-                "inmem",
+                "plugged_inmem",
                 InmemWallet::create,
                 InmemWallet::open,
                 InmemWallet::set,
@@ -748,7 +754,7 @@ mod tests {
             )
             .unwrap();
 
-        wallet_service.create("pool1", Some("inmem"), "wallet1", None, None).unwrap();
+        wallet_service.create("pool1", Some("plugged_inmem"), "wallet1", None, None).unwrap();
         let wallet_handle = wallet_service.open("wallet1", Some("{\"freshness_time\": 10}"), None).unwrap();
         wallet_service.set(wallet_handle, "key1", "value1").unwrap();
 
@@ -768,7 +774,7 @@ mod tests {
 
         wallet_service
             .register_type(
-                "inmem",
+                "plugged_inmem",
                 InmemWallet::create,
                 InmemWallet::open,
                 InmemWallet::set,
@@ -781,7 +787,7 @@ mod tests {
             )
             .unwrap();
 
-        wallet_service.create("pool1", Some("inmem"), "wallet1", None, None).unwrap();
+        wallet_service.create("pool1", Some("plugged_inmem"), "wallet1", None, None).unwrap();
         let wallet_handle = wallet_service.open("wallet1", Some("{\"freshness_time\": 1}"), None).unwrap();
         wallet_service.set(wallet_handle, "key1", "value1").unwrap();
 
@@ -830,7 +836,7 @@ mod tests {
 
         wallet_service
             .register_type(
-                "inmem",
+                "plugged_inmem",
                 InmemWallet::create,
                 InmemWallet::open,
                 InmemWallet::set,
@@ -843,7 +849,7 @@ mod tests {
             )
             .unwrap();
 
-        wallet_service.create("pool1", Some("inmem"), "wallet1", None, None).unwrap();
+        wallet_service.create("pool1", Some("plugged_inmem"), "wallet1", None, None).unwrap();
         let wallet_handle = wallet_service.open("wallet1", Some("{\"freshness_time\": 1}"), None).unwrap();
 
         wallet_service.set(wallet_handle, "key1::subkey1", "value1").unwrap();
@@ -889,7 +895,7 @@ mod tests {
 
         wallet_service
             .register_type(
-                "inmem",
+                "plugged_inmem",
                 InmemWallet::create,
                 InmemWallet::open,
                 InmemWallet::set,
@@ -902,7 +908,7 @@ mod tests {
             )
             .unwrap();
 
-        wallet_service.create("pool1", Some("inmem"), "wallet1", None, None).unwrap();
+        wallet_service.create("pool1", Some("plugged_inmem"), "wallet1", None, None).unwrap();
         let wallet_handle = wallet_service.open("wallet1", None, None).unwrap();
 
         assert_eq!(wallet_service.get_pool_name(wallet_handle).unwrap(), "pool1");
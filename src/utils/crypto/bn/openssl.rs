@@ -153,6 +153,10 @@ impl BigNumber {
         Ok(self.openssl_bn.is_bit_set(n))
     }
 
+    pub fn is_negative(&self) -> bool {
+        self.openssl_bn.is_negative()
+    }
+
     pub fn set_bit(&mut self, n: i32) -> Result<&mut BigNumber, CommonError> {
         BigNumRef::set_bit(&mut self.openssl_bn, n)?;
         Ok(self)
@@ -34,6 +34,10 @@ impl ED25519 {
     }
 
     pub fn decrypt(private_key: &[u8], public_key: &[u8], doc: &[u8], nonce: &[u8]) -> Result<Vec<u8>, CommonError> {
+        if nonce.len() != box_::NONCEBYTES {
+            return Err(CommonError::InvalidStructure(format!("Invalid nonce")))
+        }
+
         box_::open(
             doc,
             &box_::Nonce(ED25519::_clone_into_array(nonce)),
@@ -97,6 +101,33 @@ impl ED25519 {
         ))
     }
 
+    // libsodium doesn't provide real ed25519 batch verification, so signatures
+    // are checked one by one, but the verkey is validated and converted only once.
+    // Signature of invalid length can't be valid, so it doesn't fail the whole batch
+    pub fn verify_batch(public_key: &[u8], docs_and_signs: &[(Vec<u8>, Vec<u8>)]) -> Result<Vec<bool>, CommonError> {
+        if public_key.len() != 32 {
+            return Err(CommonError::InvalidStructure(format!("Invalid verkey")))
+        }
+
+        let public_key = sign::PublicKey(ED25519::_clone_into_array(public_key));
+
+        let verified = docs_and_signs
+            .iter()
+            .map(|&(ref doc, ref sign)| {
+                if sign.len() != 64 {
+                    return false
+                }
+
+                let mut signature: [u8; 64] = [0; 64];
+                signature.clone_from_slice(sign);
+
+                sign::verify_detached(&sign::Signature(signature), doc, &public_key)
+            })
+            .collect();
+
+        Ok(verified)
+    }
+
     pub fn sk_to_curve25519(sk: &[u8]) -> Result<Vec<u8>, CommonError> {
         if sk.len() != 64 {
             return Err(CommonError::InvalidStructure(format!("Invalid signkey")))
@@ -178,6 +209,26 @@ mod tests {
         assert!(verified);
     }
 
+    #[test]
+    fn verify_batch_works() {
+        let seed = randombytes::randombytes(32);
+        let text1 = randombytes::randombytes(16);
+        let text2 = randombytes::randombytes(16);
+
+        let (public_key, secret_key) = ED25519::create_key_pair_for_signature(Some(&seed)).unwrap();
+        let signed_text1 = ED25519::sign(&secret_key, &text1).unwrap();
+        let signed_text2 = ED25519::sign(&secret_key, &text2).unwrap();
+
+        let verified = ED25519::verify_batch(&public_key, &vec![
+            (text1.clone(), signed_text1.clone()),
+            (text2.clone(), signed_text2.clone()),
+            (text1.clone(), signed_text2.clone()),
+            (text2.clone(), signed_text2[..32].to_vec())
+        ]).unwrap();
+
+        assert_eq!(vec![true, true, false, false], verified);
+    }
+
     #[test]
     fn pk_to_curve25519_works() {
         let pk = vec!(236, 191, 114, 144, 108, 87, 211, 244, 148, 23, 20, 175, 122, 6, 159, 254, 85, 99, 145, 152, 178, 133, 230, 236, 192, 69, 35, 136, 141, 194, 243, 134);
@@ -28,6 +28,10 @@ impl Hash {
         Ok(Hasher::new(MessageDigest::sha256())?)
     }
 
+    pub fn hash(data: &[u8]) -> Result<Digest, CommonError> {
+        Ok(Digest::new(hash2(MessageDigest::sha256(), data)?))
+    }
+
     pub fn hash_empty() -> Result<Digest, CommonError> {
         Ok(Digest::new(hash2(MessageDigest::sha256(), &[])?))
 
@@ -49,4 +49,15 @@ macro_rules! check_useful_opt_c_str {
             Err(_) => return $e
         };
     }
-}
\ No newline at end of file
+}
+
+// Empty array is valid, but its pointer still must not be null
+macro_rules! check_useful_c_byte_array {
+    ($ptr:ident, $len:expr, $e:expr) => {
+        if $ptr.is_null() {
+            return $e
+        }
+
+        let $ptr = unsafe { ::std::slice::from_raw_parts($ptr, $len as usize) }.to_vec();
+    }
+}
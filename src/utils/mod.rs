@@ -19,6 +19,8 @@ pub mod result;
 
 pub mod sequence;
 
+pub mod threadpool;
+
 #[macro_use]
 pub mod test;
 
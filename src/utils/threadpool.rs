@@ -0,0 +1,127 @@
+use std::sync::{Arc, Mutex};
+use std::sync::mpsc::{Sender, Receiver, channel};
+use std::thread;
+
+trait FnBox {
+    fn call_box(self: Box<Self>);
+}
+
+impl<F: FnOnce()> FnBox for F {
+    fn call_box(self: Box<F>) {
+        (*self)()
+    }
+}
+
+type Job = Box<FnBox + Send + 'static>;
+
+enum Message {
+    Job(Job),
+    Exit
+}
+
+pub struct ThreadPool {
+    workers: Vec<thread::JoinHandle<()>>,
+    sender: Sender<Message>
+}
+
+impl ThreadPool {
+    // Pool with 0 threads executes all jobs in the caller thread
+    pub fn new(size: usize) -> ThreadPool {
+        let (sender, receiver) = channel();
+        let receiver = Arc::new(Mutex::new(receiver));
+
+        let workers = (0..size)
+            .map(|id| ThreadPool::_spawn_worker(id, receiver.clone()))
+            .collect();
+
+        ThreadPool {
+            workers: workers,
+            sender: sender
+        }
+    }
+
+    pub fn size(&self) -> usize {
+        self.workers.len()
+    }
+
+    pub fn execute<F>(&self, job: F) where F: FnOnce() + Send + 'static {
+        if self.workers.is_empty() {
+            return job();
+        }
+
+        if let Err(err) = self.sender.send(Message::Job(Box::new(job))) {
+            error!(target: "thread_pool", "Can't send job to thread pool worker: {:?}", err);
+        }
+    }
+
+    fn _spawn_worker(id: usize, receiver: Arc<Mutex<Receiver<Message>>>) -> thread::JoinHandle<()> {
+        thread::spawn(move || {
+            info!(target: "thread_pool", "Worker {} started", id);
+
+            loop {
+                let message = match receiver.lock() {
+                    Ok(receiver) => receiver.recv(),
+                    Err(_) => break
+                };
+
+                match message {
+                    Ok(Message::Job(job)) => job.call_box(),
+                    Ok(Message::Exit) | Err(_) => break
+                }
+            }
+
+            info!(target: "thread_pool", "Worker {} finished", id);
+        })
+    }
+}
+
+impl Drop for ThreadPool {
+    fn drop(&mut self) {
+        for _ in &self.workers {
+            self.sender.send(Message::Exit).ok();
+        }
+
+        for worker in self.workers.drain(..) {
+            worker.join().ok();
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    use std::sync::mpsc::channel;
+
+    #[test]
+    fn thread_pool_execute_works() {
+        let pool = ThreadPool::new(4);
+        let (sender, receiver) = channel();
+
+        for i in 0..8 {
+            let sender = sender.clone();
+            pool.execute(move || sender.send(i).unwrap());
+        }
+
+        let mut results: Vec<i32> = receiver.iter().take(8).collect();
+        results.sort();
+        assert_eq!((0..8).collect::<Vec<i32>>(), results);
+    }
+
+    #[test]
+    fn thread_pool_execute_works_for_zero_threads() {
+        let pool = ThreadPool::new(0);
+        let (sender, receiver) = channel();
+
+        pool.execute(move || sender.send(1).unwrap());
+
+        assert_eq!(0, pool.size());
+        assert_eq!(1, receiver.try_recv().unwrap());
+    }
+
+    #[test]
+    fn thread_pool_drop_works() {
+        let pool = ThreadPool::new(2);
+        pool.execute(|| {});
+    }
+}
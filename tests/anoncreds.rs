@@ -378,6 +378,16 @@ mod high_cases {
             assert_eq!(claims.len(), 1);
         }
 
+        #[test]
+        fn prover_get_claims_works_for_filter_by_other_issuer_did() {
+            let (wallet_handle, _) = AnoncredsUtils::init_common_wallet();
+
+            let claims = AnoncredsUtils::prover_get_claims(wallet_handle, r#"{"issuer_did":"CnEDk9HrMnmiHXEV1WFgbVCRteYnPqsJwrTdcZaNhFVW", "schema_seq_no":1}"#).unwrap();
+            let claims: Vec<ClaimInfo> = serde_json::from_str(&claims).unwrap();
+
+            assert_eq!(claims.len(), 0);
+        }
+
         #[test]
         fn prover_get_claims_works_for_empty_result() {
             let (wallet_handle, _) = AnoncredsUtils::init_common_wallet();
@@ -423,6 +433,27 @@ mod high_cases {
             assert_eq!(claims_for_attr_1.len(), 1);
         }
 
+        #[test]
+        fn prover_get_claims_for_proof_req_works_for_revealed_attr_by_issuer_did() {
+            let (wallet_handle, _) = AnoncredsUtils::init_common_wallet();
+
+            let proof_req = format!(r#"{{"nonce":"123432421212",
+                                "name":"proof_req_1",
+                                "version":"0.1",
+                                "requested_attrs":{{"attr1_uuid":{{"issuer_did":"{}", "name":"name"}},
+                                                   "attr2_uuid":{{"issuer_did":"CnEDk9HrMnmiHXEV1WFgbVCRteYnPqsJwrTdcZaNhFVW", "name":"name"}}}},
+                                "requested_predicates":{{}}
+                              }}"#, ISSUER_DID);
+
+            let claims_json = AnoncredsUtils::prover_get_claims_for_proof_req(wallet_handle, &proof_req).unwrap();
+
+            let claims: ProofClaimsJson = serde_json::from_str(&claims_json).unwrap();
+
+            assert_eq!(claims.attrs.len(), 2);
+            assert_eq!(claims.attrs.get("attr1_uuid").unwrap().len(), 1);
+            assert_eq!(claims.attrs.get("attr2_uuid").unwrap().len(), 0);
+        }
+
         #[test]
         fn prover_get_claims_for_proof_req_works_for_not_found_attribute() {
             let (wallet_handle, _) = AnoncredsUtils::init_common_wallet();
@@ -318,6 +318,150 @@ mod high_cases {
         }
     }
 
+    mod sign_batch {
+        use super::*;
+
+        #[test]
+        fn indy_sign_batch_works() {
+            TestUtils::cleanup_storage();
+
+            let wallet_handle = WalletUtils::create_and_open_wallet("pool1", None).unwrap();
+
+            let (my_did, _, _) = SignusUtils::create_and_store_my_did(wallet_handle, Some("000000000000000000000000Trustee1")).unwrap();
+
+            let message1 = r#"{"reqId":1496822211362017764}"#;
+            let message2 = r#"{"reqId":1496822211362017765}"#;
+            let messages = serde_json::to_string(&vec![message1, message2]).unwrap();
+
+            let signed_msgs_json = SignusUtils::sign_batch(wallet_handle, &my_did, &messages).unwrap();
+            let signed_msgs: Vec<String> = serde_json::from_str(&signed_msgs_json).unwrap();
+
+            assert_eq!(2, signed_msgs.len());
+            assert_eq!(SignusUtils::sign(wallet_handle, &my_did, message1).unwrap(), signed_msgs[0]);
+            assert_eq!(SignusUtils::sign(wallet_handle, &my_did, message2).unwrap(), signed_msgs[1]);
+
+            TestUtils::cleanup_storage();
+        }
+
+        #[test]
+        fn indy_sign_batch_works_for_unknow_did() {
+            TestUtils::cleanup_storage();
+
+            let wallet_handle = WalletUtils::create_and_open_wallet("pool1", None).unwrap();
+
+            let messages = r#"["{\"reqId\":1495034346617224651}"]"#;
+
+            let res = SignusUtils::sign_batch(wallet_handle, "did", messages);
+            assert_eq!(res.unwrap_err(), ErrorCode::WalletNotFoundError);
+
+            TestUtils::cleanup_storage();
+        }
+
+        #[test]
+        fn indy_sign_batch_works_for_invalid_msgs_json() {
+            TestUtils::cleanup_storage();
+
+            let wallet_handle = WalletUtils::create_and_open_wallet("pool1", None).unwrap();
+
+            let (my_did, _, _) = SignusUtils::create_my_did(wallet_handle, r#"{}"#).unwrap();
+
+            let res = SignusUtils::sign_batch(wallet_handle, &my_did, r#"{"reqId":1495034346617224651}"#);
+            assert_eq!(res.unwrap_err(), ErrorCode::CommonInvalidStructure);
+
+            TestUtils::cleanup_storage();
+        }
+    }
+
+    mod verify_signatures_batch {
+        use super::*;
+
+        #[test]
+        fn indy_verify_signatures_batch_works() {
+            TestUtils::cleanup_storage();
+
+            let wallet_handle = WalletUtils::create_and_open_wallet("pool1", None).unwrap();
+
+            let (did, verkey, _) = SignusUtils::create_my_did(wallet_handle, r#"{}"#).unwrap();
+            let (other_did, _, _) = SignusUtils::create_my_did(wallet_handle, r#"{}"#).unwrap();
+
+            let identity_json = format!(r#"{{"did":"{}", "verkey":"{}"}}"#, did, verkey);
+            SignusUtils::store_their_did(wallet_handle, &identity_json).unwrap();
+
+            let signed_msg = SignusUtils::sign(wallet_handle, &did, r#"{"reqId":1496822211362017764}"#).unwrap();
+            let other_signed_msg = SignusUtils::sign(wallet_handle, &other_did, r#"{"reqId":1496822211362017764}"#).unwrap();
+
+            let signed_msgs_json = serde_json::to_string(&vec![(&did, &signed_msg), (&did, &other_signed_msg)]).unwrap();
+
+            let results_json = SignusUtils::verify_signatures_batch(wallet_handle, &signed_msgs_json).unwrap();
+            let results: Vec<bool> = serde_json::from_str(&results_json).unwrap();
+            assert_eq!(vec![true, false], results);
+
+            TestUtils::cleanup_storage();
+        }
+
+        #[test]
+        fn indy_verify_signatures_batch_works_for_unknown_did() {
+            TestUtils::cleanup_storage();
+
+            let wallet_handle = WalletUtils::create_and_open_wallet("pool1", None).unwrap();
+
+            let (did, _, _) = SignusUtils::create_my_did(wallet_handle, r#"{}"#).unwrap();
+            let signed_msg = SignusUtils::sign(wallet_handle, &did, r#"{"reqId":1496822211362017764}"#).unwrap();
+
+            let signed_msgs_json = serde_json::to_string(&vec![(&did, &signed_msg)]).unwrap();
+
+            let results_json = SignusUtils::verify_signatures_batch(wallet_handle, &signed_msgs_json).unwrap();
+            let results: Vec<bool> = serde_json::from_str(&results_json).unwrap();
+            assert_eq!(vec![false], results);
+
+            TestUtils::cleanup_storage();
+        }
+
+        #[test]
+        fn indy_verify_signatures_batch_works_for_malformed_entries() {
+            TestUtils::cleanup_storage();
+
+            let wallet_handle = WalletUtils::create_and_open_wallet("pool1", None).unwrap();
+
+            let (did, verkey, _) = SignusUtils::create_my_did(wallet_handle, r#"{}"#).unwrap();
+            let (unknown_did, _, _) = SignusUtils::create_my_did(wallet_handle, r#"{}"#).unwrap();
+
+            let identity_json = format!(r#"{{"did":"{}", "verkey":"{}"}}"#, did, verkey);
+            SignusUtils::store_their_did(wallet_handle, &identity_json).unwrap();
+
+            let signed_msg = SignusUtils::sign(wallet_handle, &did, r#"{"reqId":1496822211362017764}"#).unwrap();
+            let unknown_signed_msg = SignusUtils::sign(wallet_handle, &unknown_did, r#"{"reqId":1496822211362017764}"#).unwrap();
+            let not_signed_msg = r#"{"reqId":1496822211362017764}"#.to_string();
+            let short_signature_msg = r#"{"reqId":1496822211362017764,"signature":"2Vc4"}"#.to_string();
+
+            let signed_msgs_json = serde_json::to_string(&vec![
+                (&did, &signed_msg),
+                (&did, &not_signed_msg),
+                (&unknown_did, &unknown_signed_msg),
+                (&did, &short_signature_msg),
+                (&did, &signed_msg)
+            ]).unwrap();
+
+            let results_json = SignusUtils::verify_signatures_batch(wallet_handle, &signed_msgs_json).unwrap();
+            let results: Vec<bool> = serde_json::from_str(&results_json).unwrap();
+            assert_eq!(vec![true, false, false, false, true], results);
+
+            TestUtils::cleanup_storage();
+        }
+
+        #[test]
+        fn indy_verify_signatures_batch_works_for_invalid_signed_msgs_json() {
+            TestUtils::cleanup_storage();
+
+            let wallet_handle = WalletUtils::create_and_open_wallet("pool1", None).unwrap();
+
+            let res = SignusUtils::verify_signatures_batch(wallet_handle, r#"{"reqId":1496822211362017764}"#);
+            assert_eq!(res.unwrap_err(), ErrorCode::CommonInvalidStructure);
+
+            TestUtils::cleanup_storage();
+        }
+    }
+
     mod verify {
         use super::*;
 
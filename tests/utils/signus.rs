@@ -3,10 +3,12 @@ use std::ffi::{CString};
 
 use indy::api::signus::{
     indy_sign,
+    indy_sign_batch,
     indy_create_and_store_my_did,
     indy_store_their_did,
     indy_replace_keys,
-    indy_verify_signature
+    indy_verify_signature,
+    indy_verify_signatures_batch
 };
 use indy::api::ErrorCode;
 
@@ -48,6 +50,38 @@ impl SignusUtils {
         Ok(signature)
     }
 
+    pub fn sign_batch(wallet_handle: i32, their_did: &str, msgs_json: &str) -> Result<String, ErrorCode> {
+        let (sender, receiver) = channel();
+
+        let cb = Box::new(move |err, signed_msgs_json| {
+            sender.send((err, signed_msgs_json)).unwrap();
+        });
+
+        let (command_handle, cb) = CallbackUtils::closure_to_sign_cb(cb);
+
+        let their_did = CString::new(their_did).unwrap();
+        let msgs_json = CString::new(msgs_json).unwrap();
+
+        let err =
+            indy_sign_batch(command_handle,
+                            wallet_handle,
+                            their_did.as_ptr(),
+                            msgs_json.as_ptr(),
+                            cb);
+
+        if err != ErrorCode::Success {
+            return Err(err);
+        }
+
+        let (err, signed_msgs_json) = receiver.recv_timeout(TimeoutUtils::long_timeout()).unwrap();
+
+        if err != ErrorCode::Success {
+            return Err(err);
+        }
+
+        Ok(signed_msgs_json)
+    }
+
     pub fn create_and_store_my_did(wallet_handle: i32, seed: Option<&str>) -> Result<(String, String, String), ErrorCode> {
         let (create_and_store_my_did_sender, create_and_store_my_did_receiver) = channel();
         let create_and_store_my_did_cb = Box::new(move |err, did, verkey, public_key| {
@@ -230,4 +264,34 @@ impl SignusUtils {
 
         Ok(valid)
     }
-}
\ No newline at end of file
+
+    pub fn verify_signatures_batch(wallet_handle: i32, signed_msgs_json: &str) -> Result<String, ErrorCode> {
+        let (sender, receiver) = channel();
+
+        let cb = Box::new(move |err, results_json| {
+            sender.send((err, results_json)).unwrap();
+        });
+
+        let (command_handle, cb) = CallbackUtils::closure_to_sign_cb(cb);
+
+        let signed_msgs_json = CString::new(signed_msgs_json).unwrap();
+
+        let err =
+            indy_verify_signatures_batch(command_handle,
+                                         wallet_handle,
+                                         signed_msgs_json.as_ptr(),
+                                         cb);
+
+        if err != ErrorCode::Success {
+            return Err(err);
+        }
+
+        let (err, results_json) = receiver.recv_timeout(TimeoutUtils::long_timeout()).unwrap();
+
+        if err != ErrorCode::Success {
+            return Err(err);
+        }
+
+        Ok(results_json)
+    }
+}
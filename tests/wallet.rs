@@ -31,7 +31,7 @@ mod high_cases {
             TestUtils::cleanup_storage();
             InmemWallet::cleanup();
 
-            WalletUtils::register_wallet_type("inmem", false).unwrap();
+            WalletUtils::register_wallet_type("plugged_inmem", false).unwrap();
 
             TestUtils::cleanup_storage();
             InmemWallet::cleanup();
@@ -61,9 +61,9 @@ mod high_cases {
 
             let pool_name = "indy_create_wallet_works";
             let wallet_name = "indy_create_wallet_works";
-            let xtype = "inmem";
+            let xtype = "plugged_inmem";
 
-            WalletUtils::register_wallet_type("inmem", false).unwrap();
+            WalletUtils::register_wallet_type("plugged_inmem", false).unwrap();
             WalletUtils::create_wallet(pool_name, wallet_name, Some(xtype), None).unwrap();
 
             TestUtils::cleanup_storage();
@@ -167,7 +167,7 @@ mod high_cases {
 
             let pool_name = "indy_delete_wallet_works_for_plugged";
             let wallet_name = "indy_delete_wallet_works_for_plugged";
-            let xtype = "inmem";
+            let xtype = "plugged_inmem";
 
             WalletUtils::register_wallet_type(xtype, false).unwrap();
             WalletUtils::create_wallet(pool_name, wallet_name, Some(xtype), None).unwrap();
@@ -202,7 +202,7 @@ mod high_cases {
 
             let pool_name = "indy_open_wallet_works_for_plugged";
             let wallet_name = "indy_open_wallet_works_for_plugged";
-            let xtype = "inmem";
+            let xtype = "plugged_inmem";
 
             WalletUtils::register_wallet_type(xtype, false).unwrap();
             WalletUtils::create_wallet(pool_name, wallet_name, Some(xtype), None).unwrap();
@@ -253,7 +253,7 @@ mod high_cases {
 
             let pool_name = "indy_close_wallet_works_for_plugged";
             let wallet_name = "indy_close_wallet_works_for_plugged";
-            let xtype = "inmem";
+            let xtype = "plugged_inmem";
 
             WalletUtils::register_wallet_type(xtype, false).unwrap();
             WalletUtils::create_wallet(pool_name, wallet_name, Some(xtype), None).unwrap();
@@ -283,8 +283,8 @@ mod medium_cases {
             TestUtils::cleanup_storage();
             InmemWallet::cleanup();
 
-            WalletUtils::register_wallet_type("inmem", false).unwrap();
-            let res = WalletUtils::register_wallet_type("inmem", true);
+            WalletUtils::register_wallet_type("plugged_inmem", false).unwrap();
+            let res = WalletUtils::register_wallet_type("plugged_inmem", true);
 
             assert_eq!(res.unwrap_err(), ErrorCode::WalletTypeAlreadyRegisteredError);
             TestUtils::cleanup_storage();
@@ -296,7 +296,7 @@ mod medium_cases {
             TestUtils::cleanup_storage();
             InmemWallet::cleanup();
 
-            let xtype = CString::new("inmem").unwrap();
+            let xtype = CString::new("plugged_inmem").unwrap();
             let res = indy_register_wallet_type(1, xtype.as_ptr(), None, None, None, None, None,
                                                 None, None, None, None, None);
             assert_eq!(res, ErrorCode::CommonInvalidParam3);
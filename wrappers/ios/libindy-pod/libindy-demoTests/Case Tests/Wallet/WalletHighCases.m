@@ -62,7 +62,7 @@
     //InmemWallet::cleanup();
     NSString *poolName = @"indy_create_wallet_works";
     NSString *walletName = @"indy_create_wallet_works";
-    NSString *xtype = @"inmem";
+    NSString *xtype = @"plugged_inmem";
     
     // register type
     
@@ -165,7 +165,7 @@
     NSError *ret;
     NSString *poolName = @"indy_delete_wallet_works_for_plugged";
     NSString *walletName = @"indy_delete_wallet_works_for_plugged";
-    NSString *xtype = @"inmem";
+    NSString *xtype = @"plugged_inmem";
     
     // 1. Register wallet type
     
@@ -223,7 +223,7 @@
     
     NSString *poolName = @"indy_open_wallet_works_for_plugged";
     NSString *walletName = @"indy_open_wallet_works_for_plugged";
-    NSString *xtype = @"inmem";
+    NSString *xtype = @"plugged_inmem";
     NSError *ret;
     
     // 1. register wallet type
@@ -310,7 +310,7 @@
     [TestUtils cleanupStorage];
     NSString *poolName = @"indy_close_wallet_works_for_plugged";
     NSString *walletName = @"indy_close_wallet_works_for_plugged";
-    NSString *xtype = @"inmem";
+    NSString *xtype = @"plugged_inmem";
     NSError *ret;
     
     // 1. register wallet type
@@ -379,7 +379,7 @@
 {
     [TestUtils cleanupStorage];
     NSString *poolName = @"indy_wallet_set_seqno_works_for_plugged";
-    NSString *xtype = @"inmem";
+    NSString *xtype = @"plugged_inmem";
     NSError *ret;
     
     // 1. register wallet type
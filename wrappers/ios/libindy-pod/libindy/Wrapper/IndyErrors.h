@@ -90,6 +90,12 @@ typedef NS_ENUM(NSInteger, IndyErrorCode)
     // Attempt to send transaction without the necessary privileges
     LedgerSecurityError,
     
+    // Pool ledger request wasn't completed in time
+    LedgerTimeoutError,
+    
+    // Pool ledger request was cancelled by caller
+    LedgerCancelledError,
+    
     // Revocation registry is full and creation of new registry is necessary
     AnoncredsRevocationRegistryFullError = 400,
     
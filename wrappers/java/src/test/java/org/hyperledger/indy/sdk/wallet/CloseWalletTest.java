@@ -47,7 +47,7 @@ public class CloseWalletTest extends IndyIntegrationTest {
 	public void testCloseWalletWorksForPlugged() throws Exception {
 		WalletTypeInmem.getInstance().clear();
 
-		String type = "inmem";
+		String type = "plugged_inmem";
 		String walletName = "testCloseWalletWorksForPlugged";
 
 		Wallet.registerWalletType(type, WalletTypeInmem.getInstance(), false).get();
@@ -79,7 +79,7 @@ public class DeleteWalletTest extends IndyIntegrationTest {
 	public void testDeleteWalletWorksForPlugged() throws Exception {
 		WalletTypeInmem.getInstance().clear();
 
-		String type = "inmem";
+		String type = "plugged_inmem";
 		String poolName = "default";
 		String walletName = "wallet";
 
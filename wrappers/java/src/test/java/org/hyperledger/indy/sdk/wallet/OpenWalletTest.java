@@ -39,7 +39,7 @@ public class OpenWalletTest extends IndyIntegrationTest {
 	public void testOpenWalletWorksForPlugged() throws Exception {
 		WalletTypeInmem.getInstance().clear();
 
-		String type = "inmem";
+		String type = "plugged_inmem";
 		String poolName = "default";
 		String walletName = "testOpenWalletWorksForPlugged";
 
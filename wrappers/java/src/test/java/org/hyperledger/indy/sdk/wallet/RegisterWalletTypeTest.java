@@ -16,7 +16,7 @@ public class RegisterWalletTypeTest extends IndyIntegrationTest {
 	public void testRegisterWalletTypeWorks() throws Exception {
 		WalletTypeInmem.getInstance().clear();
 
-		Wallet.registerWalletType("inmem", WalletTypeInmem.getInstance(), false).get();
+		Wallet.registerWalletType("plugged_inmem", WalletTypeInmem.getInstance(), false).get();
 
 		WalletTypeInmem.getInstance().clear();
 	}
@@ -27,7 +27,7 @@ public class RegisterWalletTypeTest extends IndyIntegrationTest {
 		thrown.expect(ExecutionException.class);
 		thrown.expectCause(new ErrorCodeMatcher(ErrorCode.WalletTypeAlreadyRegisteredError));
 
-		String type = "inmem";
+		String type = "plugged_inmem";
 
 		Wallet.registerWalletType(type, WalletTypeInmem.getInstance(), false).get();
 		Wallet.registerWalletType(type, WalletTypeInmem.getInstance(), true).get();
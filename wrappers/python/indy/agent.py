@@ -1,10 +1,19 @@
 import asyncio
+import itertools
 import logging
+import threading
+from collections import deque, OrderedDict
 from ctypes import *
-from typing import List, Tuple, Any
+from typing import Any, Deque, Dict, List, Optional
 
 from .error import ErrorCode, IndyError
-from .libindy import do_call, create_cb
+from .libindy import bind, do_call, create_cb
+
+bind('indy_agent_add_identity', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_agent_remove_identity', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_agent_send', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_agent_close_connection', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_agent_close_listener', CFUNCTYPE(None, c_int32, c_int32))
 
 
 class Event:
@@ -88,28 +97,91 @@ class MessageEvent(Event):
         logger.debug("MessageEvent:__init__ <<< self: %r", self)
 
 
-_events: List[Event] = []
-_event_waiters: List[Tuple[List[int], Any, Any]] = []
+class _EventWaiter:
+    def __init__(self, waiter_id: int, handles: List[int], event_loop: Any, future: Any):
+        self.id = waiter_id
+        self.handles = handles
+        self.event_loop = event_loop
+        self.future = future
+
+    def __repr__(self):
+        return "_EventWaiter(id={}, handles={})".format(self.id, self.handles)
+
+
+# Not consumed events and waiters are kept per handle, so an event is matched
+# with a waiter by its handle only. Waiter is registered for all its handles
+# and is removed from all of them when it gets an event or is cancelled.
+# Events are put from libindy threads, so the state is guarded by the lock.
+_events: Dict[int, Deque[Event]] = {}
+_event_waiters: Dict[int, 'OrderedDict[int, _EventWaiter]'] = {}
+_event_waiter_ids = itertools.count()
+_events_lock = threading.Lock()
+
 
+def _remove_event_waiter(waiter: _EventWaiter):
+    for handle in waiter.handles:
+        waiters = _event_waiters.get(handle)
 
-def _notify_event_waiters():
+        if waiters is not None:
+            waiters.pop(waiter.id, None)
+
+            if not waiters:
+                del _event_waiters[handle]
+
+
+# Event returned by cancelled waiter is put first, before events of its handle received after it
+def _put_event(event: Event, first=False):
     logger = logging.getLogger(__name__)
-    logger.debug("_notify_event_waiters: >>> _event_waiters: %r, _events: %r",
-                 _event_waiters,
-                 _events)
+    logger.debug("_put_event: >>> event: %r, first: %r", event, first)
+
+    with _events_lock:
+        waiters = _event_waiters.get(event.handle)
+
+        if not waiters:
+            events = _events.setdefault(event.handle, deque())
+
+            if first:
+                events.appendleft(event)
+            else:
+                events.append(event)
+
+            logger.debug("_put_event: <<< no waiters")
+            return
+
+        (_, waiter) = waiters.popitem(last=False)
+        _remove_event_waiter(waiter)
+
+    waiter.event_loop.call_soon_threadsafe(_set_event, waiter.future, event)
+    logger.debug("_put_event: <<< waiter: %r", waiter)
+
+
+def _set_event(future: Any, event: Event):
+    if future.cancelled():
+        # Waiter is cancelled after the event was passed to it, so event is put back
+        # before events received after it to keep their order
+        _put_event(event, first=True)
+    else:
+        future.set_result(event)
+
+
+def _drop_events(handle: int):
+    with _events_lock:
+        _events.pop(handle, None)
 
-    for i, (handles, event_loop, future) in enumerate(_event_waiters):
-        for j, event in enumerate(_events):
-            if event.handle in handles:
-                del _event_waiters[i]
-                del _events[j]
-                event_loop.call_soon_threadsafe(lambda f, e: f.set_result(e),
-                                                future,
-                                                event)
-                logger.debug("_notify_event_waiters: <<< handles: %r, event: %r", handles, event)
-                return
 
-    logger.debug("_notify_event_waiters: <<< no events")
+def _take_event(handles: List[int]) -> Optional[Event]:
+    for handle in handles:
+        events = _events.get(handle)
+
+        if events:
+            event = events.popleft()
+
+            if not events:
+                del _events[handle]
+
+            return event
+
+    return None
 
 
 async def agent_wait_for_event(handles: List[int]) -> Event:
@@ -124,12 +196,26 @@ async def agent_wait_for_event(handles: List[int]) -> Event:
     logger.debug("agent_wait_for_event: >>> handles: %r", handles)
 
     event_loop = asyncio.get_event_loop()
-    future = event_loop.create_future()
 
-    _event_waiters.append((handles, event_loop, future))
-    _notify_event_waiters()
+    with _events_lock:
+        event = _take_event(handles)
+
+        if event is None:
+            waiter = _EventWaiter(next(_event_waiter_ids), list(handles), event_loop, event_loop.create_future())
 
-    res = await future
+            for handle in waiter.handles:
+                _event_waiters.setdefault(handle, OrderedDict())[waiter.id] = waiter
+
+    if event is not None:
+        logger.debug("agent_wait_for_event: <<< res: %r", event)
+        return event
+
+    try:
+        res = await waiter.future
+    except asyncio.CancelledError:
+        with _events_lock:
+            _remove_event_waiter(waiter)
+        raise
 
     logger.debug("agent_wait_for_event: <<< res: %r", res)
     return res
@@ -151,6 +237,11 @@ async def agent_connect(pool_handle: int,
 
     Note that messages encryption/decryption will be performed automatically.
 
+    If INDY_AGENT_REUSE_CONNECTIONS=true env variable is set, socket of closed connection is kept
+    for a while and reused by the next connect to the same endpoint with the same keys and DIDs.
+    Reused connection sends RECONNECT frame that listeners of previous libindy versions don't
+    understand, so enable it only if all listeners you connect to support it.
+
     After connection is established returned connection handle can be used to wait for messages with
     agent_wait_for_event or sending messages with agent_send.
 
@@ -177,8 +268,7 @@ async def agent_connect(pool_handle: int,
                      connection_handle,
                      err,
                      message)
-        _events.append(MessageEvent(connection_handle, err, message))
-        _notify_event_waiters()
+        _put_event(MessageEvent(connection_handle, err, message))
 
     if not hasattr(agent_connect, "message_cb"):
         logger.debug("agent_connect: Creating message callback")
@@ -234,8 +324,7 @@ async def agent_listen(endpoint: str) -> int:
                      connection_handle,
                      sender_did,
                      receiver_did)
-        _events.append(ConnectionEvent(listener_handle, err, connection_handle, sender_did, receiver_did))
-        _notify_event_waiters()
+        _put_event(ConnectionEvent(listener_handle, err, connection_handle, sender_did, receiver_did))
 
     if not hasattr(agent_listen, "connection_cb"):
         logger.debug("agent_listen: Creating connection callback")
@@ -246,8 +335,7 @@ async def agent_listen(endpoint: str) -> int:
                      connection_handle,
                      err,
                      message)
-        _events.append(MessageEvent(connection_handle, err, message))
-        _notify_event_waiters()
+        _put_event(MessageEvent(connection_handle, err, message))
 
     if not hasattr(agent_listen, "message_cb"):
         logger.debug("agent_connect: Creating message callback")
@@ -290,10 +378,6 @@ async def agent_add_identity(listener_handle: int,
                  wallet_handle,
                  did)
 
-    if not hasattr(agent_add_identity, "cb"):
-        logger.debug("agent_add_identity: Creating callback")
-        agent_add_identity.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_listener_handle = c_int32(listener_handle)
     c_pool_handle = c_int32(pool_handle)
     c_wallet_handle = c_int32(wallet_handle)
@@ -303,8 +387,7 @@ async def agent_add_identity(listener_handle: int,
                   c_listener_handle,
                   c_pool_handle,
                   c_wallet_handle,
-                  c_did,
-                  agent_add_identity.cb)
+                  c_did)
 
     logger.debug("agent_add_identity: <<<")
 
@@ -331,10 +414,6 @@ async def agent_remove_identity(listener_handle: int,
                  wallet_handle,
                  did)
 
-    if not hasattr(agent_remove_identity, "cb"):
-        logger.debug("agent_remove_identity: Creating callback")
-        agent_remove_identity.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_listener_handle = c_int32(listener_handle)
     c_wallet_handle = c_int32(wallet_handle)
     c_did = c_char_p(did.encode('utf-8'))
@@ -342,8 +421,7 @@ async def agent_remove_identity(listener_handle: int,
     await do_call('indy_agent_remove_identity',
                   c_listener_handle,
                   c_wallet_handle,
-                  c_did,
-                  agent_remove_identity.cb)
+                  c_did)
 
     logger.debug("agent_remove_identity: <<<")
 
@@ -364,17 +442,12 @@ async def agent_send(connection_handle: int, message: str) -> None:
                  connection_handle,
                  message)
 
-    if not hasattr(agent_send, "cb"):
-        logger.debug("agent_send: Creating callback")
-        agent_send.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_connection_handle = c_int32(connection_handle)
     c_message = c_char_p(message.encode('utf-8'))
 
     await do_call('indy_agent_send',
                   c_connection_handle,
-                  c_message,
-                  agent_send.cb)
+                  c_message)
 
     logger.debug("agent_send: <<<")
 
@@ -391,15 +464,12 @@ async def agent_close_connection(connection_handle: int) -> None:
     logger = logging.getLogger(__name__)
     logger.debug("agent_close_connection: >>> connection_handle: %r", connection_handle)
 
-    if not hasattr(agent_close_connection, "cb"):
-        logger.debug("agent_close_connection: Creating callback")
-        agent_close_connection.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_connection_handle = c_int32(connection_handle)
 
     await do_call('indy_agent_close_connection',
-                  c_connection_handle,
-                  agent_close_connection.cb)
+                  c_connection_handle)
+
+    _drop_events(connection_handle)
 
     logger.debug("agent_close_connection: <<<")
 
@@ -416,14 +486,11 @@ async def agent_close_listener(listener_handle: int) -> None:
     logger = logging.getLogger(__name__)
     logger.debug("agent_close_listener: >>> listener_handle: %r", listener_handle)
 
-    if not hasattr(agent_close_listener, "cb"):
-        logger.debug("agent_close_listener: Creating callback")
-        agent_close_listener.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_listener_handle = c_int32(listener_handle)
 
     await do_call('indy_agent_close_listener',
-                  c_listener_handle,
-                  agent_close_listener.cb)
+                  c_listener_handle)
+
+    _drop_events(listener_handle)
 
     logger.debug("agent_close_listener: <<<")
@@ -1,10 +1,35 @@
-from .libindy import do_call, create_cb
+from .libindy import bind, do_call
 
-from typing import Optional
+from typing import Optional, AsyncIterator
 from ctypes import *
 
+import json
 import logging
 
+# Default number of records fetched by search generators per libindy call
+SEARCH_PAGE_SIZE = 100
+
+bind('indy_issuer_create_and_store_claim_def', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind('indy_issuer_create_and_store_revoc_reg', CFUNCTYPE(None, c_int32, c_int32, c_char_p, c_char_p))
+bind('indy_issuer_create_claim', CFUNCTYPE(None, c_int32, c_int32, c_char_p, c_char_p))
+bind('indy_issuer_revoke_claim', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind('indy_prover_store_claim_offer', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_prover_get_claim_offers', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind('indy_prover_open_claim_offers_search', CFUNCTYPE(None, c_int32, c_int32, c_int32))
+bind('indy_prover_fetch_claim_offers', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind('indy_prover_close_claim_offers_search', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_prover_create_master_secret', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_prover_create_and_store_claim_req', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind('indy_prover_store_claim', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_prover_get_claims', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind('indy_prover_open_claims_search', CFUNCTYPE(None, c_int32, c_int32, c_int32))
+bind('indy_prover_fetch_claims', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind('indy_prover_close_claims_search', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_prover_get_claims_for_proof_req', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind('indy_prover_create_proof', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind('indy_verifier_verify_proof', CFUNCTYPE(None, c_int32, c_int32, c_bool))
+bind('indy_verifier_verify_proofs', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+
 
 async def issuer_create_and_store_claim_def(wallet_handle: int,
                                             issuer_did: str,
@@ -35,10 +60,6 @@ async def issuer_create_and_store_claim_def(wallet_handle: int,
                  signature_type,
                  create_non_revoc)
 
-    if not hasattr(issuer_create_and_store_claim_def, "cb"):
-        logger.debug("issuer_create_and_store_claim_def: Creating callback")
-        issuer_create_and_store_claim_def.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_issuer_did = c_char_p(issuer_did.encode('utf-8'))
     c_schema_json = c_char_p(schema_json.encode('utf-8'))
@@ -50,8 +71,7 @@ async def issuer_create_and_store_claim_def(wallet_handle: int,
                                    c_issuer_did,
                                    c_schema_json,
                                    c_signature_type,
-                                   c_create_non_revoc,
-                                   issuer_create_and_store_claim_def.cb)
+                                   c_create_non_revoc)
     res = claim_def_json.decode()
     logger.debug("issuer_create_and_store_claim_def: <<< res: %r", res)
     return res
@@ -81,10 +101,6 @@ async def issuer_create_and_store_revoc_reg(wallet_handle: int,
                  schema_seq_no,
                  max_claim_num)
 
-    if not hasattr(issuer_create_and_store_revoc_reg, "cb"):
-        logger.debug("issuer_create_and_store_revoc_reg: Creating callback")
-        issuer_create_and_store_revoc_reg.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p, c_char_p))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_issuer_did = c_char_p(issuer_did.encode('utf-8'))
     c_schema_seq_no = c_int32(schema_seq_no)
@@ -94,8 +110,7 @@ async def issuer_create_and_store_revoc_reg(wallet_handle: int,
                                                      c_wallet_handle,
                                                      c_issuer_did,
                                                      c_schema_seq_no,
-                                                     c_max_claim_num,
-                                                     issuer_create_and_store_revoc_reg.cb)
+                                                     c_max_claim_num)
     res = (revoc_reg_json.decode(), revoc_reg_uuid.decode())
     logger.debug("issuer_create_and_store_revoc_reg: <<< res: %r", res)
     return res
@@ -152,10 +167,6 @@ async def issuer_create_claim(wallet_handle: int,
                  revoc_reg_seq_no,
                  user_revoc_index)
 
-    if not hasattr(issuer_create_claim, "cb"):
-        logger.debug("issuer_create_claim: Creating callback")
-        issuer_create_claim.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p, c_char_p))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_claim_req_json = c_char_p(claim_req_json.encode('utf-8'))
     c_claim_json = c_char_p(claim_json.encode('utf-8'))
@@ -167,8 +178,7 @@ async def issuer_create_claim(wallet_handle: int,
                                                         c_claim_req_json,
                                                         c_claim_json,
                                                         c_revoc_reg_seq_no,
-                                                        c_user_revoc_index,
-                                                        issuer_create_claim.cb)
+                                                        c_user_revoc_index)
     res = (revoc_reg_update_json.decode(), claim_json.decode())
     logger.debug("issuer_create_claim: <<< res: %r", res)
     return res
@@ -194,10 +204,6 @@ async def issuer_revoke_claim(wallet_handle: int,
                  revoc_reg_seq_no,
                  user_revoc_index)
 
-    if not hasattr(issuer_revoke_claim, "cb"):
-        logger.debug("issuer_revoke_claim: Creating callback")
-        issuer_revoke_claim.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_revoc_reg_seq_no = c_int32(revoc_reg_seq_no)
     c_user_revoc_index = c_int32(user_revoc_index)
@@ -205,8 +211,7 @@ async def issuer_revoke_claim(wallet_handle: int,
     revoc_reg_update_json = await do_call('indy_issuer_revoke_claim',
                                           c_wallet_handle,
                                           c_revoc_reg_seq_no,
-                                          c_user_revoc_index,
-                                          issuer_revoke_claim.cb)
+                                          c_user_revoc_index)
     res = revoc_reg_update_json.decode()
     logger.debug("issuer_revoke_claim: <<< res: %r", res)
     return res
@@ -231,17 +236,12 @@ async def prover_store_claim_offer(wallet_handle: int,
                  wallet_handle,
                  claim_offer_json)
 
-    if not hasattr(prover_store_claim_offer, "cb"):
-        logger.debug("prover_store_claim_offer: Creating callback")
-        prover_store_claim_offer.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_claim_offer_json = c_char_p(claim_offer_json.encode('utf-8'))
 
     res = await do_call('indy_prover_store_claim_offer',
                         c_wallet_handle,
-                        c_claim_offer_json,
-                        prover_store_claim_offer.cb)
+                        c_claim_offer_json)
 
     logger.debug("prover_store_claim_offer: <<< res: %r", res)
     return res
@@ -272,23 +272,130 @@ async def prover_get_claim_offers(wallet_handle: int,
                  wallet_handle,
                  filter_json)
 
-    if not hasattr(prover_get_claim_offers, "cb"):
-        logger.debug("prover_get_claim_offers: Creating callback")
-        prover_get_claim_offers.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_filter_json = c_char_p(filter_json.encode('utf-8'))
 
     claim_offers_json = await do_call('indy_prover_get_claim_offers',
                                       c_wallet_handle,
-                                      c_filter_json,
-                                      prover_get_claim_offers.cb)
+                                      c_filter_json)
 
     res = claim_offers_json.decode()
     logger.debug("prover_get_claim_offers: <<< res: %r", res)
     return res
 
 
+async def prover_open_claim_offers_search(wallet_handle: int,
+                                          filter_json: str) -> int:
+    """
+    Opens a search over stored claim offers (see prover_store_claim_offer) matching the filter.
+    Unlike prover_get_claim_offers matched claim offers are returned by pages (see prover_fetch_claim_offers),
+    so large wallets can be read with bounded memory.
+    The search must be closed with prover_close_claim_offers_search.
+
+    :param wallet_handle: wallet handler (created by open_wallet).
+    :param filter_json: filter for claim offers
+        {
+            "issuer_did": string,
+            "schema_seq_no": string
+        }
+    :return: search handle
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("prover_open_claim_offers_search: >>> wallet_handle: %r, filter_json: %r",
+                 wallet_handle,
+                 filter_json)
+
+    c_wallet_handle = c_int32(wallet_handle)
+    c_filter_json = c_char_p(filter_json.encode('utf-8'))
+
+    res = await do_call('indy_prover_open_claim_offers_search',
+                        c_wallet_handle,
+                        c_filter_json)
+
+    logger.debug("prover_open_claim_offers_search: <<< res: %r", res)
+    return res
+
+
+async def prover_fetch_claim_offers(search_handle: int,
+                                    count: int) -> str:
+    """
+    Fetches next page of claim offers from the search (see prover_open_claim_offers_search).
+
+    :param search_handle: handle of search opened by prover_open_claim_offers_search
+    :param count: maximum number of claim offers to fetch
+    :return: A json with a list of claim offers, empty list if search is exhausted.
+        [{"issuer_did": string,
+          "schema_seq_no": string}]
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("prover_fetch_claim_offers: >>> search_handle: %r, count: %r",
+                 search_handle,
+                 count)
+
+    c_search_handle = c_int32(search_handle)
+    c_count = c_uint32(count)
+
+    claim_offers_json = await do_call('indy_prover_fetch_claim_offers',
+                                      c_search_handle,
+                                      c_count)
+
+    res = claim_offers_json.decode()
+    logger.debug("prover_fetch_claim_offers: <<< res: %r", res)
+    return res
+
+
+async def prover_close_claim_offers_search(search_handle: int) -> None:
+    """
+    Closes the search opened by prover_open_claim_offers_search.
+
+    :param search_handle: handle of search opened by prover_open_claim_offers_search
+    :return: None
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("prover_close_claim_offers_search: >>> search_handle: %r",
+                 search_handle)
+
+    c_search_handle = c_int32(search_handle)
+
+    res = await do_call('indy_prover_close_claim_offers_search',
+                        c_search_handle)
+
+    logger.debug("prover_close_claim_offers_search: <<< res: %r", res)
+    return res
+
+
+async def prover_search_claim_offers(wallet_handle: int,
+                                     filter_json: str,
+                                     page_size: int = SEARCH_PAGE_SIZE) -> AsyncIterator[dict]:
+    """
+    Asynchronously iterates over stored claim offers (see prover_store_claim_offer) matching the filter.
+    Claim offers are fetched from libindy by pages of page_size, search is closed
+    when iteration is finished or interrupted.
+
+    :param wallet_handle: wallet handler (created by open_wallet).
+    :param filter_json: filter for claim offers (see prover_open_claim_offers_search)
+    :param page_size: number of claim offers fetched per libindy call
+    :return: async iterator over decoded claim offers
+    """
+
+    search_handle = await prover_open_claim_offers_search(wallet_handle, filter_json)
+
+    try:
+        while True:
+            page = json.loads(await prover_fetch_claim_offers(search_handle, page_size))
+
+            if not page:
+                break
+
+            for item in page:
+                yield item
+    finally:
+        await prover_close_claim_offers_search(search_handle)
+
+
 async def prover_create_master_secret(wallet_handle: int,
                                       master_secret_name: str) -> None:
     """
@@ -305,17 +412,12 @@ async def prover_create_master_secret(wallet_handle: int,
                  wallet_handle,
                  master_secret_name)
 
-    if not hasattr(prover_create_master_secret, "cb"):
-        logger.debug("prover_create_master_secret: Creating callback")
-        prover_create_master_secret.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_master_secret_name = c_char_p(master_secret_name.encode('utf-8'))
 
     res = await do_call('indy_prover_create_master_secret',
                         c_wallet_handle,
-                        c_master_secret_name,
-                        prover_create_master_secret.cb)
+                        c_master_secret_name)
 
     logger.debug("prover_create_master_secret: <<< res: %r", res)
     return res
@@ -361,10 +463,6 @@ async def prover_create_and_store_claim_req(wallet_handle: int,
                  claim_def_json,
                  master_secret_name)
 
-    if not hasattr(prover_create_and_store_claim_req, "cb"):
-        logger.debug("prover_create_and_store_claim_req: Creating callback")
-        prover_create_and_store_claim_req.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_prover_did = c_char_p(prover_did.encode('utf-8'))
     c_claim_offer_json = c_char_p(claim_offer_json.encode('utf-8'))
@@ -376,8 +474,7 @@ async def prover_create_and_store_claim_req(wallet_handle: int,
                                    c_prover_did,
                                    c_claim_offer_json,
                                    c_claim_def_json,
-                                   c_master_secret_name,
-                                   prover_create_and_store_claim_req.cb)
+                                   c_master_secret_name)
 
     res = claim_req_json.decode()
     logger.debug("prover_create_and_store_claim_req: <<< res: %r", res)
@@ -411,17 +508,12 @@ async def prover_store_claim(wallet_handle: int,
                  wallet_handle,
                  claims_json)
 
-    if not hasattr(prover_store_claim, "cb"):
-        logger.debug("prover_store_claim: Creating callback")
-        prover_store_claim.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_claims_json = c_char_p(claims_json.encode('utf-8'))
 
     res = await do_call('indy_prover_store_claim',
                         c_wallet_handle,
-                        c_claims_json,
-                        prover_store_claim.cb)
+                        c_claims_json)
 
     logger.debug("prover_store_claim: <<< res: %r", res)
     return res
@@ -455,23 +547,135 @@ async def prover_get_claims(wallet_handle: int,
                  wallet_handle,
                  filter_json)
 
-    if not hasattr(prover_get_claims, "cb"):
-        logger.debug("prover_get_claims: Creating callback")
-        prover_get_claims.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_filter_json = c_char_p(filter_json.encode('utf-8'))
 
     claims_json = await do_call('indy_prover_get_claims',
                                 c_wallet_handle,
-                                c_filter_json,
-                                prover_get_claims.cb)
+                                c_filter_json)
 
     res = claims_json.decode()
     logger.debug("prover_get_claims: <<< res: %r", res)
     return res
 
 
+async def prover_open_claims_search(wallet_handle: int,
+                                    filter_json: str) -> int:
+    """
+    Opens a search over human readable claims matching the filter.
+    Unlike prover_get_claims matched claims are returned by pages (see prover_fetch_claims),
+    so large wallets can be read with bounded memory.
+    The search must be closed with prover_close_claims_search, it is also closed when the wallet is closed.
+
+    :param wallet_handle: wallet handler (created by open_wallet).
+    :param filter_json: filter for claims
+        {
+            "issuer_did": string,
+            "schema_seq_no": string
+        }
+    :return: search handle
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("prover_open_claims_search: >>> wallet_handle: %r, filter_json: %r",
+                 wallet_handle,
+                 filter_json)
+
+    c_wallet_handle = c_int32(wallet_handle)
+    c_filter_json = c_char_p(filter_json.encode('utf-8'))
+
+    res = await do_call('indy_prover_open_claims_search',
+                        c_wallet_handle,
+                        c_filter_json)
+
+    logger.debug("prover_open_claims_search: <<< res: %r", res)
+    return res
+
+
+async def prover_fetch_claims(search_handle: int,
+                              count: int) -> str:
+    """
+    Fetches next page of claims from the search (see prover_open_claims_search).
+
+    :param search_handle: handle of search opened by prover_open_claims_search
+    :param count: maximum number of claims to fetch
+    :return: claims json, empty list if search is exhausted
+        [{
+            "claim_uuid": <string>,
+            "attrs": [{"attr_name" : "attr_value"}],
+            "schema_seq_no": string,
+            "issuer_did": string,
+            "revoc_reg_seq_no": string,
+        }]
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("prover_fetch_claims: >>> search_handle: %r, count: %r",
+                 search_handle,
+                 count)
+
+    c_search_handle = c_int32(search_handle)
+    c_count = c_uint32(count)
+
+    claims_json = await do_call('indy_prover_fetch_claims',
+                                c_search_handle,
+                                c_count)
+
+    res = claims_json.decode()
+    logger.debug("prover_fetch_claims: <<< res: %r", res)
+    return res
+
+
+async def prover_close_claims_search(search_handle: int) -> None:
+    """
+    Closes the search opened by prover_open_claims_search.
+
+    :param search_handle: handle of search opened by prover_open_claims_search
+    :return: None
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("prover_close_claims_search: >>> search_handle: %r",
+                 search_handle)
+
+    c_search_handle = c_int32(search_handle)
+
+    res = await do_call('indy_prover_close_claims_search',
+                        c_search_handle)
+
+    logger.debug("prover_close_claims_search: <<< res: %r", res)
+    return res
+
+
+async def prover_search_claims(wallet_handle: int,
+                               filter_json: str,
+                               page_size: int = SEARCH_PAGE_SIZE) -> AsyncIterator[dict]:
+    """
+    Asynchronously iterates over human readable claims matching the filter.
+    Claims are fetched from libindy by pages of page_size, search is closed
+    when iteration is finished or interrupted.
+
+    :param wallet_handle: wallet handler (created by open_wallet).
+    :param filter_json: filter for claims (see prover_open_claims_search)
+    :param page_size: number of claims fetched per libindy call
+    :return: async iterator over decoded claims
+    """
+
+    search_handle = await prover_open_claims_search(wallet_handle, filter_json)
+
+    try:
+        while True:
+            page = json.loads(await prover_fetch_claims(search_handle, page_size))
+
+            if not page:
+                break
+
+            for item in page:
+                yield item
+    finally:
+        await prover_close_claims_search(search_handle)
+
+
 async def prover_get_claims_for_proof_req(wallet_handle: int,
                                           proof_request_json: str) -> str:
     """
@@ -512,17 +716,12 @@ async def prover_get_claims_for_proof_req(wallet_handle: int,
                  wallet_handle,
                  proof_request_json)
 
-    if not hasattr(prover_get_claims, "cb"):
-        logger.debug("prover_get_claims_for_proof_req: Creating callback")
-        prover_get_claims_for_proof_req.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_proof_request_json = c_char_p(proof_request_json.encode('utf-8'))
 
     claims_json = await do_call('indy_prover_get_claims_for_proof_req',
                                 c_wallet_handle,
-                                c_proof_request_json,
-                                prover_get_claims_for_proof_req.cb)
+                                c_proof_request_json)
 
     res = claims_json.decode()
     logger.debug("prover_get_claims_for_proof_req: <<< res: %r", res)
@@ -619,10 +818,6 @@ async def prover_create_proof(wallet_handle: int,
                  claim_defs_json,
                  revoc_regs_json)
 
-    if not hasattr(prover_create_proof, "cb"):
-        logger.debug("prover_create_proof: Creating callback")
-        prover_create_proof.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_proof_req_json = c_char_p(proof_req_json.encode('utf-8'))
     c_requested_claims_json = c_char_p(requested_claims_json.encode('utf-8'))
@@ -638,8 +833,7 @@ async def prover_create_proof(wallet_handle: int,
                                c_schemas_json,
                                c_master_secret_name,
                                c_claim_defs_json,
-                               c_revoc_regs_json,
-                               prover_create_proof.cb)
+                               c_revoc_regs_json)
 
     res = proof_json.decode()
     logger.debug("prover_create_proof: <<< res: %r", res)
@@ -716,10 +910,6 @@ async def verifier_verify_proof(proof_request_json: str,
                  claim_defs_jsons,
                  revoc_regs_json)
 
-    if not hasattr(verifier_verify_proof, "cb"):
-        logger.debug("verifier_verify_proof: Creating callback")
-        verifier_verify_proof.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_bool))
-
     c_proof_request_json = c_char_p(proof_request_json.encode('utf-8'))
     c_proof_json = c_char_p(proof_json.encode('utf-8'))
     c_schemas_json = c_char_p(schemas_json.encode('utf-8'))
@@ -731,8 +921,41 @@ async def verifier_verify_proof(proof_request_json: str,
                         c_proof_json,
                         c_schemas_json,
                         c_claim_defs_jsons,
-                        c_revoc_regs_json,
-                        verifier_verify_proof.cb)
+                        c_revoc_regs_json)
 
     logger.debug("verifier_verify_proof: <<< res: %r", res)
     return res
+
+
+async def verifier_verify_proofs(proofs_json: str) -> [bool]:
+    """
+    Verifies a batch of proofs.
+    Proofs are verified concurrently, claim proofs of each proof are verified concurrently as well.
+
+    :param proofs_json: json array with parameters of verifier_verify_proof for each proof
+        [
+            {
+                "proof_request": <proof_request_json>,
+                "proof": <proof_json>,
+                "schemas": <schemas_json>,
+                "claim_defs": <claim_defs_jsons>,
+                "revoc_regs": <revoc_regs_json>
+            }
+        ]
+    :return: list of booleans in the same order as proofs_json,
+        true - if proof is valid, false - otherwise (including items that are malformed
+        or can't be verified, they don't fail the whole batch)
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("verifier_verify_proofs: >>> proofs_json: %r",
+                 proofs_json)
+
+    c_proofs_json = c_char_p(proofs_json.encode('utf-8'))
+
+    results_json = await do_call('indy_verifier_verify_proofs',
+                                 c_proofs_json)
+
+    res = json.loads(results_json.decode())
+    logger.debug("verifier_verify_proofs: <<< res: %r", res)
+    return res
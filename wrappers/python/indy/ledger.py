@@ -1,10 +1,27 @@
-from .libindy import do_call, create_cb
+from .error import IndyError
+from .libindy import bind, bind_sync, do_call, do_sync_call
 
 from typing import Optional
 from ctypes import *
 
+import asyncio
 import logging
 
+bind('indy_sign_and_submit_request', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind('indy_submit_request', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind('indy_cancel_request', CFUNCTYPE(None, c_int32, c_int32))
+bind_sync('indy_build_get_ddo_request', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind_sync('indy_build_nym_request', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind_sync('indy_build_attrib_request', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind_sync('indy_build_get_attrib_request', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind_sync('indy_build_get_nym_request', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind_sync('indy_build_schema_request', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind_sync('indy_build_get_schema_request', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind_sync('indy_build_claim_def_txn', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind_sync('indy_build_get_claim_def_txn', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind_sync('indy_build_node_request', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind_sync('indy_build_get_txn_request', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+
 
 async def sign_and_submit_request(pool_handle: int,
                                   wallet_handle: int,
@@ -31,21 +48,20 @@ async def sign_and_submit_request(pool_handle: int,
                  submitter_did,
                  request_json)
 
-    if not hasattr(sign_and_submit_request, "cb"):
-        logger.debug("sign_and_submit_request: Creating callback")
-        sign_and_submit_request.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_pool_handle = c_int32(pool_handle)
     c_wallet_handle = c_int32(wallet_handle)
     c_submitter_did = c_char_p(submitter_did.encode('utf-8'))
     c_request_json = c_char_p(request_json.encode('utf-8'))
 
-    request_result = await do_call('indy_sign_and_submit_request',
-                                   c_pool_handle,
-                                   c_wallet_handle,
-                                   c_submitter_did,
-                                   c_request_json,
-                                   sign_and_submit_request.cb)
+    try:
+        request_result = await do_call('indy_sign_and_submit_request',
+                                       c_pool_handle,
+                                       c_wallet_handle,
+                                       c_submitter_did,
+                                       c_request_json)
+    except asyncio.CancelledError:
+        await _cancel_pending_request(pool_handle, request_json)
+        raise
 
     res = request_result.decode()
     logger.debug("sign_and_submit_request: <<< res: %s", res)
@@ -68,23 +84,63 @@ async def submit_request(pool_handle: int,
                  pool_handle,
                  request_json)
 
-    if not hasattr(submit_request, "cb"):
-        logger.debug("submit_request: Creating callback")
-        submit_request.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_pool_handle = c_int32(pool_handle)
     c_request_json = c_char_p(request_json.encode('utf-8'))
 
-    request_result = await do_call('indy_submit_request',
-                                   c_pool_handle,
-                                   c_request_json,
-                                   submit_request.cb)
+    try:
+        request_result = await do_call('indy_submit_request',
+                                       c_pool_handle,
+                                       c_request_json)
+    except asyncio.CancelledError:
+        await _cancel_pending_request(pool_handle, request_json)
+        raise
 
     res = request_result.decode()
     logger.debug("submit_request: <<< res: %s", res)
     return res
 
 
+async def cancel_request(pool_handle: int,
+                         request_json: str) -> None:
+    """
+    Cancels request sent to validator pool by sign_and_submit_request or submit_request.
+    Pending call of cancelled request fails with LedgerCancelledError.
+    Cancelling of request that is already completed does nothing.
+
+    Cancelling of submit_request or sign_and_submit_request coroutine
+    (for example by asyncio.wait_for timeout) cancels the request automatically.
+
+    :param pool_handle: pool handle (created by open_pool_ledger).
+    :param request_json: Request data json (only reqId is used).
+    :return: None
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("cancel_request: >>> pool_handle: %s, request_json: %s",
+                 pool_handle,
+                 request_json)
+
+    c_pool_handle = c_int32(pool_handle)
+    c_request_json = c_char_p(request_json.encode('utf-8'))
+
+    res = await do_call('indy_cancel_request',
+                        c_pool_handle,
+                        c_request_json)
+
+    logger.debug("cancel_request: <<< res: %s", res)
+    return res
+
+
+async def _cancel_pending_request(pool_handle: int,
+                                  request_json: str) -> None:
+    logger = logging.getLogger(__name__)
+
+    try:
+        await cancel_request(pool_handle, request_json)
+    except IndyError as err:
+        logger.warning("_cancel_pending_request: Can't cancel request: %s", err)
+
+
 async def build_get_ddo_request(submitter_did: str,
                                 target_did: str) -> str:
     """
@@ -95,25 +151,29 @@ async def build_get_ddo_request(submitter_did: str,
     :return: Request result as json.
     """
 
+    return build_get_ddo_request_sync(submitter_did, target_did)
+
+
+def build_get_ddo_request_sync(submitter_did: str,
+                               target_did: str) -> str:
+    """
+    Synchronous version of build_get_ddo_request, request is built in the caller thread.
+    """
+
     logger = logging.getLogger(__name__)
-    logger.debug("build_get_ddo_request: >>> submitter_did: %s, target_did: %s",
+    logger.debug("build_get_ddo_request_sync: >>> submitter_did: %s, target_did: %s",
                  submitter_did,
                  target_did)
 
-    if not hasattr(build_get_ddo_request, "cb"):
-        logger.debug("build_get_ddo_request: Creating callback")
-        build_get_ddo_request.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_submitter_did = c_char_p(submitter_did.encode('utf-8'))
     c_target_did = c_char_p(target_did.encode('utf-8'))
 
-    request_json = await do_call('indy_build_get_ddo_request',
-                                 c_submitter_did,
-                                 c_target_did,
-                                 build_get_ddo_request.cb)
+    request_json = do_sync_call('indy_build_get_ddo_request',
+                                c_submitter_did,
+                                c_target_did)
 
     res = request_json.decode()
-    logger.debug("build_get_ddo_request: <<< res: %s", res)
+    logger.debug("build_get_ddo_request_sync: <<< res: %s", res)
     return res
 
 
@@ -133,34 +193,41 @@ async def build_nym_request(submitter_did: str,
     :return: Request result as json.
     """
 
+    return build_nym_request_sync(submitter_did, target_did, ver_key, alias, role)
+
+
+def build_nym_request_sync(submitter_did: str,
+                           target_did: str,
+                           ver_key: Optional[str],
+                           alias: Optional[str],
+                           role: Optional[str]) -> str:
+    """
+    Synchronous version of build_nym_request, request is built in the caller thread.
+    """
+
     logger = logging.getLogger(__name__)
-    logger.debug("build_nym_request: >>> submitter_did: %s, target_did: %s, ver_key: %s, alias: %s, role: %s",
+    logger.debug("build_nym_request_sync: >>> submitter_did: %s, target_did: %s, ver_key: %s, alias: %s, role: %s",
                  submitter_did,
                  target_did,
                  ver_key,
                  alias,
                  role)
 
-    if not hasattr(build_nym_request, "cb"):
-        logger.debug("build_nym_request: Creating callback")
-        build_nym_request.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_submitter_did = c_char_p(submitter_did.encode('utf-8'))
     c_target_did = c_char_p(target_did.encode('utf-8'))
     c_ver_key = c_char_p(ver_key.encode('utf-8')) if ver_key is not None else None
     c_alias = c_char_p(alias.encode('utf-8')) if alias is not None else None
     c_role = c_char_p(role.encode('utf-8')) if role is not None else None
 
-    request_json = await do_call('indy_build_nym_request',
-                                 c_submitter_did,
-                                 c_target_did,
-                                 c_ver_key,
-                                 c_alias,
-                                 c_role,
-                                 build_nym_request.cb)
+    request_json = do_sync_call('indy_build_nym_request',
+                                c_submitter_did,
+                                c_target_did,
+                                c_ver_key,
+                                c_alias,
+                                c_role)
 
     res = request_json.decode()
-    logger.debug("build_nym_request: <<< res: %s", res)
+    logger.debug("build_nym_request_sync: <<< res: %s", res)
     return res
 
 
@@ -180,34 +247,41 @@ async def build_attrib_request(submitter_did: str,
     :return: Request result as json.
     """
 
+    return build_attrib_request_sync(submitter_did, target_did, xhash, raw, enc)
+
+
+def build_attrib_request_sync(submitter_did: str,
+                              target_did: str,
+                              xhash: Optional[str],
+                              raw: Optional[str],
+                              enc: Optional[str]) -> str:
+    """
+    Synchronous version of build_attrib_request, request is built in the caller thread.
+    """
+
     logger = logging.getLogger(__name__)
-    logger.debug("build_attrib_request: >>> submitter_did: %s, target_did: %s, hash: %s, raw: %s, enc: %s",
+    logger.debug("build_attrib_request_sync: >>> submitter_did: %s, target_did: %s, hash: %s, raw: %s, enc: %s",
                  submitter_did,
                  target_did,
                  xhash,
                  raw,
                  enc)
 
-    if not hasattr(build_attrib_request, "cb"):
-        logger.debug("build_attrib_request: Creating callback")
-        build_attrib_request.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_submitter_did = c_char_p(submitter_did.encode('utf-8'))
     c_target_did = c_char_p(target_did.encode('utf-8'))
     c_hash = c_char_p(xhash.encode('utf-8')) if xhash is not None else None
     c_raw = c_char_p(raw.encode('utf-8')) if raw is not None else None
     c_enc = c_char_p(enc.encode('utf-8')) if enc is not None else None
 
-    request_json = await do_call('indy_build_attrib_request',
-                                 c_submitter_did,
-                                 c_target_did,
-                                 c_hash,
-                                 c_raw,
-                                 c_enc,
-                                 build_attrib_request.cb)
+    request_json = do_sync_call('indy_build_attrib_request',
+                                c_submitter_did,
+                                c_target_did,
+                                c_hash,
+                                c_raw,
+                                c_enc)
 
     res = request_json.decode()
-    logger.debug("build_attrib_request: <<< res: %s", res)
+    logger.debug("build_attrib_request_sync: <<< res: %s", res)
     return res
 
 
@@ -223,28 +297,33 @@ async def build_get_attrib_request(submitter_did: str,
     :return: Request result as json.
     """
 
+    return build_get_attrib_request_sync(submitter_did, target_did, data)
+
+
+def build_get_attrib_request_sync(submitter_did: str,
+                                  target_did: str,
+                                  data: str) -> str:
+    """
+    Synchronous version of build_get_attrib_request, request is built in the caller thread.
+    """
+
     logger = logging.getLogger(__name__)
-    logger.debug("build_get_attrib_request: >>> submitter_did: %s, target_did: %s, data: %s",
+    logger.debug("build_get_attrib_request_sync: >>> submitter_did: %s, target_did: %s, data: %s",
                  submitter_did,
                  target_did,
                  data)
 
-    if not hasattr(build_get_attrib_request, "cb"):
-        logger.debug("build_get_attrib_request: Creating callback")
-        build_get_attrib_request.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_submitter_did = c_char_p(submitter_did.encode('utf-8'))
     c_target_did = c_char_p(target_did.encode('utf-8'))
     c_data = c_char_p(data.encode('utf-8'))
 
-    request_json = await do_call('indy_build_get_attrib_request',
-                                 c_submitter_did,
-                                 c_target_did,
-                                 c_data,
-                                 build_get_attrib_request.cb)
+    request_json = do_sync_call('indy_build_get_attrib_request',
+                                c_submitter_did,
+                                c_target_did,
+                                c_data)
 
     res = request_json.decode()
-    logger.debug("build_get_attrib_request: <<< res: %s", res)
+    logger.debug("build_get_attrib_request_sync: <<< res: %s", res)
     return res
 
 
@@ -258,25 +337,29 @@ async def build_get_nym_request(submitter_did: str,
     :return: Request result as json.
     """
 
+    return build_get_nym_request_sync(submitter_did, target_did)
+
+
+def build_get_nym_request_sync(submitter_did: str,
+                               target_did: str) -> str:
+    """
+    Synchronous version of build_get_nym_request, request is built in the caller thread.
+    """
+
     logger = logging.getLogger(__name__)
-    logger.debug("build_get_nym_request: >>> submitter_did: %s, target_did: %s",
+    logger.debug("build_get_nym_request_sync: >>> submitter_did: %s, target_did: %s",
                  submitter_did,
                  target_did)
 
-    if not hasattr(build_get_nym_request, "cb"):
-        logger.debug("build_get_nym_request: Creating callback")
-        build_get_nym_request.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_submitter_did = c_char_p(submitter_did.encode('utf-8'))
     c_target_did = c_char_p(target_did.encode('utf-8'))
 
-    request_json = await do_call('indy_build_get_nym_request',
-                                 c_submitter_did,
-                                 c_target_did,
-                                 build_get_nym_request.cb)
+    request_json = do_sync_call('indy_build_get_nym_request',
+                                c_submitter_did,
+                                c_target_did)
 
     res = request_json.decode()
-    logger.debug("build_get_nym_request: <<< res: %s", res)
+    logger.debug("build_get_nym_request_sync: <<< res: %s", res)
     return res
 
 
@@ -290,25 +373,29 @@ async def build_schema_request(submitter_did: str,
     :return: Request result as json.
     """
 
+    return build_schema_request_sync(submitter_did, data)
+
+
+def build_schema_request_sync(submitter_did: str,
+                              data: str) -> str:
+    """
+    Synchronous version of build_schema_request, request is built in the caller thread.
+    """
+
     logger = logging.getLogger(__name__)
-    logger.debug("build_schema_request: >>> submitter_did: %s, data: %s",
+    logger.debug("build_schema_request_sync: >>> submitter_did: %s, data: %s",
                  submitter_did,
                  data)
 
-    if not hasattr(build_schema_request, "cb"):
-        logger.debug("build_schema_request: Creating callback")
-        build_schema_request.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_submitter_did = c_char_p(submitter_did.encode('utf-8'))
     c_data = c_char_p(data.encode('utf-8'))
 
-    request_json = await do_call('indy_build_schema_request',
-                                 c_submitter_did,
-                                 c_data,
-                                 build_schema_request.cb)
+    request_json = do_sync_call('indy_build_schema_request',
+                                c_submitter_did,
+                                c_data)
 
     res = request_json.decode()
-    logger.debug("build_schema_request: <<< res: %s", res)
+    logger.debug("build_schema_request_sync: <<< res: %s", res)
     return res
 
 
@@ -324,28 +411,33 @@ async def build_get_schema_request(submitter_did: str,
     :return: Request result as json.
     """
 
+    return build_get_schema_request_sync(submitter_did, dest, data)
+
+
+def build_get_schema_request_sync(submitter_did: str,
+                                  dest: str,
+                                  data: str) -> str:
+    """
+    Synchronous version of build_get_schema_request, request is built in the caller thread.
+    """
+
     logger = logging.getLogger(__name__)
-    logger.debug("build_get_schema_request: >>> submitter_did: %s, dest: %s, data: %s",
+    logger.debug("build_get_schema_request_sync: >>> submitter_did: %s, dest: %s, data: %s",
                  submitter_did,
                  dest,
                  data)
 
-    if not hasattr(build_get_schema_request, "cb"):
-        logger.debug("build_get_schema_request: Creating callback")
-        build_get_schema_request.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_submitter_did = c_char_p(submitter_did.encode('utf-8'))
     c_dest = c_char_p(dest.encode('utf-8'))
     c_data = c_char_p(data.encode('utf-8'))
 
-    request_json = await do_call('indy_build_get_schema_request',
-                                 c_submitter_did,
-                                 c_dest,
-                                 c_data,
-                                 build_get_schema_request.cb)
+    request_json = do_sync_call('indy_build_get_schema_request',
+                                c_submitter_did,
+                                c_dest,
+                                c_data)
 
     res = request_json.decode()
-    logger.debug("build_get_schema_request: <<< res: %s", res)
+    logger.debug("build_get_schema_request_sync: <<< res: %s", res)
     return res
 
 
@@ -363,31 +455,37 @@ async def build_claim_def_txn(submitter_did: str,
     :return: Request result as json.
     """
 
+    return build_claim_def_txn_sync(submitter_did, xref, signature_type, data)
+
+
+def build_claim_def_txn_sync(submitter_did: str,
+                             xref: int,
+                             signature_type: str,
+                             data: str) -> str:
+    """
+    Synchronous version of build_claim_def_txn, request is built in the caller thread.
+    """
+
     logger = logging.getLogger(__name__)
-    logger.debug("build_get_schema_request: >>> submitter_did: %s, xref: %s, signature_type: %s, data: %s",
+    logger.debug("build_claim_def_txn_sync: >>> submitter_did: %s, xref: %s, signature_type: %s, data: %s",
                  submitter_did,
                  xref,
                  signature_type,
                  data)
 
-    if not hasattr(build_claim_def_txn, "cb"):
-        logger.debug("build_claim_def_txn: Creating callback")
-        build_claim_def_txn.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_submitter_did = c_char_p(submitter_did.encode('utf-8'))
     c_xref = c_int32(xref)
     c_signature_type = c_char_p(signature_type.encode('utf-8'))
     c_data = c_char_p(data.encode('utf-8'))
 
-    request_result = await do_call('indy_build_claim_def_txn',
-                                   c_submitter_did,
-                                   c_xref,
-                                   c_signature_type,
-                                   c_data,
-                                   build_claim_def_txn.cb)
+    request_result = do_sync_call('indy_build_claim_def_txn',
+                                  c_submitter_did,
+                                  c_xref,
+                                  c_signature_type,
+                                  c_data)
 
     res = request_result.decode()
-    logger.debug("build_claim_def_txn: <<< res: %s", res)
+    logger.debug("build_claim_def_txn_sync: <<< res: %s", res)
     return res
 
 
@@ -405,31 +503,37 @@ async def build_get_claim_def_txn(submitter_did: str,
     :return: Request result as json.
     """
 
+    return build_get_claim_def_txn_sync(submitter_did, xref, signature_type, origin)
+
+
+def build_get_claim_def_txn_sync(submitter_did: str,
+                                 xref: int,
+                                 signature_type: str,
+                                 origin: str) -> str:
+    """
+    Synchronous version of build_get_claim_def_txn, request is built in the caller thread.
+    """
+
     logger = logging.getLogger(__name__)
-    logger.debug("build_get_claim_def_txn: >>> submitter_did: %s, xref: %s, signature_type: %s, origin: %s",
+    logger.debug("build_get_claim_def_txn_sync: >>> submitter_did: %s, xref: %s, signature_type: %s, origin: %s",
                  submitter_did,
                  xref,
                  signature_type,
                  origin)
 
-    if not hasattr(build_get_claim_def_txn, "cb"):
-        logger.debug("build_get_claim_def_txn: Creating callback")
-        build_get_claim_def_txn.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_submitter_did = c_char_p(submitter_did.encode('utf-8'))
     c_xref = c_int32(xref)
     c_signature_type = c_char_p(signature_type.encode('utf-8'))
     c_origin = c_char_p(origin.encode('utf-8'))
 
-    request_json = await do_call('indy_build_get_claim_def_txn',
-                                 c_submitter_did,
-                                 c_xref,
-                                 c_signature_type,
-                                 c_origin,
-                                 build_get_claim_def_txn.cb)
+    request_json = do_sync_call('indy_build_get_claim_def_txn',
+                                c_submitter_did,
+                                c_xref,
+                                c_signature_type,
+                                c_origin)
 
     res = request_json.decode()
-    logger.debug("build_get_claim_def_txn: <<< res: %s", res)
+    logger.debug("build_get_claim_def_txn_sync: <<< res: %s", res)
     return res
 
 
@@ -445,28 +549,33 @@ async def build_node_request(submitter_did: str,
     :return: Request result as json.
     """
 
+    return build_node_request_sync(submitter_did, target_did, data)
+
+
+def build_node_request_sync(submitter_did: str,
+                            target_did: str,
+                            data: str) -> str:
+    """
+    Synchronous version of build_node_request, request is built in the caller thread.
+    """
+
     logger = logging.getLogger(__name__)
-    logger.debug("build_node_request: >>> submitter_did: %s, target_did: %s, data: %s",
+    logger.debug("build_node_request_sync: >>> submitter_did: %s, target_did: %s, data: %s",
                  submitter_did,
                  target_did,
                  data)
 
-    if not hasattr(build_node_request, "cb"):
-        logger.debug("build_node_request: Creating callback")
-        build_node_request.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_submitter_did = c_char_p(submitter_did.encode('utf-8'))
     c_target_did = c_char_p(target_did.encode('utf-8'))
     c_data = c_char_p(data.encode('utf-8'))
 
-    request_json = await do_call('indy_build_node_request',
-                                 c_submitter_did,
-                                 c_target_did,
-                                 c_data,
-                                 build_node_request.cb)
+    request_json = do_sync_call('indy_build_node_request',
+                                c_submitter_did,
+                                c_target_did,
+                                c_data)
 
     res = request_json.decode()
-    logger.debug("build_node_request: <<< res: %s", res)
+    logger.debug("build_node_request_sync: <<< res: %s", res)
     return res
 
 
@@ -480,23 +589,27 @@ async def build_get_txn_request(submitter_did: str,
     :return: Request result as json.
     """
 
+    return build_get_txn_request_sync(submitter_did, data)
+
+
+def build_get_txn_request_sync(submitter_did: str,
+                               data: int) -> str:
+    """
+    Synchronous version of build_get_txn_request, request is built in the caller thread.
+    """
+
     logger = logging.getLogger(__name__)
-    logger.debug("build_get_txn_request: >>> submitter_did: %s, data: %s",
+    logger.debug("build_get_txn_request_sync: >>> submitter_did: %s, data: %s",
                  submitter_did,
                  data)
 
-    if not hasattr(build_get_txn_request, "cb"):
-        logger.debug("build_get_txn_request: Creating callback")
-        build_get_txn_request.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_submitter_did = c_char_p(submitter_did.encode('utf-8'))
     c_data = c_int32(data)
 
-    request_json = await do_call('indy_build_get_txn_request',
-                                 c_submitter_did,
-                                 c_data,
-                                 build_get_txn_request.cb)
+    request_json = do_sync_call('indy_build_get_txn_request',
+                                c_submitter_did,
+                                c_data)
 
     res = request_json.decode()
-    logger.debug("build_get_txn_request: <<< res: %s", res)
+    logger.debug("build_get_txn_request_sync: <<< res: %s", res)
     return res
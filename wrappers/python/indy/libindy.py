@@ -6,75 +6,318 @@ import asyncio
 import sys
 import itertools
 import logging
+import threading
 
+_logger = logging.getLogger(__name__)
+
+# Command handle -> (event loop or None for blocking call, future). Registry is shared by all threads
+# without lock: handles are unique as next() of itertools.count is atomic, entry is added
+# by do_call before libindy function is called and popped once by its callback.
 _futures = {}
 _futures_counter = itertools.count()
 
+# Calls made by run_blocking in the current thread
+_blocking = threading.local()
+
+# Results of synchronous calls by command handle, see do_sync_call
+_sync_results = {}
+
+# Function name -> [libindy function (resolved on the first call), callback or None]
+_bindings = {}
+
+
+def bind(name: str, cb_type: CFUNCTYPE, transform_fn=None):
+    """
+    Binds C callback to libindy function once, so do_call passes it as the last argument.
+
+    :param name: name of libindy function.
+    :param cb_type: CFUNCTYPE of callback.
+    :param transform_fn: (optional) see create_cb.
+    """
+
+    _bindings[name] = [None, create_cb(cb_type, transform_fn)]
+
+
+def bind_sync(name: str, cb_type: CFUNCTYPE):
+    """
+    Binds C callback to libindy function that calls it before return, see do_sync_call.
+
+    :param name: name of libindy function.
+    :param cb_type: CFUNCTYPE of callback.
+    """
+
+    _bindings[name] = [None, cb_type(_indy_sync_callback)]
+
 
 def do_call(name: str, *args):
-    logger = logging.getLogger(__name__)
-    logger.debug("do_call: >>> name: %s, args: %s", name, args)
+    debug = _logger.isEnabledFor(logging.DEBUG)
+
+    if debug:
+        _logger.debug("do_call: >>> name: %s, args: %s", name, args)
+
+    (fn, cb) = _binding(name)
+
+    if getattr(_blocking, "active", False):
+        event_loop = None
+        future = _BlockingFuture()
+    else:
+        event_loop = asyncio.get_event_loop()
+        future = event_loop.create_future()
 
-    event_loop = asyncio.get_event_loop()
-    future = event_loop.create_future()
     command_handle = next(_futures_counter)
 
     _futures[command_handle] = (event_loop, future)
 
-    err = getattr(_cdll(), name)(command_handle,
-                                 *args)
+    if cb is None:
+        err = fn(command_handle, *args)
+    else:
+        err = fn(command_handle, *args, cb)
 
-    logger.debug("do_call: Function %s returned err: %i", name, err)
+    if debug:
+        _logger.debug("do_call: Function %s returned err: %i", name, err)
 
     if err != ErrorCode.Success:
-        logger.warning("_do_call: Function %s returned error %i", name, err)
+        _logger.warning("_do_call: Function %s returned error %i", name, err)
+        _futures.pop(command_handle, None)
         future.set_exception(IndyError(ErrorCode(err)))
 
-    logger.debug("do_call: <<< %s", future)
+    if debug:
+        _logger.debug("do_call: <<< %s", future)
+
     return future
 
 
-def create_cb(cb_type: CFUNCTYPE):
-    logger = logging.getLogger(__name__)
-    logger.debug("create_cb: >>> cb_type: %s", cb_type)
+def do_sync_call(name: str, *args):
+    """
+    Calls libindy function that calls its callback in the caller thread before return
+    and returns callback result without going through the event loop.
+    """
+
+    debug = _logger.isEnabledFor(logging.DEBUG)
+
+    if debug:
+        _logger.debug("do_sync_call: >>> name: %s, args: %s", name, args)
+
+    (fn, cb) = _binding(name)
+    command_handle = next(_futures_counter)
+
+    err = fn(command_handle, *args, cb)
+    (cb_err, res) = _sync_results.pop(command_handle, (err, None))
+
+    if err == ErrorCode.Success:
+        err = cb_err
 
-    res = cb_type(_indy_callback)
+    if err != ErrorCode.Success:
+        _logger.warning("do_sync_call: Function %s returned error %i", name, err)
+        raise IndyError(ErrorCode(err))
+
+    if debug:
+        _logger.debug("do_sync_call: <<< res: %s", res)
 
-    logger.debug("create_cb: <<< res: %s", res)
     return res
 
 
-def _indy_callback(command_handle: int, err: int, *args):
-    logger = logging.getLogger(__name__)
-    logger.debug("_indy_callback: >>> command_handle: %i, err %i, args: %s", command_handle, err, args)
+def run_blocking(coro):
+    """
+    Runs wrapper coroutine in the calling thread without event loop and returns its result.
 
-    (event_loop, future) = _futures[command_handle]
-    event_loop.call_soon_threadsafe(_indy_loop_callback, command_handle, err, *args)
+    Allows to call indy functions from threads that don't run event loop (for example thread pool workers).
+    Coroutine can await only libindy calls, so functions that wait for events or use asyncio
+    (agent.agent_wait_for_event, pool.PoolManager) aren't supported.
 
-    logger.debug("_indy_callback: <<<")
+    :param coro: coroutine of indy wrapper function, for example ledger.submit_request(...).
+    :return: coroutine result.
+    """
 
+    if getattr(_blocking, "active", False):
+        raise RuntimeError("run_blocking can't be nested")
 
-def _indy_loop_callback(command_handle: int, err, *args):
-    logger = logging.getLogger(__name__)
-    logger.debug("_indy_loop_callback: >>> command_handle: %i, err %i, args: %s", command_handle, err, args)
+    _blocking.active = True
+
+    try:
+        value = None
+
+        while True:
+            try:
+                future = coro.send(value)
+            except StopIteration as e:
+                return e.value
+
+            if not isinstance(future, _BlockingFuture):
+                coro.close()
+                raise RuntimeError("Coroutine awaited not libindy call: {}".format(future))
+
+            future.wait()
+    finally:
+        _blocking.active = False
+
+
+class _BlockingFuture:
+    """
+    Future of libindy call made by run_blocking. Resolved in libindy thread.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._result = None
+        self._exception = None
+
+    def cancelled(self) -> bool:
+        return False
+
+    def set_result(self, result):
+        self._result = result
+        self._event.set()
+
+    def set_exception(self, exception):
+        self._exception = exception
+        self._event.set()
+
+    def wait(self):
+        self._event.wait()
+
+    def result(self):
+        self._event.wait()
+
+        if self._exception is not None:
+            raise self._exception
+
+        return self._result
+
+    def __await__(self):
+        if not self._event.is_set():
+            yield self
+
+        return self.result()
+
+
+def create_cb(cb_type: CFUNCTYPE, transform_fn=None):
+    """
+    Creates C callback for libindy function.
+
+    :param cb_type: CFUNCTYPE of callback.
+    :param transform_fn: (optional) function applied to callback args (without command_handle and err)
+        in libindy thread. Must be used to copy memory owned by libindy (pointers to raw bytes)
+        as it can be released right after callback returns.
+    :return: C callback
+    """
+
+    _logger.debug("create_cb: >>> cb_type: %s, transform_fn: %s", cb_type, transform_fn)
+
+    if transform_fn is None:
+        res = cb_type(_indy_callback)
+    else:
+        def _transform_callback(command_handle: int, err: int, *args):
+            if err == ErrorCode.Success:
+                args = transform_fn(*args)
+            _indy_callback(command_handle, err, *args)
+
+        res = cb_type(_transform_callback)
+
+    _logger.debug("create_cb: <<< res: %s", res)
+    return res
+
+
+def c_bytes(data) -> (object, c_uint32):
+    """
+    Converts bytes-like object to (pointer, length) args of libindy function without copying
+    if possible (bytes, bytearray or writable memoryview).
+    """
+
+    if isinstance(data, bytes):
+        return c_char_p(data), c_uint32(len(data))
+
+    view = memoryview(data)
+
+    if view.readonly or not view.c_contiguous:
+        data = view.tobytes()
+        return c_char_p(data), c_uint32(len(data))
+
+    return (c_char * view.nbytes).from_buffer(view), c_uint32(view.nbytes)
+
+
+def bytes_from_raw(*args) -> tuple:
+    """
+    Transform function for create_cb that copies (pointer, length) pairs of callback args to bytes.
+    """
+
+    return tuple(string_at(ptr, length) for (ptr, length) in zip(args[::2], args[1::2]))
+
+
+def _indy_callback(command_handle: int, err: int, *args):
+    debug = _logger.isEnabledFor(logging.DEBUG)
+
+    if debug:
+        _logger.debug("_indy_callback: >>> command_handle: %i, err %i, args: %s", command_handle, err, args)
 
     (event_loop, future) = _futures.pop(command_handle)
 
+    if event_loop is None:
+        _set_future(future, err, args)
+    else:
+        try:
+            event_loop.call_soon_threadsafe(_indy_loop_callback, future, err, *args)
+        except RuntimeError as e:
+            _logger.warning("_indy_callback: Can't complete command %i: %s", command_handle, e)
+
+    if debug:
+        _logger.debug("_indy_callback: <<<")
+
+
+def _indy_sync_callback(command_handle: int, err: int, *args):
+    _sync_results[command_handle] = (err, _result(args))
+
+
+def _indy_loop_callback(future, err, *args):
+    debug = _logger.isEnabledFor(logging.DEBUG)
+
+    if debug:
+        _logger.debug("_indy_loop_callback: >>> future: %s, err %i, args: %s", future, err, args)
+
+    if future.cancelled():
+        if debug:
+            _logger.debug("_indy_loop_callback: Future was cancelled")
+        return
+
+    _set_future(future, err, args)
+
+    if debug:
+        _logger.debug("_indy_loop_callback <<<")
+
+
+def _set_future(future, err: int, args: tuple):
     if err != ErrorCode.Success:
-        logger.warning("_indy_loop_callback: Function returned error %i", err)
+        _logger.warning("_set_future: Function returned error %i", err)
         future.set_exception(IndyError(ErrorCode(err)))
     else:
-        if len(args) == 0:
-            res = None
-        elif len(args) == 1:
-            (res,) = args
-        else:
-            res = args
-
-        logger.warning("_indy_loop_callback: Function returned %s", res)
+        res = _result(args)
+
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("_set_future: Function returned %s", res)
+
         future.set_result(res)
 
-    logger.debug("_indy_loop_callback <<<")
+
+def _result(args: tuple):
+    if len(args) == 0:
+        return None
+    elif len(args) == 1:
+        (res,) = args
+        return res
+    else:
+        return args
+
+
+def _binding(name: str) -> list:
+    binding = _bindings.get(name)
+
+    if binding is None:
+        binding = _bindings[name] = [None, None]
+
+    if binding[0] is None:
+        binding[0] = getattr(_cdll(), name)
+
+    return binding
 
 
 def _cdll() -> CDLL:
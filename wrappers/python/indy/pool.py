@@ -1,9 +1,20 @@
-from .libindy import do_call, create_cb
+from .error import IndyError
+from .libindy import bind, do_call
 
-from typing import Optional
+from typing import Optional, Dict
 from ctypes import *
 
+import asyncio
+import json
 import logging
+import time
+
+bind('indy_create_pool_ledger_config', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_open_pool_ledger', CFUNCTYPE(None, c_int32, c_int32, c_int32))
+bind('indy_refresh_pool_ledger', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_close_pool_ledger', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_delete_pool_ledger_config', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_pool_get_stats', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
 
 
 async def create_pool_ledger_config(config_name: str,
@@ -25,17 +36,12 @@ async def create_pool_ledger_config(config_name: str,
                  config_name,
                  config)
 
-    if not hasattr(create_pool_ledger_config, "cb"):
-        logger.debug("create_pool_ledger_config: Creating callback")
-        create_pool_ledger_config.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_config_name = c_char_p(config_name.encode('utf-8'))
     c_config = c_char_p(config.encode('utf-8')) if config is not None else None
 
     res = await do_call('indy_create_pool_ledger_config',
                         c_config_name,
-                        c_config,
-                        create_pool_ledger_config.cb)
+                        c_config)
 
     logger.debug("create_pool_ledger_config: <<< res: %s", res)
     return res
@@ -69,17 +75,12 @@ async def open_pool_ledger(config_name: str,
                  config_name,
                  config)
 
-    if not hasattr(open_pool_ledger, "cb"):
-        logger.debug("open_pool_ledger: Creating callback")
-        open_pool_ledger.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_int32))
-
     c_config_name = c_char_p(config_name.encode('utf-8'))
     c_config = c_char_p(config.encode('utf-8')) if config is not None else None
 
     res = await do_call('indy_open_pool_ledger',
                         c_config_name,
-                        c_config,
-                        open_pool_ledger.cb)
+                        c_config)
 
     logger.debug("open_pool_ledger: <<< res: %s", res)
     return res
@@ -97,15 +98,10 @@ async def refresh_pool_ledger(handle: int) -> None:
     logger.debug("refresh_pool_ledger: >>> config_name: %s",
                  handle)
 
-    if not hasattr(refresh_pool_ledger, "cb"):
-        logger.debug("refresh_pool_ledger: Creating callback")
-        refresh_pool_ledger.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_handle = c_int32(handle)
 
     res = await do_call('indy_refresh_pool_ledger',
-                        c_handle,
-                        refresh_pool_ledger.cb)
+                        c_handle)
 
     logger.debug("refresh_pool_ledger: <<< res: %s", res)
     return res
@@ -123,15 +119,10 @@ async def close_pool_ledger(handle: int) -> None:
     logger.debug("close_pool_ledger: >>> config_name: %s",
                  handle)
 
-    if not hasattr(close_pool_ledger, "cb"):
-        logger.debug("close_pool_ledger: Creating callback")
-        close_pool_ledger.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_handle = c_int32(handle)
 
     res = await do_call('indy_close_pool_ledger',
-                        c_handle,
-                        close_pool_ledger.cb)
+                        c_handle)
 
     logger.debug("close_pool_ledger: <<< res: %s", res)
     return res
@@ -149,15 +140,300 @@ async def delete_pool_ledger_config(config_name: str) -> None:
     logger.debug("delete_pool_ledger_config: >>> config_name: %s",
                  config_name)
 
-    if not hasattr(delete_pool_ledger_config, "cb"):
-        logger.debug("delete_pool_ledger_config: Creating callback")
-        delete_pool_ledger_config.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_config_name = c_char_p(config_name.encode('utf-8'))
 
     res = await do_call('indy_delete_pool_ledger_config',
-                        c_config_name,
-                        delete_pool_ledger_config.cb)
+                        c_config_name)
 
     logger.debug("delete_pool_ledger_config: <<< res: %s", res)
     return res
+
+
+async def get_stats(handle: int) -> str:
+    """
+    Returns statistics of pool nodes round-trips.
+    Read requests are sent to the healthy nodes with the lowest average latency first.
+
+    :param handle: pool handle returned by indy_open_pool_ledger
+    :return: Stats json:
+        {
+            "nodes": [{
+                "name": string, node alias,
+                "sent": int, count of requests sent to the node,
+                "replies": int, count of requests answered by the node,
+                "missed": int, count of requests the node didn't answer in time,
+                "healthy": bool, false if the node missed the last requests,
+                "avg_latency_ms": float or null, moving average of round-trip,
+                "histogram": [{"le_ms": int or null, "count": int}], round-trips histogram,
+            }],
+            "pending_requests": int, count of requests waiting for replies
+        }
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("get_stats: >>> handle: %s",
+                 handle)
+
+    c_handle = c_int32(handle)
+
+    stats_json = await do_call('indy_pool_get_stats',
+                               c_handle)
+
+    res = stats_json.decode()
+    logger.debug("get_stats: <<< res: %s", res)
+    return res
+
+
+class PoolStats:
+    """
+    Health and latency stats of pool ledger opened by PoolManager
+
+    :handle: (int) Pool handle
+    :users: (int) Count of coroutines using the pool now
+    :opened_at: (float) Time of pool opening (time.time())
+    :open_latency: (float) Seconds spent to open the pool
+    :refresh_count: (int) Count of successful refreshes
+    :refresh_errors: (int) Count of failed refreshes
+    :last_refresh_at: (float) Time of the last successful refresh or None
+    :last_refresh_latency: (float) Seconds spent by the last successful refresh or None
+    :last_error: (IndyError) The last refresh error or None
+    """
+
+    def __init__(self, handle: int, open_latency: float):
+        self.handle = handle
+        self.users = 0
+        self.opened_at = time.time()
+        self.open_latency = open_latency
+        self.refresh_count = 0
+        self.refresh_errors = 0
+        self.last_refresh_at = None
+        self.last_refresh_latency = None
+        self.last_error = None
+
+    def is_healthy(self) -> bool:
+        """
+        Checks that the last refresh of the pool didn't fail
+
+        :return: True if the pool was refreshed or opened successfully after the last error
+        """
+
+        return self.last_error is None
+
+    def to_dict(self) -> dict:
+        return {
+            "handle": self.handle,
+            "users": self.users,
+            "healthy": self.is_healthy(),
+            "opened_at": self.opened_at,
+            "open_latency": self.open_latency,
+            "refresh_count": self.refresh_count,
+            "refresh_errors": self.refresh_errors,
+            "last_refresh_at": self.last_refresh_at,
+            "last_refresh_latency": self.last_refresh_latency,
+            "last_error": repr(self.last_error) if self.last_error is not None else None,
+        }
+
+
+class PoolManager:
+    """
+    Keeps pool ledgers open and shares their handles between coroutines.
+
+    Pool is opened by the first user and stays open until the manager is closed,
+    so opening of threads and nodes connections is paid once per pool.
+    Pools are refreshed in background according to "autoRefreshTime" of runtime config.
+
+    Example:
+        async with PoolManager() as manager:
+            async with manager.pool("pool_1") as pool_handle:
+                await ledger.submit_request(pool_handle, request_json)
+    """
+
+    # Default of "autoRefreshTime" in minutes, the same as libindy one
+    DEFAULT_AUTO_REFRESH_TIME = 24 * 60
+
+    def __init__(self, config: Optional[str] = None):
+        """
+        :param config: (optional) Runtime pool configuration json passed to open_pool_ledger
+         for all pools of the manager.
+        """
+
+        self._config = config
+        self._pools: Dict[str, PoolStats] = {}
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        # Pools being opened now, concurrent users of the same pool wait for the same opening
+        self._openings: Dict[str, asyncio.Future] = {}
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> 'PoolManager':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def pool(self, config_name: str) -> '_PoolUsage':
+        """
+        Returns async context manager that acquires pool handle on enter and releases it on exit.
+
+        :param config_name: Name of the pool ledger configuration.
+        """
+
+        return _PoolUsage(self, config_name)
+
+    async def acquire(self, config_name: str) -> int:
+        """
+        Returns handle of opened pool ledger, opens the pool if it isn't opened yet.
+        Every acquire must be paired with release.
+
+        :param config_name: Name of the pool ledger configuration.
+        :return: Pool handle
+        """
+
+        logger = logging.getLogger(__name__)
+        logger.debug("PoolManager.acquire: >>> config_name: %s", config_name)
+
+        stats = self._pools.get(config_name)
+
+        if stats is None:
+            opening = self._openings.get(config_name)
+
+            if opening is None:
+                opening = asyncio.ensure_future(self._open(config_name))
+                self._openings[config_name] = opening
+
+            # Cancellation of one user mustn't cancel opening for other users
+            stats = await asyncio.shield(opening)
+
+        stats.users += 1
+
+        logger.debug("PoolManager.acquire: <<< handle: %s", stats.handle)
+        return stats.handle
+
+    async def release(self, config_name: str) -> None:
+        """
+        Releases pool acquired by acquire. Pool stays open for the next users.
+
+        :param config_name: Name of the pool ledger configuration.
+        """
+
+        logger = logging.getLogger(__name__)
+        logger.debug("PoolManager.release: >>> config_name: %s", config_name)
+
+        stats = self._pools.get(config_name)
+
+        if stats is not None and stats.users > 0:
+            stats.users -= 1
+
+        logger.debug("PoolManager.release: <<<")
+
+    async def refresh(self, config_name: str) -> None:
+        """
+        Refreshes opened pool ledger and updates its stats.
+
+        :param config_name: Name of the pool ledger configuration.
+        """
+
+        logger = logging.getLogger(__name__)
+        logger.debug("PoolManager.refresh: >>> config_name: %s", config_name)
+
+        stats = self._pools[config_name]
+        started_at = time.perf_counter()
+
+        try:
+            await refresh_pool_ledger(stats.handle)
+        except IndyError as e:
+            stats.refresh_errors += 1
+            stats.last_error = e
+            raise
+
+        stats.refresh_count += 1
+        stats.last_refresh_at = time.time()
+        stats.last_refresh_latency = time.perf_counter() - started_at
+        stats.last_error = None
+
+        logger.debug("PoolManager.refresh: <<<")
+
+    def get_stats(self, config_name: Optional[str] = None) -> dict:
+        """
+        Returns health and latency stats of opened pools.
+
+        :param config_name: (optional) Name of the pool ledger configuration, stats of all pools if None.
+        :return: Stats dict of the pool or dict of stats dicts by pool names.
+        """
+
+        if config_name is not None:
+            return self._pools[config_name].to_dict()
+
+        return {name: stats.to_dict() for name, stats in self._pools.items()}
+
+    async def close(self) -> None:
+        """
+        Stops background refreshes and closes all opened pools.
+        """
+
+        logger = logging.getLogger(__name__)
+        logger.debug("PoolManager.close: >>> pools: %s", list(self._pools.keys()))
+
+        async with self._lock:
+            if self._openings:
+                await asyncio.gather(*self._openings.values(), return_exceptions=True)
+
+            for task in self._refresh_tasks.values():
+                task.cancel()
+
+            self._refresh_tasks.clear()
+
+            while self._pools:
+                (config_name, stats) = self._pools.popitem()
+
+                if stats.users > 0:
+                    logger.warning("PoolManager.close: pool %s is closed with %s users", config_name, stats.users)
+
+                try:
+                    await close_pool_ledger(stats.handle)
+                except IndyError as e:
+                    logger.warning("PoolManager.close: Can't close pool %s: %s", config_name, e)
+
+        logger.debug("PoolManager.close: <<<")
+
+    async def _open(self, config_name: str) -> PoolStats:
+        try:
+            started_at = time.perf_counter()
+            handle = await open_pool_ledger(config_name, self._config)
+            stats = PoolStats(handle, time.perf_counter() - started_at)
+            self._pools[config_name] = stats
+            self._start_auto_refresh(config_name)
+            return stats
+        finally:
+            del self._openings[config_name]
+
+    def _start_auto_refresh(self, config_name: str) -> None:
+        refresh_time = PoolManager.DEFAULT_AUTO_REFRESH_TIME
+
+        if self._config:
+            refresh_time = json.loads(self._config).get("autoRefreshTime", refresh_time)
+
+        if refresh_time > 0:
+            self._refresh_tasks[config_name] = asyncio.ensure_future(self._auto_refresh(config_name, refresh_time * 60))
+
+    async def _auto_refresh(self, config_name: str, interval: float) -> None:
+        logger = logging.getLogger(__name__)
+
+        while True:
+            await asyncio.sleep(interval)
+
+            try:
+                await self.refresh(config_name)
+            except IndyError as e:
+                logger.warning("PoolManager._auto_refresh: Can't refresh pool %s: %s", config_name, e)
+
+
+class _PoolUsage:
+    def __init__(self, manager: PoolManager, config_name: str):
+        self._manager = manager
+        self._config_name = config_name
+
+    async def __aenter__(self) -> int:
+        return await self._manager.acquire(self._config_name)
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._manager.release(self._config_name)
@@ -1,9 +1,26 @@
-from .libindy import do_call, create_cb
+from .libindy import bind, do_call, c_bytes, bytes_from_raw
 
 from ctypes import *
 
+import json
 import logging
 
+bind('indy_create_and_store_my_did', CFUNCTYPE(None, c_int32, c_int32, c_char_p, c_char_p, c_char_p))
+bind('indy_replace_keys', CFUNCTYPE(None, c_int32, c_int32, c_char_p, c_char_p))
+bind('indy_store_their_did', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_sign', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind('indy_sign_batch', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind('indy_verify_signature', CFUNCTYPE(None, c_int32, c_int32, c_bool))
+bind('indy_verify_signatures_batch', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind('indy_encrypt', CFUNCTYPE(None, c_int32, c_int32, c_char_p, c_char_p))
+bind('indy_decrypt', CFUNCTYPE(None, c_int32, c_int32, c_char_p))
+bind('indy_sign_bytes', CFUNCTYPE(None, c_int32, c_int32, POINTER(c_uint8), c_uint32), bytes_from_raw)
+bind('indy_verify_signature_bytes', CFUNCTYPE(None, c_int32, c_int32, c_bool))
+bind('indy_encrypt_bytes',
+     CFUNCTYPE(None, c_int32, c_int32, POINTER(c_uint8), c_uint32, POINTER(c_uint8), c_uint32),
+     bytes_from_raw)
+bind('indy_decrypt_bytes', CFUNCTYPE(None, c_int32, c_int32, POINTER(c_uint8), c_uint32), bytes_from_raw)
+
 
 async def create_and_store_my_did(wallet_handle: int,
                                   did_json: str) -> (str, str, str):
@@ -34,17 +51,12 @@ async def create_and_store_my_did(wallet_handle: int,
                  wallet_handle,
                  did_json)
 
-    if not hasattr(create_and_store_my_did, "cb"):
-        logger.debug("create_wallet: Creating callback")
-        create_and_store_my_did.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p, c_char_p, c_char_p))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_did_json = c_char_p(did_json.encode('utf-8'))
 
     did, verkey, pk = await do_call('indy_create_and_store_my_did',
                                     c_wallet_handle,
-                                    c_did_json,
-                                    create_and_store_my_did.cb)
+                                    c_did_json)
 
     res = (did.decode(), verkey.decode(), pk.decode())
 
@@ -76,10 +88,6 @@ async def replace_keys(wallet_handle: int,
                  did,
                  identity_json)
 
-    if not hasattr(replace_keys, "cb"):
-        logger.debug("replace_keys: Creating callback")
-        replace_keys.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p, c_char_p))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_did = c_char_p(did.encode('utf-8'))
     c_identity_json = c_char_p(identity_json.encode('utf-8'))
@@ -87,8 +95,7 @@ async def replace_keys(wallet_handle: int,
     verkey, pk = await do_call('indy_replace_keys',
                         c_wallet_handle,
                         c_did,
-                        c_identity_json,
-                        replace_keys.cb)
+                        c_identity_json)
 
     res = (verkey.decode(), pk.decode())
 
@@ -118,17 +125,12 @@ async def store_their_did(wallet_handle: int,
                  wallet_handle,
                  identity_json)
 
-    if not hasattr(store_their_did, "cb"):
-        logger.debug("store_their_did: Creating callback")
-        store_their_did.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_identity_json = c_char_p(identity_json.encode('utf-8'))
 
     res = await do_call('indy_store_their_did',
                         c_wallet_handle,
-                        c_identity_json,
-                        store_their_did.cb)
+                        c_identity_json)
 
     logger.debug("store_their_did: <<< res: %s", res)
     return res
@@ -153,10 +155,6 @@ async def sign(wallet_handle: int,
                  did,
                  msg)
 
-    if not hasattr(sign, "cb"):
-        logger.debug("sign: Creating callback")
-        sign.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_did = c_char_p(did.encode('utf-8'))
     c_msg = c_char_p(msg.encode('utf-8'))
@@ -164,8 +162,7 @@ async def sign(wallet_handle: int,
     res = await do_call('indy_sign',
                         c_wallet_handle,
                         c_did,
-                        c_msg,
-                        sign.cb)
+                        c_msg)
 
     res = res.decode()
 
@@ -173,6 +170,41 @@ async def sign(wallet_handle: int,
     return res
 
 
+async def sign_batch(wallet_handle: int,
+                     did: str,
+                     msgs: [str]) -> [str]:
+    """
+    Signs a batch of messages by a signing key associated with my DID. The DID with a signing key
+    must be already created and stored in a secured wallet (see create_and_store_my_identity).
+    Signing key is loaded from the wallet only once for the whole batch.
+
+    :param wallet_handle: wallet handler (created by open_wallet).
+    :param did: signing DID
+    :param msgs: list of messages to be signed
+    :return: list of signed messages in the same order as input messages
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("sign_batch: >>> wallet_handle: %s, did: %s, msgs: %s",
+                 wallet_handle,
+                 did,
+                 msgs)
+
+    c_wallet_handle = c_int32(wallet_handle)
+    c_did = c_char_p(did.encode('utf-8'))
+    c_msgs_json = c_char_p(json.dumps(msgs).encode('utf-8'))
+
+    signed_msgs_json = await do_call('indy_sign_batch',
+                                     c_wallet_handle,
+                                     c_did,
+                                     c_msgs_json)
+
+    res = json.loads(signed_msgs_json.decode())
+
+    logger.debug("sign_batch: <<< res: %s", res)
+    return res
+
+
 async def verify_signature(wallet_handle: int,
                            pool_handle: int,
                            did: str,
@@ -199,10 +231,6 @@ async def verify_signature(wallet_handle: int,
                  did,
                  signed_msg)
 
-    if not hasattr(verify_signature, "cb"):
-        logger.debug("verify_signature: Creating callback")
-        verify_signature.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_bool))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_pool_handle = c_int32(pool_handle)
     c_did = c_char_p(did.encode('utf-8'))
@@ -212,13 +240,43 @@ async def verify_signature(wallet_handle: int,
                         c_wallet_handle,
                         c_pool_handle,
                         c_did,
-                        c_signed_msg,
-                        verify_signature.cb)
+                        c_signed_msg)
 
     logger.debug("verify_signature: <<< res: %s", res)
     return res
 
 
+async def verify_signatures_batch(wallet_handle: int,
+                                  signed_msgs: [(str, str)]) -> [bool]:
+    """
+    Verifies a batch of signatures created by keys associated with DIDs.
+    Verkeys are read from a secure wallet only once per DID (see wallet_store_their_identity),
+    unlike verify_signature Ledger isn't requested for unknown DIDs.
+
+    :param wallet_handle: wallet handler (created by open_wallet).
+    :param signed_msgs: list of (DID that signed the message, signed message) pairs
+    :return: list of verification results in the same order as input messages,
+        messages that can't be verified (malformed, signed by DID unknown to the wallet) are False
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("verify_signatures_batch: >>> wallet_handle: %s, signed_msgs: %s",
+                 wallet_handle,
+                 signed_msgs)
+
+    c_wallet_handle = c_int32(wallet_handle)
+    c_signed_msgs_json = c_char_p(json.dumps(signed_msgs).encode('utf-8'))
+
+    results_json = await do_call('indy_verify_signatures_batch',
+                                 c_wallet_handle,
+                                 c_signed_msgs_json)
+
+    res = json.loads(results_json.decode())
+
+    logger.debug("verify_signatures_batch: <<< res: %s", res)
+    return res
+
+
 async def encrypt(wallet_handle: int,
                   pool_handle: int,
                   my_did: str,
@@ -248,10 +306,6 @@ async def encrypt(wallet_handle: int,
                  did,
                  msg)
 
-    if not hasattr(encrypt, "cb"):
-        logger.debug("encrypt: Creating callback")
-        encrypt.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p, c_char_p))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_pool_handle = c_int32(pool_handle)
     c_my_did = c_char_p(my_did.encode('utf-8'))
@@ -263,8 +317,7 @@ async def encrypt(wallet_handle: int,
                         c_pool_handle,
                         c_my_did,
                         c_did,
-                        c_msg,
-                        encrypt.cb)
+                        c_msg)
 
     logger.debug("encrypt: <<< res: %s", res)
     return res
@@ -296,10 +349,6 @@ async def decrypt(wallet_handle: int,
                  encrypted_msg,
                  nonce)
 
-    if not hasattr(decrypt, "cb"):
-        logger.debug("decrypt: Creating callback")
-        decrypt.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_char_p))
-
     c_wallet_handle = c_int32(wallet_handle)
     c_my_did = c_char_p(my_did.encode('utf-8'))
     c_did = c_char_p(did.encode('utf-8'))
@@ -311,8 +360,165 @@ async def decrypt(wallet_handle: int,
                         c_my_did,
                         c_did,
                         c_encrypted_msg,
-                        c_nonce,
-                        decrypt.cb)
+                        c_nonce)
 
     logger.debug("decrypt: <<< res: %s", res)
     return res
+
+
+async def sign_bytes(wallet_handle: int,
+                     did: str,
+                     msg: bytes) -> bytes:
+    """
+    Signs raw bytes by a signing key associated with my DID. The DID with a signing key
+    must be already created and stored in a secured wallet (see create_and_store_my_identity).
+    Unlike sign message isn't required to be json and detached signature is returned.
+
+    :param wallet_handle: wallet handler (created by open_wallet).
+    :param did: signing DID
+    :param msg: a message to be signed (bytes, bytearray or memoryview)
+    :return: a signature bytes
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("sign_bytes: >>> wallet_handle: %s, did: %s, msg: %s",
+                 wallet_handle,
+                 did,
+                 msg)
+
+    c_wallet_handle = c_int32(wallet_handle)
+    c_did = c_char_p(did.encode('utf-8'))
+    c_msg, c_msg_len = c_bytes(msg)
+
+    res = await do_call('indy_sign_bytes',
+                        c_wallet_handle,
+                        c_did,
+                        c_msg,
+                        c_msg_len)
+
+    logger.debug("sign_bytes: <<< res: %s", res)
+    return res
+
+
+async def verify_signature_bytes(wallet_handle: int,
+                                 did: str,
+                                 msg: bytes,
+                                 signature: bytes) -> bool:
+    """
+    Verify a detached signature of raw bytes created by a key associated with a DID.
+    Verkey must be already stored in a secured wallet (see wallet_store_their_identity),
+    Ledger isn't requested.
+
+    :param wallet_handle: wallet handler (created by open_wallet).
+    :param did: DID that signed the message
+    :param msg: a message (bytes, bytearray or memoryview)
+    :param signature: a signature (bytes, bytearray or memoryview)
+    :return: valid: true - if signature is valid, false - otherwise
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("verify_signature_bytes: >>> wallet_handle: %s, did: %s, msg: %s, signature: %s",
+                 wallet_handle,
+                 did,
+                 msg,
+                 signature)
+
+    c_wallet_handle = c_int32(wallet_handle)
+    c_did = c_char_p(did.encode('utf-8'))
+    c_msg, c_msg_len = c_bytes(msg)
+    c_signature, c_signature_len = c_bytes(signature)
+
+    res = await do_call('indy_verify_signature_bytes',
+                        c_wallet_handle,
+                        c_did,
+                        c_msg,
+                        c_msg_len,
+                        c_signature,
+                        c_signature_len)
+
+    logger.debug("verify_signature_bytes: <<< res: %s", res)
+    return res
+
+
+async def encrypt_bytes(wallet_handle: int,
+                        my_did: str,
+                        did: str,
+                        msg: bytes) -> (bytes, bytes):
+    """
+    Encrypts raw bytes by a public key associated with a DID.
+    Public key must be already stored in a secured wallet (see wallet_store_their_identity),
+    Ledger isn't requested.
+
+    :param wallet_handle: wallet handler (created by open_wallet).
+    :param my_did: encrypting DID
+    :param did: encrypting DID
+    :param msg: a message to be encrypted (bytes, bytearray or memoryview)
+    :return: an encrypted message and nonce bytes
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("encrypt_bytes: >>> wallet_handle: %s, my_did: %s, did: %s, msg: %s",
+                 wallet_handle,
+                 my_did,
+                 did,
+                 msg)
+
+    c_wallet_handle = c_int32(wallet_handle)
+    c_my_did = c_char_p(my_did.encode('utf-8'))
+    c_did = c_char_p(did.encode('utf-8'))
+    c_msg, c_msg_len = c_bytes(msg)
+
+    res = await do_call('indy_encrypt_bytes',
+                        c_wallet_handle,
+                        c_my_did,
+                        c_did,
+                        c_msg,
+                        c_msg_len)
+
+    logger.debug("encrypt_bytes: <<< res: %s", res)
+    return res
+
+
+async def decrypt_bytes(wallet_handle: int,
+                        my_did: str,
+                        did: str,
+                        encrypted_msg: bytes,
+                        nonce: bytes) -> bytes:
+    """
+    Decrypts raw bytes encrypted by a public key associated with my DID.
+    The DID with a secret key must be already created and
+    stored in a secured wallet (see wallet_create_and_store_my_identity)
+
+    :param wallet_handle: wallet handler (created by open_wallet).
+    :param my_did: DID
+    :param did: DID that encrypted the message
+    :param encrypted_msg: encrypted message (bytes, bytearray or memoryview)
+    :param nonce: nonce that encrypted message (bytes, bytearray or memoryview)
+    :return: decrypted message bytes
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("decrypt_bytes: >>> wallet_handle: %s, my_did: %s, did: %s, encrypted_msg: %s, nonce: %s",
+                 wallet_handle,
+                 my_did,
+                 did,
+                 encrypted_msg,
+                 nonce)
+
+    c_wallet_handle = c_int32(wallet_handle)
+    c_my_did = c_char_p(my_did.encode('utf-8'))
+    c_did = c_char_p(did.encode('utf-8'))
+    c_encrypted_msg, c_encrypted_msg_len = c_bytes(encrypted_msg)
+    c_nonce, c_nonce_len = c_bytes(nonce)
+
+    res = await do_call('indy_decrypt_bytes',
+                        c_wallet_handle,
+                        c_my_did,
+                        c_did,
+                        c_encrypted_msg,
+                        c_encrypted_msg_len,
+                        c_nonce,
+                        c_nonce_len)
+
+    logger.debug("decrypt_bytes: <<< res: %s", res)
+    return res
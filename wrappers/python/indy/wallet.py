@@ -1,9 +1,254 @@
-from .libindy import do_call, create_cb
+from .error import ErrorCode, IndyError
+from .libindy import bind, do_call
 
-from typing import Optional
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
 from ctypes import *
 
+import itertools
+import json
 import logging
+import threading
+import time
+
+bind('indy_register_wallet_type', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_create_wallet', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_open_wallet', CFUNCTYPE(None, c_int32, c_int32, c_int32))
+bind('indy_close_wallet', CFUNCTYPE(None, c_int32, c_int32))
+bind('indy_delete_wallet', CFUNCTYPE(None, c_int32, c_int32))
+
+
+class WalletBackend(ABC):
+    """
+    Base class of custom wallet storage registered with register_wallet_type.
+
+    Methods are called in libindy thread, so they must be thread-safe and shouldn't block for a long time.
+    Errors are returned to libindy by raising IndyError, other exceptions are returned as CommonInvalidState.
+    """
+
+    @abstractmethod
+    def create(self, name: str, config: Optional[str], credentials: Optional[str]) -> None:
+        pass
+
+    @abstractmethod
+    def open(self, name: str, config: Optional[str], runtime_config: Optional[str],
+             credentials: Optional[str]) -> int:
+        """
+        :return: handle of opened wallet passed to other methods.
+        """
+
+    @abstractmethod
+    def set(self, handle: int, key: str, value: str) -> None:
+        pass
+
+    @abstractmethod
+    def get(self, handle: int, key: str) -> str:
+        """
+        :return: value of the key, raises IndyError(WalletNotFoundError) if there is no such key.
+        """
+
+    def get_not_expired(self, handle: int, key: str) -> str:
+        """
+        Same as get, but raises IndyError(WalletNotFoundError) if value isn't fresh anymore.
+        """
+        return self.get(handle, key)
+
+    @abstractmethod
+    def list(self, handle: int, key_prefix: str) -> List[Tuple[str, str]]:
+        """
+        :return: (key, value) pairs of all keys with key_prefix.
+        """
+
+    @abstractmethod
+    def close(self, handle: int) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, name: str, config: Optional[str], credentials: Optional[str]) -> None:
+        pass
+
+
+class InmemWalletBackend(WalletBackend):
+    """
+    Wallet backend that keeps values in process memory, so values are lost when the process exits.
+    Runtime config is {"freshness_time": int} - seconds to consider value as fresh
+    (1000 by default, 0 means that values never expire).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._wallets: Dict[str, Dict[str, Tuple[str, float]]] = {}
+        self._handles: Dict[int, Tuple[str, int]] = {}
+        self._handles_counter = itertools.count(1)
+
+    def create(self, name: str, config: Optional[str], credentials: Optional[str]) -> None:
+        with self._lock:
+            if name in self._wallets:
+                # Invalid state as "already exists" case must be checked by libindy
+                raise IndyError(ErrorCode.CommonInvalidState)
+
+            self._wallets[name] = {}
+
+    def open(self, name: str, config: Optional[str], runtime_config: Optional[str],
+             credentials: Optional[str]) -> int:
+        freshness_time = json.loads(runtime_config).get("freshness_time", 1000) if runtime_config else 1000
+
+        with self._lock:
+            if name not in self._wallets:
+                raise IndyError(ErrorCode.CommonInvalidState)
+
+            handle = next(self._handles_counter)
+            self._handles[handle] = (name, freshness_time)
+            return handle
+
+    def set(self, handle: int, key: str, value: str) -> None:
+        with self._lock:
+            self._wallet(handle)[key] = (value, time.time())
+
+    def get(self, handle: int, key: str) -> str:
+        with self._lock:
+            (value, _) = self._record(handle, key)
+            return value
+
+    def get_not_expired(self, handle: int, key: str) -> str:
+        with self._lock:
+            (value, time_created) = self._record(handle, key)
+            (_, freshness_time) = self._handles[handle]
+
+            if freshness_time != 0 and time.time() - time_created > freshness_time:
+                raise IndyError(ErrorCode.WalletNotFoundError)
+
+            return value
+
+    def list(self, handle: int, key_prefix: str) -> List[Tuple[str, str]]:
+        with self._lock:
+            return [(key, value) for (key, (value, _)) in self._wallet(handle).items() if key.startswith(key_prefix)]
+
+    def close(self, handle: int) -> None:
+        with self._lock:
+            if self._handles.pop(handle, None) is None:
+                raise IndyError(ErrorCode.CommonInvalidState)
+
+    def delete(self, name: str, config: Optional[str], credentials: Optional[str]) -> None:
+        with self._lock:
+            if self._wallets.pop(name, None) is None:
+                raise IndyError(ErrorCode.CommonInvalidState)
+
+    def _wallet(self, handle: int) -> Dict[str, Tuple[str, float]]:
+        if handle not in self._handles:
+            raise IndyError(ErrorCode.CommonInvalidState)
+
+        (name, _) = self._handles[handle]
+        wallet = self._wallets.get(name)
+
+        if wallet is None:
+            raise IndyError(ErrorCode.CommonInvalidState)
+
+        return wallet
+
+    def _record(self, handle: int, key: str) -> Tuple[str, float]:
+        record = self._wallet(handle).get(key)
+
+        if record is None:
+            raise IndyError(ErrorCode.WalletNotFoundError)
+
+        return record
+
+
+# Callbacks of registered wallet types must live while libindy is loaded
+_wallet_types: Dict[str, tuple] = {}
+
+# Address -> buffer of values returned to libindy till it calls free handler
+_wallet_values: Dict[int, Array] = {}
+
+
+async def register_wallet_type(xtype: str,
+                               backend: WalletBackend) -> None:
+    """
+    Registers custom wallet implementation.
+
+    It allows library user to provide custom wallet implementation.
+
+    :param xtype: Wallet type name. Names of built-in types ('default' and 'inmem') are reserved.
+    :param backend: Wallet storage implementation, see WalletBackend.
+    :return: Error code
+    """
+
+    logger = logging.getLogger(__name__)
+    logger.debug("register_wallet_type: >>> xtype: %s, backend: %s",
+                 xtype,
+                 backend)
+
+    def decode(value: Optional[bytes]) -> Optional[str]:
+        return value.decode() if value is not None else None
+
+    def return_value(value: str, value_ptr):
+        buffer = create_string_buffer(value.encode('utf-8'))
+        _wallet_values[addressof(buffer)] = buffer
+        value_ptr[0] = addressof(buffer)
+
+    def create(name, config, credentials):
+        backend.create(decode(name), decode(config), decode(credentials))
+
+    def open_(name, config, runtime_config, credentials, handle_ptr):
+        handle_ptr[0] = backend.open(decode(name), decode(config), decode(runtime_config), decode(credentials))
+
+    def set_(handle, key, value):
+        backend.set(handle, decode(key), decode(value))
+
+    def get(handle, key, value_ptr):
+        return_value(backend.get(handle, decode(key)), value_ptr)
+
+    def get_not_expired(handle, key, value_ptr):
+        return_value(backend.get_not_expired(handle, decode(key)), value_ptr)
+
+    def list_(handle, key_prefix, values_json_ptr):
+        values = [{"key": key, "value": value} for (key, value) in backend.list(handle, decode(key_prefix))]
+        return_value(json.dumps({"values": values}), values_json_ptr)
+
+    def close(handle):
+        backend.close(handle)
+
+    def delete(name, config, credentials):
+        backend.delete(decode(name), decode(config), decode(credentials))
+
+    def free(handle, value):
+        _wallet_values.pop(value, None)
+
+    callbacks = (
+        CFUNCTYPE(c_int32, c_char_p, c_char_p, c_char_p)(_wallet_handler(create)),
+        CFUNCTYPE(c_int32, c_char_p, c_char_p, c_char_p, c_char_p, POINTER(c_int32))(_wallet_handler(open_)),
+        CFUNCTYPE(c_int32, c_int32, c_char_p, c_char_p)(_wallet_handler(set_)),
+        CFUNCTYPE(c_int32, c_int32, c_char_p, POINTER(c_void_p))(_wallet_handler(get)),
+        CFUNCTYPE(c_int32, c_int32, c_char_p, POINTER(c_void_p))(_wallet_handler(get_not_expired)),
+        CFUNCTYPE(c_int32, c_int32, c_char_p, POINTER(c_void_p))(_wallet_handler(list_)),
+        CFUNCTYPE(c_int32, c_int32)(_wallet_handler(close)),
+        CFUNCTYPE(c_int32, c_char_p, c_char_p, c_char_p)(_wallet_handler(delete)),
+        CFUNCTYPE(c_int32, c_int32, c_void_p)(_wallet_handler(free)),
+    )
+
+    c_xtype = c_char_p(xtype.encode('utf-8'))
+
+    await do_call('indy_register_wallet_type',
+                  c_xtype,
+                  *callbacks)
+
+    _wallet_types[xtype] = (backend, callbacks)
+    logger.debug("register_wallet_type: <<<")
+
+
+def _wallet_handler(fn):
+    def handler(*args) -> int:
+        try:
+            fn(*args)
+            return int(ErrorCode.Success)
+        except IndyError as e:
+            return int(e.error_code)
+        except Exception as e:
+            logging.getLogger(__name__).warning("_wallet_handler: %s failed: %s", fn.__name__, e)
+            return int(ErrorCode.CommonInvalidState)
+
+    return handler
 
 
 async def create_wallet(pool_name: str,
@@ -17,6 +262,8 @@ async def create_wallet(pool_name: str,
     :param pool_name: Name of the pool that corresponds to this wallet.
     :param name: Name of the wallet.
     :param xtype: (optional) Type of the wallet. Defaults to 'default'.
+     Built-in types are 'default' (sqlite) and 'inmem' (records are kept in process memory,
+     config {"snapshot": true} writes them to wallet directory on close to restore in other process).
      Custom types can be registered with indy_register_wallet_type call.
     :param config: (optional) Wallet configuration json. List of supported keys are defined by wallet type.
      if NULL, then default config will be used.
@@ -33,10 +280,6 @@ async def create_wallet(pool_name: str,
                  config,
                  credentials)
 
-    if not hasattr(create_wallet, "cb"):
-        logger.debug("create_wallet: Creating callback")
-        create_wallet.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_pool_name = c_char_p(pool_name.encode('utf-8'))
     c_name = c_char_p(name.encode('utf-8'))
     c_xtype = c_char_p(xtype.encode('utf-8')) if xtype is not None else None
@@ -48,8 +291,7 @@ async def create_wallet(pool_name: str,
                   c_name,
                   c_xtype,
                   c_config,
-                  c_credentials,
-                  create_wallet.cb)
+                  c_credentials)
 
     logger.debug("create_wallet: <<<")
 
@@ -80,10 +322,6 @@ async def open_wallet(name: str,
                  runtime_config,
                  credentials)
 
-    if not hasattr(open_wallet, "cb"):
-        logger.debug("open_wallet: Creating callback")
-        open_wallet.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32, c_int32))
-
     c_name = c_char_p(name.encode('utf-8'))
     c_runtime_config = c_char_p(runtime_config.encode('utf-8')) if runtime_config is not None else None
     c_credentials = c_char_p(credentials.encode('utf-8')) if credentials is not None else None
@@ -91,8 +329,7 @@ async def open_wallet(name: str,
     res = await do_call('indy_open_wallet',
                         c_name,
                         c_runtime_config,
-                        c_credentials,
-                        open_wallet.cb)
+                        c_credentials)
 
     logger.debug("open_wallet: <<< res: %s", res)
     return res
@@ -109,15 +346,10 @@ async def close_wallet(handle: int) -> None:
     logger = logging.getLogger(__name__)
     logger.debug("close_wallet: >>> handle: %i", handle)
 
-    if not hasattr(close_wallet, "cb"):
-        logger.debug("close_wallet: Creating callback")
-        close_wallet.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_handle = c_int32(handle)
 
     await do_call('indy_close_wallet',
-                  c_handle,
-                  close_wallet.cb)
+                  c_handle)
 
     logger.debug("close_wallet: <<<")
 
@@ -142,16 +374,11 @@ async def delete_wallet(name: str,
                  name,
                  credentials)
 
-    if not hasattr(delete_wallet, "cb"):
-        logger.debug("delete_wallet: Creating callback")
-        delete_wallet.cb = create_cb(CFUNCTYPE(None, c_int32, c_int32))
-
     c_name = c_char_p(name.encode('utf-8'))
     c_credentials = c_char_p(credentials.encode('utf-8')) if credentials is not None else None
 
     await do_call('indy_delete_wallet',
                   c_name,
-                  c_credentials,
-                  delete_wallet.cb)
+                  c_credentials)
 
     logger.debug("delete_wallet: <<<")
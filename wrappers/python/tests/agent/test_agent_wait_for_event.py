@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from indy import agent
+
+
+@pytest.mark.asyncio
+async def test_agent_wait_for_event_works_for_queued_events():
+    agent._put_event(agent.MessageEvent(-101, 0, b"msg_1"))
+    agent._put_event(agent.MessageEvent(-101, 0, b"msg_2"))
+
+    assert (await agent.agent_wait_for_event([-101])).message == "msg_1"
+    assert (await agent.agent_wait_for_event([-101])).message == "msg_2"
+    assert -101 not in agent._events
+
+
+@pytest.mark.asyncio
+async def test_agent_wait_for_event_works_for_several_waiters():
+    waiters = [asyncio.ensure_future(agent.agent_wait_for_event([-102, -103])) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    agent._put_event(agent.MessageEvent(-103, 0, b"msg_1"))
+    agent._put_event(agent.MessageEvent(-102, 0, b"msg_2"))
+    agent._put_event(agent.MessageEvent(-103, 0, b"msg_3"))
+
+    events = await asyncio.gather(*waiters)
+
+    assert [event.message for event in events] == ["msg_1", "msg_2", "msg_3"]
+    assert -102 not in agent._event_waiters
+    assert -103 not in agent._event_waiters
+
+
+@pytest.mark.asyncio
+async def test_agent_wait_for_event_works_for_cancelled_waiter():
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(agent.agent_wait_for_event([-104]), 0.01)
+
+    assert -104 not in agent._event_waiters
+
+    agent._put_event(agent.MessageEvent(-104, 0, b"msg"))
+
+    assert (await agent.agent_wait_for_event([-104])).message == "msg"
+
+
+@pytest.mark.asyncio
+async def test_agent_wait_for_event_works_for_waiter_cancelled_after_event():
+    waiter = asyncio.ensure_future(agent.agent_wait_for_event([-105]))
+    await asyncio.sleep(0)
+
+    agent._put_event(agent.MessageEvent(-105, 0, b"msg_1"))
+    waiter.cancel()
+    agent._put_event(agent.MessageEvent(-105, 0, b"msg_2"))
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert (await agent.agent_wait_for_event([-105])).message == "msg_1"
+    assert (await agent.agent_wait_for_event([-105])).message == "msg_2"
@@ -0,0 +1,56 @@
+from indy import wallet
+from indy.anoncreds import prover_open_claim_offers_search, prover_fetch_claim_offers, \
+    prover_close_claim_offers_search, prover_search_claim_offers
+from indy.error import ErrorCode, IndyError
+
+from tests.utils import storage, anoncreds
+from tests.utils.wallet import create_and_open_wallet
+
+import json
+import pytest
+import logging
+
+logging.basicConfig(level=logging.DEBUG)
+
+
+@pytest.fixture(autouse=True)
+def before_after_each():
+    storage.cleanup()
+    yield
+    storage.cleanup()
+
+
+@pytest.fixture
+async def wallet_handle():
+    handle = await create_and_open_wallet()
+    await anoncreds.prepare_common_wallet(handle)
+    yield handle
+    await wallet.close_wallet(handle)
+
+
+@pytest.mark.asyncio
+async def test_prover_fetch_claim_offers_works_for_pages(wallet_handle):
+    search_handle = await prover_open_claim_offers_search(wallet_handle, "{}")
+
+    assert len(json.loads(await prover_fetch_claim_offers(search_handle, 2))) == 2
+    assert len(json.loads(await prover_fetch_claim_offers(search_handle, 2))) == 1
+    assert len(json.loads(await prover_fetch_claim_offers(search_handle, 2))) == 0
+
+    await prover_close_claim_offers_search(search_handle)
+
+
+@pytest.mark.asyncio
+async def test_prover_search_claim_offers_works_for_filter_by_issuer(wallet_handle):
+    claim_offers = [claim_offer async for claim_offer in prover_search_claim_offers(
+        wallet_handle, '{{"issuer_did":"{}"}}'.format(anoncreds.ISSUER_DID), page_size=1)]
+
+    assert len(claim_offers) == 2
+    assert anoncreds.get_claim_offer(anoncreds.ISSUER_DID, 1) in claim_offers
+    assert anoncreds.get_claim_offer(anoncreds.ISSUER_DID, 2) in claim_offers
+
+
+@pytest.mark.asyncio
+async def test_prover_close_claim_offers_search_works_for_invalid_handle(wallet_handle):
+    with pytest.raises(IndyError) as e:
+        await prover_close_claim_offers_search(-1)
+    assert ErrorCode.CommonInvalidStructure == e.value.error_code
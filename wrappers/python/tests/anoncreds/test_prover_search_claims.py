@@ -0,0 +1,94 @@
+from indy import wallet
+from indy.anoncreds import prover_open_claims_search, prover_fetch_claims, prover_close_claims_search, \
+    prover_search_claims, prover_get_claims, prover_close_claim_offers_search
+from indy.error import ErrorCode, IndyError
+
+from tests.utils import storage, anoncreds
+from tests.utils.wallet import create_and_open_wallet
+
+import json
+import pytest
+import logging
+
+logging.basicConfig(level=logging.DEBUG)
+
+
+@pytest.fixture(autouse=True)
+def before_after_each():
+    storage.cleanup()
+    yield
+    storage.cleanup()
+
+
+@pytest.fixture
+async def wallet_handle():
+    handle = await create_and_open_wallet()
+    await anoncreds.prepare_common_wallet(handle)
+    yield handle
+    await wallet.close_wallet(handle)
+
+
+@pytest.mark.asyncio
+async def test_prover_fetch_claims_works(wallet_handle):
+    search_handle = await prover_open_claims_search(wallet_handle, "{}")
+
+    claims = json.loads(await prover_fetch_claims(search_handle, 10))
+    assert claims == json.loads(await prover_get_claims(wallet_handle, "{}"))
+    assert [] == json.loads(await prover_fetch_claims(search_handle, 10))
+
+    await prover_close_claims_search(search_handle)
+
+
+@pytest.mark.asyncio
+async def test_prover_fetch_claims_works_for_empty_result(wallet_handle):
+    search_handle = await prover_open_claims_search(wallet_handle, '{"schema_seq_no":10}')
+    assert [] == json.loads(await prover_fetch_claims(search_handle, 10))
+    await prover_close_claims_search(search_handle)
+
+
+@pytest.mark.asyncio
+async def test_prover_search_claims_works(wallet_handle):
+    claims = [claim async for claim in prover_search_claims(wallet_handle, "{}", page_size=1)]
+    assert claims == json.loads(await prover_get_claims(wallet_handle, "{}"))
+
+
+@pytest.mark.asyncio
+async def test_prover_fetch_claims_works_for_closed_search(wallet_handle):
+    search_handle = await prover_open_claims_search(wallet_handle, "{}")
+    await prover_close_claims_search(search_handle)
+
+    with pytest.raises(IndyError) as e:
+        await prover_fetch_claims(search_handle, 10)
+    assert ErrorCode.CommonInvalidStructure == e.value.error_code
+
+
+@pytest.mark.asyncio
+async def test_prover_open_claims_search_works_for_invalid_wallet_handle(wallet_handle):
+    invalid_wallet_handle = wallet_handle + 100
+
+    with pytest.raises(IndyError) as e:
+        await prover_open_claims_search(invalid_wallet_handle, "{}")
+    assert ErrorCode.WalletInvalidHandle == e.value.error_code
+
+
+@pytest.mark.asyncio
+async def test_prover_close_claim_offers_search_works_for_claims_search(wallet_handle):
+    search_handle = await prover_open_claims_search(wallet_handle, "{}")
+
+    with pytest.raises(IndyError) as e:
+        await prover_close_claim_offers_search(search_handle)
+    assert ErrorCode.CommonInvalidStructure == e.value.error_code
+
+    await prover_close_claims_search(search_handle)
+
+
+@pytest.mark.asyncio
+async def test_prover_fetch_claims_works_for_closed_wallet():
+    handle = await create_and_open_wallet()
+    await anoncreds.prepare_common_wallet(handle)
+    search_handle = await prover_open_claims_search(handle, "{}")
+    await wallet.close_wallet(handle)
+
+    with pytest.raises(IndyError) as e:
+        await prover_fetch_claims(search_handle, 10)
+    assert ErrorCode.CommonInvalidStructure == e.value.error_code
@@ -0,0 +1,69 @@
+from indy import wallet
+from indy.anoncreds import prover_create_proof, verifier_verify_proofs
+from indy.error import ErrorCode, IndyError
+
+from tests.utils import storage, anoncreds
+from tests.utils.wallet import create_and_open_wallet
+
+import json
+import pytest
+import logging
+
+logging.basicConfig(level=logging.DEBUG)
+
+
+@pytest.fixture(autouse=True)
+def before_after_each():
+    storage.cleanup()
+    yield
+    storage.cleanup()
+
+
+@pytest.fixture
+async def proof_item():
+    handle = await create_and_open_wallet()
+    args = await anoncreds.prepare_create_proof_args(handle)
+    proof_json = await prover_create_proof(*args)
+    yield anoncreds.get_proof_item(args, proof_json)
+    await wallet.close_wallet(handle)
+
+
+@pytest.mark.asyncio
+async def test_verifier_verify_proofs_works(proof_item):
+    valid = await verifier_verify_proofs(json.dumps([proof_item, proof_item]))
+    assert valid == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_verifier_verify_proofs_works_for_wrong_proof(proof_item):
+    wrong_proof_item = json.loads(json.dumps(proof_item))
+    wrong_proof_item["proof_request"]["nonce"] = "1"
+
+    valid = await verifier_verify_proofs(json.dumps([proof_item, wrong_proof_item]))
+    assert valid == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_verifier_verify_proofs_works_for_empty_batch():
+    valid = await verifier_verify_proofs("[]")
+    assert valid == []
+
+
+@pytest.mark.asyncio
+async def test_verifier_verify_proofs_works_for_malformed_items(proof_item):
+    item_without_claim_defs = json.loads(json.dumps(proof_item))
+    del item_without_claim_defs["claim_defs"]
+
+    item_with_invalid_proof = json.loads(json.dumps(proof_item))
+    item_with_invalid_proof["proof"] = {"proofs": "invalid"}
+
+    valid = await verifier_verify_proofs(json.dumps([proof_item, item_without_claim_defs, "invalid",
+                                                     item_with_invalid_proof, proof_item]))
+    assert valid == [True, False, False, False, True]
+
+
+@pytest.mark.asyncio
+async def test_verifier_verify_proofs_works_for_invalid_json():
+    with pytest.raises(IndyError) as e:
+        await verifier_verify_proofs('{"proof": {}}')
+    assert ErrorCode.CommonInvalidStructure == e.value.error_code
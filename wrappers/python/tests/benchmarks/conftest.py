@@ -0,0 +1,17 @@
+import os
+
+import pytest
+
+BENCHMARKS_PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+# Benchmarks are slow, so they are run only if INDY_BENCHMARKS env variable is set
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get("INDY_BENCHMARKS"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="Set INDY_BENCHMARKS env variable to run benchmarks")
+
+    for item in items:
+        if str(item.fspath).startswith(BENCHMARKS_PATH):
+            item.add_marker(skip_benchmark)
@@ -0,0 +1,96 @@
+from indy import agent, signus
+
+from tests.utils.benchmark import ops_per_sec
+
+import asyncio
+import json
+import logging
+import os
+import pytest
+import time
+
+# Can be overridden with INDY_BENCHMARK_MESSAGES env variable
+MESSAGES_COUNT = int(os.environ.get("INDY_BENCHMARK_MESSAGES", 1000))
+
+# Can be overridden with INDY_BENCHMARK_CONNECTIONS env variable
+CONNECTIONS_COUNT = int(os.environ.get("INDY_BENCHMARK_CONNECTIONS", 1000))
+
+
+@pytest.mark.asyncio
+async def test_agent_send_round_trip_benchmark(connection):
+    listener_handle, inc_con_handle, out_con_handle, wallet_handle, did = connection
+
+    async def op():
+        await agent.agent_send(out_con_handle, "msg_from_client")
+        await agent.agent_wait_for_event([inc_con_handle])
+
+    assert await ops_per_sec("agent.agent_send round trip", op) > 0
+
+
+@pytest.mark.asyncio
+async def test_agent_send_throughput_benchmark(connection):
+    logger = logging.getLogger(__name__)
+    listener_handle, inc_con_handle, out_con_handle, wallet_handle, did = connection
+
+    started = time.perf_counter()
+
+    for i in range(MESSAGES_COUNT):
+        await agent.agent_send(out_con_handle, "msg_from_client_{}".format(i))
+
+    sent = time.perf_counter() - started
+
+    for i in range(MESSAGES_COUNT):
+        event = await agent.agent_wait_for_event([inc_con_handle])  # type: agent.MessageEvent
+        assert event.message == "msg_from_client_{}".format(i)
+
+    received = time.perf_counter() - started
+
+    logger.info("agent.agent_send x %i: sent %.1f msgs/sec, received %.1f msgs/sec",
+                MESSAGES_COUNT, MESSAGES_COUNT / sent, MESSAGES_COUNT / received)
+
+
+@pytest.mark.asyncio
+async def test_agent_wait_for_event_load(listener_with_identity):
+    logger = logging.getLogger(__name__)
+    listener_handle, wallet_handle, did = listener_with_identity
+
+    sender_dids = []
+
+    for _ in range(CONNECTIONS_COUNT):
+        (sender_did, sender_verkey, sender_pk) = await signus.create_and_store_my_did(wallet_handle, "{}")
+        await signus.store_their_did(wallet_handle, json.dumps({
+            "did": sender_did,
+            "verkey": sender_verkey,
+            "pk": sender_pk
+        }))
+        sender_dids.append(sender_did)
+
+    started = time.perf_counter()
+
+    out_con_handles = await asyncio.gather(
+        *[agent.agent_connect(0, wallet_handle, sender_did, did) for sender_did in sender_dids])
+
+    inc_con_handles = []
+
+    for _ in range(CONNECTIONS_COUNT):
+        event = await agent.agent_wait_for_event([listener_handle])  # type: agent.ConnectionEvent
+        inc_con_handles.append(event.connection_handle)
+
+    connected = time.perf_counter() - started
+    started = time.perf_counter()
+
+    waiters = [asyncio.ensure_future(agent.agent_wait_for_event([inc_con_handle])) for inc_con_handle in inc_con_handles]
+
+    for out_con_handle in out_con_handles:
+        await agent.agent_send(out_con_handle, "msg_from_client")
+
+    events = await asyncio.gather(*waiters)
+    received = time.perf_counter() - started
+
+    logger.info("agent x %i connections: connected in %.3f sec, message per connection received in %.3f sec, "
+                "%.1f msgs/sec", CONNECTIONS_COUNT, connected, received, CONNECTIONS_COUNT / received)
+
+    assert sorted(event.handle for event in events) == sorted(inc_con_handles)
+
+    for con_handle in out_con_handles + inc_con_handles:
+        await agent.agent_close_connection(con_handle)
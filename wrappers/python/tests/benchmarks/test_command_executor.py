@@ -0,0 +1,56 @@
+from indy import anoncreds
+
+from tests.utils import anoncreds as anoncreds_utils
+
+import asyncio
+import json
+import logging
+import pytest
+import time
+
+PROOFS_COUNT = 8
+
+
+@pytest.mark.asyncio
+async def test_command_executor_concurrent_create_proof_benchmark(wallet_handle):
+    logger = logging.getLogger(__name__)
+    args = await anoncreds_utils.prepare_create_proof_args(wallet_handle)
+
+    started = time.perf_counter()
+    for _ in range(PROOFS_COUNT):
+        await anoncreds.prover_create_proof(*args)
+    sequential = time.perf_counter() - started
+
+    started = time.perf_counter()
+    proofs = await asyncio.gather(*[anoncreds.prover_create_proof(*args) for _ in range(PROOFS_COUNT)])
+    concurrent = time.perf_counter() - started
+
+    logger.info("prover_create_proof x %i: sequential %.3f sec, concurrent %.3f sec, speedup %.2f",
+                PROOFS_COUNT, sequential, concurrent, sequential / concurrent)
+
+    assert len(proofs) == PROOFS_COUNT
+
+
+@pytest.mark.asyncio
+async def test_command_executor_verify_proofs_benchmark(wallet_handle):
+    logger = logging.getLogger(__name__)
+    args = await anoncreds_utils.prepare_create_proof_args(wallet_handle)
+    proof_json = await anoncreds.prover_create_proof(*args)
+    (_, proof_req_json, _, schemas_json, _, claim_defs_json, revoc_regs_json) = args
+
+    started = time.perf_counter()
+    for _ in range(PROOFS_COUNT):
+        assert await anoncreds.verifier_verify_proof(proof_req_json, proof_json, schemas_json,
+                                                     claim_defs_json, revoc_regs_json)
+    sequential = time.perf_counter() - started
+
+    proof_item = anoncreds_utils.get_proof_item(args, proof_json)
+
+    started = time.perf_counter()
+    valid = await anoncreds.verifier_verify_proofs(json.dumps([proof_item] * PROOFS_COUNT))
+    batch = time.perf_counter() - started
+
+    logger.info("verifier_verify_proof x %i: sequential %.3f sec, batch %.3f sec, speedup %.2f",
+                PROOFS_COUNT, sequential, batch, sequential / batch)
+
+    assert valid == [True] * PROOFS_COUNT
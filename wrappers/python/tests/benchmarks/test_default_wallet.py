@@ -0,0 +1,51 @@
+from indy import anoncreds, signus
+
+from tests.utils import anoncreds as anoncreds_utils
+from tests.utils.benchmark import ops_per_sec
+
+import json
+import logging
+import os
+import pytest
+import time
+
+# Can be overridden with INDY_BENCHMARK_CLAIMS env variable
+CLAIMS_COUNT = int(os.environ.get("INDY_BENCHMARK_CLAIMS", 1000))
+
+
+@pytest.mark.asyncio
+async def test_default_wallet_sign_benchmark(wallet_handle):
+    (did, _, _) = await signus.create_and_store_my_did(wallet_handle, '{"seed":"000000000000000000000000Trustee1"}')
+    message = json.dumps({"reqId": 1496822211362017764})
+
+    async def op():
+        await signus.sign(wallet_handle, did, message)
+
+    assert await ops_per_sec("signus.sign", op) > 0
+
+
+@pytest.mark.asyncio
+async def test_default_wallet_prover_get_claims_benchmark(wallet_handle):
+    await anoncreds_utils.prepare_common_wallet(wallet_handle)
+
+    async def op():
+        await anoncreds.prover_get_claims(wallet_handle, "{}")
+
+    assert await ops_per_sec("anoncreds.prover_get_claims", op) > 0
+
+
+@pytest.mark.asyncio
+async def test_default_wallet_prover_get_claims_benchmark_for_many_claims(wallet_handle):
+    logger = logging.getLogger(__name__)
+    claim_json = await anoncreds_utils.prepare_claim_json(wallet_handle)
+
+    started = time.perf_counter()
+    for _ in range(CLAIMS_COUNT):
+        await anoncreds.prover_store_claim(wallet_handle, claim_json)
+    logger.info("prover_store_claim x %i: %.3f sec", CLAIMS_COUNT, time.perf_counter() - started)
+
+    async def op():
+        await anoncreds.prover_get_claims(wallet_handle, "{}")
+
+    assert await ops_per_sec("anoncreds.prover_get_claims with {} claims".format(CLAIMS_COUNT), op, 10) > 0
+    assert CLAIMS_COUNT == len(json.loads(await anoncreds.prover_get_claims(wallet_handle, "{}")))
@@ -0,0 +1,40 @@
+from indy import anoncreds, signus, wallet
+
+from tests.utils import anoncreds as anoncreds_utils
+from tests.utils.benchmark import ops_per_sec
+
+import json
+import pytest
+
+
+@pytest.fixture(params=["default", "inmem"])
+async def typed_wallet_handle(request, cleanup_storage):
+    xtype = request.param
+    await wallet.create_wallet("pool_1", "wallet_1", xtype, None, None)
+    wallet_handle = await wallet.open_wallet("wallet_1", None, None)
+    yield (xtype, wallet_handle)
+    await wallet.close_wallet(wallet_handle)
+
+
+@pytest.mark.asyncio
+async def test_inmem_wallet_sign_benchmark(typed_wallet_handle):
+    (xtype, wallet_handle) = typed_wallet_handle
+    (did, _, _) = await signus.create_and_store_my_did(wallet_handle, '{"seed":"000000000000000000000000Trustee1"}')
+    message = json.dumps({"reqId": 1496822211362017764})
+
+    async def op():
+        await signus.sign(wallet_handle, did, message)
+
+    assert await ops_per_sec("signus.sign in {} wallet".format(xtype), op) > 0
+
+
+@pytest.mark.asyncio
+async def test_inmem_wallet_prover_store_claim_benchmark(typed_wallet_handle):
+    (xtype, wallet_handle) = typed_wallet_handle
+    claim_json = await anoncreds_utils.prepare_claim_json(wallet_handle)
+
+    async def op():
+        await anoncreds.prover_store_claim(wallet_handle, claim_json)
+
+    assert await ops_per_sec("anoncreds.prover_store_claim in {} wallet".format(xtype), op) > 0
+
@@ -0,0 +1,31 @@
+from indy import ledger, signus
+
+from tests.utils.benchmark import ops_per_sec
+
+import os
+import pytest
+
+# Can be overridden with INDY_BENCHMARK_CALLS env variable
+CALLS_COUNT = int(os.environ.get("INDY_BENCHMARK_CALLS", 10000))
+
+
+@pytest.mark.asyncio
+async def test_libindy_do_call_benchmark(wallet_with_identity):
+    (wallet_handle, did) = wallet_with_identity
+    message = '{"reqId":1496822211362017764}'
+
+    async def op():
+        await signus.sign(wallet_handle, did, message)
+
+    assert await ops_per_sec("signus.sign", op, CALLS_COUNT) > 0
+
+
+@pytest.mark.asyncio
+async def test_libindy_do_sync_call_benchmark():
+    identifier = "Th7MpTaRZVRYnPiabds81Y"
+    destination = "FYmoFw55GeQH7SRFa37dkx1d2dZ3zUF8ckg7wmL7ofN4"
+
+    async def op():
+        ledger.build_get_nym_request_sync(identifier, destination)
+
+    assert await ops_per_sec("ledger.build_get_nym_request_sync", op, CALLS_COUNT) > 0
@@ -0,0 +1,36 @@
+from indy import anoncreds
+
+from tests.utils import anoncreds as anoncreds_utils
+from tests.utils.benchmark import ops_per_sec
+
+import pytest
+
+PROOFS_COUNT = 100
+
+
+@pytest.mark.asyncio
+async def test_verifier_verify_proof_benchmark(wallet_handle):
+    args = await anoncreds_utils.prepare_create_proof_args(wallet_handle)
+    proof_json = await anoncreds.prover_create_proof(*args)
+    (_, proof_req_json, _, schemas_json, _, claim_defs_json, revoc_regs_json) = args
+
+    async def op():
+        assert await anoncreds.verifier_verify_proof(proof_req_json, proof_json, schemas_json,
+                                                     claim_defs_json, revoc_regs_json)
+
+    # The first verification builds exponentiation tables for the issuer public key
+    await op()
+
+    assert await ops_per_sec("anoncreds.verifier_verify_proof", op, PROOFS_COUNT) > 0
+
+
+@pytest.mark.asyncio
+async def test_verifier_prover_create_proof_benchmark(wallet_handle):
+    args = await anoncreds_utils.prepare_create_proof_args(wallet_handle)
+
+    async def op():
+        await anoncreds.prover_create_proof(*args)
+
+    await op()
+
+    assert await ops_per_sec("anoncreds.prover_create_proof", op, PROOFS_COUNT) > 0
@@ -0,0 +1,39 @@
+from tests.utils import storage
+from indy import ledger
+from indy.error import ErrorCode, IndyError
+
+import json
+import pytest
+import logging
+
+logging.basicConfig(level=logging.DEBUG)
+
+IDENTIFIER = "Th7MpTaRZVRYnPiabds81Y"
+DEST = "FYmoFw55GeQH7SRFa37dkx1d2dZ3zUF8ckg7wmL7ofN4"
+
+
+@pytest.fixture(autouse=True)
+def before_after_each():
+    storage.cleanup()
+    yield
+    storage.cleanup()
+
+
+def test_build_get_nym_request_sync_works():
+    expected_response = {
+        "identifier": IDENTIFIER,
+        "operation": {
+            "type": "105",
+            "dest": DEST
+        }
+    }
+
+    response = json.loads(ledger.build_get_nym_request_sync(IDENTIFIER, DEST))
+    assert expected_response.items() <= response.items()
+
+
+def test_build_nym_request_sync_works_for_invalid_identifier():
+    with pytest.raises(IndyError) as e:
+        ledger.build_nym_request_sync("invalid_base58_identifier", DEST, None, None, None)
+    assert ErrorCode.CommonInvalidStructure == e.value.error_code
+
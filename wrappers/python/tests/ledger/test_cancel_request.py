@@ -0,0 +1,65 @@
+from tests.utils import pool, storage
+from indy import ledger
+from indy.pool import close_pool_ledger
+from indy.error import ErrorCode, IndyError
+
+import asyncio
+import json
+import pytest
+import logging
+
+logging.basicConfig(level=logging.DEBUG)
+
+
+@pytest.fixture(autouse=True)
+def before_after_each():
+    storage.cleanup()
+    yield
+    storage.cleanup()
+
+
+@pytest.fixture
+async def pool_handle():
+    handle = await pool.create_and_open_pool_ledger("pool_1")
+    yield handle
+    await close_pool_ledger(handle)
+
+
+def _get_nym_request():
+    return json.dumps({
+        "reqId": 1491566332010861,
+        "identifier": "Th7MpTaRZVRYnPiabds81Y",
+        "operation": {
+            "type": "105",
+            "dest": "Th7MpTaRZVRYnPiabds81Y"
+        },
+        "signature": "4o86XfkiJ4e2r3J6Ufoi17UU3W5Zi9sshV6FjBjkVw4sgEQFQov9dxqDEtLbAJAWffCWd5KfAk164QVo7mYwKkiV"
+    })
+
+
+@pytest.mark.asyncio
+async def test_cancel_request_works_for_completed_request(pool_handle):
+    request = _get_nym_request()
+    await ledger.submit_request(pool_handle, request)
+    await ledger.cancel_request(pool_handle, request)
+
+
+@pytest.mark.asyncio
+async def test_cancel_request_works_for_cancelled_submit(pool_handle):
+    request = _get_nym_request()
+    submit = asyncio.ensure_future(ledger.submit_request(pool_handle, request))
+    await asyncio.sleep(0)
+    submit.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await submit
+
+    response = json.loads(await ledger.submit_request(pool_handle, request))
+    assert response["op"] == "REPLY"
+
+
+@pytest.mark.asyncio
+async def test_cancel_request_works_for_invalid_pool_handle(pool_handle):
+    with pytest.raises(IndyError) as e:
+        await ledger.cancel_request(pool_handle + 1, _get_nym_request())
+    assert ErrorCode.PoolLedgerInvalidPoolHandle == e.value.error_code
@@ -0,0 +1,70 @@
+from indy import signus, wallet
+from indy.error import ErrorCode, IndyError
+from indy.libindy import run_blocking
+from tests.utils import storage
+
+from concurrent.futures import ThreadPoolExecutor
+
+import asyncio
+import pytest
+import logging
+
+logging.basicConfig(level=logging.DEBUG)
+
+THREADS_COUNT = 4
+
+
+@pytest.fixture(autouse=True)
+def before_after_each():
+    storage.cleanup()
+    yield
+    storage.cleanup()
+
+
+async def _create_did(wallet_name):
+    await wallet.create_wallet("pool_1", wallet_name, None, None, None)
+    wallet_handle = await wallet.open_wallet(wallet_name, None, None)
+
+    try:
+        (did, _, _) = await signus.create_and_store_my_did(wallet_handle, "{}")
+        return did
+    finally:
+        await wallet.close_wallet(wallet_handle)
+
+
+def test_run_blocking_works():
+    did = run_blocking(_create_did("wallet_1"))
+    assert did
+
+
+def test_run_blocking_works_for_error():
+    with pytest.raises(IndyError) as e:
+        run_blocking(wallet.close_wallet(-1))
+    assert ErrorCode.WalletInvalidHandle == e.value.error_code
+
+
+def test_run_blocking_works_for_thread_pool():
+    with ThreadPoolExecutor(THREADS_COUNT) as executor:
+        dids = list(executor.map(lambda i: run_blocking(_create_did("wallet_{}".format(i))), range(THREADS_COUNT)))
+
+    assert len(set(dids)) == THREADS_COUNT
+
+
+def test_run_blocking_works_for_asyncio_coroutine():
+    with pytest.raises(RuntimeError):
+        run_blocking(asyncio.sleep(1))
+
+
+def test_do_call_works_for_event_loop_per_thread():
+    def run_loop(i):
+        event_loop = asyncio.new_event_loop()
+
+        try:
+            return event_loop.run_until_complete(_create_did("wallet_{}".format(i)))
+        finally:
+            event_loop.close()
+
+    with ThreadPoolExecutor(THREADS_COUNT) as executor:
+        dids = list(executor.map(run_loop, range(THREADS_COUNT)))
+
+    assert len(set(dids)) == THREADS_COUNT
@@ -0,0 +1,39 @@
+from tests.utils import pool, storage
+from indy.pool import get_stats
+from indy.error import ErrorCode, IndyError
+import json
+import pytest
+import logging
+
+logging.basicConfig(level=logging.DEBUG)
+
+
+@pytest.fixture(autouse=True)
+def before_after_each():
+    storage.cleanup()
+    yield
+    storage.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_get_stats_works():
+    handle = await pool.create_and_open_pool_ledger("pool_1")
+    stats = json.loads(await get_stats(handle))
+
+    assert len(stats['nodes']) > 0
+    assert stats['pending_requests'] == 0
+
+    for node in stats['nodes']:
+        assert node['name']
+        assert node['healthy']
+        assert node['replies'] <= node['sent']
+        assert sum(bucket['count'] for bucket in node['histogram']) == node['replies']
+
+
+@pytest.mark.asyncio
+async def test_get_stats_works_for_invalid_handle():
+    handle = await pool.create_and_open_pool_ledger("pool_1")
+
+    with pytest.raises(IndyError) as e:
+        await get_stats(handle + 1)
+    assert ErrorCode.PoolLedgerInvalidPoolHandle == e.value.error_code
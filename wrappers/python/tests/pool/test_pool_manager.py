@@ -0,0 +1,82 @@
+from tests.utils import pool, storage
+from indy.pool import PoolManager
+from indy.error import ErrorCode, IndyError
+
+import asyncio
+import json
+import pytest
+import logging
+
+logging.basicConfig(level=logging.DEBUG)
+
+
+@pytest.fixture(autouse=True)
+def before_after_each():
+    storage.cleanup()
+    yield
+    storage.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_pool_manager_works():
+    await pool.create_pool_ledger_config("pool_1")
+
+    async with PoolManager() as manager:
+        async with manager.pool("pool_1") as handle:
+            assert handle is not None
+            assert manager.get_stats("pool_1")["users"] == 1
+
+        stats = manager.get_stats("pool_1")
+        assert stats["users"] == 0
+        assert stats["healthy"]
+
+
+@pytest.mark.asyncio
+async def test_pool_manager_works_for_shared_pool():
+    await pool.create_pool_ledger_config("pool_1")
+
+    async with PoolManager() as manager:
+        async def use_pool():
+            async with manager.pool("pool_1") as handle:
+                await asyncio.sleep(0.1)
+                return handle
+
+        handles = await asyncio.gather(*[use_pool() for _ in range(5)])
+
+        assert len(set(handles)) == 1
+        assert list(manager.get_stats().keys()) == ["pool_1"]
+
+
+@pytest.mark.asyncio
+async def test_pool_manager_refresh_works():
+    await pool.create_pool_ledger_config("pool_1")
+
+    async with PoolManager(json.dumps({"autoRefreshTime": 0})) as manager:
+        async with manager.pool("pool_1"):
+            await manager.refresh("pool_1")
+
+        stats = manager.get_stats("pool_1")
+        assert stats["refresh_count"] == 1
+        assert stats["last_refresh_latency"] is not None
+
+
+@pytest.mark.asyncio
+async def test_pool_manager_works_for_unknown_pool():
+    async with PoolManager() as manager:
+        with pytest.raises(IndyError) as e:
+            await manager.acquire("unknown_pool")
+        assert ErrorCode.PoolLedgerNotCreatedError == e.value.error_code
+        assert manager.get_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_pool_manager_works_for_different_pools():
+    await pool.create_pool_ledger_config("pool_1")
+    await pool.create_pool_ledger_config("pool_2")
+
+    async with PoolManager() as manager:
+        handles = await asyncio.gather(manager.acquire("pool_1"), manager.acquire("pool_2"))
+
+        assert len(set(handles)) == 2
+        assert manager.get_stats("pool_1")["users"] == 1
+        assert manager.get_stats("pool_2")["users"] == 1
@@ -0,0 +1,43 @@
+from indy import IndyError
+from indy import signus
+from indy.error import ErrorCode
+
+import json
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_encrypt_decrypt_bytes_works(wallet_handle):
+    (my_did, my_ver_key, _) = await signus.create_and_store_my_did(wallet_handle, '{}')
+    (their_did, their_ver_key, _) = await signus.create_and_store_my_did(wallet_handle, '{}')
+    await signus.store_their_did(wallet_handle, json.dumps({"did": my_did, "verkey": my_ver_key}))
+    await signus.store_their_did(wallet_handle, json.dumps({"did": their_did, "verkey": their_ver_key}))
+
+    message = bytes(range(256))
+
+    (encrypted_msg, nonce) = await signus.encrypt_bytes(wallet_handle, my_did, their_did, message)
+    assert encrypted_msg != message
+
+    decrypted_msg = await signus.decrypt_bytes(wallet_handle, their_did, my_did, encrypted_msg, nonce)
+    assert message == decrypted_msg
+
+
+@pytest.mark.asyncio
+async def test_encrypt_bytes_works_for_unknown_their_did(wallet_handle):
+    (my_did, _, _) = await signus.create_and_store_my_did(wallet_handle, '{}')
+
+    with pytest.raises(IndyError) as e:
+        await signus.encrypt_bytes(wallet_handle, my_did, '8wZcEriaNLNKtteJvx7f8i', b'message')
+    assert ErrorCode.WalletNotFoundError == e.value.error_code
+
+
+@pytest.mark.asyncio
+async def test_decrypt_bytes_works_for_invalid_nonce(wallet_handle):
+    (my_did, my_ver_key, _) = await signus.create_and_store_my_did(wallet_handle, '{}')
+    await signus.store_their_did(wallet_handle, json.dumps({"did": my_did, "verkey": my_ver_key}))
+
+    (encrypted_msg, _) = await signus.encrypt_bytes(wallet_handle, my_did, my_did, b'message')
+
+    with pytest.raises(IndyError) as e:
+        await signus.decrypt_bytes(wallet_handle, my_did, my_did, encrypted_msg, b'\x00' * 24)
+    assert ErrorCode.CommonInvalidStructure == e.value.error_code
@@ -0,0 +1,40 @@
+from indy import IndyError
+from indy import signus
+from indy.error import ErrorCode
+
+import json
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_sign_batch_works(wallet_handle):
+    (did, _, _) = await signus.create_and_store_my_did(wallet_handle, '{"seed":"000000000000000000000000Trustee1"}')
+
+    messages = [json.dumps({"reqId": 1496822211362017764}), json.dumps({"reqId": 1496822211362017765})]
+
+    signed_msgs = await signus.sign_batch(wallet_handle, did, messages)
+
+    assert len(signed_msgs) == 2
+    assert signed_msgs[0] == await signus.sign(wallet_handle, did, messages[0])
+    assert signed_msgs[1] == await signus.sign(wallet_handle, did, messages[1])
+
+
+@pytest.mark.asyncio
+async def test_sign_batch_works_for_empty_batch(wallet_handle):
+    (did, _, _) = await signus.create_and_store_my_did(wallet_handle, '{}')
+    assert [] == await signus.sign_batch(wallet_handle, did, [])
+
+
+@pytest.mark.asyncio
+async def test_sign_batch_works_for_unknown_did(wallet_handle):
+    with pytest.raises(IndyError) as e:
+        await signus.sign_batch(wallet_handle, '8wZcEriaNLNKtteJvx7f8i', [json.dumps({"reqId": 1496822211362017764})])
+    assert ErrorCode.WalletNotFoundError == e.value.error_code
+
+
+@pytest.mark.asyncio
+async def test_sign_batch_works_for_invalid_message_format(wallet_handle):
+    with pytest.raises(IndyError) as e:
+        (did, _, _) = await signus.create_and_store_my_did(wallet_handle, '{}')
+        await signus.sign_batch(wallet_handle, did, [json.dumps({"reqId": 1}), '"reqId":1495034346617224651'])
+    assert ErrorCode.CommonInvalidStructure == e.value.error_code
@@ -0,0 +1,39 @@
+from indy import IndyError
+from indy import signus
+from indy.error import ErrorCode
+
+import json
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_sign_bytes_works(wallet_handle):
+    (did, ver_key, _) = await signus.create_and_store_my_did(wallet_handle, '{}')
+    await signus.store_their_did(wallet_handle, json.dumps({"did": did, "verkey": ver_key}))
+
+    message = b'\x00\x01binary message\xff'
+
+    signature = await signus.sign_bytes(wallet_handle, did, message)
+
+    assert len(signature) == 64
+    assert await signus.verify_signature_bytes(wallet_handle, did, message, signature)
+    assert await signus.verify_signature_bytes(wallet_handle, did, bytearray(message), memoryview(signature))
+    assert not await signus.verify_signature_bytes(wallet_handle, did, b'other message', signature)
+
+
+@pytest.mark.asyncio
+async def test_sign_bytes_works_for_unknown_did(wallet_handle):
+    with pytest.raises(IndyError) as e:
+        await signus.sign_bytes(wallet_handle, '8wZcEriaNLNKtteJvx7f8i', b'message')
+    assert ErrorCode.WalletNotFoundError == e.value.error_code
+
+
+@pytest.mark.asyncio
+async def test_sign_bytes_works_for_empty_message(wallet_handle):
+    (did, ver_key, _) = await signus.create_and_store_my_did(wallet_handle, '{}')
+    await signus.store_their_did(wallet_handle, json.dumps({"did": did, "verkey": ver_key}))
+
+    signature = await signus.sign_bytes(wallet_handle, did, b'')
+
+    assert len(signature) == 64
+    assert await signus.verify_signature_bytes(wallet_handle, did, bytearray(), signature)
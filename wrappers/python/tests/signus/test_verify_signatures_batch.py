@@ -0,0 +1,45 @@
+from indy import signus
+
+import json
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_verify_signatures_batch_works(wallet_handle):
+    (did1, ver_key1, _) = await signus.create_and_store_my_did(wallet_handle, '{}')
+    (did2, ver_key2, _) = await signus.create_and_store_my_did(wallet_handle, '{}')
+
+    await signus.store_their_did(wallet_handle, json.dumps({"did": did1, "verkey": ver_key1}))
+    await signus.store_their_did(wallet_handle, json.dumps({"did": did2, "verkey": ver_key2}))
+
+    message = json.dumps({"reqId": 1496822211362017764})
+
+    signed_msg1 = await signus.sign(wallet_handle, did1, message)
+    signed_msg2 = await signus.sign(wallet_handle, did2, message)
+
+    res = await signus.verify_signatures_batch(wallet_handle,
+                                               [(did1, signed_msg1), (did2, signed_msg2), (did1, signed_msg2)])
+    assert [True, True, False] == res
+
+
+@pytest.mark.asyncio
+async def test_verify_signatures_batch_works_for_unknown_did(wallet_handle):
+    (did, _, _) = await signus.create_and_store_my_did(wallet_handle, '{}')
+    signed_msg = await signus.sign(wallet_handle, did, json.dumps({"reqId": 1496822211362017764}))
+
+    res = await signus.verify_signatures_batch(wallet_handle, [(did, signed_msg)])
+    assert [False] == res
+
+
+@pytest.mark.asyncio
+async def test_verify_signatures_batch_works_for_invalid_message(wallet_handle):
+    (did, ver_key, _) = await signus.create_and_store_my_did(wallet_handle, '{}')
+    await signus.store_their_did(wallet_handle, json.dumps({"did": did, "verkey": ver_key}))
+
+    message = json.dumps({"reqId": 1496822211362017764})
+    signed_msg = await signus.sign(wallet_handle, did, message)
+
+    res = await signus.verify_signatures_batch(wallet_handle,
+                                               [(did, signed_msg), (did, '"reqId":1496822211362017764'),
+                                                (did, message), (did, signed_msg)])
+    assert [True, False, False, True] == res
@@ -30,6 +30,60 @@ async def prepare_common_wallet(wallet_handle):
     return claim_def_json
 
 
+async def prepare_claim_json(wallet_handle):
+    schema = get_gvt_schema_json(1)
+    claim_def_json = await anoncreds.issuer_create_and_store_claim_def(
+        wallet_handle, ISSUER_DID, json.dumps(schema), None, False)
+
+    claim_offer_json = get_claim_offer(ISSUER_DID, 1)
+    await anoncreds.prover_store_claim_offer(wallet_handle, json.dumps(claim_offer_json))
+    await anoncreds.prover_create_master_secret(wallet_handle, COMMON_MASTER_SECRET_NAME)
+
+    claim_req = await anoncreds.prover_create_and_store_claim_req(
+        wallet_handle, "HEJ9gvWX64wW7UD", json.dumps(claim_offer_json), claim_def_json, COMMON_MASTER_SECRET_NAME)
+    (_, claim_json) = await anoncreds.issuer_create_claim(
+        wallet_handle, claim_req, json.dumps(get_gvt_claim_json()), -1, -1)
+
+    return claim_json
+
+
+async def prepare_create_proof_args(wallet_handle):
+    claim_def_json = await prepare_common_wallet(wallet_handle)
+    proof_req = get_proof_req()
+
+    claims = json.loads(await anoncreds.prover_get_claims_for_proof_req(wallet_handle, json.dumps(proof_req)))
+    claim_for_attr = claims['attrs']['attr1_uuid'][0]['claim_uuid']
+    claim_for_predicate = claims['predicates']['predicate1_uuid'][0]['claim_uuid']
+
+    requested_claims = {
+        "self_attested_attributes": {},
+        "requested_attrs": {
+            "attr1_uuid": [claim_for_attr, True]
+        },
+        "requested_predicates": {
+            "predicate1_uuid": claim_for_predicate
+        }
+    }
+
+    schemas = {claim_for_attr: get_gvt_schema_json(1)}
+    claim_defs = {claim_for_attr: json.loads(claim_def_json)}
+
+    return (wallet_handle, json.dumps(proof_req), json.dumps(requested_claims), json.dumps(schemas),
+            COMMON_MASTER_SECRET_NAME, json.dumps(claim_defs), "{}")
+
+
+def get_proof_item(create_proof_args, proof_json):
+    (_, proof_req_json, _, schemas_json, _, claim_defs_json, revoc_regs_json) = create_proof_args
+
+    return {
+        "proof_request": json.loads(proof_req_json),
+        "proof": json.loads(proof_json),
+        "schemas": json.loads(schemas_json),
+        "claim_defs": json.loads(claim_defs_json),
+        "revoc_regs": json.loads(revoc_regs_json)
+    }
+
+
 def get_claim_offer(issuer_did, schema_seq_no):
     return {"issuer_did": issuer_did, "schema_seq_no": schema_seq_no}
 
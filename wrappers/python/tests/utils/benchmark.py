@@ -0,0 +1,19 @@
+import logging
+import time
+
+
+async def ops_per_sec(name, op, count=1000):
+    logger = logging.getLogger(__name__)
+    logger.debug("ops_per_sec: >>> name: %s, count: %s", name, count)
+
+    started = time.perf_counter()
+
+    for _ in range(count):
+        await op()
+
+    elapsed = time.perf_counter() - started
+    res = count / elapsed
+
+    logger.info("ops_per_sec: %s: %i ops in %.3f sec, %.1f ops/sec", name, count, elapsed, res)
+    logger.debug("ops_per_sec: <<< res: %s", res)
+    return res
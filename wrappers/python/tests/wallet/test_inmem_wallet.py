@@ -0,0 +1,53 @@
+from indy import signus, wallet
+
+from tests.utils import storage
+
+from pathlib import Path
+
+import pytest
+import subprocess
+import sys
+
+MESSAGE = '{"reqId":1496822211362017764}'
+
+# Opens snapshot wallet in other process, so records can be only restored from snapshot
+RESTORE_SCRIPT = """
+import sys
+from indy import signus, wallet
+from indy.libindy import run_blocking
+
+wallet_handle = run_blocking(wallet.open_wallet("wallet_1", None, None))
+run_blocking(signus.sign(wallet_handle, sys.argv[1], sys.argv[2]))
+run_blocking(wallet.close_wallet(wallet_handle))
+"""
+
+
+@pytest.mark.asyncio
+async def test_inmem_wallet_works_for_reopen(cleanup_storage):
+    await wallet.create_wallet('pool1', 'wallet_1', 'inmem', None, None)
+
+    wallet_handle = await wallet.open_wallet('wallet_1', None, None)
+    (did, verkey, _) = await signus.create_and_store_my_did(wallet_handle, '{}')
+    await wallet.close_wallet(wallet_handle)
+
+    wallet_handle = await wallet.open_wallet('wallet_1', None, None)
+    signature = await signus.sign(wallet_handle, did, MESSAGE)
+    assert signature is not None
+    await wallet.close_wallet(wallet_handle)
+
+
+@pytest.mark.asyncio
+async def test_inmem_wallet_close_works_for_snapshot(cleanup_storage):
+    await wallet.create_wallet('pool1', 'wallet_1', 'inmem', '{"snapshot":true}', None)
+    snapshot_path = storage.indy_home_path().joinpath("wallet", "wallet_1", "inmem.json")
+
+    wallet_handle = await wallet.open_wallet('wallet_1', None, None)
+    (did, _, _) = await signus.create_and_store_my_did(wallet_handle, '{}')
+    assert not snapshot_path.exists()
+
+    await wallet.close_wallet(wallet_handle)
+    assert snapshot_path.exists()
+
+    restore = subprocess.run([sys.executable, "-c", RESTORE_SCRIPT, did, MESSAGE],
+                             cwd=str(Path(__file__).parents[2]))
+    assert 0 == restore.returncode
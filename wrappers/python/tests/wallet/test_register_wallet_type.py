@@ -0,0 +1,91 @@
+from indy import IndyError
+from indy import signus, wallet
+from indy.error import ErrorCode
+
+import pytest
+import time
+
+INMEM_WALLET_TYPE = "inmem_py"
+
+_registered_types = set()
+
+
+@pytest.fixture
+async def inmem_wallet_type():
+    # Wallet types can't be unregistered, so the type is registered once per process
+    if INMEM_WALLET_TYPE not in _registered_types:
+        await wallet.register_wallet_type(INMEM_WALLET_TYPE, wallet.InmemWalletBackend())
+        _registered_types.add(INMEM_WALLET_TYPE)
+
+    return INMEM_WALLET_TYPE
+
+
+@pytest.mark.asyncio
+async def test_register_wallet_type_works(inmem_wallet_type, cleanup_storage):
+    await wallet.create_wallet('pool1', 'wallet1', inmem_wallet_type, None, None)
+    wallet_handle = await wallet.open_wallet('wallet1', None, None)
+
+    (did, verkey, _) = await signus.create_and_store_my_did(wallet_handle, "{}")
+    signature = await signus.sign(wallet_handle, did, '{"reqId":1496822211362017764}')
+    assert signature
+
+    await wallet.close_wallet(wallet_handle)
+    await wallet.delete_wallet('wallet1', None)
+
+
+@pytest.mark.asyncio
+async def test_register_wallet_type_works_for_twice(inmem_wallet_type):
+    with pytest.raises(IndyError) as e:
+        await wallet.register_wallet_type(inmem_wallet_type, wallet.InmemWalletBackend())
+    assert ErrorCode.WalletTypeAlreadyRegisteredError == e.value.error_code
+
+
+def test_inmem_wallet_backend_works():
+    backend = wallet.InmemWalletBackend()
+    backend.create("wallet1", None, None)
+    handle = backend.open("wallet1", None, None, None)
+
+    backend.set(handle, "key1", "value1")
+    backend.set(handle, "key2", "value2")
+    backend.set(handle, "other", "value3")
+
+    assert "value1" == backend.get(handle, "key1")
+    assert "value1" == backend.get_not_expired(handle, "key1")
+    assert [("key1", "value1"), ("key2", "value2")] == sorted(backend.list(handle, "key"))
+
+    with pytest.raises(IndyError) as e:
+        backend.get(handle, "unknown_key")
+    assert ErrorCode.WalletNotFoundError == e.value.error_code
+
+    backend.close(handle)
+    backend.delete("wallet1", None, None)
+
+
+def test_inmem_wallet_backend_get_not_expired_works_for_expired():
+    backend = wallet.InmemWalletBackend()
+    backend.create("wallet1", None, None)
+    handle = backend.open("wallet1", None, '{"freshness_time":1}', None)
+
+    backend.set(handle, "key1", "value1")
+    time.sleep(2)
+
+    with pytest.raises(IndyError) as e:
+        backend.get_not_expired(handle, "key1")
+    assert ErrorCode.WalletNotFoundError == e.value.error_code
+    assert "value1" == backend.get(handle, "key1")
+
+
+def test_inmem_wallet_backend_get_not_expired_works_for_zero_freshness_time():
+    backend = wallet.InmemWalletBackend()
+    backend.create("wallet1", None, None)
+    handle = backend.open("wallet1", None, '{"freshness_time":0}', None)
+
+    backend.set(handle, "key1", "value1")
+    time.sleep(0.01)
+
+    assert "value1" == backend.get_not_expired(handle, "key1")
+
+
+def test_wallet_backend_cannot_be_created_without_implementation():
+    with pytest.raises(TypeError):
+        wallet.WalletBackend()